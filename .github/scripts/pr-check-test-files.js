@@ -4,7 +4,7 @@ const { execSync } = require("child_process");
 const fs = require("fs");
 
 // These are the directories we want to check for correct naming
-const TEST_DIRS = ["tests/unit", "tests/integration", "tests/tck", "tests/fuzz"];
+const TEST_DIRS = ["tests/unit", "tests/integration", "tests/tck", "tests/fuzz", "tests/benchmarks"];
 
 // These are the excluded paths and file names inside the TEST_DIRS
 const IGNORED = ["tests/fuzz/support"];
@@ -1,186 +1,411 @@
-# Account
-from .account.account_allowance_approve_transaction import AccountAllowanceApproveTransaction
-from .account.account_allowance_delete_transaction import AccountAllowanceDeleteTransaction
-from .account.account_create_transaction import AccountCreateTransaction
-from .account.account_delete_transaction import AccountDeleteTransaction
-from .account.account_id import AccountId
-from .account.account_info import AccountInfo
-from .account.account_records_query import AccountRecordsQuery
-from .account.account_update_transaction import AccountUpdateTransaction
-
-# Address book
-from .address_book.block_node_api import BlockNodeApi
-from .address_book.block_node_service_endpoint import BlockNodeServiceEndpoint
-from .address_book.endpoint import Endpoint
-from .address_book.general_service_endpoint import GeneralServiceEndpoint
-from .address_book.mirror_node_service_endpoint import MirrorNodeServiceEndpoint
-from .address_book.node_address import NodeAddress
-from .address_book.registered_node import RegisteredNode
-from .address_book.registered_node_address_book import RegisteredNodeAddressBook
-from .address_book.registered_node_address_book_query import RegisteredNodeAddressBookQuery
-from .address_book.registered_service_endpoint import RegisteredServiceEndpoint
-from .address_book.rpc_relay_service_endpoint import RpcRelayServiceEndpoint
-
-# Client and Network
-from .client.client import Client
-from .client.network import Network
-
-# Consensus
-from .consensus.topic_create_transaction import TopicCreateTransaction
-from .consensus.topic_delete_transaction import TopicDeleteTransaction
-from .consensus.topic_id import TopicId
-from .consensus.topic_message_submit_transaction import TopicMessageSubmitTransaction
-from .consensus.topic_update_transaction import TopicUpdateTransaction
-
-# Contract
-from .contract.contract_bytecode_query import ContractBytecodeQuery
-from .contract.contract_call_query import ContractCallQuery
-from .contract.contract_create_transaction import ContractCreateTransaction
-from .contract.contract_delete_transaction import ContractDeleteTransaction
-from .contract.contract_execute_transaction import ContractExecuteTransaction
-from .contract.contract_function_parameters import ContractFunctionParameters
-from .contract.contract_function_result import ContractFunctionResult
-from .contract.contract_id import ContractId
-from .contract.contract_info import ContractInfo
-from .contract.contract_info_query import ContractInfoQuery
-from .contract.contract_update_transaction import ContractUpdateTransaction
-from .contract.ethereum_transaction import EthereumTransaction
-
-# Crypto
-from .crypto.evm_address import EvmAddress
-from .crypto.private_key import PrivateKey
-from .crypto.public_key import PublicKey
-
-# Duration
+"""
+Hiero SDK for Python.
+
+Public names are imported on first attribute access (PEP 562) rather than when the
+package is imported, so ``import hiero_sdk_python`` does not load every transaction,
+query and generated protobuf module up front.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+# Duration shares its name with its submodule. Importing the submodule later would
+# rebind the package attribute to the module, so the class is imported eagerly.
 from .Duration import Duration
 
-# Errors
-from .exceptions import PrecheckError, ReceiptStatusError
-
-# Fee
-from .fees.fee_estimate import FeeEstimate
-from .fees.fee_estimate_mode import FeeEstimateMode
-from .fees.fee_estimate_response import FeeEstimateResponse
-from .fees.fee_extra import FeeExtra
-from .fees.network_fee import NetworkFee
-
-# File
-from .file.file_append_transaction import FileAppendTransaction
-from .file.file_contents_query import FileContentsQuery
-from .file.file_create_transaction import FileCreateTransaction
-from .file.file_delete_transaction import FileDeleteTransaction
-from .file.file_id import FileId
-from .file.file_info import FileInfo
-from .file.file_info_query import FileInfoQuery
-from .file.file_update_transaction import FileUpdateTransaction
-
-# HBAR
-from .hbar import Hbar
-from .hbar_unit import HbarUnit
-
-# Logger
-from .logger.log_level import LogLevel
-from .logger.logger import Logger
-
-# Nodes
-from .nodes.node_create_transaction import NodeCreateTransaction
-from .nodes.node_delete_transaction import NodeDeleteTransaction
-from .nodes.node_update_transaction import NodeUpdateTransaction
-from .nodes.registered_node_create_transaction import RegisteredNodeCreateTransaction
-from .nodes.registered_node_delete_transaction import RegisteredNodeDeleteTransaction
-from .nodes.registered_node_update_transaction import RegisteredNodeUpdateTransaction
-
-# PRNG
-from .prng_transaction import PrngTransaction
-
-# Queries
-from .query.account_balance_query import CryptoGetAccountBalanceQuery
-from .query.account_info_query import AccountInfoQuery
-from .query.fee_estimate_query import FeeEstimateQuery
-from .query.token_info_query import TokenInfoQuery
-from .query.token_nft_info_query import TokenNftInfoQuery
-from .query.topic_info_query import TopicInfoQuery
-from .query.topic_message_query import TopicMessageQuery
-from .query.transaction_get_receipt_query import TransactionGetReceiptQuery
-from .query.transaction_record_query import TransactionRecordQuery
-
-# Response / Codes
-from .response_code import ResponseCode
-
-# Schedule
-from .schedule.schedule_create_transaction import ScheduleCreateTransaction
-from .schedule.schedule_delete_transaction import ScheduleDeleteTransaction
-from .schedule.schedule_id import ScheduleId
-from .schedule.schedule_info import ScheduleInfo
-from .schedule.schedule_info_query import ScheduleInfoQuery
-from .schedule.schedule_sign_transaction import ScheduleSignTransaction
-from .staking_info import StakingInfo
-
-# System
-from .system.freeze_transaction import FreezeTransaction
-from .system.freeze_type import FreezeType
-
-# Timestamp
-from .timestamp import Timestamp
-from .tokens.assessed_custom_fee import AssessedCustomFee
-
-# Custom Fees
-from .tokens.custom_fee import CustomFee
-from .tokens.custom_fixed_fee import CustomFixedFee
-from .tokens.custom_fractional_fee import CustomFractionalFee
-from .tokens.custom_royalty_fee import CustomRoyaltyFee
-from .tokens.hbar_allowance import HbarAllowance
-from .tokens.hbar_transfer import HbarTransfer
-from .tokens.nft_id import NftId
-from .tokens.supply_type import SupplyType
-from .tokens.token_airdrop_claim import TokenClaimAirdropTransaction
-from .tokens.token_airdrop_pending_id import PendingAirdropId
-from .tokens.token_airdrop_pending_record import PendingAirdropRecord
-from .tokens.token_airdrop_transaction import TokenAirdropTransaction
-from .tokens.token_airdrop_transaction_cancel import TokenCancelAirdropTransaction
-from .tokens.token_allowance import TokenAllowance
-from .tokens.token_associate_transaction import TokenAssociateTransaction
-from .tokens.token_association import TokenAssociation
-from .tokens.token_burn_transaction import TokenBurnTransaction
-
-# Tokens
-from .tokens.token_create_transaction import TokenCreateTransaction
-from .tokens.token_delete_transaction import TokenDeleteTransaction
-from .tokens.token_dissociate_transaction import TokenDissociateTransaction
-from .tokens.token_freeze_transaction import TokenFreezeTransaction
-from .tokens.token_grant_kyc_transaction import TokenGrantKycTransaction
-from .tokens.token_id import TokenId
-from .tokens.token_info import TokenInfo
-from .tokens.token_mint_transaction import TokenMintTransaction
-from .tokens.token_nft_allowance import TokenNftAllowance
-from .tokens.token_nft_info import TokenNftInfo
-from .tokens.token_nft_transfer import TokenNftTransfer
-from .tokens.token_pause_transaction import TokenPauseTransaction
-from .tokens.token_reject_transaction import TokenRejectTransaction
-from .tokens.token_relationship import TokenRelationship
-from .tokens.token_revoke_kyc_transaction import TokenRevokeKycTransaction
-from .tokens.token_type import TokenType
-from .tokens.token_unfreeze_transaction import TokenUnfreezeTransaction
-from .tokens.token_unpause_transaction import TokenUnpauseTransaction
-from .tokens.token_update_nfts_transaction import TokenUpdateNftsTransaction
-from .tokens.token_update_transaction import TokenUpdateTransaction
-from .tokens.token_wipe_transaction import TokenWipeTransaction
-from .transaction.batch_transaction import BatchTransaction
-
-# Transaction
-from .transaction.custom_fee_limit import CustomFeeLimit
-from .transaction.transaction import Transaction
-from .transaction.transaction_id import TransactionId
-from .transaction.transaction_receipt import TransactionReceipt
-from .transaction.transaction_record import TransactionRecord
-from .transaction.transaction_response import TransactionResponse
-from .transaction.transfer_transaction import TransferTransaction
+
+if TYPE_CHECKING:
+    # Account
+    from .account.account_allowance_approve_transaction import AccountAllowanceApproveTransaction
+    from .account.account_allowance_delete_transaction import AccountAllowanceDeleteTransaction
+    from .account.account_create_transaction import AccountCreateTransaction
+    from .account.account_delete_transaction import AccountDeleteTransaction
+    from .account.account_id import AccountId
+    from .account.account_info import AccountInfo
+    from .account.account_records_query import AccountRecordsQuery
+    from .account.account_update_transaction import AccountUpdateTransaction
+
+    # Address book
+    from .address_book.block_node_api import BlockNodeApi
+    from .address_book.block_node_service_endpoint import BlockNodeServiceEndpoint
+    from .address_book.endpoint import Endpoint
+    from .address_book.general_service_endpoint import GeneralServiceEndpoint
+    from .address_book.mirror_node_service_endpoint import MirrorNodeServiceEndpoint
+    from .address_book.node_address import NodeAddress
+    from .address_book.registered_node import RegisteredNode
+    from .address_book.registered_node_address_book import RegisteredNodeAddressBook
+    from .address_book.registered_node_address_book_query import RegisteredNodeAddressBookQuery
+    from .address_book.registered_service_endpoint import RegisteredServiceEndpoint
+    from .address_book.rpc_relay_service_endpoint import RpcRelayServiceEndpoint
+
+    # Client and Network
+    from .circuit_breaker import CircuitBreakerConfig, CircuitState
+    from .client.client import Client
+    from .client.network import Network
+    from .client.network_cache import NetworkCache
+    from .client.warm_up import NodeReadiness
+
+    # Consensus
+    from .consensus.topic_create_transaction import TopicCreateTransaction
+    from .consensus.topic_delete_transaction import TopicDeleteTransaction
+    from .consensus.topic_id import TopicId
+    from .consensus.topic_message_submit_transaction import TopicMessageSubmitTransaction
+    from .consensus.topic_update_transaction import TopicUpdateTransaction
+
+    # Contract
+    from .contract.contract_bytecode_query import ContractBytecodeQuery
+    from .contract.contract_call_query import ContractCallQuery
+    from .contract.contract_create_transaction import ContractCreateTransaction
+    from .contract.contract_delete_transaction import ContractDeleteTransaction
+    from .contract.contract_execute_transaction import ContractExecuteTransaction
+    from .contract.contract_function_parameters import ContractFunctionParameters
+    from .contract.contract_function_result import ContractFunctionResult
+    from .contract.contract_id import ContractId
+    from .contract.contract_info import ContractInfo
+    from .contract.contract_info_query import ContractInfoQuery
+    from .contract.contract_update_transaction import ContractUpdateTransaction
+    from .contract.ethereum_transaction import EthereumTransaction
+
+    # Crypto
+    from .crypto.evm_address import EvmAddress
+    from .crypto.private_key import PrivateKey
+    from .crypto.public_key import PublicKey
+    from .crypto.signer import AsyncLocalSigner, AsyncSigner, LocalSigner, Signer
+    from .crypto.signing_backend import InProcessSigningBackend, ProcessPoolSigningBackend, SigningBackend
+
+    # Errors
+    from .exceptions import PrecheckError, ReceiptStatusError
+
+    # Fee
+    from .fees.fee_calculator import ExchangeRate, FeeCalculator, UnsupportedFeeEstimate
+    from .fees.fee_estimate import FeeEstimate
+    from .fees.fee_estimate_mode import FeeEstimateMode
+    from .fees.fee_estimate_response import FeeEstimateResponse
+    from .fees.fee_extra import FeeExtra
+    from .fees.network_fee import NetworkFee
+
+    # File
+    from .file.file_append_transaction import FileAppendTransaction
+    from .file.file_contents_query import FileContentsQuery
+    from .file.file_create_transaction import FileCreateTransaction
+    from .file.file_delete_transaction import FileDeleteTransaction
+    from .file.file_id import FileId
+    from .file.file_info import FileInfo
+    from .file.file_info_query import FileInfoQuery
+    from .file.file_update_transaction import FileUpdateTransaction
+
+    # HBAR
+    from .hbar import Hbar
+    from .hbar_unit import HbarUnit
+
+    # Logger
+    from .logger.log_level import LogLevel
+    from .logger.logger import Logger
+
+    # Metrics
+    from .metrics import InMemoryMetricsSink, MetricsSink, MetricsSnapshot, NoOpMetricsSink
+
+    # Nodes
+    from .nodes.node_create_transaction import NodeCreateTransaction
+    from .nodes.node_delete_transaction import NodeDeleteTransaction
+    from .nodes.node_update_transaction import NodeUpdateTransaction
+    from .nodes.registered_node_create_transaction import RegisteredNodeCreateTransaction
+    from .nodes.registered_node_delete_transaction import RegisteredNodeDeleteTransaction
+    from .nodes.registered_node_update_transaction import RegisteredNodeUpdateTransaction
+
+    # PRNG
+    from .prng_transaction import PrngTransaction
+
+    # Queries
+    from .query.account_balance_query import CryptoGetAccountBalanceQuery
+    from .query.account_info_query import AccountInfoQuery
+    from .query.fee_estimate_query import FeeEstimateQuery
+    from .query.token_info_query import TokenInfoQuery
+    from .query.token_nft_info_query import TokenNftInfoQuery
+    from .query.topic_info_query import TopicInfoQuery
+    from .query.topic_message_query import TopicMessageQuery
+    from .query.transaction_get_receipt_query import TransactionGetReceiptQuery
+    from .query.transaction_record_query import TransactionRecordQuery
+    from .rate_limiter import AdaptiveRateLimiter
+
+    # Response / Codes
+    from .response_code import ResponseCode
+
+    # Schedule
+    from .schedule.schedule_create_transaction import ScheduleCreateTransaction
+    from .schedule.schedule_delete_transaction import ScheduleDeleteTransaction
+    from .schedule.schedule_id import ScheduleId
+    from .schedule.schedule_info import ScheduleInfo
+    from .schedule.schedule_info_query import ScheduleInfoQuery
+    from .schedule.schedule_sign_transaction import ScheduleSignTransaction
+    from .staking_info import StakingInfo
+
+    # System
+    from .system.freeze_transaction import FreezeTransaction
+    from .system.freeze_type import FreezeType
+
+    # Timestamp
+    from .timestamp import Timestamp
+    from .tokens.assessed_custom_fee import AssessedCustomFee
+
+    # Custom Fees
+    from .tokens.custom_fee import CustomFee
+    from .tokens.custom_fixed_fee import CustomFixedFee
+    from .tokens.custom_fractional_fee import CustomFractionalFee
+    from .tokens.custom_royalty_fee import CustomRoyaltyFee
+    from .tokens.hbar_allowance import HbarAllowance
+    from .tokens.hbar_transfer import HbarTransfer
+    from .tokens.nft_id import NftId
+    from .tokens.nft_mint_pipeline import MintedNfts, NftMintError
+    from .tokens.supply_type import SupplyType
+    from .tokens.token_airdrop_claim import TokenClaimAirdropTransaction
+    from .tokens.token_airdrop_pending_id import PendingAirdropId
+    from .tokens.token_airdrop_pending_record import PendingAirdropRecord
+    from .tokens.token_airdrop_transaction import TokenAirdropTransaction
+    from .tokens.token_airdrop_transaction_cancel import TokenCancelAirdropTransaction
+    from .tokens.token_allowance import TokenAllowance
+    from .tokens.token_associate_transaction import TokenAssociateTransaction
+    from .tokens.token_association import TokenAssociation
+    from .tokens.token_burn_transaction import TokenBurnTransaction
+
+    # Tokens
+    from .tokens.token_create_transaction import TokenCreateTransaction
+    from .tokens.token_delete_transaction import TokenDeleteTransaction
+    from .tokens.token_dissociate_transaction import TokenDissociateTransaction
+    from .tokens.token_freeze_transaction import TokenFreezeTransaction
+    from .tokens.token_grant_kyc_transaction import TokenGrantKycTransaction
+    from .tokens.token_id import TokenId
+    from .tokens.token_info import TokenInfo
+    from .tokens.token_mint_transaction import TokenMintTransaction
+    from .tokens.token_nft_allowance import TokenNftAllowance
+    from .tokens.token_nft_info import TokenNftInfo
+    from .tokens.token_nft_transfer import TokenNftTransfer
+    from .tokens.token_pause_transaction import TokenPauseTransaction
+    from .tokens.token_reject_transaction import TokenRejectTransaction
+    from .tokens.token_relationship import TokenRelationship
+    from .tokens.token_revoke_kyc_transaction import TokenRevokeKycTransaction
+    from .tokens.token_type import TokenType
+    from .tokens.token_unfreeze_transaction import TokenUnfreezeTransaction
+    from .tokens.token_unpause_transaction import TokenUnpauseTransaction
+    from .tokens.token_update_nfts_transaction import TokenUpdateNftsTransaction
+    from .tokens.token_update_transaction import TokenUpdateTransaction
+    from .tokens.token_wipe_transaction import TokenWipeTransaction
+    from .transaction.batch_packer import BatchPacker, BatchPackerError, BatchResult
+    from .transaction.batch_transaction import BatchTransaction
+
+    # Transaction
+    from .transaction.custom_fee_limit import CustomFeeLimit
+    from .transaction.presigned_pool import PresignedPool
+    from .transaction.transaction import Transaction
+    from .transaction.transaction_id import TransactionId
+    from .transaction.transaction_id_allocator import TransactionIdAllocator
+    from .transaction.transaction_receipt import TransactionReceipt
+    from .transaction.transaction_record import TransactionRecord
+    from .transaction.transaction_response import TransactionResponse
+    from .transaction.transfer_planner import ShardResult, TransferCheckpoint, TransferPlanner, TransferShard
+    from .transaction.transfer_transaction import TransferTransaction
+
+
+# Maps each lazily imported public name to the module that defines it
+_LAZY_IMPORTS: dict[str, str] = {
+    # Account
+    "AccountAllowanceApproveTransaction": ".account.account_allowance_approve_transaction",
+    "AccountAllowanceDeleteTransaction": ".account.account_allowance_delete_transaction",
+    "AccountCreateTransaction": ".account.account_create_transaction",
+    "AccountDeleteTransaction": ".account.account_delete_transaction",
+    "AccountId": ".account.account_id",
+    "AccountInfo": ".account.account_info",
+    "AccountRecordsQuery": ".account.account_records_query",
+    "AccountUpdateTransaction": ".account.account_update_transaction",
+    # Address book
+    "BlockNodeApi": ".address_book.block_node_api",
+    "BlockNodeServiceEndpoint": ".address_book.block_node_service_endpoint",
+    "Endpoint": ".address_book.endpoint",
+    "GeneralServiceEndpoint": ".address_book.general_service_endpoint",
+    "MirrorNodeServiceEndpoint": ".address_book.mirror_node_service_endpoint",
+    "NodeAddress": ".address_book.node_address",
+    "RegisteredNode": ".address_book.registered_node",
+    "RegisteredNodeAddressBook": ".address_book.registered_node_address_book",
+    "RegisteredNodeAddressBookQuery": ".address_book.registered_node_address_book_query",
+    "RegisteredServiceEndpoint": ".address_book.registered_service_endpoint",
+    "RpcRelayServiceEndpoint": ".address_book.rpc_relay_service_endpoint",
+    # Client and Network
+    "CircuitBreakerConfig": ".circuit_breaker",
+    "CircuitState": ".circuit_breaker",
+    "Client": ".client.client",
+    "Network": ".client.network",
+    "NetworkCache": ".client.network_cache",
+    "NodeReadiness": ".client.warm_up",
+    "AdaptiveRateLimiter": ".rate_limiter",
+    # Consensus
+    "TopicCreateTransaction": ".consensus.topic_create_transaction",
+    "TopicDeleteTransaction": ".consensus.topic_delete_transaction",
+    "TopicId": ".consensus.topic_id",
+    "TopicMessageSubmitTransaction": ".consensus.topic_message_submit_transaction",
+    "TopicUpdateTransaction": ".consensus.topic_update_transaction",
+    # Contract
+    "ContractBytecodeQuery": ".contract.contract_bytecode_query",
+    "ContractCallQuery": ".contract.contract_call_query",
+    "ContractCreateTransaction": ".contract.contract_create_transaction",
+    "ContractDeleteTransaction": ".contract.contract_delete_transaction",
+    "ContractExecuteTransaction": ".contract.contract_execute_transaction",
+    "ContractFunctionParameters": ".contract.contract_function_parameters",
+    "ContractFunctionResult": ".contract.contract_function_result",
+    "ContractId": ".contract.contract_id",
+    "ContractInfo": ".contract.contract_info",
+    "ContractInfoQuery": ".contract.contract_info_query",
+    "ContractUpdateTransaction": ".contract.contract_update_transaction",
+    "EthereumTransaction": ".contract.ethereum_transaction",
+    # Crypto
+    "EvmAddress": ".crypto.evm_address",
+    "PrivateKey": ".crypto.private_key",
+    "PublicKey": ".crypto.public_key",
+    "Signer": ".crypto.signer",
+    "AsyncSigner": ".crypto.signer",
+    "LocalSigner": ".crypto.signer",
+    "AsyncLocalSigner": ".crypto.signer",
+    "SigningBackend": ".crypto.signing_backend",
+    "InProcessSigningBackend": ".crypto.signing_backend",
+    "ProcessPoolSigningBackend": ".crypto.signing_backend",
+    # Errors
+    "PrecheckError": ".exceptions",
+    "ReceiptStatusError": ".exceptions",
+    # Fee
+    "ExchangeRate": ".fees.fee_calculator",
+    "FeeCalculator": ".fees.fee_calculator",
+    "UnsupportedFeeEstimate": ".fees.fee_calculator",
+    "FeeEstimate": ".fees.fee_estimate",
+    "FeeEstimateMode": ".fees.fee_estimate_mode",
+    "FeeEstimateResponse": ".fees.fee_estimate_response",
+    "FeeExtra": ".fees.fee_extra",
+    "NetworkFee": ".fees.network_fee",
+    # File
+    "FileAppendTransaction": ".file.file_append_transaction",
+    "FileContentsQuery": ".file.file_contents_query",
+    "FileCreateTransaction": ".file.file_create_transaction",
+    "FileDeleteTransaction": ".file.file_delete_transaction",
+    "FileId": ".file.file_id",
+    "FileInfo": ".file.file_info",
+    "FileInfoQuery": ".file.file_info_query",
+    "FileUpdateTransaction": ".file.file_update_transaction",
+    # HBAR
+    "Hbar": ".hbar",
+    "HbarUnit": ".hbar_unit",
+    # Logger
+    "LogLevel": ".logger.log_level",
+    "Logger": ".logger.logger",
+    # Metrics
+    "InMemoryMetricsSink": ".metrics",
+    "MetricsSink": ".metrics",
+    "MetricsSnapshot": ".metrics",
+    "NoOpMetricsSink": ".metrics",
+    # Nodes
+    "NodeCreateTransaction": ".nodes.node_create_transaction",
+    "NodeDeleteTransaction": ".nodes.node_delete_transaction",
+    "NodeUpdateTransaction": ".nodes.node_update_transaction",
+    "RegisteredNodeCreateTransaction": ".nodes.registered_node_create_transaction",
+    "RegisteredNodeDeleteTransaction": ".nodes.registered_node_delete_transaction",
+    "RegisteredNodeUpdateTransaction": ".nodes.registered_node_update_transaction",
+    # PRNG
+    "PrngTransaction": ".prng_transaction",
+    # Queries
+    "CryptoGetAccountBalanceQuery": ".query.account_balance_query",
+    "AccountInfoQuery": ".query.account_info_query",
+    "FeeEstimateQuery": ".query.fee_estimate_query",
+    "TokenInfoQuery": ".query.token_info_query",
+    "TokenNftInfoQuery": ".query.token_nft_info_query",
+    "TopicInfoQuery": ".query.topic_info_query",
+    "TopicMessageQuery": ".query.topic_message_query",
+    "TransactionGetReceiptQuery": ".query.transaction_get_receipt_query",
+    "TransactionRecordQuery": ".query.transaction_record_query",
+    # Response / Codes
+    "ResponseCode": ".response_code",
+    # Schedule
+    "ScheduleCreateTransaction": ".schedule.schedule_create_transaction",
+    "ScheduleDeleteTransaction": ".schedule.schedule_delete_transaction",
+    "ScheduleId": ".schedule.schedule_id",
+    "ScheduleInfo": ".schedule.schedule_info",
+    "ScheduleInfoQuery": ".schedule.schedule_info_query",
+    "ScheduleSignTransaction": ".schedule.schedule_sign_transaction",
+    "StakingInfo": ".staking_info",
+    # System
+    "FreezeTransaction": ".system.freeze_transaction",
+    "FreezeType": ".system.freeze_type",
+    # Timestamp
+    "Timestamp": ".timestamp",
+    "AssessedCustomFee": ".tokens.assessed_custom_fee",
+    # Custom Fees
+    "CustomFee": ".tokens.custom_fee",
+    "CustomFixedFee": ".tokens.custom_fixed_fee",
+    "CustomFractionalFee": ".tokens.custom_fractional_fee",
+    "CustomRoyaltyFee": ".tokens.custom_royalty_fee",
+    "HbarAllowance": ".tokens.hbar_allowance",
+    "HbarTransfer": ".tokens.hbar_transfer",
+    "NftId": ".tokens.nft_id",
+    "SupplyType": ".tokens.supply_type",
+    "TokenClaimAirdropTransaction": ".tokens.token_airdrop_claim",
+    "PendingAirdropId": ".tokens.token_airdrop_pending_id",
+    "PendingAirdropRecord": ".tokens.token_airdrop_pending_record",
+    "TokenAirdropTransaction": ".tokens.token_airdrop_transaction",
+    "TokenCancelAirdropTransaction": ".tokens.token_airdrop_transaction_cancel",
+    "TokenAllowance": ".tokens.token_allowance",
+    "TokenAssociateTransaction": ".tokens.token_associate_transaction",
+    "TokenAssociation": ".tokens.token_association",
+    "TokenBurnTransaction": ".tokens.token_burn_transaction",
+    # Tokens
+    "TokenCreateTransaction": ".tokens.token_create_transaction",
+    "TokenDeleteTransaction": ".tokens.token_delete_transaction",
+    "TokenDissociateTransaction": ".tokens.token_dissociate_transaction",
+    "TokenFreezeTransaction": ".tokens.token_freeze_transaction",
+    "TokenGrantKycTransaction": ".tokens.token_grant_kyc_transaction",
+    "TokenId": ".tokens.token_id",
+    "TokenInfo": ".tokens.token_info",
+    "TokenMintTransaction": ".tokens.token_mint_transaction",
+    "MintedNfts": ".tokens.nft_mint_pipeline",
+    "NftMintError": ".tokens.nft_mint_pipeline",
+    "TokenNftAllowance": ".tokens.token_nft_allowance",
+    "TokenNftInfo": ".tokens.token_nft_info",
+    "TokenNftTransfer": ".tokens.token_nft_transfer",
+    "TokenPauseTransaction": ".tokens.token_pause_transaction",
+    "TokenRejectTransaction": ".tokens.token_reject_transaction",
+    "TokenRelationship": ".tokens.token_relationship",
+    "TokenRevokeKycTransaction": ".tokens.token_revoke_kyc_transaction",
+    "TokenType": ".tokens.token_type",
+    "TokenUnfreezeTransaction": ".tokens.token_unfreeze_transaction",
+    "TokenUnpauseTransaction": ".tokens.token_unpause_transaction",
+    "TokenUpdateNftsTransaction": ".tokens.token_update_nfts_transaction",
+    "TokenUpdateTransaction": ".tokens.token_update_transaction",
+    "TokenWipeTransaction": ".tokens.token_wipe_transaction",
+    "BatchPacker": ".transaction.batch_packer",
+    "BatchPackerError": ".transaction.batch_packer",
+    "BatchResult": ".transaction.batch_packer",
+    "BatchTransaction": ".transaction.batch_transaction",
+    # Transaction
+    "CustomFeeLimit": ".transaction.custom_fee_limit",
+    "Transaction": ".transaction.transaction",
+    "PresignedPool": ".transaction.presigned_pool",
+    "TransferPlanner": ".transaction.transfer_planner",
+    "TransferShard": ".transaction.transfer_planner",
+    "TransferCheckpoint": ".transaction.transfer_planner",
+    "ShardResult": ".transaction.transfer_planner",
+    "TransactionId": ".transaction.transaction_id",
+    "TransactionIdAllocator": ".transaction.transaction_id_allocator",
+    "TransactionReceipt": ".transaction.transaction_receipt",
+    "TransactionRecord": ".transaction.transaction_record",
+    "TransactionResponse": ".transaction.transaction_response",
+    "TransferTransaction": ".transaction.transfer_transaction",
+}
 
 
 __all__ = [
     # Client
+    "AdaptiveRateLimiter",
+    "CircuitBreakerConfig",
+    "CircuitState",
     "Client",
     "Network",
+    "NetworkCache",
+    "NodeReadiness",
     # Account
     "AccountId",
     "AccountCreateTransaction",
@@ -194,12 +419,21 @@ __all__ = [
     "PrivateKey",
     "PublicKey",
     "EvmAddress",
+    "Signer",
+    "AsyncSigner",
+    "LocalSigner",
+    "AsyncLocalSigner",
+    "SigningBackend",
+    "InProcessSigningBackend",
+    "ProcessPoolSigningBackend",
     # Tokens
     "TokenCreateTransaction",
     "TokenAssociateTransaction",
     "TokenDissociateTransaction",
     "TokenDeleteTransaction",
     "TokenMintTransaction",
+    "MintedNfts",
+    "NftMintError",
     "TokenFreezeTransaction",
     "TokenUnfreezeTransaction",
     "TokenWipeTransaction",
@@ -234,10 +468,19 @@ __all__ = [
     "Transaction",
     "TransferTransaction",
     "TransactionId",
+    "TransactionIdAllocator",
     "TransactionReceipt",
     "TransactionResponse",
     "TransactionRecord",
     "BatchTransaction",
+    "BatchPacker",
+    "BatchPackerError",
+    "BatchResult",
+    "PresignedPool",
+    "TransferPlanner",
+    "TransferShard",
+    "TransferCheckpoint",
+    "ShardResult",
     # Response
     "ResponseCode",
     # Consensus
@@ -271,6 +514,11 @@ __all__ = [
     # Logger
     "Logger",
     "LogLevel",
+    # Metrics
+    "MetricsSink",
+    "NoOpMetricsSink",
+    "InMemoryMetricsSink",
+    "MetricsSnapshot",
     # HBAR
     "Hbar",
     "HbarUnit",
@@ -293,6 +541,9 @@ __all__ = [
     "FeeEstimateResponse",
     "FeeExtra",
     "NetworkFee",
+    "FeeCalculator",
+    "ExchangeRate",
+    "UnsupportedFeeEstimate",
     # Contract
     "ContractCreateTransaction",
     "ContractCallQuery",
@@ -335,3 +586,28 @@ __all__ = [
     "ReceiptStatusError",
     "PrecheckError",
 ]
+
+
+def __getattr__(name: str):
+    """
+    Import a public name, or a submodule, on first access.
+
+    Raises:
+        AttributeError: If `name` is neither a public name nor a submodule of the package.
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        try:
+            return importlib.import_module(f".{name}", __name__)
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -41,6 +41,8 @@ class AccountAllowanceApproveTransaction(Transaction):
       then at consensus each spender account will have new allowances to spend HBAR or tokens from 0.0.X.
     """
 
+    _proto_body_field = "cryptoApproveAllowance"
+
     def __init__(
         self,
         hbar_allowances: list[HbarAllowance] | None = None,
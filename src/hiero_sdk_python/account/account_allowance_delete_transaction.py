@@ -32,6 +32,8 @@ class AccountAllowanceDeleteTransaction(Transaction):
     AccountAllowanceApproveTransaction.
     """
 
+    _proto_body_field = "cryptoDeleteAllowance"
+
     def __init__(
         self,
         nft_wipe: list[TokenNftAllowance] | None = None,
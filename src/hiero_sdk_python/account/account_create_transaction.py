@@ -27,6 +27,8 @@ DEFAULT_TRANSACTION_FEE = Hbar(3).to_tinybars()  # 3 Hbars
 class AccountCreateTransaction(Transaction):
     """Represents an account creation transaction on the Hedera network."""
 
+    _proto_body_field = "cryptoCreateAccount"
+
     def __init__(
         self,
         key: Key | None = None,
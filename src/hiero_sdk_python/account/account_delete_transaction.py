@@ -28,6 +28,8 @@ class AccountDeleteTransaction(Transaction):
             remaining balance to.
     """
 
+    _proto_body_field = "cryptoDelete"
+
     def __init__(
         self,
         account_id: AccountId | None = None,
@@ -66,6 +66,8 @@ class AccountUpdateTransaction(Transaction):
     attribute remains unchanged. Only appropriate signers may update account state.
     """
 
+    _proto_body_field = "cryptoUpdateAccount"
+
     def __init__(self, account_params: AccountUpdateParams | None = None):
         """
         Initialize a new `AccountUpdateTransaction`.
@@ -0,0 +1,125 @@
+"""
+hiero_sdk_python.channel_pool.py.
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Defines the process-wide pool of node channels shared by every Client, so that
+processes holding many clients open one connection per node instead of one per
+node and client.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+
+from hiero_sdk_python.channels import _Channel
+
+
+@dataclass
+class _PooledChannel:
+    channel: _Channel
+    references: int
+
+
+class _ChannelPool:
+    """
+    Reference-counted channels keyed by everything that determines a connection.
+
+    Nodes acquire a channel under a key built from their address and TLS settings
+    and release it when they are closed; the gRPC channel is closed when its last
+    reference is released. Channels for different keys are created concurrently,
+    while concurrent acquisitions of one key create a single channel.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an empty pool."""
+        self._lock = threading.Lock()
+        self._entries: dict[Hashable, _PooledChannel] = {}
+        self._creation_locks: dict[Hashable, threading.Lock] = {}
+
+    def _acquire_existing(self, key: Hashable) -> _Channel | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        entry.references += 1
+        return entry.channel
+
+    def acquire(self, key: Hashable, factory: Callable[[], _Channel]) -> _Channel:
+        """
+        Return the channel for a key, creating it with factory if there is none.
+
+        Args:
+            key (Hashable): Identifies the connection.
+            factory (Callable[[], _Channel]): Creates the channel; only called when none is pooled.
+
+        Returns:
+            _Channel: The shared channel. Each call must be paired with a call to `release`.
+        """
+        with self._lock:
+            channel = self._acquire_existing(key)
+            if channel is not None:
+                return channel
+            creation_lock = self._creation_locks.setdefault(key, threading.Lock())
+
+        with creation_lock:
+            with self._lock:
+                channel = self._acquire_existing(key)
+                if channel is not None:
+                    return channel
+
+            # A failed creation keeps the creation lock, so callers waiting on it retry one at a time
+            channel = factory()
+
+            # The entry replaces the creation lock atomically, so no caller can start a second creation
+            with self._lock:
+                self._entries[key] = _PooledChannel(channel, 1)
+                self._creation_locks.pop(key, None)
+            return channel
+
+    def release(self, key: Hashable, channel: _Channel) -> bool:
+        """
+        Release a reference taken by `acquire`, closing the channel with its last reference.
+
+        Args:
+            key (Hashable): The key the channel was acquired under.
+            channel (_Channel): The acquired channel.
+
+        Returns:
+            bool: False if channel is not the pooled channel for key, in which case nothing is released.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.channel is not channel:
+                return False
+            entry.references -= 1
+            if entry.references > 0:
+                return True
+            del self._entries[key]
+
+        channel.channel.close()
+        return True
+
+    def _close_all(self) -> None:
+        """Close every pooled channel, regardless of outstanding references."""
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+
+        for entry in entries:
+            entry.channel.channel.close()
+
+    def references(self, key: Hashable) -> int:
+        """Return the number of references held on the channel for a key."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return 0 if entry is None else entry.references
+
+    def __len__(self) -> int:
+        """Return the number of open pooled channels."""
+        with self._lock:
+            return len(self._entries)
+
+
+# The pool shared by every node in the process
+_CHANNEL_POOL = _ChannelPool()
@@ -0,0 +1,200 @@
+"""
+hiero_sdk_python.circuit_breaker.py.
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Defines the per-node circuit breaker that decides when a consensus node is taken
+out of rotation and how it is let back in.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+
+
+class CircuitState(Enum):
+    """
+    The state of a node's circuit breaker.
+
+    Attributes:
+        CLOSED: The node receives requests; outcomes are tracked in the failure window.
+        OPEN: The node is out of rotation until its backoff period has passed.
+        HALF_OPEN: A limited number of probe requests decide whether the node recovered.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True)
+class CircuitBreakerConfig:
+    """
+    Settings of the circuit breakers of a client's nodes.
+
+    Attributes:
+        failure_rate_threshold (float): Fraction of failed requests in the window that opens the circuit.
+        window_size (int): Number of most recent request outcomes the failure rate is computed over.
+        minimum_calls (int): Outcomes needed in the window before the failure rate is evaluated.
+        half_open_probes (int): Requests let through, and successes needed to close, once an open
+            circuit's backoff period has passed.
+    """
+
+    failure_rate_threshold: float = 0.5
+    window_size: int = 20
+    minimum_calls: int = 1
+    half_open_probes: int = 1
+
+    def __post_init__(self) -> None:
+        """
+        Validate the settings.
+
+        Raises:
+            ValueError: If a setting is out of range.
+        """
+        if not 0 < self.failure_rate_threshold <= 1:
+            raise ValueError("failure_rate_threshold must be in (0, 1]")
+        if self.window_size < 1:
+            raise ValueError("window_size must be >= 1")
+        if not 1 <= self.minimum_calls <= self.window_size:
+            raise ValueError("minimum_calls must be between 1 and window_size")
+        if self.half_open_probes < 1:
+            raise ValueError("half_open_probes must be >= 1")
+
+
+class CircuitBreaker:
+    """
+    Tracks the recent outcomes of requests to one node.
+
+    The breaker only decides on state; how long an open circuit stays open is the
+    node's backoff, which doubles each time the circuit opens.
+
+    While closed, the circuit opens when the failure rate over the last
+    `window_size` outcomes reaches `failure_rate_threshold`. With the default
+    `minimum_calls` of 1, the first failure of a node without recorded successes
+    opens it, while an occasional failure of an otherwise healthy node does not.
+
+    Once the backoff has passed the circuit is half-open: at most
+    `half_open_probes` requests are in flight at a time, other requests go to
+    other nodes, and any probe failure opens the circuit again. After
+    `half_open_probes` successes it closes with an empty window. When
+    `passive_probes` is False, only active health checks may probe.
+    """
+
+    def __init__(self, config: CircuitBreakerConfig | None = None) -> None:
+        """
+        Initializes a closed CircuitBreaker.
+
+        Args:
+            config (CircuitBreakerConfig, optional): The breaker settings; defaults to CircuitBreakerConfig().
+        """
+        self.config = config or CircuitBreakerConfig()
+        self.passive_probes = True
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._outcomes: deque[bool] = deque(maxlen=self.config.window_size)
+        self._failures = 0
+        self._probes_in_flight = 0
+        self._probe_successes = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Return the current state."""
+        return self._state
+
+    def failure_rate(self) -> float:
+        """Return the fraction of failures among the outcomes in the window."""
+        with self._lock:
+            return self._failures / len(self._outcomes) if self._outcomes else 0.0
+
+    def allow_request(self, backoff_elapsed: bool, probe: bool = False) -> bool:
+        """
+        Decide whether a request may be sent to the node.
+
+        A request admitted while half-open holds a probe permit until its outcome is
+        recorded or `release` is called.
+
+        Args:
+            backoff_elapsed (bool): Whether the node's backoff period has passed.
+            probe (bool): Whether the request is an active health check.
+
+        Returns:
+            bool: Whether to send the request.
+        """
+        if self._state is CircuitState.CLOSED:
+            return True
+
+        with self._lock:
+            if self._state is CircuitState.CLOSED:
+                return True
+            if self._state is CircuitState.OPEN:
+                if not backoff_elapsed:
+                    return False
+                self._state = CircuitState.HALF_OPEN
+                self._probes_in_flight = 0
+                self._probe_successes = 0
+
+            if not (probe or self.passive_probes) or self._probes_in_flight >= self.config.half_open_probes:
+                return False
+            self._probes_in_flight += 1
+            return True
+
+    def record_success(self) -> bool:
+        """
+        Record a request the node answered.
+
+        Returns:
+            bool: Whether the circuit was already closed, i.e. the request was not a probe.
+        """
+        with self._lock:
+            if self._state is CircuitState.CLOSED:
+                self._record(True)
+                return True
+            if self._state is CircuitState.HALF_OPEN:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+                self._probe_successes += 1
+                if self._probe_successes >= self.config.half_open_probes:
+                    self._state = CircuitState.CLOSED
+                    self._outcomes.clear()
+                    self._failures = 0
+            return False
+
+    def record_failure(self) -> bool:
+        """
+        Record a request that failed at the transport level.
+
+        Returns:
+            bool: Whether the circuit is open after the failure.
+        """
+        with self._lock:
+            if self._state is CircuitState.CLOSED:
+                self._record(False)
+                if len(self._outcomes) < self.config.minimum_calls:
+                    return False
+                if self._failures / len(self._outcomes) < self.config.failure_rate_threshold:
+                    return False
+
+            self._state = CircuitState.OPEN
+            self._probes_in_flight = 0
+            return True
+
+    def trip(self) -> None:
+        """Open the circuit regardless of the recorded outcomes, e.g. for a node known to be unreachable."""
+        with self._lock:
+            self._state = CircuitState.OPEN
+            self._probes_in_flight = 0
+
+    def release(self) -> None:
+        """Return the probe permit of a request that ended without an outcome for the node."""
+        with self._lock:
+            if self._state is CircuitState.HALF_OPEN:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+
+    def _record(self, success: bool) -> None:
+        if len(self._outcomes) == self._outcomes.maxlen and not self._outcomes[0]:
+            self._failures -= 1
+        self._outcomes.append(success)
+        if not success:
+            self._failures += 1
@@ -0,0 +1,141 @@
+"""
+hiero_sdk_python.client.address_book_refresher.py.
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Defines AddressBookRefresher, which keeps a Network's node list in sync with the
+mirror node from a background thread so that requests never wait for a refresh.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from hiero_sdk_python.client.network import Network
+
+
+logger = logging.getLogger(__name__)
+
+
+class AddressBookRefresher:
+    """
+    Refreshes a Network's address book on a background thread.
+
+    A refresh fetches every page of the mirror node's address book, keeps the
+    existing _Node (and so its channel and health state) of every unchanged node,
+    and swaps the new node list in. A failed fetch leaves the current nodes in place.
+
+    Refreshes run when `trigger` is called, e.g. after a node reported
+    INVALID_NODE_ACCOUNT, and every `interval` seconds when an interval is set.
+    Triggers that arrive while a refresh is pending are coalesced into it.
+    """
+
+    def __init__(self, network: Network, interval: float | None = None) -> None:
+        """
+        Initializes an AddressBookRefresher. The thread starts on the first trigger or
+        when an interval is set.
+
+        Args:
+            network (Network): The network to refresh.
+            interval (float, optional): Seconds between periodic refreshes; None disables them.
+
+        Raises:
+            ValueError: If interval is not positive.
+        """
+        self._network = network
+        self._condition = threading.Condition()
+        self._interval: float | None = None
+        self._requested = False
+        self._closed = False
+        self._thread: threading.Thread | None = None
+        self.refresh_count = 0
+        self.set_interval(interval)
+
+    @property
+    def interval(self) -> float | None:
+        """Return the seconds between periodic refreshes, or None if they are disabled."""
+        return self._interval
+
+    def set_interval(self, interval: float | None) -> AddressBookRefresher:
+        """
+        Set the period of background refreshes.
+
+        Args:
+            interval (float, optional): Seconds between refreshes; None disables them.
+
+        Returns:
+            AddressBookRefresher: This refresher, for chaining.
+
+        Raises:
+            ValueError: If interval is not positive.
+        """
+        if interval is not None and interval <= 0:
+            raise ValueError("interval must be positive")
+
+        with self._condition:
+            self._interval = interval
+            self._condition.notify_all()
+        if interval is not None:
+            self._ensure_started()
+        return self
+
+    def trigger(self) -> None:
+        """Request a refresh without waiting for it."""
+        with self._condition:
+            if self._closed:
+                return
+            self._requested = True
+            self._condition.notify_all()
+        self._ensure_started()
+
+    def close(self) -> None:
+        """Stop the background thread, waiting for a running refresh to finish."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            thread = self._thread
+
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def _ensure_started(self) -> None:
+        with self._condition:
+            if self._closed or self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="hiero-address-book-refresh", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        next_due: float | None = None
+        while True:
+            with self._condition:
+                while not self._closed and not self._requested:
+                    if self._interval is None:
+                        next_due = None
+                        self._condition.wait()
+                        continue
+
+                    now = time.monotonic()
+                    if next_due is None:
+                        next_due = now + self._interval
+                    if now >= next_due:
+                        break
+                    self._condition.wait(next_due - now)
+
+                if self._closed:
+                    return
+                self._requested = False
+
+            try:
+                self._network._refresh_from_mirror_node()
+            except Exception as e:  # noqa: BLE001
+                logger.warning("Address book refresh failed: %s", e)
+
+            with self._condition:
+                self.refresh_count += 1
+                next_due = None if self._interval is None else time.monotonic() + self._interval
+                self._condition.notify_all()
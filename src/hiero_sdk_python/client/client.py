@@ -5,25 +5,42 @@ from __future__ import annotations
 import math
 import os
 import warnings
+from collections.abc import Iterable, Iterator
 from decimal import Decimal
-from typing import Literal, NamedTuple
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple
 
 import grpc
 from dotenv import load_dotenv
 
 from hiero_sdk_python.account.account_id import AccountId
+from hiero_sdk_python.circuit_breaker import CircuitBreakerConfig
+from hiero_sdk_python.client.warm_up import DEFAULT_WARM_UP_PARALLELISM
 from hiero_sdk_python.crypto.private_key import PrivateKey
+from hiero_sdk_python.crypto.signer import SigningKey
+from hiero_sdk_python.crypto.signing_backend import InProcessSigningBackend, SigningBackend
 from hiero_sdk_python.hapi.mirror import (
     consensus_service_pb2_grpc as mirror_consensus_grpc,
 )
 from hiero_sdk_python.hbar import Hbar
 from hiero_sdk_python.logger.logger import Logger, LogLevel
+from hiero_sdk_python.metrics import MetricsSink, NoOpMetricsSink
 from hiero_sdk_python.node import _Node
+from hiero_sdk_python.rate_limiter import AdaptiveRateLimiter
+from hiero_sdk_python.tokens.nft_mint_pipeline import DEFAULT_MAX_CONCURRENCY
 from hiero_sdk_python.transaction.transaction_id import TransactionId
+from hiero_sdk_python.transaction.transaction_id_allocator import TransactionIdAllocator
 
+from .address_book_refresher import AddressBookRefresher
 from .network import Network
 
 
+if TYPE_CHECKING:
+    from hiero_sdk_python.client.network_cache import NetworkCache
+    from hiero_sdk_python.client.node_health_checker import NodeHealthChecker
+    from hiero_sdk_python.client.warm_up import NodeReadiness
+    from hiero_sdk_python.tokens.nft_mint_pipeline import MintedNfts
+    from hiero_sdk_python.tokens.token_id import TokenId
+
 DEFAULT_MAX_QUERY_PAYMENT = Hbar(1)
 
 DEFAULT_GRPC_DEADLINE = 10  # seconds
@@ -38,11 +55,20 @@ class Operator(NamedTuple):
     """A named tuple for the operator's account ID and private key."""
 
     account_id: AccountId
-    private_key: PrivateKey
+    private_key: SigningKey
 
 
 class Client:
-    """Client to interact with Hedera network services including mirror nodes and transactions."""
+    """
+    Client to interact with Hedera network services including mirror nodes and transactions.
+
+    A Client can be shared by many threads executing transactions and queries
+    concurrently. Node selection reads the healthy node list without locking; the
+    list is replaced, never modified in place, when nodes are marked unhealthy,
+    re-admitted or refreshed from the mirror node. Each node opens its channels
+    once, under its own lock. Configure the client (operator, TLS, timeouts)
+    before sharing it, since setters are not synchronized with running requests.
+    """
 
     def __init__(self, network: Network = None) -> None:
         """
@@ -50,7 +76,7 @@ class Client:
         If no network is provided, it defaults to a new Network instance.
         """
         self.operator_account_id: AccountId = None
-        self.operator_private_key: PrivateKey = None
+        self.operator_private_key: SigningKey = None
 
         if network is None:
             network = Network()
@@ -67,6 +93,12 @@ class Client:
         self._request_timeout: float = DEFAULT_REQUEST_TIMEOUT
 
         self.logger: Logger = Logger(LogLevel.from_env(), "hiero_sdk_python")
+        self.metrics: MetricsSink = NoOpMetricsSink()
+        self.rate_limiter: AdaptiveRateLimiter | None = None
+        self.transaction_id_allocator: TransactionIdAllocator = TransactionIdAllocator()
+        self.signing_backend: SigningBackend = InProcessSigningBackend()
+        self._address_book_refresher = AddressBookRefresher(self.network)
+        self._node_health_checker: NodeHealthChecker | None = None
 
     @property
     def mirror_stub(self) -> mirror_consensus_grpc.ConsensusServiceStub:
@@ -122,40 +154,64 @@ class Client:
         return client
 
     @classmethod
-    def for_testnet(cls) -> Client:
+    def for_testnet(cls, cache: NetworkCache | None = None, background_bootstrap: bool = False) -> Client:
         """
         Create a Client configured for Hedera Testnet.
 
         Note: Operator must be set manually using set_operator().
 
+        Args:
+            cache (NetworkCache, optional): An on-disk cache of the address book and node
+                certificates, which spares the mirror node request and TLS handshakes
+                on start-up once it is populated.
+            background_bootstrap (bool): Return without waiting for the mirror node; the
+                client starts from the cached or built-in node list and switches to the
+                fetched address book in the background.
+
         Returns:
             Client: A Client instance configured for testnet.
         """
-        return cls(Network("testnet"))
+        return cls(Network("testnet", cache=cache, background_bootstrap=background_bootstrap))
 
     @classmethod
-    def for_mainnet(cls) -> Client:
+    def for_mainnet(cls, cache: NetworkCache | None = None, background_bootstrap: bool = False) -> Client:
         """
         Create a Client configured for Hedera Mainnet.
 
         Note: Operator must be set manually using set_operator().
 
+        Args:
+            cache (NetworkCache, optional): An on-disk cache of the address book and node
+                certificates, which spares the mirror node request and TLS handshakes
+                on start-up once it is populated.
+            background_bootstrap (bool): Return without waiting for the mirror node; the
+                client starts from the cached or built-in node list and switches to the
+                fetched address book in the background.
+
         Returns:
             Client: A Client instance configured for mainnet.
         """
-        return cls(Network("mainnet"))
+        return cls(Network("mainnet", cache=cache, background_bootstrap=background_bootstrap))
 
     @classmethod
-    def for_previewnet(cls) -> Client:
+    def for_previewnet(cls, cache: NetworkCache | None = None, background_bootstrap: bool = False) -> Client:
         """
         Create a Client configured for Hedera Previewnet.
 
         Note: Operator must be set manually using set_operator().
 
+        Args:
+            cache (NetworkCache, optional): An on-disk cache of the address book and node
+                certificates, which spares the mirror node request and TLS handshakes
+                on start-up once it is populated.
+            background_bootstrap (bool): Return without waiting for the mirror node; the
+                client starts from the cached or built-in node list and switches to the
+                fetched address book in the background.
+
         Returns:
             Client: A Client instance configured for previewnet.
         """
-        return cls(Network("previewnet"))
+        return cls(Network("previewnet", cache=cache, background_bootstrap=background_bootstrap))
 
     @classmethod
     def for_network(cls, network_map: dict[str, AccountId], network_name: str | None = "localhost") -> Client:
@@ -184,8 +240,12 @@ class Client:
         nodes = [_Node(account_id, address, None) for address, account_id in network_map.items()]
         return cls(Network(network=network_name, nodes=nodes))
 
-    def set_operator(self, account_id: AccountId, private_key: PrivateKey) -> None:
-        """Sets the operator credentials (account ID and private key)."""
+    def set_operator(self, account_id: AccountId, private_key: SigningKey) -> None:
+        """
+        Sets the operator credentials (account ID and private key).
+
+        The key may also be a Signer or AsyncSigner, for operator keys held in an HSM or KMS.
+        """
         self.operator_account_id = account_id
         self.operator_private_key = private_key
 
@@ -203,10 +263,31 @@ class Client:
         return None
 
     def generate_transaction_id(self) -> TransactionId:
-        """Generates a new transaction ID, requiring that the operator_account_id is set."""
+        """
+        Generates a new transaction ID, requiring that the operator_account_id is set.
+
+        IDs come from `transaction_id_allocator`, so they are unique per payer even
+        when generated concurrently from many threads.
+        """
         if self.operator_account_id is None:
             raise ValueError("Operator account ID must be set to generate transaction ID.")
-        return TransactionId.generate(self.operator_account_id)
+        return self.transaction_id_allocator.generate(self.operator_account_id)
+
+    def generate_transaction_ids(self, count: int, account_id: AccountId | None = None) -> list[TransactionId]:
+        """
+        Reserves `count` consecutive transaction IDs, e.g. to pre-build transactions in bulk.
+
+        Args:
+            count (int): The number of IDs to reserve.
+            account_id (AccountId, optional): The payer. Defaults to the operator.
+
+        Returns:
+            list[TransactionId]: The IDs, one nanosecond apart in valid start order.
+        """
+        account_id = account_id or self.operator_account_id
+        if account_id is None:
+            raise ValueError("Operator account ID must be set to generate transaction ID.")
+        return self.transaction_id_allocator.generate_many(account_id, count)
 
     def get_node_account_ids(self) -> list[AccountId]:
         """Returns a list of node AccountIds that the client can use to send queries and transactions."""
@@ -219,6 +300,8 @@ class Client:
         Closes any open gRPC channels and frees resources.
         Call this when you are done using the Client to ensure a clean shutdown.
         """
+        self._address_book_refresher.close()
+        self.set_node_health_check_interval(None)
         self.network._close()
 
     def set_transport_security(self, enabled: bool) -> Client:
@@ -261,6 +344,131 @@ class Client:
         """Retrieve the configured root certificates for TLS connections."""
         return self.network.get_tls_root_certificates()
 
+    def set_channels_per_node(self, channels_per_node: int) -> Client:
+        """
+        Set how many gRPC channels are opened to each node.
+
+        Every channel is a separate HTTP/2 connection. Requests to a node rotate
+        through its channels, which avoids queuing behind the server's limit on
+        concurrent streams when many threads share one client. Extra channels are
+        opened on first use.
+
+        Args:
+            channels_per_node (int): The number of channels per node. Defaults to 1.
+
+        Returns:
+            Client: This client instance for fluent chaining.
+
+        Raises:
+            TypeError: If channels_per_node is not an int.
+            ValueError: If channels_per_node is less than 1.
+        """
+        if isinstance(channels_per_node, bool) or not isinstance(channels_per_node, int):
+            raise TypeError(f"channels_per_node must be of type int, got {type(channels_per_node).__name__}")
+        if channels_per_node < 1:
+            raise ValueError("channels_per_node must be >= 1")
+
+        self.network.set_channel_config(channels_per_node, self.network.get_channel_options())
+        return self
+
+    def get_channels_per_node(self) -> int:
+        """Retrieve the number of gRPC channels opened to each node."""
+        return self.network.get_channels_per_node()
+
+    def set_channel_options(self, options: dict[str, Any] | None) -> Client:
+        """
+        Set extra gRPC options for the channels to consensus nodes.
+
+        The options replace the SDK's defaults of the same name, e.g.
+        "grpc.keepalive_time_ms", and are otherwise added to them. Useful options
+        include "grpc.max_send_message_length", "grpc.max_receive_message_length"
+        and "grpc.max_concurrent_streams". Open channels are reopened.
+
+        Args:
+            options (dict[str, Any] | None): gRPC channel arguments by name; None clears them.
+
+        Returns:
+            Client: This client instance for fluent chaining.
+
+        Raises:
+            TypeError: If options is not a dict, an option name is not a str, or a
+                value is not an int or str.
+        """
+        if options is None:
+            options = {}
+        if not isinstance(options, dict):
+            raise TypeError(f"options must be of type dict, got {type(options).__name__}")
+        for name, value in options.items():
+            if not isinstance(name, str):
+                raise TypeError(f"channel option names must be of type str, got {type(name).__name__}")
+            if isinstance(value, bool) or not isinstance(value, (int, str)):
+                raise TypeError(f"channel option {name} must be an int or str, got {type(value).__name__}")
+
+        self.network.set_channel_config(self.network.get_channels_per_node(), options)
+        return self
+
+    def get_channel_options(self) -> dict[str, Any]:
+        """Retrieve the extra gRPC options for the channels to consensus nodes."""
+        return self.network.get_channel_options()
+
+    def set_circuit_breaker_config(self, config: CircuitBreakerConfig | None) -> Client:
+        """
+        Configure the per-node circuit breakers that take failing nodes out of rotation.
+
+        A node's circuit opens when the failure rate over its recent requests reaches
+        the threshold, and stays open for the node's backoff, which doubles each time.
+        Afterwards a limited number of probe requests decide whether it closes again.
+        Every node gets a new, closed breaker.
+
+        Args:
+            config (CircuitBreakerConfig | None): The breaker settings; None restores the defaults.
+
+        Returns:
+            Client: This client instance for fluent chaining.
+
+        Raises:
+            TypeError: If config is not a CircuitBreakerConfig.
+        """
+        if config is None:
+            config = CircuitBreakerConfig()
+        if not isinstance(config, CircuitBreakerConfig):
+            raise TypeError(f"config must be of type CircuitBreakerConfig, got {type(config).__name__}")
+
+        self.network.set_circuit_breaker_config(config)
+        return self
+
+    def get_circuit_breaker_config(self) -> CircuitBreakerConfig:
+        """Retrieve the settings of the per-node circuit breakers."""
+        return self.network.get_circuit_breaker_config()
+
+    def set_node_health_check_interval(self, interval: float | None) -> Client:
+        """
+        Actively health check nodes whose circuit is open, on a background thread.
+
+        Every `interval` seconds, each node whose backoff has passed is sent a free
+        balance query. While checks are enabled, only these probes are admitted to
+        half-open circuits, so requests never wait on a node that is still down.
+
+        Args:
+            interval (float | None): Seconds between checks. None stops the checks.
+
+        Returns:
+            Client: This client instance for fluent chaining.
+
+        Raises:
+            ValueError: If interval is not positive.
+        """
+        from hiero_sdk_python.client.node_health_checker import NodeHealthChecker
+
+        if self._node_health_checker is not None:
+            self._node_health_checker.close()
+            self._node_health_checker = None
+
+        if interval is not None:
+            self._node_health_checker = NodeHealthChecker(self, interval)
+        self.network._set_active_health_checks(interval is not None)
+        return self
+
     def set_default_max_query_payment(self, max_query_payment: int | float | Decimal | Hbar) -> Client:
         """
         Sets the default maximum Hbar amount allowed for any query executed by this client.
@@ -419,11 +627,166 @@ class Client:
         self._max_backoff = float(max_backoff)
         return self
 
+    def set_metrics_sink(self, metrics: MetricsSink | None) -> Client:
+        """
+        Set the sink that receives execution metrics (gRPC latency, attempts,
+        execution states, backoff and node health) for all requests made by this client.
+
+        Args:
+            metrics (MetricsSink | None): The sink to use. None restores the no-op default.
+
+        Returns:
+            Client: This client instance for fluent chaining.
+        """
+        if metrics is None:
+            metrics = NoOpMetricsSink()
+
+        if not isinstance(metrics, MetricsSink):
+            raise TypeError(f"metrics must be of type MetricsSink, got {type(metrics).__name__}")
+
+        self.metrics = metrics
+        self.network._set_metrics_sink(metrics)
+        return self
+
+    def set_max_tps(self, max_tps: float | None, node_max_tps: float | None = None) -> Client:
+        """
+        Limit the rate at which this client submits transactions.
+
+        All transactions executed through the client share one adaptive rate limiter,
+        and each node gets its own. A limiter starts at its maximum rate, halves it
+        when a node answers BUSY, PLATFORM_TRANSACTION_NOT_CREATED or
+        THROTTLED_AT_CONSENSUS, and grows it back additively while submissions
+        succeed. Transactions wait for both limiters before each attempt. The current
+        rates are published as the `hiero_rate_limit_tps` gauge.
+
+        Args:
+            max_tps (float | None): Transactions per second for the whole client, e.g. the
+                payer's throttle limit. None removes the client and node limits.
+            node_max_tps (float, optional): Transactions per second for each node.
+                Defaults to max_tps.
+
+        Returns:
+            Client: This client instance for fluent chaining.
+
+        Raises:
+            TypeError: If a limit is not an int or float.
+            ValueError: If a limit is not a finite value greater than 0.
+        """
+        for name, value in (("max_tps", max_tps), ("node_max_tps", node_max_tps)):
+            if value is None:
+                continue
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise TypeError(f"{name} must be of type Union[int, float], got {type(value).__name__}")
+            if not math.isfinite(value) or value <= 0:
+                raise ValueError(f"{name} must be a finite value greater than 0")
+
+        if max_tps is None:
+            self.rate_limiter = None
+            self.network.set_node_max_tps(None)
+            return self
+
+        self.rate_limiter = AdaptiveRateLimiter(max_tps)
+        self.network.set_node_max_tps(node_max_tps if node_max_tps is not None else max_tps)
+        return self
+
+    def set_signing_backend(self, backend: SigningBackend | None) -> Client:
+        """
+        Set the backend that computes signatures for transactions frozen with this client.
+
+        Args:
+            backend (SigningBackend | None): The backend to use, e.g. a
+                ProcessPoolSigningBackend for CPU-bound bulk signing. None restores the
+                in-process default.
+
+        Returns:
+            Client: This client instance for fluent chaining.
+        """
+        if backend is None:
+            backend = InProcessSigningBackend()
+
+        if not isinstance(backend, SigningBackend):
+            raise TypeError(f"backend must be of type SigningBackend, got {type(backend).__name__}")
+
+        self.signing_backend = backend
+        return self
+
+    def mint_nfts(
+        self,
+        token_id: TokenId,
+        metadata: Iterable[bytes] | str | os.PathLike[str],
+        supply_key: SigningKey,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        timeout: int | float | None = None,
+    ) -> Iterator[MintedNfts]:
+        """
+        Mint one NFT per metadata entry, splitting the entries across as many
+        TokenMintTransactions as the network's per-mint limit requires.
+
+        See `hiero_sdk_python.tokens.nft_mint_pipeline.mint_nfts` for details.
+
+        Args:
+            token_id (TokenId): The NFT collection to mint into.
+            metadata (Iterable[bytes] | str | os.PathLike): The metadata entries, or the
+                path of a file with one entry per line.
+            supply_key (SigningKey): The token's supply key, as a PrivateKey, Signer or AsyncSigner.
+            max_concurrency (int): Maximum number of mints in flight.
+            timeout (int | float, optional): The execution timeout of each mint.
+
+        Returns:
+            Iterator[MintedNfts]: The serials of each mint, yielded as mints complete.
+        """
+        from hiero_sdk_python.tokens.nft_mint_pipeline import mint_nfts
+
+        return mint_nfts(self, token_id, metadata, supply_key, max_concurrency=max_concurrency, timeout=timeout)
+
+    def warm_up(
+        self, parallelism: int = DEFAULT_WARM_UP_PARALLELISM, ping: bool = False, timeout: float | None = None
+    ) -> list[NodeReadiness]:
+        """
+        Fetch certificates and open channels for all nodes concurrently, ahead of the first request.
+
+        Nodes that cannot be reached are marked unhealthy, so requests avoid them until
+        they are readmitted. See `hiero_sdk_python.client.warm_up.warm_up` for details.
+
+        Args:
+            parallelism (int): Maximum number of nodes warmed up at the same time.
+            ping (bool): Whether to also send each node a free query.
+            timeout (float, optional): The deadline of each ping, in seconds.
+
+        Returns:
+            list[NodeReadiness]: The readiness of each node.
+        """
+        from hiero_sdk_python.client.warm_up import warm_up
+
+        return warm_up(self, parallelism=parallelism, ping=ping, timeout=timeout)
+
     def update_network(self) -> Client:
-        """Refresh the network node list from the mirror node."""
+        """
+        Refresh the network node list from the mirror node, waiting for the refresh.
+
+        A cached address book is never used here, even when it is fresh. Unchanged
+        nodes keep their open channels and health state.
+        """
         self.network._set_network_nodes()
         return self
 
+    def set_network_update_period(self, period: float | None) -> Client:
+        """
+        Refresh the address book from the mirror node periodically, on a background thread.
+
+        Args:
+            period (float | None): Seconds between refreshes. None stops periodic refreshes.
+
+        Returns:
+            Client: This client instance for fluent chaining.
+        """
+        self._address_book_refresher.set_interval(period)
+        return self
+
+    def _request_network_update(self) -> None:
+        """Schedule a background address book refresh; requests never wait for it."""
+        self._address_book_refresher.trigger()
+
     def __enter__(self) -> Client:
         """
         Allows the Client to be used in a 'with' statement for automatic resource management.
@@ -4,18 +4,25 @@ from __future__ import annotations
 
 import logging
 import secrets
+import threading
 import time
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import grpc
 import requests
 
 from hiero_sdk_python.account.account_id import AccountId
 from hiero_sdk_python.address_book.node_address import NodeAddress
+from hiero_sdk_python.circuit_breaker import CircuitBreakerConfig
 from hiero_sdk_python.hapi.mirror import consensus_service_pb2_grpc as mirror_consensus_grpc
+from hiero_sdk_python.metrics import NETWORK_HEALTHY_NODES, MetricsSink, NoOpMetricsSink
 from hiero_sdk_python.node import _Node
 
 
+if TYPE_CHECKING:
+    from hiero_sdk_python.client.network_cache import NetworkCache
+
+
 logger = logging.getLogger(__name__)
 
 
@@ -83,6 +90,8 @@ class Network:
         nodes: list[_Node] | None = None,
         mirror_address: str | None = None,
         ledger_id: bytes | None = None,
+        cache: NetworkCache | None = None,
+        background_bootstrap: bool = False,
     ) -> None:
         """
         Initializes the Network with the specified network name or custom config.
@@ -95,6 +104,15 @@ class Network:
             mirror_address (str, optional): A mirror node address (host:port) for topic queries.
                             If not provided,
                             we'll use a default from MIRROR_ADDRESS_DEFAULT[network].
+            cache (NetworkCache, optional): An on-disk cache of address books and node
+                            certificates. A cached address book is used instead of
+                            fetching one from the mirror node; a stale one is used as
+                            well and refreshed in the background.
+            background_bootstrap (bool): Do not wait for the mirror node on construction.
+                            The network starts from the cached address book or, without
+                            one, from DEFAULT_NODES, fetches the address book on a
+                            background thread and swaps it in when it arrives. Networks
+                            without default nodes still fetch synchronously.
 
         Note:
             TLS is enabled by default for hosted networks (mainnet, testnet, previewnet).
@@ -114,6 +132,20 @@ class Network:
         self._transport_security: bool = self.network in hosted_networks
         self._verify_certificates: bool = True  # Always enabled by default
         self._root_certificates: bytes | None = None
+        self._channels_per_node: int = 1
+        self._channel_options: dict[str, Any] = {}
+        self._circuit_breaker_config = CircuitBreakerConfig()
+        self._active_health_checks: bool = False
+        self._node_max_tps: float | None = None
+        self._metrics: MetricsSink = NoOpMetricsSink()
+        self._cache: NetworkCache | None = cache
+        self._cache_refresh: threading.Thread | None = None
+        self._background_bootstrap: bool = background_bootstrap
+        self._bootstrap_pending: bool = False
+        self._bootstrap_thread: threading.Thread | None = None
+        self._closed: bool = False
+        # Guards replacing the node lists; readers use the current lists without locking
+        self._nodes_lock = threading.RLock()
 
         self.nodes: list[_Node] = []
         self._healthy_nodes: list[_Node] = []
@@ -149,23 +181,132 @@ class Network:
             self._close_mirror_node()
 
     def _set_network_nodes(self, nodes: list[_Node] | None = None):
-        """Configure the consensus nodes used by this network."""
-        final_nodes = self._resolve_nodes(nodes)
+        """
+        Configure the consensus nodes used by this network.
 
-        # Apply TLS configuration to all nodes
-        for node in final_nodes:
-            if self._transport_security:
-                node._apply_transport_security(self._transport_security)  # pylint: disable=protected-access
-            node._set_verify_certificates(self._verify_certificates)  # pylint: disable=protected-access
-            node._set_root_certificates(self._root_certificates)  # pylint: disable=protected-access
+        Nodes whose account ID, address and certificate hash are unchanged keep their
+        existing _Node, with its open channel and health state.
+        """
+        self._swap_nodes(self._resolve_nodes(nodes))
+
+        # Started once the initial nodes are in place, so the fetched ones cannot be overwritten
+        if self._bootstrap_pending:
+            self._bootstrap_pending = False
+            self._bootstrap_thread = threading.Thread(
+                target=self._bootstrap_from_mirror_node, name="hiero-network-bootstrap", daemon=True
+            )
+            self._bootstrap_thread.start()
+
+    def _configure_node(self, node: _Node) -> None:
+        """Apply this network's TLS configuration to a node."""
+        if self._transport_security:
+            node._apply_transport_security(self._transport_security)  # pylint: disable=protected-access
+        node._set_verify_certificates(self._verify_certificates)  # pylint: disable=protected-access
+        node._set_root_certificates(self._root_certificates)  # pylint: disable=protected-access
+        node._set_channel_config(self._channels_per_node, self._channel_options)  # pylint: disable=protected-access
+        node._set_circuit_breaker_config(  # pylint: disable=protected-access
+            self._circuit_breaker_config, passive_probes=not self._active_health_checks
+        )
+        node._set_max_tps(self._node_max_tps)  # pylint: disable=protected-access
+        node._certificate_cache = self._cache  # pylint: disable=protected-access
 
-        self.nodes = final_nodes
-        self._healthy_nodes = []
+    @staticmethod
+    def _node_identity(node: _Node) -> tuple[object, str, bytes | None]:
+        address_book = getattr(node, "_address_book", None)
+        cert_hash = address_book._cert_hash if address_book else None  # pylint: disable=protected-access
+        return getattr(node, "_account_id", None), str(getattr(node, "_address", "")), cert_hash
 
-        for node in self.nodes:
-            if not node.is_healthy():
-                continue
-            self._healthy_nodes.append(node)
+    def _swap_nodes(self, nodes: list[_Node]) -> None:
+        """
+        Replace the node list with `nodes`, reusing the current _Node of every unchanged node.
+
+        The new node and healthy node lists are built aside and then swapped in, so
+        requests running concurrently see either the old or the new lists. Channels
+        of nodes that left the network are closed.
+        """
+        with self._nodes_lock:
+            current = {self._node_identity(node): node for node in self.nodes}
+            current_ids = {id(node) for node in self.nodes}
+            healthy_ids = {id(node) for node in self._healthy_nodes}
+
+            merged: list[_Node] = []
+            merged_healthy: list[_Node] = []
+            for node in nodes:
+                if id(node) not in current_ids:
+                    self._configure_node(node)
+                    node = current.get(self._node_identity(node), node)
+
+                merged.append(node)
+                is_healthy = id(node) in healthy_ids if id(node) in current_ids else node.is_healthy()
+                if is_healthy:
+                    merged_healthy.append(node)
+
+            merged_ids = {id(node) for node in merged}
+            removed = [node for node in self.nodes if id(node) not in merged_ids]
+
+            self.nodes = merged
+            self._healthy_nodes = merged_healthy
+            self._publish_healthy_nodes()
+
+            if merged_healthy and id(getattr(self, "current_node", None)) not in merged_ids:
+                self._node_index = secrets.randbelow(len(merged_healthy))
+                self.current_node = merged_healthy[self._node_index]
+
+        for node in removed:
+            node._close()  # pylint: disable=protected-access
+
+    def _refresh_from_mirror_node(self) -> bool:
+        """
+        Fetch the address book from the mirror node and swap it in.
+
+        Unlike `_set_network_nodes`, a failed fetch leaves the current nodes in place
+        rather than falling back to the default node list.
+
+        Returns:
+            bool: Whether a new address book was applied.
+        """
+        nodes = self._fetch_nodes_from_mirror_node()
+        if not nodes:
+            return False
+        self._swap_nodes(nodes)
+        return True
+
+    def _bootstrap_from_mirror_node(self) -> None:
+        """Swap the mirror node's address book in for the nodes the network started from."""
+        try:
+            nodes = self._fetch_nodes_from_mirror_node()
+        except Exception as e:  # noqa: BLE001
+            logger.warning("Background address book fetch failed: %s", e)
+            return
+
+        if not nodes:
+            logger.warning("Background address book fetch failed; keeping the initial nodes")
+            return
+
+        with self._nodes_lock:
+            if not self._closed:
+                self._swap_nodes(nodes)
+
+    def wait_for_bootstrap(self, timeout: float | None = None) -> bool:
+        """
+        Wait for a background bootstrap to swap in the mirror node's address book.
+
+        Args:
+            timeout (float, optional): Maximum seconds to wait; None waits until it finishes.
+
+        Returns:
+            bool: Whether no bootstrap is running anymore.
+        """
+        thread = self._bootstrap_thread
+        if thread is None:
+            return True
+        thread.join(timeout)
+        return not thread.is_alive()
+
+    def _bootstrapping(self) -> bool:
+        """Return whether a background bootstrap is still fetching the address book."""
+        thread = self._bootstrap_thread
+        return thread is not None and thread.is_alive()
 
     def _resolve_nodes(self, nodes: list[_Node] | None) -> list[_Node]:
         if nodes:
@@ -174,6 +315,19 @@ class Network:
         if self.network in ("solo", "localhost", "local"):
             return self._fetch_nodes_from_default_nodes()
 
+        # Only the first resolution may start from cached or placeholder nodes; later ones
+        # are explicit updates, which always ask the mirror node
+        initial = not self.nodes
+        bootstrap = self._background_bootstrap and initial
+
+        cached = self._load_nodes_from_cache(bootstrap) if initial else []
+        if cached:
+            return cached
+
+        if bootstrap and self.network in self.DEFAULT_NODES:
+            self._bootstrap_pending = True
+            return self._fetch_nodes_from_default_nodes()
+
         fetched = self._fetch_nodes_from_mirror_node()
         if fetched:
             return fetched
@@ -187,24 +341,66 @@ class Network:
         """
         Fetches the list of nodes from the Hedera Mirror Node REST API.
 
+        The fetched address book is written to the cache, if there is one.
+
         Returns:
             list: A list of _Node objects.
         """
+        entries = self._fetch_node_entries_from_mirror_node()
+        nodes = self._nodes_from_entries(entries)
+
+        if nodes:
+            self._store_address_book(entries)
+
+        return nodes
+
+    def _fetch_node_entries_from_mirror_node(self) -> list[dict[str, Any]]:
+        """
+        Fetches the raw node entries from the Hedera Mirror Node REST API, following pagination.
+
+        Returns:
+            list: The `nodes` of every page, or an empty list if a request failed.
+        """
         base_url: str | None = self.MIRROR_NODE_URLS.get(self.network)
         if not base_url:
             logger.warning("No known mirror node URL for network='%s'. Skipping fetch.", self.network)
             return []
 
-        url: str = f"{base_url}/api/v1/network/nodes?limit=100&order=desc"
+        url: str | None = f"{base_url}/api/v1/network/nodes?limit=100&order=desc"
+        entries: list[dict[str, Any]] = []
+        visited: set[str] = set()
 
         try:
-            response: requests.Response = requests.get(url, timeout=30)  # Add 30 second timeout
-            response.raise_for_status()
-            data: dict[str, Any] = response.json()
+            # Follow links.next so that networks with more nodes than fit a page are complete
+            while url and url not in visited:
+                visited.add(url)
+                response: requests.Response = requests.get(url, timeout=30)  # Add 30 second timeout
+                response.raise_for_status()
+                data: dict[str, Any] = response.json()
+                entries.extend(data.get("nodes", []))
+
+                next_link = (data.get("links") or {}).get("next")
+                url = f"{base_url}{next_link}" if next_link else None
+
+            return entries
+        except requests.RequestException as e:
+            logger.error("Error fetching nodes from mirror node API: %s", e)
+            return []
+        except (ValueError, TypeError, AttributeError) as e:
+            logger.error("Error parsing mirror node API response: %s", e, exc_info=True)
+            return []
 
+    def _nodes_from_entries(self, entries: list[dict[str, Any]]) -> list[_Node]:
+        """
+        Builds nodes from mirror node entries.
+
+        Returns:
+            list: A list of _Node objects, or an empty list if an entry is malformed.
+        """
+        try:
             nodes: list[_Node] = []
             # Process each node from the mirror node API response
-            for node in data.get("nodes", []):
+            for node in entries:
                 address_book: NodeAddress = NodeAddress._from_dict(node)
                 account_id: AccountId = address_book._account_id
                 address: str = str(address_book._addresses[0])
@@ -212,13 +408,54 @@ class Network:
                 nodes.append(_Node(account_id, address, address_book))
 
             return nodes
-        except requests.RequestException as e:
-            logger.error("Error fetching nodes from mirror node API: %s", e)
-            return []
         except (ValueError, KeyError, TypeError, IndexError, AttributeError) as e:
             logger.error("Error parsing mirror node API response: %s", e, exc_info=True)
             return []
 
+    def _load_nodes_from_cache(self, bootstrap: bool = False) -> list[_Node]:
+        """
+        Builds nodes from the cached address book, if there is a usable one.
+
+        A stale address book is still used, and the cache is refreshed from the mirror
+        node on a background thread so that later networks start from fresh data.
+
+        Args:
+            bootstrap (bool): Whether a stale address book is also replaced by the fetched
+                one once it arrives, rather than only refreshing the cache.
+
+        Returns:
+            list: A list of _Node objects, or an empty list.
+        """
+        if self._cache is None:
+            return []
+
+        cached = self._cache.load_address_book(self.network)
+        if cached is None:
+            return []
+
+        nodes = self._nodes_from_entries(cached.nodes)
+        if nodes and cached.stale and bootstrap:
+            self._bootstrap_pending = True
+        elif nodes and cached.stale:
+            self._cache_refresh = threading.Thread(
+                target=self._fetch_node_entries_into_cache, name="hiero-address-book-cache", daemon=True
+            )
+            self._cache_refresh.start()
+        return nodes
+
+    def _fetch_node_entries_into_cache(self) -> None:
+        entries = self._fetch_node_entries_from_mirror_node()
+        if self._nodes_from_entries(entries):
+            self._store_address_book(entries)
+
+    def _store_address_book(self, entries: list[dict[str, Any]]) -> None:
+        if self._cache is None:
+            return
+        try:
+            self._cache.store_address_book(self.network, entries)
+        except OSError as e:
+            logger.warning("Could not write the address book cache: %s", e)
+
     def _fetch_nodes_from_default_nodes(self) -> list[_Node]:
         """Fetches the list of nodes from the default nodes for the network."""
         return [_Node(node[1], node[0], None) for node in self.DEFAULT_NODES[self.network]]
@@ -228,7 +465,8 @@ class Network:
         Select the next node in the collection of available nodes using round-robin selection.
 
         This method increments the internal node index, wrapping around when reaching the end
-        of the node list, and updates the current_node reference.
+        of the node list, and updates the current_node reference. It takes no lock: it works
+        on a snapshot of the healthy node list, which is only ever replaced, never mutated.
 
         Raises:
             ValueError: If no nodes are available for selection.
@@ -238,14 +476,16 @@ class Network:
         """
         self._readmit_nodes()
 
-        if not self._healthy_nodes:
+        healthy_nodes = self._healthy_nodes
+        if not healthy_nodes:
             raise ValueError("No healthy node available to select")
 
-        self._node_index %= len(self._healthy_nodes)
-        self._node_index = (self._node_index + 1) % len(self._healthy_nodes)
+        index = (self._node_index + 1) % len(healthy_nodes)
+        self._node_index = index
 
-        self.current_node = self._healthy_nodes[self._node_index]
-        return self.current_node
+        node = healthy_nodes[index]
+        self.current_node = node
+        return node
 
     def _get_node(self, account_id: AccountId) -> _Node | None:
         """
@@ -381,6 +621,56 @@ class Network:
         """Determine if certificate verification is enabled."""
         return self._verify_certificates
 
+    def set_channel_config(self, channels_per_node: int, channel_options: dict[str, Any]) -> None:
+        """Set the number of gRPC channels opened per node and the extra options they are created with."""
+        self._channels_per_node = channels_per_node
+        self._channel_options = dict(channel_options)
+        for node in self.nodes:
+            node._set_channel_config(channels_per_node, channel_options)  # pylint: disable=protected-access
+
+    def get_channels_per_node(self) -> int:
+        """Retrieve the number of gRPC channels opened per node."""
+        return self._channels_per_node
+
+    def get_channel_options(self) -> dict[str, Any]:
+        """Retrieve the extra options gRPC channels to nodes are created with."""
+        return dict(self._channel_options)
+
+    def set_circuit_breaker_config(self, config: CircuitBreakerConfig) -> None:
+        """Give every node a new, closed circuit breaker with the given settings."""
+        self._circuit_breaker_config = config
+        for node in self.nodes:
+            node._set_circuit_breaker_config(config, passive_probes=not self._active_health_checks)  # pylint: disable=protected-access
+
+    def get_circuit_breaker_config(self) -> CircuitBreakerConfig:
+        """Retrieve the settings of the nodes' circuit breakers."""
+        return self._circuit_breaker_config
+
+    def set_node_max_tps(self, max_tps: float | None) -> None:
+        """Give every node an adaptive rate limiter capped at max_tps, or remove them with None."""
+        self._node_max_tps = max_tps
+        for node in self.nodes:
+            node._set_max_tps(max_tps)  # pylint: disable=protected-access
+
+    def get_node_max_tps(self) -> float | None:
+        """Retrieve the per-node transaction rate limit, if any."""
+        return self._node_max_tps
+
+    def _set_active_health_checks(self, enabled: bool) -> None:
+        """Reserve half-open circuits for active health checks instead of probing them with requests."""
+        self._active_health_checks = enabled
+        for node in self.nodes:
+            node._set_circuit_breaker_config(self._circuit_breaker_config, passive_probes=not enabled)  # pylint: disable=protected-access
+
+    def _set_metrics_sink(self, metrics: MetricsSink) -> None:
+        """Set the sink that receives the healthy node count of this network."""
+        self._metrics = metrics
+        self._publish_healthy_nodes()
+
+    def _publish_healthy_nodes(self) -> None:
+        """Publish the number of healthy nodes, after every change of the healthy node list."""
+        self._metrics.set_gauge(NETWORK_HEALTHY_NODES, len(self._healthy_nodes), {"network": self.network})
+
     def _readmit_nodes(self) -> None:
         """Re-admit nodes whose backoff period has expired."""
         now = time.monotonic()
@@ -388,32 +678,44 @@ class Network:
         if self._earliest_readmit_time > now:
             return
 
-        next_readmit = float("inf")
+        with self._nodes_lock:
+            # Another thread may have re-admitted the nodes while this one waited
+            if self._earliest_readmit_time > now:
+                return
 
-        for node in self.nodes:
-            if node in self._healthy_nodes:
-                continue
+            next_readmit = float("inf")
+            healthy_ids = {id(node) for node in self._healthy_nodes}
+            readmitted = []
 
-            if node._readmit_time > now:
-                next_readmit = min(next_readmit, node._readmit_time)
-                continue
+            for node in self.nodes:
+                if id(node) in healthy_ids:
+                    continue
 
-            self._mark_node_healthy(node)
+                if node._readmit_time > now:
+                    next_readmit = min(next_readmit, node._readmit_time)
+                    continue
 
-        delay = min(
-            self._node_max_readmit_period,
-            max(self._node_min_readmit_period, next_readmit - now),
-        )
+                readmitted.append(node)
+
+            if readmitted:
+                self._healthy_nodes = self._healthy_nodes + readmitted
+                self._publish_healthy_nodes()
+
+            delay = min(
+                self._node_max_readmit_period,
+                max(self._node_min_readmit_period, next_readmit - now),
+            )
 
-        self._earliest_readmit_time = now + delay
+            self._earliest_readmit_time = now + delay
 
     def _increase_backoff(self, node: _Node) -> None:
-        """Increase the node's backoff duration after a failure and remove node from healthy node."""
+        """Record a failed request to a node, removing it from the healthy nodes if its circuit opened."""
         if not isinstance(node, _Node):
             raise TypeError("node must be of type _Node")
 
-        node._increase_backoff()
-        self._mark_node_unhealthy(node)
+        # A failure that does not open the node's circuit keeps it in rotation
+        if node._increase_backoff():
+            self._mark_node_unhealthy(node)
 
     def _decrease_backoff(self, node: _Node) -> None:
         """Decrease the node's backoff duration after a successful operation."""
@@ -421,20 +723,25 @@ class Network:
             raise TypeError("node must be of type _Node")
 
         node._decrease_backoff()
+        self._publish_healthy_nodes()
 
     def _mark_node_unhealthy(self, node: _Node) -> None:
         if not isinstance(node, _Node):
             raise TypeError("node must be of type _Node")
 
-        if node in self._healthy_nodes:
-            self._healthy_nodes.remove(node)
+        with self._nodes_lock:
+            if node in self._healthy_nodes:
+                self._healthy_nodes = [healthy for healthy in self._healthy_nodes if healthy is not node]
+                self._publish_healthy_nodes()
 
     def _mark_node_healthy(self, node: _Node) -> None:
         if not isinstance(node, _Node):
             raise TypeError("node must be of type _Node")
 
-        if node not in self._healthy_nodes:
-            self._healthy_nodes.append(node)
+        with self._nodes_lock:
+            if node not in self._healthy_nodes:
+                self._healthy_nodes = [*self._healthy_nodes, node]
+                self._publish_healthy_nodes()
 
     def _close_mirror_node(self):
         """Safely closes the mirror gRPC channel."""
@@ -446,6 +753,9 @@ class Network:
 
     def _close(self):
         """Safely closes the mirror gRPC channel and consensus node."""
+        with self._nodes_lock:
+            self._closed = True
+
         self._close_mirror_node()
 
         if self.nodes:
@@ -0,0 +1,217 @@
+"""
+hiero_sdk_python.client.network_cache.py.
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Defines NetworkCache, an on-disk cache of mirror node address books and node TLS
+certificates that lets short-lived processes start without contacting the mirror
+node or handshaking with every node first.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+
+logger = logging.getLogger(__name__)
+
+
+# Version of the on-disk format; files written with another version are ignored
+CACHE_FORMAT_VERSION = 1
+
+# Age in seconds after which a cached address book is refreshed from the mirror node
+DEFAULT_CACHE_TTL_SECONDS = 3600
+
+_ADDRESS_BOOK_DIR = "address_books"
+_CERTIFICATE_DIR = "certificates"
+
+
+@dataclass(frozen=True)
+class CachedAddressBook:
+    """
+    An address book read from the cache.
+
+    Attributes:
+        network (str): The network the address book belongs to.
+        nodes (list[dict]): The node entries, as returned by the mirror node REST API.
+        fetched_at (float): When the address book was fetched, in seconds since the epoch.
+        stale (bool): Whether the entry is older than the cache's TTL.
+    """
+
+    network: str
+    nodes: list[dict[str, Any]]
+    fetched_at: float
+    stale: bool
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write a file so that readers see either the old or the new content, never a partial one."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def _normalize_cert_hash(cert_hash: bytes | str) -> str:
+    if isinstance(cert_hash, bytes):
+        try:
+            cert_hash = cert_hash.decode("utf-8")
+        except UnicodeDecodeError:
+            return cert_hash.hex()
+    return cert_hash.strip().lower().removeprefix("0x")
+
+
+class NetworkCache:
+    """
+    Caches address books and node certificates in a directory shared between processes.
+
+    Address books are cached per network, as the node entries of the mirror node's
+    `/api/v1/network/nodes` endpoint. An entry older than `ttl` seconds is stale: a
+    Network built from it is usable immediately and refreshes the cache from the
+    mirror node in the background.
+
+    Certificates are cached under the hash the address book pins them to and are only
+    returned when their SHA-384 digest still matches that hash, so a tampered or
+    outdated file is never trusted.
+
+    Writes go to a temporary file that is atomically renamed into place, so several
+    processes can share one cache directory.
+
+    Example:
+        cache = NetworkCache("~/.cache/hiero")
+        client = Client.for_mainnet(cache=cache)
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        ttl: float = DEFAULT_CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initializes a NetworkCache. The directory is created on first write.
+
+        Args:
+            directory (str | os.PathLike): Where cache files are kept.
+            ttl (float): Seconds after which a cached address book is stale.
+            clock (Callable[[], float]): Returns the current time in seconds since the epoch.
+
+        Raises:
+            ValueError: If ttl is negative.
+        """
+        if ttl < 0:
+            raise ValueError("ttl must be non-negative")
+
+        self.directory = Path(directory).expanduser()
+        self.ttl = ttl
+        self._clock = clock
+
+    def _address_book_path(self, network: str) -> Path:
+        return self.directory / _ADDRESS_BOOK_DIR / f"{network}.json"
+
+    def _certificate_path(self, cert_hash: str) -> Path:
+        return self.directory / _CERTIFICATE_DIR / f"{cert_hash}.pem"
+
+    def load_address_book(self, network: str) -> CachedAddressBook | None:
+        """
+        Read the cached address book of a network.
+
+        Args:
+            network (str): The network name, e.g. "mainnet".
+
+        Returns:
+            CachedAddressBook | None: The cached entry, or None if there is no usable one.
+        """
+        path = self._address_book_path(network)
+        try:
+            document = json.loads(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable address book cache %s: %s", path, e)
+            return None
+
+        if not isinstance(document, dict) or document.get("version") != CACHE_FORMAT_VERSION:
+            return None
+
+        nodes = document.get("nodes")
+        fetched_at = document.get("fetched_at")
+        if not isinstance(nodes, list) or not nodes or not isinstance(fetched_at, (int, float)):
+            return None
+
+        stale = self._clock() - fetched_at >= self.ttl
+        return CachedAddressBook(network, nodes, fetched_at, stale)
+
+    def store_address_book(self, network: str, nodes: list[dict[str, Any]]) -> None:
+        """
+        Cache the address book of a network.
+
+        Args:
+            network (str): The network name, e.g. "mainnet".
+            nodes (list[dict]): The node entries returned by the mirror node.
+        """
+        document = {
+            "version": CACHE_FORMAT_VERSION,
+            "network": network,
+            "fetched_at": self._clock(),
+            "nodes": nodes,
+        }
+        _atomic_write(self._address_book_path(network), json.dumps(document).encode("utf-8"))
+
+    def load_certificate(self, cert_hash: bytes | str) -> bytes | None:
+        """
+        Read a cached certificate.
+
+        Args:
+            cert_hash (bytes | str): The SHA-384 hash the address book pins the certificate to.
+
+        Returns:
+            bytes | None: The PEM certificate, or None if none is cached or it does not match the hash.
+        """
+        normalized = _normalize_cert_hash(cert_hash)
+        if not normalized:
+            return None
+
+        try:
+            pem = self._certificate_path(normalized).read_bytes()
+        except OSError:
+            return None
+
+        if hashlib.sha384(pem).hexdigest() != normalized:
+            return None
+        return pem
+
+    def store_certificate(self, cert_hash: bytes | str, pem: bytes) -> None:
+        """
+        Cache a certificate under the hash it was validated against.
+
+        Args:
+            cert_hash (bytes | str): The SHA-384 hash the address book pins the certificate to.
+            pem (bytes): The PEM-encoded certificate.
+
+        Raises:
+            ValueError: If the certificate does not match the hash.
+        """
+        normalized = _normalize_cert_hash(cert_hash)
+        if hashlib.sha384(pem).hexdigest() != normalized:
+            raise ValueError("certificate does not match cert_hash")
+
+        _atomic_write(self._certificate_path(normalized), pem)
@@ -0,0 +1,100 @@
+"""
+hiero_sdk_python.client.node_health_checker.py.
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Defines NodeHealthChecker, which probes nodes whose circuit is open with a free
+query from a background thread, so that no user request is spent finding out
+whether a failed node recovered.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import TYPE_CHECKING
+
+from hiero_sdk_python.circuit_breaker import CircuitState
+from hiero_sdk_python.executable import _execute_method
+from hiero_sdk_python.query.account_balance_query import CryptoGetAccountBalanceQuery
+
+
+if TYPE_CHECKING:
+    from hiero_sdk_python.client.client import Client
+    from hiero_sdk_python.node import _Node
+
+
+logger = logging.getLogger(__name__)
+
+
+def _probe(client: Client, node: _Node) -> bool:
+    """Send a node a free balance query for its own account; any answer counts as healthy."""
+    query = CryptoGetAccountBalanceQuery(node._account_id).set_node_account_ids([node._account_id])
+    try:
+        _execute_method(query._get_method(node._get_channel()), query._make_request(), client._grpc_deadline)
+    except Exception as e:  # noqa: BLE001
+        logger.debug("Health check of node %s failed: %s", node._account_id, e)
+        client.network._increase_backoff(node)
+        return False
+
+    client.network._decrease_backoff(node)
+    client.network._mark_node_healthy(node)
+    return True
+
+
+class NodeHealthChecker:
+    """
+    Probes nodes with an open circuit every `interval` seconds.
+
+    A node is probed once its backoff period has passed, i.e. when its circuit
+    would otherwise let a user request through as a probe. While the checker
+    runs, only its probes are admitted to half-open circuits, and user requests
+    go to other nodes until a probe closes the circuit.
+    """
+
+    def __init__(self, client: Client, interval: float) -> None:
+        """
+        Initializes a NodeHealthChecker and starts its thread.
+
+        Args:
+            client (Client): The client whose nodes are checked.
+            interval (float): Seconds between checks.
+
+        Raises:
+            ValueError: If interval is not positive.
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+
+        self._client = client
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="hiero-node-health-check", daemon=True)
+        self._thread.start()
+
+    def run_once(self) -> int:
+        """
+        Probe every node whose circuit is open and whose backoff period has passed.
+
+        Returns:
+            int: The number of nodes probed.
+        """
+        probed = 0
+        for node in list(self._client.network.nodes):
+            if node._circuit_breaker.state is CircuitState.CLOSED or not node._allow_request(probe=True):
+                continue
+            _probe(self._client, node)
+            probed += 1
+        return probed
+
+    def close(self) -> None:
+        """Stop the background thread, waiting for a running check to finish."""
+        self._stop.set()
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.run_once()
+            except Exception as e:  # noqa: BLE001, PERF203
+                logger.warning("Node health check failed: %s", e)
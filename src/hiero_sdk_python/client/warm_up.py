@@ -0,0 +1,117 @@
+"""
+hiero_sdk_python.client.warm_up.py.
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Opens the channels of every consensus node ahead of the first request. Creating a
+node's channel fetches and validates its TLS certificate, a blocking handshake that
+would otherwise happen on the request path the first time the node is used.
+"""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from hiero_sdk_python.account.account_id import AccountId
+    from hiero_sdk_python.client.client import Client
+    from hiero_sdk_python.node import _Node
+
+
+# Nodes warmed up at the same time; each blocks a thread on a TLS handshake
+DEFAULT_WARM_UP_PARALLELISM = 8
+
+
+@dataclass(frozen=True)
+class NodeReadiness:
+    """
+    The outcome of warming up one consensus node.
+
+    Attributes:
+        account_id (AccountId): The node's account ID.
+        address (str): The address the node's channel connects to.
+        ready (bool): Whether the channel was created and, if requested, the ping succeeded.
+        elapsed (float): Seconds spent warming up the node.
+        error (BaseException | None): Why the node is not ready, if it is not.
+    """
+
+    account_id: AccountId
+    address: str
+    ready: bool
+    elapsed: float
+    error: BaseException | None = None
+
+
+def _ping(client: Client, node: _Node, timeout: float | None) -> None:
+    # Imported here because the client imports this module for its defaults
+    from hiero_sdk_python.query.account_balance_query import CryptoGetAccountBalanceQuery
+
+    query = (
+        CryptoGetAccountBalanceQuery()
+        .set_account_id(node._account_id)
+        .set_node_account_ids([node._account_id])
+        .set_max_attempts(1)
+    )
+    if timeout is not None:
+        query.set_grpc_deadline(timeout)
+    query.execute(client, timeout)
+
+
+def _warm_up_node(client: Client, node: _Node, ping: bool, timeout: float | None) -> NodeReadiness:
+    start = time.monotonic()
+    try:
+        node._get_channel()
+        if ping:
+            _ping(client, node, timeout)
+    except Exception as e:  # noqa: BLE001
+        return NodeReadiness(node._account_id, str(node._address), False, time.monotonic() - start, e)
+    return NodeReadiness(node._account_id, str(node._address), True, time.monotonic() - start)
+
+
+def warm_up(
+    client: Client,
+    parallelism: int = DEFAULT_WARM_UP_PARALLELISM,
+    ping: bool = False,
+    timeout: float | None = None,
+) -> list[NodeReadiness]:
+    """
+    Fetch certificates and create channels for all of a client's nodes concurrently.
+
+    With `ping`, each node is also sent a free account balance query for its own
+    account, which proves the node answers requests. Nodes that fail are marked
+    unhealthy in the client's network, exactly as a failed request would, so that
+    requests go to the reachable nodes until the failed ones are readmitted.
+
+    Args:
+        client (Client): The client whose nodes are warmed up.
+        parallelism (int): Maximum number of nodes warmed up at the same time.
+        ping (bool): Whether to send each node a query after creating its channel.
+        timeout (float, optional): The deadline of each ping, in seconds.
+
+    Returns:
+        list[NodeReadiness]: One entry per node, in the order of `client.network.nodes`.
+
+    Raises:
+        ValueError: If parallelism is below 1.
+    """
+    if parallelism < 1:
+        raise ValueError("parallelism must be >= 1")
+
+    network = client.network
+    nodes = list(network.nodes)
+    if not nodes:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(parallelism, len(nodes)), thread_name_prefix="hiero-warm-up") as executor:
+        readiness = list(executor.map(lambda node: _warm_up_node(client, node, ping, timeout), nodes))
+
+    for node, result in zip(nodes, readiness, strict=True):
+        # A single failure may not open the circuit under the configured breaker, so open it outright
+        if not result.ready and node in network._healthy_nodes:
+            node._open_circuit()
+            network._mark_node_unhealthy(node)
+
+    return readiness
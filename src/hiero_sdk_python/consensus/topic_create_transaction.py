@@ -38,6 +38,8 @@ class TopicCreateTransaction(Transaction):
     auto-renew period, auto-renew account, and memo.
     """
 
+    _proto_body_field = "consensusCreateTopic"
+
     def __init__(
         self,
         memo: str | None = None,
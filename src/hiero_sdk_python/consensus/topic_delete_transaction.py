@@ -25,6 +25,8 @@ class TopicDeleteTransaction(Transaction):
 
     """
 
+    _proto_body_field = "consensusDeleteTopic"
+
     def __init__(self, topic_id: TopicId | None = None) -> None:
         super().__init__()
         self.topic_id: TopicId | None = topic_id
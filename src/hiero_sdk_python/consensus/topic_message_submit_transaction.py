@@ -4,7 +4,7 @@ import math
 
 from hiero_sdk_python.channels import _Channel
 from hiero_sdk_python.consensus.topic_id import TopicId
-from hiero_sdk_python.crypto.private_key import PrivateKey
+from hiero_sdk_python.crypto.signer import SigningKey
 from hiero_sdk_python.executable import _Method
 from hiero_sdk_python.hapi.services import consensus_submit_message_pb2, transaction_pb2
 from hiero_sdk_python.hapi.services.schedulable_transaction_body_pb2 import (
@@ -24,6 +24,8 @@ class TopicMessageSubmitTransaction(ChunkedTransaction):
     Supports automatic chunking for large messages.
     """
 
+    _proto_body_field = "consensusSubmitMessage"
+
     def __init__(
         self,
         topic_id: TopicId | None = None,
@@ -244,12 +246,12 @@ class TopicMessageSubmitTransaction(ChunkedTransaction):
         """
         return _Method(transaction_func=channel.topic.submitMessage, query_func=None)
 
-    def sign(self, private_key: PrivateKey) -> TopicMessageSubmitTransaction:
+    def sign(self, private_key: SigningKey) -> TopicMessageSubmitTransaction:
         """
         Signs the transaction using the provided private key.
 
         Args:
-            private_key (PrivateKey): The private key to sign the transaction with.
+            private_key (SigningKey): The private key or Signer to sign the transaction with.
 
         Returns:
             TopicMessageSubmitTransaction: This transaction instance (for chaining).
@@ -27,6 +27,8 @@ from hiero_sdk_python.utils.key_utils import key_to_proto
 class TopicUpdateTransaction(Transaction):
     """Represents a transaction to update a consensus topic."""
 
+    _proto_body_field = "consensusUpdateTopic"
+
     def __init__(
         self,
         topic_id: TopicId | None = None,
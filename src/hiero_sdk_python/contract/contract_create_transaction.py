@@ -83,6 +83,8 @@ class ContractCreateTransaction(Transaction):
             contract creation.
     """
 
+    _proto_body_field = "contractCreateInstance"
+
     def __init__(self, contract_params: ContractCreateParams | None = None):
         """
         Initializes a new ContractCreateTransaction instance.
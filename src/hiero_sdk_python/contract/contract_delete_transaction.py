@@ -32,6 +32,8 @@ class ContractDeleteTransaction(Transaction):
             contract from network state.
     """
 
+    _proto_body_field = "contractDeleteInstance"
+
     def __init__(
         self,
         contract_id: ContractId | None = None,
@@ -25,6 +25,8 @@ class ContractExecuteTransaction(Transaction):
     to send, and any function parameters required for the contract call.
     """
 
+    _proto_body_field = "contractCall"
+
     def __init__(
         self,
         contract_id: ContractId | None = None,
@@ -70,6 +70,8 @@ class ContractUpdateTransaction(Transaction):
     to build and execute a contract update transaction.
     """
 
+    _proto_body_field = "contractUpdateInstance"
+
     def __init__(
         self,
         contract_params: ContractUpdateParams | None = None,
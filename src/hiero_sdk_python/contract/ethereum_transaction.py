@@ -24,6 +24,8 @@ class EthereumTransaction(Transaction):
     transaction execution.
     """
 
+    _proto_body_field = "ethereumTransaction"
+
     def __init__(
         self,
         ethereum_data: bytes | None = None,
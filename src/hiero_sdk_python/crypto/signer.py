@@ -0,0 +1,214 @@
+"""
+hiero_sdk_python.crypto.signer.py.
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Interfaces for keys held outside the process, such as in an HSM or a cloud KMS.
+A Signer can be used wherever a PrivateKey signs: `Transaction.sign`,
+`Client.set_operator` and query payments. Signers receive all the bodies that need
+their signature in one `sign_many` call, so a remote signer costs one round trip per
+transaction, or per batch of transactions with `SigningBackend.sign_transactions`,
+instead of one per node.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Sequence
+from typing import TYPE_CHECKING, TypeVar
+
+from hiero_sdk_python.crypto.private_key import PrivateKey
+
+
+if TYPE_CHECKING:
+    from hiero_sdk_python.crypto.public_key import PublicKey
+
+
+_T = TypeVar("_T")
+
+
+class Signer(ABC):
+    """
+    A signing key whose private half is not available to the SDK.
+
+    Implementations return signatures in the format the network expects for the key
+    type: raw 64-byte Ed25519 signatures, or 64-byte r||s ECDSA(secp256k1) signatures
+    over the keccak-256 digest of the message, as produced by `PrivateKey.sign`.
+    """
+
+    @abstractmethod
+    def public_key(self) -> PublicKey:
+        """Return the public key matching the signatures this signer produces."""
+
+    @abstractmethod
+    def sign_many(self, messages: Sequence[bytes]) -> list[bytes]:
+        """
+        Sign several messages in one request.
+
+        Args:
+            messages (Sequence[bytes]): The messages to sign.
+
+        Returns:
+            list[bytes]: One signature per message, in the same order.
+        """
+
+    def sign(self, message: bytes) -> bytes:
+        """Sign a single message."""
+        return self.sign_many([message])[0]
+
+
+class AsyncSigner(ABC):
+    """
+    A Signer whose `sign_many` is a coroutine, for signing services with an asyncio client.
+
+    The synchronous SDK APIs run the coroutine to completion on a private event loop,
+    so they block the calling thread for the duration of the request.
+    """
+
+    @abstractmethod
+    def public_key(self) -> PublicKey:
+        """Return the public key matching the signatures this signer produces."""
+
+    @abstractmethod
+    async def sign_many(self, messages: Sequence[bytes]) -> list[bytes]:
+        """
+        Sign several messages in one request.
+
+        Args:
+            messages (Sequence[bytes]): The messages to sign.
+
+        Returns:
+            list[bytes]: One signature per message, in the same order.
+        """
+
+
+# Anything that can sign a transaction or a query payment
+SigningKey = PrivateKey | Signer | AsyncSigner
+
+
+def _run_sync(awaitable: Awaitable[_T]) -> _T:
+    """Run an awaitable to completion from synchronous code, even inside a running event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(_await(awaitable))
+
+    # asyncio.run cannot nest, so run the awaitable on a loop of its own in another thread
+    outcome: dict[str, object] = {}
+
+    def target() -> None:
+        try:
+            outcome["result"] = asyncio.run(_await(awaitable))
+        except BaseException as e:  # noqa: BLE001
+            outcome["error"] = e
+
+    thread = threading.Thread(target=target, name="hiero-async-signer")
+    thread.start()
+    thread.join()
+    if "error" in outcome:
+        raise outcome["error"]
+    return outcome["result"]
+
+
+async def _await(awaitable: Awaitable[_T]) -> _T:
+    return await awaitable
+
+
+def sign_many(key: SigningKey, messages: Sequence[bytes]) -> list[bytes]:
+    """
+    Sign several messages with a private key, a Signer or an AsyncSigner.
+
+    Signers are called once for all the messages; nothing is requested when there are none.
+
+    Args:
+        key (SigningKey): The key to sign with.
+        messages (Sequence[bytes]): The messages to sign.
+
+    Returns:
+        list[bytes]: One signature per message, in the same order.
+
+    Raises:
+        ValueError: If a signer returned the wrong number of signatures.
+    """
+    if not messages:
+        return []
+
+    if isinstance(key, Signer):
+        signatures = key.sign_many(list(messages))
+    elif isinstance(key, AsyncSigner):
+        signatures = _run_sync(key.sign_many(list(messages)))
+    else:
+        return [key.sign(message) for message in messages]
+
+    if len(signatures) != len(messages):
+        raise ValueError(f"Signer returned {len(signatures)} signatures for {len(messages)} messages")
+    return list(signatures)
+
+
+class LocalSigner(Signer):
+    """
+    A Signer backed by an in-memory private key, with an optional artificial delay per request.
+
+    Intended for tests and benchmarks that stand in for a remote signer: `calls` counts
+    the requests made and `latency` simulates the round trip of each.
+    """
+
+    def __init__(self, private_key: PrivateKey, latency: float = 0.0) -> None:
+        """
+        Initializes a LocalSigner.
+
+        Args:
+            private_key (PrivateKey): The key that produces the signatures.
+            latency (float): Seconds each `sign_many` call sleeps before returning.
+
+        Raises:
+            ValueError: If latency is negative.
+        """
+        if latency < 0:
+            raise ValueError("latency must be non-negative")
+
+        self._private_key = private_key
+        self.latency = latency
+        self.calls = 0
+
+    def public_key(self) -> PublicKey:
+        return self._private_key.public_key()
+
+    def sign_many(self, messages: Sequence[bytes]) -> list[bytes]:
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return [self._private_key.sign(message) for message in messages]
+
+
+class AsyncLocalSigner(AsyncSigner):
+    """The AsyncSigner counterpart of LocalSigner."""
+
+    def __init__(self, private_key: PrivateKey, latency: float = 0.0) -> None:
+        """
+        Initializes an AsyncLocalSigner.
+
+        Args:
+            private_key (PrivateKey): The key that produces the signatures.
+            latency (float): Seconds each `sign_many` call awaits before returning.
+
+        Raises:
+            ValueError: If latency is negative.
+        """
+        if latency < 0:
+            raise ValueError("latency must be non-negative")
+
+        self._private_key = private_key
+        self.latency = latency
+        self.calls = 0
+
+    def public_key(self) -> PublicKey:
+        return self._private_key.public_key()
+
+    async def sign_many(self, messages: Sequence[bytes]) -> list[bytes]:
+        self.calls += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return [self._private_key.sign(message) for message in messages]
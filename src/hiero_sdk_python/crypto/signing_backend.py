@@ -0,0 +1,236 @@
+"""
+hiero_sdk_python.crypto.signing_backend.py.
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Pluggable backends that compute the signatures transactions attach to their node
+bodies. The in-process default signs on the calling thread;
+ProcessPoolSigningBackend spreads large signing batches over worker processes,
+which is what lets bulk jobs use more than one core despite the GIL.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING
+
+from hiero_sdk_python.crypto.private_key import PrivateKey
+from hiero_sdk_python.crypto.signer import AsyncSigner, Signer, SigningKey, sign_many
+from hiero_sdk_python.hapi.services import basic_types_pb2
+
+
+if TYPE_CHECKING:
+    from multiprocessing.context import BaseContext
+
+    from hiero_sdk_python.transaction.transaction import Transaction
+
+
+# Batches smaller than this are signed in the calling process, where they cost
+# less than the round trip to a worker
+DEFAULT_MIN_PARALLEL_BATCH = 64
+
+# Private keys deserialized in this worker process, keyed by public key bytes
+_WORKER_KEYS: dict[bytes, PrivateKey] = {}
+
+
+def _signature_pair(public_key_bytes: bytes, is_ed25519: bool, signature: bytes) -> basic_types_pb2.SignaturePair:
+    if is_ed25519:
+        return basic_types_pb2.SignaturePair(pubKeyPrefix=public_key_bytes, ed25519=signature)
+    return basic_types_pb2.SignaturePair(pubKeyPrefix=public_key_bytes, ECDSA_secp256k1=signature)
+
+
+def _key_material(private_key: PrivateKey) -> tuple[bytes, bytes, bool]:
+    return private_key.public_key().to_bytes_raw(), private_key.to_bytes_raw(), private_key.is_ed25519()
+
+
+def _load_worker_key(public_key_bytes: bytes, raw_key: bytes, is_ed25519: bool) -> PrivateKey:
+    key = _WORKER_KEYS.get(public_key_bytes)
+    if key is None:
+        key = PrivateKey.from_bytes_ed25519(raw_key) if is_ed25519 else PrivateKey.from_bytes_ecdsa(raw_key)
+        _WORKER_KEYS[public_key_bytes] = key
+    return key
+
+
+def _init_worker(key_material: list[tuple[bytes, bytes, bool]]) -> None:
+    for material in key_material:
+        _load_worker_key(*material)
+
+
+def _sign_in_worker(
+    public_key_bytes: bytes, material: tuple[bytes, bytes, bool] | None, bodies: list[bytes]
+) -> list[bytes]:
+    # Only plain bytes cross the process boundary; protobuf messages do not pickle reliably
+    key = _WORKER_KEYS.get(public_key_bytes)
+    if key is None:
+        if material is None:
+            raise KeyError("signing key is not registered with this worker")
+        key = _load_worker_key(*material)
+    return [key.sign(body) for body in bodies]
+
+
+class SigningBackend(ABC):
+    """
+    Computes signatures over transaction body bytes.
+
+    A Client's backend is picked up by transactions frozen with that client and used
+    by `Transaction.sign`. `sign_transactions` signs many transactions in one batch
+    per key, which is how bulk jobs give a parallel backend enough work.
+    """
+
+    @abstractmethod
+    def sign_bodies(self, private_key: PrivateKey, bodies: Sequence[bytes]) -> list[basic_types_pb2.SignaturePair]:
+        """
+        Sign each body with a key.
+
+        Args:
+            private_key (PrivateKey): The signing key.
+            bodies (Sequence[bytes]): Serialized transaction bodies.
+
+        Returns:
+            list[SignaturePair]: One signature pair per body, in the same order.
+        """
+
+    def sign_with(self, key: SigningKey, bodies: Sequence[bytes]) -> list[basic_types_pb2.SignaturePair]:
+        """
+        Sign each body with a private key or a Signer.
+
+        Private keys are handed to `sign_bodies`. Signers and AsyncSigners hold their
+        own keys, so they are called directly, once for all the bodies.
+
+        Args:
+            key (SigningKey): The key to sign with.
+            bodies (Sequence[bytes]): Serialized transaction bodies.
+
+        Returns:
+            list[SignaturePair]: One signature pair per body, in the same order.
+        """
+        if not isinstance(key, (Signer, AsyncSigner)):
+            return self.sign_bodies(key, bodies)
+
+        public_key = key.public_key()
+        public_key_bytes = public_key.to_bytes_raw()
+        is_ed25519 = public_key.is_ed25519()
+        return [_signature_pair(public_key_bytes, is_ed25519, signature) for signature in sign_many(key, bodies)]
+
+    def sign_transactions(self, transactions: Iterable[Transaction], private_keys: Iterable[SigningKey]) -> None:
+        """
+        Sign every node body of several frozen transactions, one batch per key.
+
+        Bodies that already carry a key's signature are skipped. Signers therefore
+        receive a single request covering all the transactions.
+
+        Args:
+            transactions (Iterable[Transaction]): Frozen transactions.
+            private_keys (Iterable[SigningKey]): The private keys or Signers to sign with.
+
+        Raises:
+            Exception: If a transaction is not frozen.
+        """
+        transactions = list(transactions)
+        for transaction in transactions:
+            transaction._require_frozen()
+
+        for private_key in private_keys:
+            public_key_bytes = private_key.public_key().to_bytes_raw()
+            unsigned = [
+                (transaction, body)
+                for transaction in transactions
+                for body in transaction._transaction_body_bytes.values()
+                if not transaction._is_body_signed_by(body, public_key_bytes)
+            ]
+            pairs = self.sign_with(private_key, [body for _, body in unsigned])
+            for (transaction, body), pair in zip(unsigned, pairs, strict=True):
+                transaction._add_signature_pair(body, pair)
+
+    def close(self) -> None:  # noqa: B027
+        """Release resources held by the backend."""
+
+
+class InProcessSigningBackend(SigningBackend):
+    """Signs on the calling thread. This is the default backend."""
+
+    def sign_bodies(self, private_key: PrivateKey, bodies: Sequence[bytes]) -> list[basic_types_pb2.SignaturePair]:
+        public_key_bytes = private_key.public_key().to_bytes_raw()
+        is_ed25519 = private_key.is_ed25519()
+        return [_signature_pair(public_key_bytes, is_ed25519, private_key.sign(body)) for body in bodies]
+
+
+class ProcessPoolSigningBackend(SigningBackend):
+    """
+    Signs large batches in a pool of worker processes.
+
+    Keys passed to the constructor are loaded into every worker when it starts and
+    never cross the process boundary again. Other keys are sent along with each batch
+    and cached by the workers that receive them. Batches smaller than
+    `min_parallel_batch` are signed in the calling process.
+
+    Example:
+        backend = ProcessPoolSigningBackend(keys=[operator_key, treasury_key])
+        client.set_signing_backend(backend)
+        backend.sign_transactions(frozen_transactions, [operator_key, treasury_key])
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        keys: Iterable[PrivateKey] = (),
+        min_parallel_batch: int = DEFAULT_MIN_PARALLEL_BATCH,
+        mp_context: BaseContext | None = None,
+    ) -> None:
+        """
+        Initializes a ProcessPoolSigningBackend. Worker processes start on first use.
+
+        Args:
+            max_workers (int, optional): Number of worker processes. Defaults to the CPU count.
+            keys (Iterable[PrivateKey]): Keys to load into every worker up front.
+            min_parallel_batch (int): Smallest batch signed in the worker processes.
+            mp_context (BaseContext, optional): The multiprocessing context for the pool.
+
+        Raises:
+            ValueError: If max_workers or min_parallel_batch are below 1.
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+
+        if min_parallel_batch < 1:
+            raise ValueError("min_parallel_batch must be >= 1")
+
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.min_parallel_batch = min_parallel_batch
+        self._registered = [_key_material(key) for key in keys]
+        self._registered_ids = {material[0] for material in self._registered}
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(self._registered,),
+        )
+        self._in_process = InProcessSigningBackend()
+
+    def sign_bodies(self, private_key: PrivateKey, bodies: Sequence[bytes]) -> list[basic_types_pb2.SignaturePair]:
+        if len(bodies) < self.min_parallel_batch:
+            return self._in_process.sign_bodies(private_key, bodies)
+
+        material = _key_material(private_key)
+        public_key_bytes, _, is_ed25519 = material
+        if public_key_bytes in self._registered_ids:
+            material = None
+
+        # One slice per worker keeps the per-task pickling overhead to a minimum
+        size = math.ceil(len(bodies) / self.max_workers)
+        futures = [
+            self._executor.submit(_sign_in_worker, public_key_bytes, material, list(bodies[start : start + size]))
+            for start in range(0, len(bodies), size)
+        ]
+
+        pairs: list[basic_types_pb2.SignaturePair] = []
+        for future in futures:
+            pairs.extend(_signature_pair(public_key_bytes, is_ed25519, signature) for signature in future.result())
+        return pairs
+
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
@@ -7,7 +7,7 @@ import warnings
 from abc import ABC, abstractmethod
 from collections.abc import Callable
 from enum import IntEnum
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 import grpc
 
@@ -17,7 +17,32 @@ from hiero_sdk_python.exceptions import MaxAttemptsError
 from hiero_sdk_python.hapi.services import query_pb2, transaction_pb2
 from hiero_sdk_python.lockable_list import _LockableList
 from hiero_sdk_python.logger.logger import Logger
+from hiero_sdk_python.metrics import (
+    BACKOFF_SECONDS,
+    EXECUTION_ATTEMPTS,
+    EXECUTION_STATE_TOTAL,
+    GRPC_ERRORS_TOTAL,
+    GRPC_LATENCY_SECONDS,
+    NODE_BAD_GRPC_RESPONSES,
+    RATE_LIMIT_TPS,
+    MetricsSink,
+)
+from hiero_sdk_python.rate_limiter import THROTTLE_STATUSES, AdaptiveRateLimiter
 from hiero_sdk_python.response_code import ResponseCode
+from hiero_sdk_python.tracing import (
+    ATTR_ATTEMPT,
+    ATTR_BACKOFF,
+    ATTR_EXECUTION_STATE,
+    ATTR_GRPC_STATUS,
+    ATTR_METHOD,
+    ATTR_NODE,
+    ATTR_STATUS,
+    SPAN_BACKOFF,
+    SPAN_GRPC_CALL,
+    _end_span,
+    _span,
+    _start_span,
+)
 
 
 if TYPE_CHECKING:
@@ -80,6 +105,9 @@ class _Executable(ABC):
     to define specific behavior for different types of operations.
     """
 
+    # Whether attempts wait for the client's and the node's adaptive rate limiters
+    _rate_limited: ClassVar[bool] = False
+
     def __init__(self):
         self._max_attempts: int | None = None
         self._max_backoff: float | None = None
@@ -168,6 +196,9 @@ class _Executable(ABC):
         """
         Set the gRPC call deadline (per attempt).
 
+        An attempt's deadline never extends past the request timeout: when less time
+        is left, the call is cancelled when the request timeout expires.
+
         Args:
             grpc_deadline (int | float): gRPC deadline in seconds.
                 Must be greater than zero.
@@ -196,6 +227,9 @@ class _Executable(ABC):
         """
         Set the total execution timeout for this operation.
 
+        The timeout bounds the whole execution, including gRPC calls, retry backoff
+        and waiting for rate limits.
+
         Args:
             request_timeout (Union[int,float]: Total execution timeout in seconds.
                 Must be greater than zero.
@@ -375,24 +409,56 @@ class _Executable(ABC):
 
         return True
 
+    def _rate_limiters(self, client: Client, node) -> list[AdaptiveRateLimiter]:
+        """Return the rate limiters an attempt of this request must wait for: the node's, then the client's."""
+        if not self._rate_limited:
+            return []
+        # The node's limiter goes first, so that waiting on a throttled node holds no client-wide token
+        limiters = (getattr(node, "_rate_limiter", None), getattr(client, "rate_limiter", None))
+        return [limiter for limiter in limiters if isinstance(limiter, AdaptiveRateLimiter)]
+
+    def _remaining_time(self, start: float) -> float:
+        """Return the seconds left of the request timeout of an execution started at `start`."""
+        return max(0.0, self._request_timeout - (time.monotonic() - start))
+
     def _calculate_backoff(self, attempt: int):
         """Calculate backoff for the given attempt, attempt start from 0."""
         return min(self._max_backoff, self._min_backoff * (2 ** (attempt + 1)))
 
-    def _handle_unhealthy_node(self, proto_request, attempt, logger, err) -> bool:
-        """Handle node switching and backoff for unhealthy node."""
+    def _handle_unhealthy_node(
+        self,
+        proto_request,
+        attempt,
+        logger,
+        err,
+        metrics: MetricsSink | None = None,
+        max_delay: float | None = None,
+        retry_later: bool = False,
+    ) -> bool:
+        """
+        Handle node switching and backoff for unhealthy node, waiting at most `max_delay` seconds.
+
+        When `retry_later` is set, some node may still accept requests, so running out of
+        nodes waits and starts over from the first one instead of raising.
+        """
         # Check if the request is a transaction receipt or record because they are single node requests
-        if _is_transaction_receipt_or_record_request(proto_request):
+        single_node = _is_transaction_receipt_or_record_request(proto_request)
+        last_node = self._node_account_ids.index == len(self._node_account_ids) - 1
+        if single_node or (last_node and retry_later):
             _delay_for_attempt(
                 self._get_request_id(),
-                self._min_backoff,
+                self._min_backoff if max_delay is None else min(self._min_backoff, max_delay),
                 attempt,
                 logger,
                 err,
+                metrics=metrics,
+                method_name=self.__class__.__name__,
             )
+            if not single_node:
+                self._node_account_ids.advance()
             return True
 
-        if self._node_account_ids.index == len(self._node_account_ids) - 1:
+        if last_node:
             raise RuntimeError("All nodes are unhealthy")
 
         self._node_account_ids.advance()
@@ -426,104 +492,181 @@ class _Executable(ABC):
         tx_id = getattr(self, "transaction_id", None)
 
         logger = client.logger
+        metrics = client.metrics
+        method_name = self.__class__.__name__
+        grpc_attempts = 0
         start = time.monotonic()
 
-        for attempt in range(self._max_attempts):
-            if time.monotonic() - start >= self._request_timeout:
-                break
-
-            # Select node
-            node_id = self._node_account_ids.current
-            node = client.network._get_node(node_id)
-
-            if node is None:
-                raise RuntimeError(f"No node found for node_account_id: {self._node_account_ids.current}")
-
-            # Create a channel wrapper from the client's channel
-            channel = node._get_channel()
-
-            logger.trace(
-                "Executing",
-                "requestId",
-                self._get_request_id(),
-                "nodeAccountID",
-                self._node_account_ids.current,
-                "attempt",
-                attempt + 1,
-                "maxAttempts",
-                self._max_attempts,
-            )
-
-            # Get the appropriate gRPC method to call
-            method = self._get_method(channel)
-
-            # Build the request using the executable's _make_request method
-            proto_request = self._make_request()
-
-            if not node.is_healthy():
-                self._handle_unhealthy_node(proto_request, attempt, logger, err_persistant)
-                continue
-
-            # Execute the GRPC call
-            try:
-                logger.trace("Executing gRPC call", "requestId", self._get_request_id())
-                response = _execute_method(method, proto_request, self._grpc_deadline)
-
-            except Exception as e:
-                if not self._should_retry_exponentially(e):
-                    raise e
-
-                client.network._increase_backoff(node)
-                err_persistant = e
-                self._node_account_ids.advance()
-                continue
-
-            client.network._decrease_backoff(node)
-
-            # Map the response to an error
-            status_error = self._map_status_error(response)
-
-            # Determine if we should retry based on the response
-            execution_state = self._should_retry(response)
-            logger.trace(
-                f"{self.__class__.__name__} status received",
-                "nodeAccountID",
-                self._node_account_ids.current,
-                "network",
-                client.network.network,
-                "state",
-                execution_state.name,
-                "txID",
-                tx_id,
-            )
-
-            # Handle the execution state
-            match execution_state:
-                case _ExecutionState.RETRY:
-                    if status_error.status == ResponseCode.INVALID_NODE_ACCOUNT:
-                        client.network._increase_backoff(node)
-                        # update nodes from the mirror_node
-                        client.update_network()
-                        self._node_account_ids.advance()
-
-                    # If we should retry, wait for the backoff period and try again
-                    err_persistant = status_error
-                    _delay_for_attempt(
-                        self._get_request_id(),
-                        self._calculate_backoff(attempt),
-                        attempt,
-                        logger,
-                        err_persistant,
+        try:
+            for attempt in range(self._max_attempts):
+                remaining = self._remaining_time(start)
+                if remaining <= 0:
+                    break
+
+                # Select node
+                node_id = self._node_account_ids.current
+                node = client.network._get_node(node_id)
+
+                # Placeholder nodes of a background bootstrap have no certificate hash to open TLS channels with
+                if _awaits_address_book(client, node):
+                    if not client.network.wait_for_bootstrap(remaining):
+                        break
+                    node = client.network._get_node(node_id)
+
+                if node is None:
+                    raise RuntimeError(f"No node found for node_account_id: {self._node_account_ids.current}")
+
+                # Create a channel wrapper from the client's channel
+                channel = node._get_channel()
+
+                logger.trace(
+                    "Executing",
+                    "requestId",
+                    self._get_request_id(),
+                    "nodeAccountID",
+                    self._node_account_ids.current,
+                    "attempt",
+                    attempt + 1,
+                    "maxAttempts",
+                    self._max_attempts,
+                )
+
+                # Get the appropriate gRPC method to call
+                method = self._get_method(channel)
+
+                # Build the request using the executable's _make_request method
+                proto_request = self._make_request()
+
+                # A half-open circuit only lets a limited number of probe requests through
+                if not node.is_healthy() or not node._allow_request():
+                    # A half-open node whose probes are all taken is busy, not down
+                    retry_later = any(
+                        candidate is not None and candidate.is_healthy()
+                        for candidate in map(client.network._get_node, self._node_account_ids.get_list())
+                    )
+                    self._handle_unhealthy_node(
+                        proto_request, attempt, logger, err_persistant, metrics, remaining, retry_later
                     )
                     continue
-                case _ExecutionState.EXPIRED:
-                    raise status_error
-                case _ExecutionState.ERROR:
-                    raise status_error
-                case _ExecutionState.FINISHED:
-                    # If the transaction completed successfully, map the response and return it
-                    logger.trace(f"{self.__class__.__name__} finished execution")
-                    return self._map_response(response, self._node_account_ids.current, proto_request)
+
+                labels = {"node": str(node_id), "method": method_name}
+
+                rate_limiters = self._rate_limiters(client, node)
+                if rate_limiters:
+                    acquired = _acquire_rate_limits(rate_limiters, remaining)
+                    remaining = self._remaining_time(start)
+                    if not acquired or remaining <= 0:
+                        if acquired:
+                            _release_rate_limits(rate_limiters)
+                        node._release_request()
+                        break
+
+                # An attempt may not outlive the request: its deadline is clipped to the remaining time
+                attempt_deadline = min(self._grpc_deadline, remaining)
+
+                # Execute the GRPC call
+                grpc_attempts += 1
+                grpc_span = _start_span(
+                    SPAN_GRPC_CALL,
+                    {ATTR_NODE: node_id, ATTR_ATTEMPT: attempt + 1, ATTR_METHOD: method_name},
+                )
+                call_start = time.perf_counter()
+                try:
+                    logger.trace("Executing gRPC call", "requestId", self._get_request_id())
+                    response = _execute_method(method, proto_request, attempt_deadline)
+
+                except Exception as e:
+                    metrics.observe(GRPC_LATENCY_SECONDS, time.perf_counter() - call_start, labels)
+                    metrics.increment(GRPC_ERRORS_TOTAL, labels={**labels, "code": _error_code_name(e)})
+                    _end_span(grpc_span, {ATTR_GRPC_STATUS: _error_code_name(e)}, error=e)
+
+                    if rate_limiters and _error_code_name(e) == grpc.StatusCode.RESOURCE_EXHAUSTED.name:
+                        _update_rate_limits(metrics, client, node, rate_limiters, throttled=True)
+
+                    if not self._should_retry_exponentially(e):
+                        node._release_request()
+                        raise e
+
+                    # The request ran out of time, not the node: do not count it against the node
+                    if attempt_deadline < self._grpc_deadline and _error_code_name(e) == "DEADLINE_EXCEEDED":
+                        node._release_request()
+                        err_persistant = e
+                        break
+
+                    client.network._increase_backoff(node)
+                    _record_node_health(metrics, node)
+                    err_persistant = e
+                    self._node_account_ids.advance()
+                    continue
+
+                metrics.observe(GRPC_LATENCY_SECONDS, time.perf_counter() - call_start, labels)
+
+                try:
+                    # Map the response to an error
+                    status_error = self._map_status_error(response)
+
+                    # Determine if we should retry based on the response
+                    execution_state = self._should_retry(response)
+                except Exception as e:
+                    # The node answered, but the response could not be handled: free its probe permit
+                    node._release_request()
+                    _end_span(grpc_span, error=e)
+                    raise
+
+                client.network._decrease_backoff(node)
+
+                _end_span(
+                    grpc_span,
+                    {ATTR_STATUS: getattr(status_error, "status", None), ATTR_EXECUTION_STATE: execution_state},
+                )
+                if rate_limiters:
+                    throttled = getattr(status_error, "status", None) in THROTTLE_STATUSES
+                    _update_rate_limits(metrics, client, node, rate_limiters, throttled)
+                metrics.increment(EXECUTION_STATE_TOTAL, labels={**labels, "state": execution_state.name})
+                logger.trace(
+                    f"{self.__class__.__name__} status received",
+                    "nodeAccountID",
+                    self._node_account_ids.current,
+                    "network",
+                    client.network.network,
+                    "state",
+                    execution_state.name,
+                    "txID",
+                    tx_id,
+                )
+
+                # Handle the execution state
+                match execution_state:
+                    case _ExecutionState.RETRY:
+                        if status_error.status == ResponseCode.INVALID_NODE_ACCOUNT:
+                            client.network._increase_backoff(node)
+                            _record_node_health(metrics, node)
+                            # update nodes from the mirror node in the background
+                            client._request_network_update()
+                            self._node_account_ids.advance()
+
+                        # If we should retry, wait for the backoff period and try again
+                        err_persistant = status_error
+                        _delay_for_attempt(
+                            self._get_request_id(),
+                            min(self._calculate_backoff(attempt), self._remaining_time(start)),
+                            attempt,
+                            logger,
+                            err_persistant,
+                            metrics=metrics,
+                            method_name=method_name,
+                        )
+                        continue
+                    case _ExecutionState.EXPIRED:
+                        raise status_error
+                    case _ExecutionState.ERROR:
+                        raise status_error
+                    case _ExecutionState.FINISHED:
+                        # If the transaction completed successfully, map the response and return it
+                        logger.trace(f"{self.__class__.__name__} finished execution")
+                        return self._map_response(response, self._node_account_ids.current, proto_request)
+        finally:
+            metrics.observe(EXECUTION_ATTEMPTS, grpc_attempts, {"method": method_name})
 
         logger.error(
             "Exceeded maximum attempts for request",
@@ -539,6 +682,68 @@ class _Executable(ABC):
         )
 
 
+def _awaits_address_book(client: Client, node) -> bool:
+    """Return whether a TLS node has no address book yet because the network is still bootstrapping."""
+    return (
+        node is not None
+        and node._address_book is None
+        and not node._root_certificates
+        and node._address._is_transport_security()
+        and client.network._bootstrapping()
+    )
+
+
+def _error_code_name(err: Exception) -> str:
+    """Return the gRPC status code name of an error, or its type name for non-gRPC errors."""
+    if isinstance(err, grpc.RpcError) and callable(getattr(err, "code", None)):
+        code = err.code()
+        return getattr(code, "name", str(code))
+    return type(err).__name__
+
+
+def _acquire_rate_limits(limiters: list[AdaptiveRateLimiter], timeout: float) -> bool:
+    """
+    Take a token from every limiter within `timeout` seconds.
+
+    Returns False if the request timed out waiting, after giving back the tokens already taken.
+    """
+    deadline = time.monotonic() + timeout
+    acquired: list[AdaptiveRateLimiter] = []
+    for limiter in limiters:
+        if not limiter.acquire(max(0.0, deadline - time.monotonic())):
+            _release_rate_limits(acquired)
+            return False
+        acquired.append(limiter)
+    return True
+
+
+def _release_rate_limits(limiters: list[AdaptiveRateLimiter]) -> None:
+    """Give back the tokens of a request that was not sent."""
+    for limiter in limiters:
+        limiter.release()
+
+
+def _update_rate_limits(
+    metrics: MetricsSink, client: Client, node, limiters: list[AdaptiveRateLimiter], throttled: bool
+) -> None:
+    """Feed the outcome of an attempt to its rate limiters and publish their rates."""
+    for limiter in limiters:
+        if throttled:
+            limiter.on_throttle()
+        else:
+            limiter.on_success()
+
+        if limiter is getattr(client, "rate_limiter", None):
+            metrics.set_gauge(RATE_LIMIT_TPS, limiter.rate, {"scope": "client"})
+        else:
+            metrics.set_gauge(RATE_LIMIT_TPS, limiter.rate, {"scope": "node", "node": str(node._account_id)})
+
+
+def _record_node_health(metrics: MetricsSink, node) -> None:
+    """Publish the bad response count of a node; the network publishes its healthy node count itself."""
+    metrics.set_gauge(NODE_BAD_GRPC_RESPONSES, node._bad_grpc_response_count, {"node": str(node._account_id)})
+
+
 def _is_transaction_receipt_or_record_request(
     request: transaction_pb2.Transaction | query_pb2.Query,
 ) -> bool:
@@ -548,13 +753,23 @@ def _is_transaction_receipt_or_record_request(
     return request.HasField("transactionGetReceipt") or request.HasField("transactionGetRecord")
 
 
-def _delay_for_attempt(request_id: str, backoff: float, attempt: int, logger: Logger, error) -> None:
+def _delay_for_attempt(
+    request_id: str,
+    backoff: float,
+    attempt: int,
+    logger: Logger,
+    error,
+    metrics: MetricsSink | None = None,
+    method_name: str | None = None,
+) -> None:
     """
     Delay for the specified backoff period before retrying.
 
     Args:
         attempt (int): The current attempt number (0-based)
         backoff (float): The current backoff period in seconds
+        metrics (MetricsSink, optional): Sink that records the time spent backing off
+        method_name (str, optional): The executable class name used as the metric label
     """
     logger.trace(
         "Retrying request attempt",
@@ -567,7 +782,11 @@ def _delay_for_attempt(request_id: str, backoff: float, attempt: int, logger: Lo
         "error",
         error,
     )
-    time.sleep(backoff)
+    if metrics is not None:
+        metrics.observe(BACKOFF_SECONDS, backoff, {"method": method_name})
+
+    with _span(SPAN_BACKOFF, {ATTR_BACKOFF: backoff, ATTR_ATTEMPT: attempt + 1, ATTR_METHOD: method_name}):
+        time.sleep(backoff)
 
 
 def _execute_method(method, proto_request, timeout: float):
@@ -0,0 +1,515 @@
+"""
+Offline fee calculator.
+
+Computes `FeeEstimateResponse`-compatible fee estimates in-process from the
+network's fee schedule and exchange rate, avoiding an HTTP round-trip to the
+mirror node's `/network/fees` endpoint for every estimate. Both files are
+fetched from the network and cached for a configurable TTL.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from google.protobuf.message import Message
+
+from hiero_sdk_python.fees.fee_estimate import FeeEstimate
+from hiero_sdk_python.fees.fee_estimate_mode import FeeEstimateMode
+from hiero_sdk_python.fees.fee_estimate_response import FeeEstimateResponse
+from hiero_sdk_python.fees.fee_extra import FeeExtra
+from hiero_sdk_python.fees.network_fee import NetworkFee
+from hiero_sdk_python.file.file_contents_query import FileContentsQuery
+from hiero_sdk_python.file.file_id import FileId
+from hiero_sdk_python.hapi.fees import fee_schedule_pb2
+from hiero_sdk_python.hapi.services import (
+    basic_types_pb2,
+    exchange_rate_pb2,
+    transaction_contents_pb2,
+    transaction_pb2,
+)
+from hiero_sdk_python.query.fee_estimate_query import FeeEstimateQuery
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from hiero_sdk_python.client.client import Client
+    from hiero_sdk_python.transaction.transaction import Transaction
+
+
+# System files holding the fee schedule and the hbar/cent exchange rate
+FEE_SCHEDULE_FILE_ID = FileId(0, 0, 113)
+EXCHANGE_RATE_FILE_ID = FileId(0, 0, 112)
+
+DEFAULT_TTL_SECONDS = 3600.0
+
+# TransactionBody fields whose HederaFunctionality name is not the capitalized field name
+_FUNCTIONALITY_NAMES: dict[str, str] = {
+    "atomic_batch": "AtomicBatch",
+    "contractCreateInstance": "ContractCreate",
+    "contractDeleteInstance": "ContractDelete",
+    "contractUpdateInstance": "ContractUpdate",
+    "cryptoCreateAccount": "CryptoCreate",
+    "cryptoUpdateAccount": "CryptoUpdate",
+    "tokenAssociate": "TokenAssociateToAccount",
+    "tokenCreation": "TokenCreate",
+    "tokenDeletion": "TokenDelete",
+    "tokenDissociate": "TokenDissociateFromAccount",
+    "tokenFreeze": "TokenFreezeAccount",
+    "tokenGrantKyc": "TokenGrantKycToAccount",
+    "tokenRevokeKyc": "TokenRevokeKycFromAccount",
+    "tokenUnfreeze": "TokenUnfreezeAccount",
+    "tokenWipe": "TokenAccountWipe",
+    "token_fee_schedule_update": "TokenFeeScheduleUpdate",
+    "token_pause": "TokenPause",
+    "token_unpause": "TokenUnpause",
+    "token_update_nfts": "TokenUpdateNfts",
+    "util_prng": "UtilPrng",
+}
+
+
+class UnsupportedFeeEstimate(ValueError):
+    """Raised when a transaction cannot be priced offline from the cached fee schedule."""
+
+
+@dataclass(frozen=True)
+class ExchangeRate:
+    """
+    Hbar to USD cent exchange rate published in the exchange rate file.
+
+    Attributes:
+        hbar_equivalent (int): Number of hbars equivalent to `cent_equivalent` cents.
+        cent_equivalent (int): Number of cents equivalent to `hbar_equivalent` hbars.
+        expiration_time (int): Epoch seconds after which the rate is superseded.
+    """
+
+    hbar_equivalent: int
+    cent_equivalent: int
+    expiration_time: int = 0
+
+    @classmethod
+    def _from_proto(cls, proto: exchange_rate_pb2.ExchangeRate) -> ExchangeRate:
+        return cls(
+            hbar_equivalent=proto.hbarEquiv,
+            cent_equivalent=proto.centEquiv,
+            expiration_time=proto.expirationTime.seconds,
+        )
+
+    def to_tinybars(self, tinycents: int) -> int:
+        """Convert an amount in tinycents into tinybars, rounding down."""
+        if self.cent_equivalent <= 0:
+            raise ValueError("Exchange rate has no cent equivalent")
+        return tinycents * self.hbar_equivalent // self.cent_equivalent
+
+
+# ---------------------------------------------------------------------------
+# Extra counters
+#
+# Each counter receives the decoded TransactionBody and the signed transaction
+# and returns how many units of the extra the transaction uses.
+# ---------------------------------------------------------------------------
+
+
+def _count_keys(message: Message) -> int:
+    """Count primitive keys anywhere in a message, expanding key lists and threshold keys."""
+    if isinstance(message, basic_types_pb2.Key):
+        key_type = message.WhichOneof("key")
+        if key_type == "keyList":
+            return sum(_count_keys(key) for key in message.keyList.keys)
+        if key_type == "thresholdKey":
+            return sum(_count_keys(key) for key in message.thresholdKey.keys.keys)
+        return 1 if key_type else 0
+
+    count = 0
+    for descriptor, value in message.ListFields():
+        if descriptor.message_type is None:
+            continue
+        if descriptor.is_repeated:
+            count += sum(_count_keys(item) for item in value)
+        else:
+            count += _count_keys(value)
+    return count
+
+
+def _count_accounts(body: transaction_pb2.TransactionBody) -> int:
+    transfer = body.cryptoTransfer
+    accounts = {adjustment.accountID.SerializeToString() for adjustment in transfer.transfers.accountAmounts}
+    for token_transfers in transfer.tokenTransfers:
+        accounts.update(adjustment.accountID.SerializeToString() for adjustment in token_transfers.transfers)
+        for nft_transfer in token_transfers.nftTransfers:
+            accounts.add(nft_transfer.senderAccountID.SerializeToString())
+            accounts.add(nft_transfer.receiverAccountID.SerializeToString())
+    return len(accounts)
+
+
+def _count_token_types(body: transaction_pb2.TransactionBody) -> int:
+    field = body.WhichOneof("data")
+    if field in ("cryptoTransfer", "tokenAirdrop"):
+        return len(getattr(body, field).tokenTransfers)
+    if field in ("tokenAssociate", "tokenDissociate"):
+        return len(getattr(body, field).tokens)
+    return 0
+
+
+def _count_nft_serials(body: transaction_pb2.TransactionBody) -> int:
+    field = body.WhichOneof("data")
+    if field in ("cryptoTransfer", "tokenAirdrop"):
+        return sum(len(token_transfers.nftTransfers) for token_transfers in getattr(body, field).tokenTransfers)
+    if field == "tokenMint":
+        return len(body.tokenMint.metadata)
+    if field in ("tokenBurn", "tokenWipe"):
+        return len(getattr(body, field).serialNumbers)
+    if field == "token_update_nfts":
+        return len(body.token_update_nfts.serial_numbers)
+    return 0
+
+
+def _count_gas(body: transaction_pb2.TransactionBody) -> int:
+    field = body.WhichOneof("data")
+    if field in ("contractCall", "contractCreateInstance"):
+        return getattr(body, field).gas
+    raise UnsupportedFeeEstimate(f"Gas cannot be determined offline for {field}")
+
+
+def _count_allowances(body: transaction_pb2.TransactionBody) -> int:
+    approve = body.cryptoApproveAllowance
+    delete = body.cryptoDeleteAllowance
+    return (
+        len(approve.cryptoAllowances)
+        + len(approve.tokenAllowances)
+        + len(approve.nftAllowances)
+        + len(delete.nftAllowances)
+    )
+
+
+def _count_airdrops(body: transaction_pb2.TransactionBody) -> int:
+    field = body.WhichOneof("data")
+    if field in ("tokenCancelAirdrop", "tokenClaimAirdrop"):
+        return len(getattr(body, field).pending_airdrops)
+    return 0
+
+
+_EXTRA_COUNTERS: dict[int, Callable[[transaction_pb2.TransactionBody, transaction_pb2.Transaction], int]] = {
+    fee_schedule_pb2.SIGNATURES: lambda _body, proto: len(
+        transaction_contents_pb2.SignedTransaction.FromString(proto.signedTransactionBytes).sigMap.sigPair
+    ),
+    fee_schedule_pb2.PROCESSING_BYTES: lambda _body, proto: proto.ByteSize(),
+    fee_schedule_pb2.KEYS: lambda body, _proto: _count_keys(body),
+    fee_schedule_pb2.ACCOUNTS: lambda body, _proto: _count_accounts(body),
+    fee_schedule_pb2.TOKEN_TYPES: lambda body, _proto: _count_token_types(body),
+    fee_schedule_pb2.NFT_SERIALS: lambda body, _proto: _count_nft_serials(body),
+    fee_schedule_pb2.GAS: lambda body, _proto: _count_gas(body),
+    fee_schedule_pb2.ALLOWANCES: lambda body, _proto: _count_allowances(body),
+    fee_schedule_pb2.AIRDROPS: lambda body, _proto: _count_airdrops(body),
+}
+
+
+class FeeCalculator:
+    """
+    Estimates transaction fees locally from a cached fee schedule.
+
+    The fee schedule and exchange rate are read from the network's system files
+    (see `refresh`) and reused until the TTL expires, so estimating a transaction
+    costs no network round-trip. Results use the same units and structure as the
+    mirror node's estimates (tinycents), and `to_tinybars` converts them with the
+    cached exchange rate.
+
+    Only INTRINSIC estimates can be computed offline. STATE estimates, high-volume
+    transactions and transactions that need an extra the calculator cannot count
+    (for example the gas of an Ethereum transaction) are sent to the mirror node
+    through `FeeEstimateQuery` when a client is available, and raise
+    `UnsupportedFeeEstimate` otherwise.
+
+    Example:
+        calculator = FeeCalculator(ttl=600)
+        estimate = calculator.estimate(transaction, client)
+        tinybars = calculator.to_tinybars(estimate.total)
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_TTL_SECONDS,
+        fallback_to_remote: bool = True,
+        fee_schedule_file_id: FileId = FEE_SCHEDULE_FILE_ID,
+        exchange_rate_file_id: FileId = EXCHANGE_RATE_FILE_ID,
+    ) -> None:
+        """
+        Initialize a calculator with an empty cache.
+
+        Args:
+            ttl (float): Seconds a fetched fee schedule and exchange rate stay fresh.
+            fallback_to_remote (bool): Whether to ask the mirror node for estimates
+                that cannot be computed offline.
+            fee_schedule_file_id (FileId): The file holding the fee schedule.
+            exchange_rate_file_id (FileId): The file holding the exchange rate.
+        """
+        if ttl <= 0:
+            raise ValueError("ttl must be > 0")
+
+        self.ttl = ttl
+        self.fallback_to_remote = fallback_to_remote
+        self.fee_schedule_file_id = fee_schedule_file_id
+        self.exchange_rate_file_id = exchange_rate_file_id
+
+        self._lock = threading.Lock()
+        self._fee_schedule: fee_schedule_pb2.FeeSchedule | None = None
+        self._exchange_rate: ExchangeRate | None = None
+        self._fetched_at: float | None = None
+
+    # -------------------------------------------------------------------------
+    # Cache
+    # -------------------------------------------------------------------------
+
+    @property
+    def fee_schedule(self) -> fee_schedule_pb2.FeeSchedule | None:
+        """Return the cached fee schedule, if any."""
+        return self._fee_schedule
+
+    @property
+    def exchange_rate(self) -> ExchangeRate | None:
+        """Return the cached exchange rate, if any."""
+        return self._exchange_rate
+
+    @property
+    def is_stale(self) -> bool:
+        """Return True when nothing is cached or the cache is older than the TTL."""
+        return self._fetched_at is None or time.monotonic() - self._fetched_at >= self.ttl
+
+    def set_fee_schedule(
+        self,
+        fee_schedule: fee_schedule_pb2.FeeSchedule | bytes,
+        exchange_rate: ExchangeRate | None = None,
+    ) -> FeeCalculator:
+        """
+        Load a fee schedule (and optionally an exchange rate) without contacting the network.
+
+        Args:
+            fee_schedule (FeeSchedule | bytes): The schedule, or the raw contents of the fee schedule file.
+            exchange_rate (ExchangeRate, optional): The exchange rate to convert totals to tinybars.
+
+        Returns:
+            FeeCalculator: This calculator instance.
+        """
+        if isinstance(fee_schedule, bytes):
+            fee_schedule = fee_schedule_pb2.FeeSchedule.FromString(fee_schedule)
+
+        if not isinstance(fee_schedule, fee_schedule_pb2.FeeSchedule):
+            raise TypeError("fee_schedule must be a FeeSchedule or bytes")
+
+        with self._lock:
+            self._fee_schedule = fee_schedule
+            if exchange_rate is not None:
+                self._exchange_rate = exchange_rate
+            self._fetched_at = time.monotonic()
+        return self
+
+    def refresh(self, client: Client) -> FeeCalculator:
+        """
+        Fetch the fee schedule and exchange rate from the network and reset the TTL.
+
+        Args:
+            client (Client): The client used to query the system files.
+
+        Returns:
+            FeeCalculator: This calculator instance.
+        """
+        schedule_bytes = FileContentsQuery(self.fee_schedule_file_id).execute(client)
+        rate_bytes = FileContentsQuery(self.exchange_rate_file_id).execute(client)
+
+        exchange_rates = exchange_rate_pb2.ExchangeRateSet.FromString(rate_bytes)
+        return self.set_fee_schedule(schedule_bytes, ExchangeRate._from_proto(exchange_rates.currentRate))
+
+    def _ensure_fresh(self, client: Client | None) -> None:
+        if client is not None and self.is_stale:
+            self.refresh(client)
+
+        if self._fee_schedule is None:
+            raise UnsupportedFeeEstimate("No fee schedule loaded; call refresh() or set_fee_schedule() first")
+
+    # -------------------------------------------------------------------------
+    # Estimation
+    # -------------------------------------------------------------------------
+
+    def estimate(
+        self,
+        transaction: Transaction,
+        client: Client | None = None,
+        mode: FeeEstimateMode = FeeEstimateMode.INTRINSIC,
+    ) -> FeeEstimateResponse:
+        """
+        Estimate the fees of a transaction.
+
+        The transaction is frozen with `client` if needed. Multi-chunk transactions are
+        estimated chunk by chunk and aggregated, as `FeeEstimateQuery` does.
+
+        Args:
+            transaction (Transaction): The transaction to estimate.
+            client (Client, optional): Used to refresh a stale cache, to freeze the
+                transaction and for the remote fallback.
+            mode (FeeEstimateMode): The estimation mode. Only INTRINSIC is computed offline.
+
+        Returns:
+            FeeEstimateResponse: The estimated fees, in tinycents.
+
+        Raises:
+            UnsupportedFeeEstimate: If the estimate cannot be computed offline and
+                no remote fallback is possible.
+        """
+        try:
+            if mode != FeeEstimateMode.INTRINSIC:
+                raise UnsupportedFeeEstimate(f"{mode.value} estimates require network state")
+
+            if transaction.high_volume:
+                raise UnsupportedFeeEstimate("High-volume pricing depends on current throttle utilization")
+
+            self._ensure_fresh(client)
+
+            if not transaction._transaction_body_bytes:
+                transaction.freeze_with(client)
+
+            if transaction.get_required_chunks() > 1:
+                return _aggregate(
+                    [
+                        self._estimate_proto(transaction._chunk_to_proto(i))
+                        for i in range(len(transaction._transaction_ids))
+                    ]
+                )
+
+            return self._estimate_proto(transaction._to_proto())
+
+        except UnsupportedFeeEstimate:
+            if not self.fallback_to_remote or client is None:
+                raise
+            return FeeEstimateQuery().set_mode(mode).set_transaction(transaction).execute(client)
+
+    def to_tinybars(self, tinycents: int) -> int:
+        """
+        Convert a fee in tinycents into tinybars with the cached exchange rate.
+
+        Raises:
+            ValueError: If no exchange rate is cached.
+        """
+        if self._exchange_rate is None:
+            raise ValueError("No exchange rate loaded")
+        return self._exchange_rate.to_tinybars(tinycents)
+
+    def _estimate_proto(self, proto: transaction_pb2.Transaction) -> FeeEstimateResponse:
+        """Compute the INTRINSIC fees of one serialized transaction."""
+        schedule = self._fee_schedule
+        signed = transaction_contents_pb2.SignedTransaction.FromString(proto.signedTransactionBytes)
+        body = transaction_pb2.TransactionBody.FromString(signed.bodyBytes)
+
+        field = body.WhichOneof("data")
+        if field is None:
+            raise UnsupportedFeeEstimate("Transaction body has no data")
+
+        functionality_name = _FUNCTIONALITY_NAMES.get(field, field[0].upper() + field[1:])
+        try:
+            functionality = basic_types_pb2.HederaFunctionality.Value(functionality_name)
+        except ValueError as e:
+            raise UnsupportedFeeEstimate(f"No HederaFunctionality for transaction body '{field}'") from e
+        service = _find_service_fee(schedule, functionality)
+
+        unit_fees = {extra.name: extra.fee for extra in schedule.extras}
+
+        if service.node_network_fee_exempt:
+            node_fee = FeeEstimate(base=0)
+        else:
+            node_fee = FeeEstimate(
+                base=schedule.node.base_fee,
+                extras=_charge_extras(schedule.node.extras, unit_fees, body, proto),
+            )
+
+        if service.free:
+            service_fee = FeeEstimate(base=0)
+        else:
+            service_fee = FeeEstimate(
+                base=service.base_fee,
+                extras=_charge_extras(service.extras, unit_fees, body, proto),
+            )
+
+        node_total = _estimate_total(node_fee)
+        network_fee = NetworkFee(
+            multiplier=schedule.network.multiplier, subtotal=node_total * schedule.network.multiplier
+        )
+
+        return FeeEstimateResponse(
+            mode=FeeEstimateMode.INTRINSIC,
+            node_fee=node_fee,
+            service_fee=service_fee,
+            network_fee=network_fee,
+            total=node_total + network_fee.subtotal + _estimate_total(service_fee),
+            high_volume_multiplier=1,
+        )
+
+
+def _find_service_fee(
+    schedule: fee_schedule_pb2.FeeSchedule, functionality: int
+) -> fee_schedule_pb2.ServiceFeeDefinition:
+    for service in schedule.services:
+        for definition in service.schedule:
+            if definition.name == functionality:
+                return definition
+
+    name = basic_types_pb2.HederaFunctionality.Name(functionality)
+    raise UnsupportedFeeEstimate(f"Fee schedule has no entry for {name}")
+
+
+def _charge_extras(
+    references: list[fee_schedule_pb2.ExtraFeeReference],
+    unit_fees: dict[int, int],
+    body: transaction_pb2.TransactionBody,
+    proto: transaction_pb2.Transaction,
+) -> list[FeeExtra]:
+    """Price every extra referenced by a node or service fee definition."""
+    extras = []
+    for reference in references:
+        counter = _EXTRA_COUNTERS.get(reference.name)
+        name = fee_schedule_pb2.Extra.Name(reference.name)
+        if counter is None:
+            raise UnsupportedFeeEstimate(f"Extra {name} cannot be counted offline")
+
+        count = counter(body, proto)
+        charged = max(0, count - reference.included_count)
+        fee_per_unit = unit_fees.get(reference.name, 0)
+
+        extras.append(
+            FeeExtra(
+                name=name,
+                included=reference.included_count,
+                count=count,
+                charged=charged,
+                fee_per_unit=fee_per_unit,
+                subtotal=charged * fee_per_unit,
+            )
+        )
+    return extras
+
+
+def _estimate_total(estimate: FeeEstimate) -> int:
+    return estimate.base + sum(extra.subtotal for extra in estimate.extras)
+
+
+def _aggregate(responses: list[FeeEstimateResponse]) -> FeeEstimateResponse:
+    """Sum per-chunk estimates into one response, the way FeeEstimateQuery aggregates chunks."""
+    last = responses[-1]
+    return FeeEstimateResponse(
+        mode=last.mode,
+        node_fee=FeeEstimate(
+            base=sum(response.node_fee.base for response in responses),
+            extras=[extra for response in responses for extra in response.node_fee.extras],
+        ),
+        service_fee=FeeEstimate(
+            base=sum(response.service_fee.base for response in responses),
+            extras=[extra for response in responses for extra in response.service_fee.extras],
+        ),
+        network_fee=NetworkFee(
+            multiplier=last.network_fee.multiplier,
+            subtotal=sum(response.network_fee.subtotal for response in responses),
+        ),
+        total=sum(response.total for response in responses),
+        high_volume_multiplier=last.high_volume_multiplier,
+    )
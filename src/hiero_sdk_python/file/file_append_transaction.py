@@ -42,6 +42,8 @@ class FileAppendTransaction(ChunkedTransaction):
     to build and execute a file append transaction.
     """
 
+    _proto_body_field = "fileAppend"
+
     def __init__(
         self,
         file_id: FileId | None = None,
@@ -26,6 +26,8 @@ class FileCreateTransaction(Transaction):
     to build and execute a file create transaction.
     """
 
+    _proto_body_field = "fileCreate"
+
     # 90 days in seconds is the default expiration time
     DEFAULT_EXPIRY_SECONDS = 90 * 24 * 60 * 60  # 7776000
 
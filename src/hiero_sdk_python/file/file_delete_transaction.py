@@ -26,6 +26,8 @@ class FileDeleteTransaction(Transaction):
     to build and execute a file deletion transaction.
     """
 
+    _proto_body_field = "fileDelete"
+
     def __init__(self, file_id: FileId | None = None):
         """
         Initializes a new FileDeleteTransaction instance with optional file_id.
@@ -36,6 +36,8 @@ class FileUpdateTransaction(Transaction):
     to build and execute a file update transaction.
     """
 
+    _proto_body_field = "fileUpdate"
+
     def __init__(
         self,
         file_id: FileId | None = None,
@@ -0,0 +1,295 @@
+"""
+Pluggable metrics surface for the Hiero SDK.
+
+The execution loop in `_Executable._execute` reports gRPC latency, attempt counts,
+execution state outcomes, backoff time and node health through a `MetricsSink`
+configured on the `Client`. The default sink discards everything; the
+`InMemoryMetricsSink` keeps counters, gauges and histograms in memory so that an
+exporter (Prometheus, StatsD, logs, ...) can periodically scrape a `MetricsSnapshot`.
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+
+
+# Metric names recorded by the SDK
+GRPC_LATENCY_SECONDS = "hiero_grpc_latency_seconds"
+GRPC_ERRORS_TOTAL = "hiero_grpc_errors_total"
+EXECUTION_STATE_TOTAL = "hiero_execution_state_total"
+EXECUTION_ATTEMPTS = "hiero_execution_attempts"
+BACKOFF_SECONDS = "hiero_backoff_seconds"
+NODE_BAD_GRPC_RESPONSES = "hiero_node_bad_grpc_responses"
+NETWORK_HEALTHY_NODES = "hiero_network_healthy_nodes"
+RATE_LIMIT_TPS = "hiero_rate_limit_tps"
+
+# Upper bounds (seconds) suitable for gRPC round trips and backoff sleeps
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+# Upper bounds suitable for histograms of counts, such as the attempts of an execution
+COUNT_BUCKETS: tuple[float, ...] = (1, 2, 3, 5, 10, 20, 50, 100)
+
+# Histograms that record counts rather than seconds
+COUNT_HISTOGRAMS: frozenset[str] = frozenset({EXECUTION_ATTEMPTS})
+
+LabelSet = tuple[tuple[str, str], ...]
+MetricKey = tuple[str, LabelSet]
+
+
+def _label_set(labels: Mapping[str, object] | None) -> LabelSet:
+    """Normalize a label mapping into a hashable, order-independent tuple."""
+    if not labels:
+        return ()
+    return tuple(sorted((str(key), str(value)) for key, value in labels.items()))
+
+
+class MetricsSink(ABC):
+    """
+    Receiver for the measurements emitted by the SDK.
+
+    Implementations must be thread-safe, since a single Client may be shared by
+    several threads executing transactions and queries concurrently.
+    """
+
+    @abstractmethod
+    def increment(self, name: str, value: float = 1, labels: Mapping[str, object] | None = None) -> None:
+        """
+        Add `value` to a monotonically increasing counter.
+
+        Args:
+            name (str): The metric name.
+            value (float): The amount to add. Defaults to 1.
+            labels (Mapping[str, object], optional): Dimensions of the measurement.
+        """
+        raise NotImplementedError("increment must be implemented by subclasses")
+
+    @abstractmethod
+    def observe(self, name: str, value: float, labels: Mapping[str, object] | None = None) -> None:
+        """
+        Record a single sample in a histogram.
+
+        Args:
+            name (str): The metric name.
+            value (float): The observed value.
+            labels (Mapping[str, object], optional): Dimensions of the measurement.
+        """
+        raise NotImplementedError("observe must be implemented by subclasses")
+
+    @abstractmethod
+    def set_gauge(self, name: str, value: float, labels: Mapping[str, object] | None = None) -> None:
+        """
+        Set a gauge to its current value.
+
+        Args:
+            name (str): The metric name.
+            value (float): The current value.
+            labels (Mapping[str, object], optional): Dimensions of the measurement.
+        """
+        raise NotImplementedError("set_gauge must be implemented by subclasses")
+
+
+class NoOpMetricsSink(MetricsSink):
+    """Metrics sink that discards every measurement. This is the Client default."""
+
+    def increment(self, name: str, value: float = 1, labels: Mapping[str, object] | None = None) -> None:  # noqa: ARG002
+        return None
+
+    def observe(self, name: str, value: float, labels: Mapping[str, object] | None = None) -> None:  # noqa: ARG002
+        return None
+
+    def set_gauge(self, name: str, value: float, labels: Mapping[str, object] | None = None) -> None:  # noqa: ARG002
+        return None
+
+
+@dataclass(frozen=True)
+class HistogramSnapshot:
+    """
+    Point-in-time view of a histogram.
+
+    Attributes:
+        count (int): Number of samples observed.
+        sum (float): Sum of all samples.
+        min (float): Smallest sample, or 0.0 if empty.
+        max (float): Largest sample, or 0.0 if empty.
+        buckets (tuple[tuple[float, int], ...]): Cumulative (upper_bound, count) pairs,
+            ending with (inf, count).
+    """
+
+    count: int
+    sum: float
+    min: float
+    max: float
+    buckets: tuple[tuple[float, int], ...]
+
+    @property
+    def mean(self) -> float:
+        """Return the arithmetic mean of the samples, or 0.0 if empty."""
+        return self.sum / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile from the bucket boundaries.
+
+        Args:
+            q (float): The quantile in the range [0, 1].
+
+        Returns:
+            float: The upper bound of the bucket containing the quantile,
+                clamped to the observed maximum.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        if self.count == 0:
+            return 0.0
+
+        rank = q * self.count
+        for upper_bound, cumulative in self.buckets:
+            if cumulative >= rank:
+                return min(upper_bound, self.max)
+        return self.max
+
+
+@dataclass(frozen=True)
+class MetricsSnapshot:
+    """Point-in-time copy of every metric held by an `InMemoryMetricsSink`."""
+
+    counters: dict[MetricKey, float] = field(default_factory=dict)
+    gauges: dict[MetricKey, float] = field(default_factory=dict)
+    histograms: dict[MetricKey, HistogramSnapshot] = field(default_factory=dict)
+
+    def counter(self, name: str, **labels: object) -> float:
+        """Return the value of a counter, or 0 if it was never incremented."""
+        return self.counters.get((name, _label_set(labels)), 0)
+
+    def gauge(self, name: str, **labels: object) -> float | None:
+        """Return the value of a gauge, or None if it was never set."""
+        return self.gauges.get((name, _label_set(labels)))
+
+    def histogram(self, name: str, **labels: object) -> HistogramSnapshot | None:
+        """Return a histogram snapshot, or None if nothing was observed."""
+        return self.histograms.get((name, _label_set(labels)))
+
+
+class _Histogram:
+    """Fixed-bucket histogram. Callers are responsible for locking."""
+
+    def __init__(self, bounds: Sequence[float]):
+        self._bounds = tuple(bounds)
+        self._counts = [0] * (len(self._bounds) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._min = math.inf
+        self._max = -math.inf
+
+    def observe(self, value: float) -> None:
+        self._counts[bisect.bisect_left(self._bounds, value)] += 1
+        self._count += 1
+        self._sum += value
+        self._min = min(self._min, value)
+        self._max = max(self._max, value)
+
+    def snapshot(self) -> HistogramSnapshot:
+        cumulative = 0
+        buckets = []
+        for bound, count in zip((*self._bounds, math.inf), self._counts, strict=True):
+            cumulative += count
+            buckets.append((bound, cumulative))
+
+        return HistogramSnapshot(
+            count=self._count,
+            sum=self._sum,
+            min=self._min if self._count else 0.0,
+            max=self._max if self._count else 0.0,
+            buckets=tuple(buckets),
+        )
+
+
+class InMemoryMetricsSink(MetricsSink):
+    """
+    Thread-safe metrics sink that aggregates measurements in memory.
+
+    Exporters call `snapshot()` on their own schedule and translate the result
+    into their backend's format.
+
+    Example:
+        sink = InMemoryMetricsSink()
+        client.set_metrics_sink(sink)
+        ...
+        latency = sink.snapshot().histogram(GRPC_LATENCY_SECONDS, node="0.0.3", method="TransferTransaction")
+    """
+
+    def __init__(
+        self, buckets: Sequence[float] = DEFAULT_BUCKETS, count_buckets: Sequence[float] = COUNT_BUCKETS
+    ) -> None:
+        """
+        Initialize an empty sink.
+
+        Args:
+            buckets (Sequence[float]): Histogram bucket upper bounds, in ascending order.
+            count_buckets (Sequence[float]): Bucket upper bounds of the COUNT_HISTOGRAMS,
+                in ascending order.
+        """
+        for bounds in (buckets, count_buckets):
+            if list(bounds) != sorted(bounds):
+                raise ValueError("buckets must be sorted in ascending order")
+
+        self._buckets: tuple[float, ...] = tuple(buckets)
+        self._count_buckets: tuple[float, ...] = tuple(count_buckets)
+        self._lock = threading.Lock()
+        self._counters: dict[MetricKey, float] = {}
+        self._gauges: dict[MetricKey, float] = {}
+        self._histograms: dict[MetricKey, _Histogram] = {}
+
+    def increment(self, name: str, value: float = 1, labels: Mapping[str, object] | None = None) -> None:
+        key = (name, _label_set(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, labels: Mapping[str, object] | None = None) -> None:
+        key = (name, _label_set(labels))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                bounds = self._count_buckets if name in COUNT_HISTOGRAMS else self._buckets
+                histogram = self._histograms[key] = _Histogram(bounds)
+            histogram.observe(value)
+
+    def set_gauge(self, name: str, value: float, labels: Mapping[str, object] | None = None) -> None:
+        key = (name, _label_set(labels))
+        with self._lock:
+            self._gauges[key] = value
+
+    def snapshot(self) -> MetricsSnapshot:
+        """Return a consistent copy of all metrics recorded so far."""
+        with self._lock:
+            return MetricsSnapshot(
+                counters=dict(self._counters),
+                gauges=dict(self._gauges),
+                histograms={key: histogram.snapshot() for key, histogram in self._histograms.items()},
+            )
+
+    def reset(self) -> None:
+        """Discard all recorded metrics."""
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._histograms.clear()
@@ -1,18 +1,31 @@
 from __future__ import annotations
 
 import hashlib
+import itertools
+import logging
 import socket
 import ssl  # Python's ssl module implements TLS (despite the name)
+import threading
 import time
+from typing import TYPE_CHECKING, Any
 
 import grpc
 
 from hiero_sdk_python.account.account_id import AccountId
 from hiero_sdk_python.address_book.node_address import NodeAddress
+from hiero_sdk_python.channel_pool import _CHANNEL_POOL
 from hiero_sdk_python.channels import _Channel, _UserAgentInterceptor
+from hiero_sdk_python.circuit_breaker import CircuitBreaker, CircuitBreakerConfig
 from hiero_sdk_python.managed_node_address import _ManagedNodeAddress
+from hiero_sdk_python.rate_limiter import AdaptiveRateLimiter
 
 
+if TYPE_CHECKING:
+    from hiero_sdk_python.client.network_cache import NetworkCache
+
+
+logger = logging.getLogger(__name__)
+
 # Timeout for fetching server certificates during TLS validation
 CERT_FETCH_TIMEOUT_SECONDS = 10
 
@@ -89,17 +102,28 @@ class _Node:
         """
         self._account_id: AccountId = account_id
         self._channel: _Channel | None = None
+        self._channel_key: tuple | None = None
+        self._channel_count: int = 1
+        self._channel_options: dict[str, Any] = {}
+        self._extra_channels: list[tuple[tuple, _Channel]] = []
+        self._channel_cursor = itertools.count()
+        # Taken only to open or close channels; returning an open channel takes no lock
+        self._channels_lock = threading.Lock()
         self._address_book: NodeAddress = address_book
         self._address: _ManagedNodeAddress = _ManagedNodeAddress._from_string(address)
         self._verify_certificates: bool = True
         self._root_certificates: bytes | None = None
         self._node_pem_cert: bytes | None = None
+        self._certificate_cache: NetworkCache | None = None
 
         self._min_backoff: float = 8  # seconds
         self._max_backoff: float = 3600  # seconds
         self._current_backoff: float = self._min_backoff
         self._readmit_time: float = time.monotonic()
         self._bad_grpc_response_count: int = 0
+        self._backoff_lock = threading.Lock()
+        self._circuit_breaker = CircuitBreaker()
+        self._rate_limiter: AdaptiveRateLimiter | None = None
 
     def _close(self):
         """
@@ -108,28 +132,108 @@ class _Node:
         Returns:
             None
         """
-        if self._channel is not None:
-            self._channel.channel.close()
+        with self._channels_lock:
+            extra_channels, self._extra_channels = self._extra_channels, []
+            channel, key = self._channel, self._channel_key
             self._channel = None
+            self._channel_key = None
+
+        for extra_key, extra_channel in extra_channels:
+            _CHANNEL_POOL.release(extra_key, extra_channel)
+
+        # Channels not taken from the shared pool are owned by this node
+        if channel is not None and (key is None or not _CHANNEL_POOL.release(key, channel)):
+            channel.channel.close()
 
     def _get_channel(self):
         """
         Get the channel for this node.
 
+        Channels are shared, through the process-wide channel pool, by every node
+        with the same address and TLS settings, so clients built for the same network
+        reuse one connection per node.
+
+        When the node is configured with several channels, successive calls rotate
+        through them so that concurrent requests are spread over several HTTP/2
+        connections. The extra channels are opened on first use.
+
+        Safe to call from several threads: a channel is opened once, under the node's
+        lock, and open channels are returned without locking.
+
         Returns:
             _Channel: The channel for this node.
         """
-        if self._channel:
-            return self._channel
+        channel = self._channel
+        if channel is None:
+            with self._channels_lock:
+                if self._channel is None:
+                    key = self._pool_key()
+                    self._channel = _CHANNEL_POOL.acquire(key, self._create_channel)
+                    self._channel_key = key
+                channel = self._channel
+
+        if self._channel_count == 1:
+            return channel
+        return self._next_channel(channel)
+
+    def _next_channel(self, channel: _Channel) -> _Channel:
+        """Return the next of this node's channels in round-robin order, given the first one."""
+        index = next(self._channel_cursor) % self._channel_count
+        if index == 0:
+            return channel
+
+        extra_channels = self._extra_channels
+        if index <= len(extra_channels):
+            return extra_channels[index - 1][1]
+
+        with self._channels_lock:
+            # The list is replaced rather than appended to, so lock-free readers never see it change
+            extra_channels = list(self._extra_channels)
+            while len(extra_channels) < index:
+                key = self._pool_key(len(extra_channels) + 1)
+                extra = _CHANNEL_POOL.acquire(key, lambda: self._create_channel(reuse_certificate=True))
+                extra_channels.append((key, extra))
+            self._extra_channels = extra_channels
+            return extra_channels[index - 1][1]
+
+    def _pool_key(self, index: int = 0) -> tuple:
+        """Return the key identifying one of this node's connections in the channel pool."""
+        options = tuple(self._merge_channel_options([]))
+        if not self._address._is_transport_security():
+            return (str(self._address), False, options, index)
+
+        cert_hash = self._cert_hash()
+        root_certificates = hashlib.sha384(self._root_certificates).hexdigest() if self._root_certificates else None
+        return (
+            str(self._address),
+            True,
+            self._verify_certificates,
+            self._normalize_cert_hash(cert_hash) if cert_hash else None,
+            root_certificates,
+            options,
+            index,
+        )
+
+    def _create_channel(self, reuse_certificate: bool = False) -> _Channel:
+        """
+        Open a new channel to this node, fetching and validating its certificate when TLS is used.
 
+        Args:
+            reuse_certificate (bool): Use the certificate the node already validated, if any,
+                instead of fetching it again.
+        """
         if self._address._is_transport_security():
+            fetched = False
             if self._root_certificates:
                 # Use the certificate that is provided
                 self._node_pem_cert = self._root_certificates
 
-            else:
-                # Fetch pem_cert for the node
-                self._node_pem_cert = self._fetch_server_certificate_pem()
+            elif not (reuse_certificate and self._node_pem_cert):
+                # Use a cached certificate for the node, or fetch its pem_cert
+                self._node_pem_cert = self._load_cached_certificate()
+                if self._node_pem_cert is None:
+                    self._node_pem_cert = self._fetch_server_certificate_pem()
+                    fetched = True
 
             if not self._node_pem_cert:
                 raise ValueError("No certificate available.")
@@ -137,6 +241,8 @@ class _Node:
             # Validate certificate if verification is enabled
             if self._verify_certificates:
                 self._validate_tls_certificate_with_trust_manager()
+                if fetched:
+                    self._store_cached_certificate()
 
             options = self._build_channel_options()
             credentials = grpc.ssl_channel_credentials(
@@ -146,13 +252,40 @@ class _Node:
             )
             channel = grpc.secure_channel(str(self._address), credentials, options=options)
         else:
-            channel = grpc.insecure_channel(str(self._address))
+            channel = grpc.insecure_channel(str(self._address), options=self._merge_channel_options([]))
 
         channel = grpc.intercept_channel(channel, _UserAgentInterceptor())
 
-        self._channel = _Channel(channel)
+        return _Channel(channel)
 
-        return self._channel
+    def _cert_hash(self) -> bytes | None:
+        return self._address_book._cert_hash if self._address_book else None  # pylint: disable=protected-access
+
+    def _load_cached_certificate(self) -> bytes | None:
+        """Return this node's certificate from the certificate cache, if one matching its pinned hash is cached."""
+        cert_hash = self._cert_hash()
+        if self._certificate_cache is None or not cert_hash:
+            return None
+        return self._certificate_cache.load_certificate(cert_hash)
+
+    def _store_cached_certificate(self) -> None:
+        """Cache this node's certificate after it was validated against its pinned hash."""
+        cert_hash = self._cert_hash()
+        if self._certificate_cache is None or not cert_hash:
+            return
+        try:
+            self._certificate_cache.store_certificate(cert_hash, self._node_pem_cert)
+        except (OSError, ValueError) as e:
+            logger.warning("Could not cache the certificate of node %s: %s", self._account_id, e)
+
+    def _set_channel_config(self, channel_count: int, channel_options: dict[str, Any]) -> None:
+        """Set the number of channels and the extra gRPC options used for this node, reopening changed channels."""
+        if self._channel_count == channel_count and self._channel_options == channel_options:
+            return
+
+        self._close()
+        self._channel_count = channel_count
+        self._channel_options = dict(channel_options)
 
     def _apply_transport_security(self, enabled: bool):
         """Update the node's address to use secure or insecure transport."""
@@ -203,14 +336,29 @@ class _Node:
         by performing certificate hash pinning. This guarantees the client is
         communicating with the correct Hedera node regardless of the hostname
         or IP address used to connect.
+
+        Options configured with Client.set_channel_options replace the defaults of
+        the same name or are appended to them.
         """
-        return [
-            ("grpc.default_authority", "127.0.0.1"),
-            ("grpc.ssl_target_name_override", "127.0.0.1"),
-            ("grpc.keepalive_time_ms", 100000),
-            ("grpc.keepalive_timeout_ms", 10000),
-            ("grpc.keepalive_permit_without_calls", 1),
-        ]
+        return self._merge_channel_options(
+            [
+                ("grpc.default_authority", "127.0.0.1"),
+                ("grpc.ssl_target_name_override", "127.0.0.1"),
+                ("grpc.keepalive_time_ms", 100000),
+                ("grpc.keepalive_timeout_ms", 10000),
+                ("grpc.keepalive_permit_without_calls", 1),
+            ]
+        )
+
+    def _merge_channel_options(self, defaults: list[tuple[str, Any]]) -> list[tuple[str, Any]]:
+        """Apply the configured channel options to a list of default gRPC channel options."""
+        overrides = dict(self._channel_options)
+        if self._channel_count > 1:
+            # Channels with identical arguments would otherwise share one connection
+            overrides.setdefault("grpc.use_local_subchannel_pool", 1)
+
+        options = [(name, overrides.pop(name, value)) for name, value in defaults]
+        return options + sorted(overrides.items())
 
     def _validate_tls_certificate_with_trust_manager(self):
         """
@@ -294,12 +442,70 @@ class _Node:
         """
         return self._readmit_time <= time.monotonic()
 
-    def _increase_backoff(self) -> None:
-        """Increase the node's backoff duration after a failure."""
-        self._bad_grpc_response_count += 1
-        self._current_backoff = min(self._current_backoff * 2, self._max_backoff)
-        self._readmit_time = time.monotonic() + self._current_backoff
+    def _allow_request(self, probe: bool = False) -> bool:
+        """
+        Ask the node's circuit breaker whether a request may be sent now.
+
+        Args:
+            probe (bool): Whether the request is an active health check.
+
+        Returns:
+            bool: Whether to send the request; a half-open circuit admits a limited number of probes.
+        """
+        return self._circuit_breaker.allow_request(self.is_healthy(), probe)
+
+    def _release_request(self) -> None:
+        """Release the probe permit of a request that ended without an outcome for the node."""
+        self._circuit_breaker.release()
+
+    def _set_circuit_breaker_config(self, config: CircuitBreakerConfig, passive_probes: bool = True) -> None:
+        """
+        Configure the node's circuit breaker; a changed config replaces it with a closed breaker.
+
+        Args:
+            config (CircuitBreakerConfig): The breaker settings.
+            passive_probes (bool): Whether requests may probe a half-open circuit, rather
+                than only active health checks.
+        """
+        if self._circuit_breaker.config != config:
+            self._circuit_breaker = CircuitBreaker(config)
+        self._circuit_breaker.passive_probes = passive_probes
+
+    def _set_max_tps(self, max_tps: float | None) -> None:
+        """Limit the transactions submitted to this node per second, adapting to its throttling; None disables the limit."""
+        if max_tps is None:
+            self._rate_limiter = None
+        elif self._rate_limiter is None or self._rate_limiter.max_tps != max_tps:
+            self._rate_limiter = AdaptiveRateLimiter(max_tps)
+
+    def _increase_backoff(self) -> bool:
+        """
+        Record a failed request; when the circuit opens, double the backoff the node stays out of rotation for.
+
+        Returns:
+            bool: Whether the node's circuit is open.
+        """
+        with self._backoff_lock:
+            self._bad_grpc_response_count += 1
+            if not self._circuit_breaker.record_failure():
+                return False
+            self._current_backoff = min(self._current_backoff * 2, self._max_backoff)
+            self._readmit_time = time.monotonic() + self._current_backoff
+            return True
+
+    def _open_circuit(self) -> None:
+        """Open the node's circuit whatever its failure rate, keeping it out of rotation for its current backoff."""
+        with self._backoff_lock:
+            self._circuit_breaker.trip()
+            self._readmit_time = time.monotonic() + self._current_backoff
 
     def _decrease_backoff(self) -> None:
-        """Decrease the node's backoff duration after a successful operation."""
-        self._current_backoff = max(self._current_backoff / 2, self._min_backoff)
+        """Record a successful request; successes through a closed circuit decrease the node's backoff duration."""
+        # Probe successes keep the backoff, so a node that fails again right after recovering stays out longer
+        if not self._circuit_breaker.record_success():
+            return
+        # Successful requests are the common case; skip the lock once at the minimum
+        if self._current_backoff <= self._min_backoff:
+            return
+        with self._backoff_lock:
+            self._current_backoff = max(self._current_backoff / 2, self._min_backoff)
@@ -57,6 +57,8 @@ class NodeCreateTransaction(Transaction):
     to build and execute a node create transaction.
     """
 
+    _proto_body_field = "nodeCreate"
+
     def __init__(self, node_create_params: NodeCreateParams | None = None):
         """
         Initializes a new NodeCreateTransaction instance with the specified parameters.
@@ -22,6 +22,8 @@ class NodeDeleteTransaction(Transaction):
     to build and execute a node delete transaction.
     """
 
+    _proto_body_field = "nodeDelete"
+
     def __init__(self, node_id: int | None = None):
         """
         Initializes a new NodeDeleteTransaction instance with the specified parameters.
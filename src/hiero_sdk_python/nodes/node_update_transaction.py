@@ -65,6 +65,8 @@ class NodeUpdateTransaction(Transaction):
     to build and execute a node update transaction.
     """
 
+    _proto_body_field = "nodeUpdate"
+
     def __init__(self, node_update_params: NodeUpdateParams | None = None):
         """
         Initializes a new NodeUpdateTransaction instance with the specified parameters.
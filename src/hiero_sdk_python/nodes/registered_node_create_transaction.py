@@ -17,6 +17,8 @@ from hiero_sdk_python.transaction.transaction import Transaction
 class RegisteredNodeCreateTransaction(Transaction):
     """Creates a new registered node on the network."""
 
+    _proto_body_field = "registeredNodeCreate"
+
     def __init__(self):
         super().__init__()
         self.admin_key: Key | None = None
@@ -15,6 +15,8 @@ from hiero_sdk_python.transaction.transaction import Transaction
 class RegisteredNodeDeleteTransaction(Transaction):
     """Deletes an existing registered node from the network."""
 
+    _proto_body_field = "registeredNodeDelete"
+
     def __init__(self, registered_node_id: int | None = None):
         super().__init__()
         self.registered_node_id: int | None = registered_node_id
@@ -19,6 +19,8 @@ from hiero_sdk_python.transaction.transaction import Transaction
 class RegisteredNodeUpdateTransaction(Transaction):
     """Updates an existing registered node on the network."""
 
+    _proto_body_field = "registeredNodeUpdate"
+
     def __init__(self):
         super().__init__()
         self.registered_node_id: int | None = None
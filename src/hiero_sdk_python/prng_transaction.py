@@ -22,6 +22,8 @@ class PrngTransaction(Transaction):
     to build and execute a prng transaction.
     """
 
+    _proto_body_field = "util_prng"
+
     def __init__(self, range: int | None = None):
         """
         Initializes a new PrngTransaction instance.
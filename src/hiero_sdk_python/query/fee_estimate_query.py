@@ -9,10 +9,12 @@ from __future__ import annotations
 
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import TYPE_CHECKING
 from urllib.parse import urlencode
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from hiero_sdk_python.client.client import Client
 from hiero_sdk_python.fees.fee_estimate import FeeEstimate
@@ -40,7 +42,8 @@ class FeeEstimateQuery:
     - Defaults to INTRINSIC mode unless explicitly set
     - Automatically freezes transactions before execution
     - Retries transient failures (HTTP 500/503, timeouts)
-    - Aggregates fees for internally chunked transactions
+    - Aggregates fees for internally chunked transactions, estimating the
+      chunks concurrently over a pooled HTTP session
     """
 
     def __init__(self) -> None:
@@ -49,6 +52,7 @@ class FeeEstimateQuery:
         self._high_volume_throttle: int = 0
         self._max_attempts: int = 3
         self._max_backoff: float = 2.0
+        self._max_concurrency: int = 8
 
     # -------------------------------------------------------------------------
     # Configuration
@@ -115,6 +119,21 @@ class FeeEstimateQuery:
         self._max_backoff = float(seconds)
         return self
 
+    def set_max_concurrency(self, max_concurrency: int) -> FeeEstimateQuery:
+        """Set the maximum number of chunk estimates requested in parallel."""
+        if not isinstance(max_concurrency, int):
+            raise TypeError("max_concurrency must be an integer")
+
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+
+        self._max_concurrency = max_concurrency
+        return self
+
+    def get_max_concurrency(self) -> int:
+        """Return the maximum number of chunk estimates requested in parallel."""
+        return self._max_concurrency
+
     def execute(self, client) -> FeeEstimateResponse:
         """
         Execute the fee estimation query.
@@ -137,7 +156,7 @@ class FeeEstimateQuery:
         self._ensure_frozen(self._transaction, client)
 
         if self._is_chunked():
-            return self._execute_chunked(client, url, mode)
+            return self._execute_chunked(url, mode)
 
         return self._execute_single(url, mode)
 
@@ -156,11 +175,13 @@ class FeeEstimateQuery:
         if not tx._transaction_body_bytes:
             tx.freeze_with(client) if hasattr(tx, "freeze_with") else tx.freeze()
 
-    def _post(self, url: str, payload: bytes) -> dict:
-        """POST with retry for transient failures."""
+    def _post(self, url: str, payload: bytes, session: requests.Session | None = None) -> dict:
+        """POST with retry for transient failures, over `session` when one is given."""
+        post = session.post if session is not None else requests.post
+
         for attempt in range(self._max_attempts):
             try:
-                resp = requests.post(
+                resp = post(
                     url,
                     data=payload,
                     headers={"Content-Type": "application/protobuf"},
@@ -191,68 +212,68 @@ class FeeEstimateQuery:
         raise RuntimeError("Unreachable")
 
     def _execute_single(self, url: str, mode: FeeEstimateMode) -> FeeEstimateResponse:
-        data = self._post(url, self._transaction.to_bytes())
+        data = self._post(url, self._transaction._to_proto().SerializeToString())
         return self._to_response(data, mode)
 
-    def _execute_chunked(self, client, url: str, mode: FeeEstimateMode) -> FeeEstimateResponse:
+    def _execute_chunked(self, url: str, mode: FeeEstimateMode) -> FeeEstimateResponse:
         """
         Aggregate fees across all chunks into a single response.
-        """
 
-        # Save original state to restore later
-        original_id = self._transaction.transaction_id
-        original_index = getattr(self._transaction, "_current_chunk_index", 0)
-        original_bodies = dict(self._transaction._transaction_body_bytes)
-        original_signatures = dict(self._transaction._signature_map)
+        Chunk payloads are built from the frozen transaction without modifying it, then
+        POSTed concurrently (up to `max_concurrency` at a time) over one pooled session.
+        Fees are summed as the responses arrive; the first failure cancels the chunks
+        that have not been sent yet and is re-raised.
+        """
+        payloads = [
+            self._transaction._chunk_to_proto(i).SerializeToString()
+            for i in range(len(self._transaction._transaction_ids))
+        ]
+        workers = min(self._max_concurrency, len(payloads))
 
         total_node_base = 0
         total_service_base = 0
         total_network_subtotal = 0
         total_combined = 0
-        node_extras: list[FeeExtra] = []
-        service_extras: list[FeeExtra] = []
+        node_extras: list[list[FeeExtra]] = [[] for _ in payloads]
+        service_extras: list[list[FeeExtra]] = [[] for _ in payloads]
 
         final_multiplier = 0
         final_hvm = 0
 
-        try:
-            for i, chunk_tx_id in enumerate(self._transaction._transaction_ids):
-                self._transaction._current_chunk_index = i
-                self._transaction.transaction_id = chunk_tx_id
-
-                self._transaction._transaction_body_bytes.clear()
-
-                self._transaction.freeze_with(client)
-
-                tx_bytes = self._transaction.to_bytes()
-                data = self._post(url, tx_bytes)
-                response = self._to_response(data, mode)
-
-                if response.node_fee:
-                    total_node_base += response.node_fee.base
-                    node_extras.extend(response.node_fee.extras)
-                if response.service_fee:
-                    total_service_base += response.service_fee.base
-                    service_extras.extend(response.service_fee.extras)
-                if response.network_fee:
-                    total_network_subtotal += response.network_fee.subtotal
-                    final_multiplier = response.network_fee.multiplier
-                total_combined += response.total
-
-                final_hvm = response.high_volume_multiplier
-
-        finally:
-            self._transaction.transaction_id = original_id
-            self._transaction._current_chunk_index = original_index
-            self._transaction._transaction_body_bytes.clear()
-            self._transaction._transaction_body_bytes.update(original_bodies)
-            self._transaction._signature_map.clear()
-            self._transaction._signature_map.update(original_signatures)
+        with requests.Session() as session:
+            session.mount(url, HTTPAdapter(pool_connections=1, pool_maxsize=workers))
+
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fee-estimate") as executor:
+                futures = {executor.submit(self._post, url, payload, session): i for i, payload in enumerate(payloads)}
+
+                try:
+                    for future in as_completed(futures):
+                        index = futures[future]
+                        response = self._to_response(future.result(), mode)
+
+                        if response.node_fee:
+                            total_node_base += response.node_fee.base
+                            node_extras[index] = response.node_fee.extras
+                        if response.service_fee:
+                            total_service_base += response.service_fee.base
+                            service_extras[index] = response.service_fee.extras
+                        if response.network_fee:
+                            total_network_subtotal += response.network_fee.subtotal
+                            final_multiplier = response.network_fee.multiplier
+                        total_combined += response.total
+
+                        final_hvm = response.high_volume_multiplier
+                except BaseException:
+                    for future in futures:
+                        future.cancel()
+                    raise
 
         return FeeEstimateResponse(
             mode=mode,
-            node_fee=FeeEstimate(base=total_node_base, extras=node_extras),
-            service_fee=FeeEstimate(base=total_service_base, extras=service_extras),
+            node_fee=FeeEstimate(base=total_node_base, extras=[extra for chunk in node_extras for extra in chunk]),
+            service_fee=FeeEstimate(
+                base=total_service_base, extras=[extra for chunk in service_extras for extra in chunk]
+            ),
             network_fee=NetworkFee(multiplier=final_multiplier, subtotal=total_network_subtotal),
             total=total_combined,
             high_volume_multiplier=final_hvm,
@@ -9,7 +9,7 @@ from typing import Any
 from hiero_sdk_python.account.account_id import AccountId
 from hiero_sdk_python.channels import _Channel
 from hiero_sdk_python.client.client import Client, Operator
-from hiero_sdk_python.crypto.private_key import PrivateKey
+from hiero_sdk_python.crypto.signer import SigningKey, sign_many
 from hiero_sdk_python.exceptions import PrecheckError, ReceiptStatusError
 from hiero_sdk_python.executable import _Executable, _ExecutionState, _Method
 from hiero_sdk_python.hapi.services import (
@@ -24,6 +24,7 @@ from hiero_sdk_python.hapi.services import (
 from hiero_sdk_python.hbar import Hbar
 from hiero_sdk_python.response_code import ResponseCode
 from hiero_sdk_python.transaction.transaction_id import TransactionId
+from hiero_sdk_python.transaction.transaction_id_allocator import TransactionIdAllocator
 
 
 class Query(_Executable):
@@ -57,6 +58,7 @@ class Query(_Executable):
         self.node_index: int = 0
         self.payment_amount: Hbar | None = None
         self.max_query_payment: Hbar | None = None
+        self._transaction_id_allocator: TransactionIdAllocator | None = None
 
     def _get_query_response(self, response: Any) -> query_pb2.Query:
         """
@@ -135,6 +137,7 @@ class Query(_Executable):
             client: The client instance to use for execution
         """
         self.operator = self.operator or client.operator
+        self._transaction_id_allocator = client.transaction_id_allocator
 
         if self._node_account_ids.is_empty:
             self._node_account_ids.set_list([node._account_id for node in client.network.nodes])
@@ -196,7 +199,7 @@ class Query(_Executable):
     def _build_query_payment_transaction(
         self,
         payer_account_id: AccountId,
-        payer_private_key: PrivateKey,
+        payer_private_key: SigningKey,
         node_account_id: AccountId,
         amount: Hbar,
     ) -> transaction_pb2.Transaction:
@@ -207,7 +210,7 @@ class Query(_Executable):
 
         Args:
             payer_account_id: The account ID of the payer
-            payer_private_key: The private key of the payer
+            payer_private_key: The private key or Signer of the payer
             node_account_id: The account ID of the node
             amount (Hbar): The amount to pay
 
@@ -227,7 +230,10 @@ class Query(_Executable):
         ]
 
         # Generate transaction ID
-        transaction_id = TransactionId.generate(payer_account_id)
+        if self._transaction_id_allocator is not None:
+            transaction_id = self._transaction_id_allocator.generate(payer_account_id)
+        else:
+            transaction_id = TransactionId.generate(payer_account_id)
 
         # Create transaction body directly
         transaction_body = transaction_pb2.TransactionBody(
@@ -244,11 +250,12 @@ class Query(_Executable):
         body_bytes = transaction_body.SerializeToString()
 
         # Sign the transaction body
-        signature = payer_private_key.sign(body_bytes)
-        public_key_bytes = payer_private_key.public_key().to_bytes_raw()
+        (signature,) = sign_many(payer_private_key, [body_bytes])
+        public_key = payer_private_key.public_key()
+        public_key_bytes = public_key.to_bytes_raw()
 
         # Create signature pair
-        if payer_private_key.is_ed25519():
+        if public_key.is_ed25519():
             sig_pair = basic_types_pb2.SignaturePair(pubKeyPrefix=public_key_bytes, ed25519=signature)
         else:
             sig_pair = basic_types_pb2.SignaturePair(pubKeyPrefix=public_key_bytes, ECDSA_secp256k1=signature)
@@ -15,6 +15,7 @@ from hiero_sdk_python.hapi.services import (
 )
 from hiero_sdk_python.query.query import Query
 from hiero_sdk_python.response_code import ResponseCode
+from hiero_sdk_python.tracing import ATTR_STATUS, ATTR_TRANSACTION_ID, SPAN_RECEIPT, _set_attributes, _span
 from hiero_sdk_python.transaction.transaction_id import TransactionId
 from hiero_sdk_python.transaction.transaction_receipt import TransactionReceipt
 
@@ -315,8 +316,11 @@ class TransactionGetReceiptQuery(Query):
             MaxAttemptsError: If the query fails after the maximum number of attempts
             ReceiptStatusError: If the transaction receipt contains an error status
         """
-        self._before_execute(client)
-        response = self._execute(client, timeout)
+        with _span(SPAN_RECEIPT, {ATTR_TRANSACTION_ID: self.transaction_id}) as span:
+            self._before_execute(client)
+            response = self._execute(client, timeout)
+            _set_attributes(span, {ATTR_STATUS: ResponseCode(response.transactionGetReceipt.receipt.status)})
+
         parent = TransactionReceipt._from_proto(response.transactionGetReceipt.receipt, self.transaction_id)
 
         if self.include_children:
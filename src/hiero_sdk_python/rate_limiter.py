@@ -0,0 +1,179 @@
+"""
+hiero_sdk_python.rate_limiter.py.
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Defines AdaptiveRateLimiter, a token bucket whose rate follows the network's
+throttling: it shrinks multiplicatively when nodes answer BUSY and grows
+additively while submissions succeed (AIMD).
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections.abc import Callable
+
+from hiero_sdk_python.response_code import ResponseCode
+
+
+# Precheck statuses with which nodes signal that the client should slow down
+THROTTLE_STATUSES = frozenset(
+    {
+        ResponseCode.BUSY,
+        ResponseCode.PLATFORM_TRANSACTION_NOT_CREATED,
+        ResponseCode.THROTTLED_AT_CONSENSUS,
+    }
+)
+
+# Fraction of the rate kept after a throttle response
+DEFAULT_DECREASE_FACTOR = 0.5
+
+# Transactions per second added to the rate for each second of successful submissions
+DEFAULT_ADDITIVE_INCREASE = 1.0
+
+# Throttle responses within this many seconds of a decrease are answers to requests
+# sent before it, and do not decrease the rate again
+DEFAULT_DECREASE_COOLDOWN_SECONDS = 0.5
+
+
+class AdaptiveRateLimiter:
+    """
+    A thread-safe token bucket with an AIMD-controlled rate.
+
+    The bucket starts at `max_tps` and holds at most one second of tokens. Each
+    throttle response multiplies the rate by `decrease_factor`, at most once per
+    `decrease_cooldown`, down to `min_tps`. Each success adds `additive_increase`
+    divided by the current rate, so the rate grows by about `additive_increase`
+    transactions per second for every second of successful submissions, up to
+    `max_tps`.
+    """
+
+    def __init__(
+        self,
+        max_tps: float,
+        min_tps: float = 1.0,
+        decrease_factor: float = DEFAULT_DECREASE_FACTOR,
+        additive_increase: float = DEFAULT_ADDITIVE_INCREASE,
+        decrease_cooldown: float = DEFAULT_DECREASE_COOLDOWN_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initializes an AdaptiveRateLimiter running at `max_tps`.
+
+        Args:
+            max_tps (float): The hard upper bound of the rate, in transactions per second.
+            min_tps (float): The rate never drops below this.
+            decrease_factor (float): Fraction of the rate kept after a throttle response.
+            additive_increase (float): Rate added per second of successful submissions.
+            decrease_cooldown (float): Seconds after a decrease during which throttles are ignored.
+            clock (Callable[[], float]): Monotonic clock in seconds.
+
+        Raises:
+            ValueError: If a rate is not positive and finite, min_tps exceeds max_tps,
+                or decrease_factor is not in (0, 1).
+        """
+        for name, value in (("max_tps", max_tps), ("min_tps", min_tps)):
+            if not math.isfinite(value) or value <= 0:
+                raise ValueError(f"{name} must be a finite value greater than 0")
+        if min_tps > max_tps:
+            raise ValueError("min_tps cannot exceed max_tps")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be in (0, 1)")
+        if additive_increase < 0 or decrease_cooldown < 0:
+            raise ValueError("additive_increase and decrease_cooldown must be non-negative")
+
+        self.max_tps = float(max_tps)
+        self.min_tps = float(min_tps)
+        self.decrease_factor = decrease_factor
+        self.additive_increase = additive_increase
+        self.decrease_cooldown = decrease_cooldown
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._rate = self.max_tps
+        self._tokens = self._capacity()
+        self._refilled_at = clock()
+        self._decreased_at = -math.inf
+
+    @property
+    def rate(self) -> float:
+        """Return the current rate, in transactions per second."""
+        return self._rate
+
+    def _capacity(self) -> float:
+        return max(1.0, self._rate)
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self._capacity(), self._tokens + (now - self._refilled_at) * self._rate)
+        self._refilled_at = now
+
+    def try_acquire(self) -> bool:
+        """
+        Take a token if one is available.
+
+        Returns:
+            bool: Whether a token was taken.
+        """
+        with self._lock:
+            self._refill(self._clock())
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    def acquire(self, timeout: float | None = None) -> bool:
+        """
+        Take a token, waiting for one to become available.
+
+        Args:
+            timeout (float, optional): Maximum seconds to wait; None waits indefinitely.
+
+        Returns:
+            bool: Whether a token was taken before the timeout.
+        """
+        deadline = None if timeout is None else self._clock() + timeout
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait = (1 - self._tokens) / self._rate
+
+            if deadline is not None:
+                if now >= deadline:
+                    return False
+                wait = min(wait, deadline - now)
+            time.sleep(wait)
+
+    def release(self) -> None:
+        """Give back a token taken for a request that was not sent."""
+        with self._lock:
+            self._refill(self._clock())
+            self._tokens = min(self._capacity(), self._tokens + 1)
+
+    def on_success(self) -> None:
+        """Record a submission that was not throttled, growing the rate."""
+        if self._rate >= self.max_tps:
+            return
+        with self._lock:
+            self._refill(self._clock())
+            self._rate = min(self.max_tps, self._rate + self.additive_increase / self._rate)
+
+    def on_throttle(self) -> bool:
+        """
+        Record a throttle response, shrinking the rate.
+
+        Returns:
+            bool: Whether the rate was decreased, i.e. the response was not within the cooldown.
+        """
+        with self._lock:
+            now = self._clock()
+            if now - self._decreased_at < self.decrease_cooldown:
+                return False
+            self._refill(now)
+            self._rate = max(self.min_tps, self._rate * self.decrease_factor)
+            self._tokens = min(self._tokens, self._capacity())
+            self._decreased_at = now
+            return True
@@ -56,6 +56,8 @@ class ScheduleCreateTransaction(Transaction):
     to build and execute a schedule create transaction.
     """
 
+    _proto_body_field = "scheduleCreate"
+
     def __init__(
         self,
         schedule_params: ScheduleCreateParams | None = None,
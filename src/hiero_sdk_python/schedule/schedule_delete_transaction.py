@@ -25,6 +25,8 @@ class ScheduleDeleteTransaction(Transaction):
     to build and execute a schedule delete transaction.
     """
 
+    _proto_body_field = "scheduleDelete"
+
     def __init__(self, schedule_id: ScheduleId | None = None):
         """
         Initializes a new ScheduleDeleteTransaction instance with the specified parameters.
@@ -31,6 +31,8 @@ class ScheduleSignTransaction(Transaction):
 
     """
 
+    _proto_body_field = "scheduleSign"
+
     def __init__(self, schedule_id: ScheduleId | None = None):
         """
         Initializes a new ScheduleSignTransaction instance with the specified parameters.
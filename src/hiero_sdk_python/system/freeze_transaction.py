@@ -26,6 +26,8 @@ class FreezeTransaction(Transaction):
     to build and execute a freeze transaction.
     """
 
+    _proto_body_field = "freeze"
+
     def __init__(
         self,
         start_time: Timestamp | None = None,
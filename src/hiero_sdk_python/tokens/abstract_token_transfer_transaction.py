@@ -13,7 +13,7 @@ from __future__ import annotations
 
 from abc import ABC
 from collections import defaultdict
-from typing import Any, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, Generic, Protocol, TypeVar
 
 from hiero_sdk_python.account.account_id import AccountId
 from hiero_sdk_python.hapi.services import basic_types_pb2
@@ -21,13 +21,44 @@ from hiero_sdk_python.tokens.nft_id import NftId
 from hiero_sdk_python.tokens.token_id import TokenId
 from hiero_sdk_python.tokens.token_nft_transfer import TokenNftTransfer
 from hiero_sdk_python.tokens.token_transfer import TokenTransfer
-from hiero_sdk_python.tokens.token_transfer_list import TokenTransferList
 from hiero_sdk_python.transaction.transaction import Transaction
 
 
+if TYPE_CHECKING:
+    from google.protobuf.message import Message
+
+    from hiero_sdk_python.client.client import Client
+
+
 T = TypeVar("T", bound="AbstractTokenTransferTransaction[Any]")
 
 
+class _AccountTransfer(Protocol):
+    account_id: AccountId
+
+
+TransferT = TypeVar("TransferT", bound=_AccountTransfer)
+
+# A transfer list together with an index of its entries by account
+_AccountIndex = tuple[list[TransferT], dict[AccountId, TransferT]]
+
+
+def _account_index(transfers: list[TransferT], cached: _AccountIndex[TransferT] | None) -> _AccountIndex[TransferT]:
+    """
+    Return an index of `transfers` by account, reusing `cached` while it is still valid.
+
+    The index is rebuilt when the list was replaced or changed size without going
+    through the transaction's add methods, so that it never hides an entry.
+    """
+    if cached is not None and cached[0] is transfers and len(cached[1]) == len(transfers):
+        return cached
+
+    index: dict[AccountId, TransferT] = {}
+    for transfer in transfers:
+        index.setdefault(transfer.account_id, transfer)
+    return transfers, index
+
+
 class AbstractTokenTransferTransaction(Transaction, ABC, Generic[T]):
     """
     Base transaction class for executing multiple token and NFT transfers.
@@ -47,6 +78,8 @@ class AbstractTokenTransferTransaction(Transaction, ABC, Generic[T]):
         super().__init__()
         self.token_transfers: dict[TokenId, list[TokenTransfer]] = defaultdict(list)
         self.nft_transfers: dict[TokenId, list[TokenNftTransfer]] = defaultdict(list)
+        self._token_transfer_index: dict[TokenId, _AccountIndex[TokenTransfer]] = {}
+        self._proto_body_cache: Message | None = None
         self._default_transaction_fee: int = 100_000_000
 
     def _init_token_transfers(self, token_transfers: dict[TokenId, dict[AccountId, int]] | list[TokenTransfer]) -> None:
@@ -153,15 +186,18 @@ class AbstractTokenTransferTransaction(Transaction, ABC, Generic[T]):
         if not isinstance(is_approved, bool):
             raise TypeError("is_approved must be a boolean.")
 
-        for transfer in self.token_transfers[token_id]:
-            if transfer.account_id == account_id:
-                transfer.amount += amount
-                transfer.expected_decimals = expected_decimals
-                return
+        transfers, index = _account_index(self.token_transfers[token_id], self._token_transfer_index.get(token_id))
+        self._token_transfer_index[token_id] = (transfers, index)
 
-        self.token_transfers[token_id].append(
-            TokenTransfer(token_id, account_id, amount, expected_decimals, is_approved)
-        )
+        existing = index.get(account_id)
+        if existing is not None:
+            existing.amount += amount
+            existing.expected_decimals = expected_decimals
+            return
+
+        transfer = TokenTransfer(token_id, account_id, amount, expected_decimals, is_approved)
+        transfers.append(transfer)
+        index[account_id] = transfer
 
     def _add_nft_transfer(
         self,
@@ -316,24 +352,53 @@ class AbstractTokenTransferTransaction(Transaction, ABC, Generic[T]):
             list[basic_types_pb2.TokenTransferList]: A list of TokenTransferList objects,
             each grouping transfers for a specific token ID.
         """
-        token_transfer_list: list[TokenTransferList] = []
+        token_transfer_list: list[basic_types_pb2.TokenTransferList] = []
 
         # Tokens
         for token_id, token_transfers in self.token_transfers.items():
-            token_list = TokenTransferList(token=token_id, expected_decimals=token_transfers[0].expected_decimals)
-
-            for token_transfer in token_transfers:
-                token_list.add_token_transfer(token_transfer)
+            token_list = basic_types_pb2.TokenTransferList(
+                token=token_id._to_proto(),
+                transfers=[token_transfer._to_proto() for token_transfer in token_transfers],
+            )
+            expected_decimals = token_transfers[0].expected_decimals if token_transfers else None
+            if expected_decimals:
+                token_list.expected_decimals.value = expected_decimals
 
             token_transfer_list.append(token_list)
 
         # NFTs
         for nft_id, nft_transfers in self.nft_transfers.items():
-            nft_list = TokenTransferList(token=nft_id)
+            token_transfer_list.append(
+                basic_types_pb2.TokenTransferList(
+                    token=nft_id._to_proto(),
+                    nftTransfers=[nft_transfer._to_proto() for nft_transfer in nft_transfers],
+                )
+            )
 
-            for nft_transfer in nft_transfers:
-                nft_list.add_nft_transfer(nft_transfer)
+        return token_transfer_list
 
-            token_transfer_list.append(nft_list)
+    def freeze_with(self, client: Client) -> T:
+        """
+        Freezes the transaction, building its transfer lists once for all node bodies.
+
+        Args:
+            client (Client): The client instance to use for setting defaults.
 
-        return [transfer._to_proto() for transfer in token_transfer_list]
+        Returns:
+            Self: The current instance of the transaction for chaining.
+        """
+        if self._transaction_body_bytes:
+            return self
+
+        # Only the transaction ID and node differ between the node bodies
+        self._proto_body_cache = self._build_proto_body()
+        try:
+            return super().freeze_with(client)
+        finally:
+            self._proto_body_cache = None
+
+    def _get_proto_body(self) -> Message:
+        """Return the transfer body built for the current freeze, or build a new one."""
+        if self._proto_body_cache is not None:
+            return self._proto_body_cache
+        return self._build_proto_body()
@@ -0,0 +1,241 @@
+"""
+hiero_sdk_python.tokens.nft_mint_pipeline.py.
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Mints large NFT collections by splitting a stream of metadata across as many
+TokenMintTransactions as the network's per-mint limit requires, submitting them
+with bounded concurrency.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from itertools import islice
+from typing import TYPE_CHECKING
+
+from hiero_sdk_python.crypto.private_key import PrivateKey
+from hiero_sdk_python.crypto.signer import AsyncSigner, Signer, SigningKey
+
+
+if TYPE_CHECKING:
+    from hiero_sdk_python.client.client import Client
+    from hiero_sdk_python.tokens.token_id import TokenId
+    from hiero_sdk_python.tokens.token_mint_transaction import TokenMintTransaction
+    from hiero_sdk_python.transaction.transaction_id import TransactionId
+    from hiero_sdk_python.transaction.transaction_receipt import TransactionReceipt
+
+
+# Network limit on the number of metadata entries in one TokenMintTransaction
+MAX_METADATA_PER_MINT = 10
+
+DEFAULT_MAX_CONCURRENCY = 4
+
+
+class NftMintError(Exception):
+    """
+    Raised by a bulk mint after a mint failed.
+
+    Every mint that succeeded before or alongside the failure has been yielded by the
+    time this is raised, so the serials already minted are never lost.
+
+    Attributes:
+        offset (int): Position in the metadata stream of the first entry of the failed mint.
+        error (Exception): The error the mint failed with, also set as `__cause__`.
+    """
+
+    def __init__(self, offset: int, error: Exception) -> None:
+        self.offset = offset
+        self.error = error
+        super().__init__(f"Minting the NFTs at offset {offset} failed: {error}")
+
+
+@dataclass(frozen=True)
+class MintedNfts:
+    """
+    Serial numbers minted by one TokenMintTransaction of a bulk mint.
+
+    Attributes:
+        offset (int): Position in the metadata stream of the first entry of this mint.
+        serial_numbers (list[int]): The serials assigned to the entries, in metadata order.
+        transaction_id (TransactionId): The ID of the mint transaction.
+        receipt (TransactionReceipt): The receipt of the mint transaction.
+    """
+
+    offset: int
+    serial_numbers: list[int]
+    transaction_id: TransactionId
+    receipt: TransactionReceipt
+
+    @property
+    def first_serial(self) -> int:
+        """Return the lowest serial number minted by this transaction."""
+        return min(self.serial_numbers)
+
+    @property
+    def last_serial(self) -> int:
+        """Return the highest serial number minted by this transaction."""
+        return max(self.serial_numbers)
+
+
+def read_metadata_file(path: str | os.PathLike[str]) -> Iterator[bytes]:
+    """
+    Stream NFT metadata from a file holding one entry per line.
+
+    Line endings are stripped and blank lines are skipped. The file is read lazily,
+    so collections larger than memory can be minted.
+
+    Args:
+        path (str | os.PathLike): The file to read.
+
+    Yields:
+        bytes: One metadata entry per non-blank line.
+    """
+    with open(path, "rb") as file:
+        for line in file:
+            entry = line.rstrip(b"\r\n")
+            if entry:
+                yield entry
+
+
+def _chunked(metadata: Iterable[bytes], size: int) -> Iterator[tuple[int, list[bytes]]]:
+    iterator = iter(metadata)
+    offset = 0
+    while chunk := list(islice(iterator, size)):
+        yield offset, chunk
+        offset += len(chunk)
+
+
+def mint_nfts(
+    client: Client,
+    token_id: TokenId,
+    metadata: Iterable[bytes] | str | os.PathLike[str],
+    supply_key: SigningKey,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    batch_size: int = MAX_METADATA_PER_MINT,
+    timeout: int | float | None = None,
+) -> Iterator[MintedNfts]:
+    """
+    Mint one NFT per metadata entry, packing `batch_size` entries into each mint.
+
+    Arguments are validated immediately; minting starts when the returned iterator is
+    first advanced. Metadata is consumed lazily: at most `max_concurrency` mints are
+    in flight and only their metadata is held in memory. Results are yielded as mints
+    complete, which is not necessarily submission order; use `MintedNfts.offset` to
+    map serials back to metadata. If a mint fails, no further mints are submitted, the
+    mints already in flight are awaited and their results yielded, and NftMintError is
+    then raised from the iterator. Closing the iterator early cancels the remaining mints.
+
+    Args:
+        client (Client): The client used to freeze, sign and submit.
+        token_id (TokenId): The NFT collection to mint into.
+        metadata (Iterable[bytes] | str | os.PathLike): The metadata entries, or the
+            path of a file with one entry per line (see `read_metadata_file`).
+        supply_key (SigningKey): The token's supply key, as a PrivateKey, Signer or
+            AsyncSigner, which signs every mint.
+        max_concurrency (int): Maximum number of mints in flight.
+        batch_size (int): Metadata entries per mint, at most `MAX_METADATA_PER_MINT`.
+        timeout (int | float, optional): The execution timeout of each mint.
+
+    Returns:
+        Iterator[MintedNfts]: The serial numbers minted by each transaction. Iterating
+            raises NftMintError, caused by e.g. ReceiptStatusError, if a mint does not succeed.
+
+    Raises:
+        TypeError: If token_id or supply_key have the wrong type.
+        ValueError: If max_concurrency or batch_size are out of range.
+    """
+    # Imported here because the client imports this module for its defaults
+    from hiero_sdk_python.tokens.token_id import TokenId
+
+    if not isinstance(token_id, TokenId):
+        raise TypeError(f"token_id must be a TokenId, got {type(token_id).__name__}")
+
+    if not isinstance(supply_key, (PrivateKey, Signer, AsyncSigner)):
+        raise TypeError(f"supply_key must be a PrivateKey, Signer or AsyncSigner, got {type(supply_key).__name__}")
+
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be >= 1")
+
+    if not 0 < batch_size <= MAX_METADATA_PER_MINT:
+        raise ValueError(f"batch_size must be between 1 and {MAX_METADATA_PER_MINT}")
+
+    if isinstance(metadata, (str, os.PathLike)):
+        metadata = read_metadata_file(metadata)
+
+    return _mint_batches(client, token_id, metadata, supply_key, max_concurrency, batch_size, timeout)
+
+
+def _mint_batches(
+    client: Client,
+    token_id: TokenId,
+    metadata: Iterable[bytes],
+    supply_key: SigningKey,
+    max_concurrency: int,
+    batch_size: int,
+    timeout: int | float | None,
+) -> Iterator[MintedNfts]:
+    """Generator behind `mint_nfts`, separated so that arguments are validated eagerly."""
+    # Imported here because the client imports this module for its defaults
+    from hiero_sdk_python.tokens.token_mint_transaction import TokenMintTransaction
+
+    def submit(offset: int, transaction: TokenMintTransaction) -> MintedNfts:
+        receipt = transaction.execute(client, timeout, validate_status=True)
+        return MintedNfts(
+            offset=offset,
+            serial_numbers=list(receipt.serial_numbers),
+            transaction_id=transaction.transaction_id,
+            receipt=receipt,
+        )
+
+    offsets: dict[Future[MintedNfts], int] = {}
+    failures: list[tuple[int, Exception]] = []
+
+    def results(done: set[Future[MintedNfts]]) -> Iterator[MintedNfts]:
+        # Every successful mint is yielded, even when another one in the same set failed
+        for future in sorted(done, key=offsets.__getitem__):
+            try:
+                yield future.result()
+            except Exception as e:  # noqa: BLE001, PERF203
+                failures.append((offsets[future], e))
+            del offsets[future]
+
+    with ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="nft-mint") as executor:
+        in_flight: set[Future[MintedNfts]] = set()
+
+        try:
+            for offset, chunk in _chunked(metadata, batch_size):
+                if failures:
+                    break
+
+                try:
+                    # Freeze and sign on this thread so transaction IDs are generated in order
+                    transaction = (
+                        TokenMintTransaction(token_id=token_id, metadata=chunk).freeze_with(client).sign(supply_key)
+                    )
+                except Exception as e:  # noqa: BLE001
+                    failures.append((offset, e))
+                    break
+
+                future = executor.submit(submit, offset, transaction)
+                offsets[future] = offset
+                in_flight.add(future)
+
+                if len(in_flight) >= max_concurrency:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    yield from results(done)
+
+            # Mints already submitted may succeed; wait for them so their serials are reported
+            while in_flight:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                yield from results(done)
+
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+    if failures:
+        offset, error = min(failures, key=lambda failure: failure[0])
+        raise NftMintError(offset, error) from error
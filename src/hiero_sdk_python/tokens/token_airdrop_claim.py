@@ -27,6 +27,8 @@ class TokenClaimAirdropTransaction(Transaction):
     This transaction MUST be signed by the receiver for each PendingAirdropId to claim.
     """
 
+    _proto_body_field = "tokenClaimAirdrop"
+
     MAX_IDS: int = 10
     MIN_IDS: int = 1
 
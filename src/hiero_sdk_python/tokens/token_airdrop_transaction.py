@@ -28,6 +28,8 @@ class TokenAirdropTransaction(AbstractTokenTransferTransaction["TokenAirdropTran
     handling both fungible tokens and NFTs.
     """
 
+    _proto_body_field = "tokenAirdrop"
+
     def __init__(
         self, token_transfers: list[TokenTransfer] | None = None, nft_transfers: list[TokenNftTransfer] | None = None
     ) -> None:
@@ -83,7 +85,7 @@ class TokenAirdropTransaction(AbstractTokenTransferTransaction["TokenAirdropTran
         Returns:
             TransactionBody: The protobuf transaction body containing the token airdrop details.
         """
-        token_airdrop_body = self._build_proto_body()
+        token_airdrop_body = self._get_proto_body()
         transaction_body = self.build_base_transaction_body()
         transaction_body.tokenAirdrop.CopyFrom(token_airdrop_body)
         return transaction_body
@@ -16,6 +16,8 @@ class TokenCancelAirdropTransaction(Transaction):
     This transaction allows users to cancel one or more airdrops for both fungible tokens and NFTs.
     """
 
+    _proto_body_field = "tokenCancelAirdrop"
+
     def __init__(self, pending_airdrops: list[PendingAirdropId] | None = None) -> None:
         """
         Initializes a new TokenCancelAirdropTransaction instance.
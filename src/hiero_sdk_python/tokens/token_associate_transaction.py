@@ -31,6 +31,8 @@ class TokenAssociateTransaction(Transaction):
     to build and execute a token association transaction.
     """
 
+    _proto_body_field = "tokenAssociate"
+
     def __init__(self, account_id: AccountId | None = None, token_ids: list[TokenId] | None = None) -> None:
         """
         Initializes a new TokenAssociateTransaction instance with optional keyword arguments.
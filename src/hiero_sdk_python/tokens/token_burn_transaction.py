@@ -30,6 +30,8 @@ class TokenBurnTransaction(Transaction):
     to build and execute a token burn transaction.
     """
 
+    _proto_body_field = "tokenBurn"
+
     def __init__(
         self, token_id: TokenId | None = None, amount: int | None = None, serials: list[int] | None = None
     ) -> None:
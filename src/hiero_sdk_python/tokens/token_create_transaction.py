@@ -114,6 +114,8 @@ class TokenCreateTransaction(Transaction):
     to build and execute a token creation transaction.
     """
 
+    _proto_body_field = "tokenCreation"
+
     def __init__(self, token_params: TokenParams | None = None, keys: TokenKeys | None = None) -> None:
         """
         Initializes a new TokenCreateTransaction instance with token parameters and optional keys.
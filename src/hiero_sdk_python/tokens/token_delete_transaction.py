@@ -28,6 +28,8 @@ class TokenDeleteTransaction(Transaction):
     to build and execute a token deletion transaction.
     """
 
+    _proto_body_field = "tokenDeletion"
+
     def __init__(self, token_id: TokenId | None = None) -> None:
         """
         Initializes a new TokenDeleteTransaction instance with optional token_id.
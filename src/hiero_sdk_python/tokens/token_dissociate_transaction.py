@@ -37,6 +37,8 @@ class TokenDissociateTransaction(Transaction):
     to build and execute a token dissociate transaction.
     """
 
+    _proto_body_field = "tokenDissociate"
+
     def __init__(self, account_id: AccountId | None = None, token_ids: list[TokenId] | None = None) -> None:
         """
         Initializes a new TokenDissociateTransaction instance with default values.
@@ -25,6 +25,8 @@ if TYPE_CHECKING:
 class TokenFeeScheduleUpdateTransaction(Transaction):
     """Updates a token's custom fee schedule."""
 
+    _proto_body_field = "token_fee_schedule_update"
+
     def __init__(
         self,
         token_id: TokenId | None = None,
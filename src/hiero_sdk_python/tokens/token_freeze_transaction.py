@@ -29,6 +29,8 @@ class TokenFreezeTransaction(Transaction):
     to build and execute a token freeze transaction.
     """
 
+    _proto_body_field = "tokenFreeze"
+
     def __init__(self, token_id: TokenId | None = None, account_id: AccountId | None = None) -> None:
         """
         Initializes a new TokenFreezeTransaction instance with optional token_id and account_id.
@@ -30,6 +30,8 @@ class TokenGrantKycTransaction(Transaction):
     to build and execute a token grant KYC transaction.
     """
 
+    _proto_body_field = "tokenGrantKyc"
+
     def __init__(self, token_id: TokenId | None = None, account_id: AccountId | None = None) -> None:
         """
         Initializes a new TokenGrantKycTransaction instance with the token ID and account ID.
@@ -28,6 +28,8 @@ class TokenMintTransaction(Transaction):
     to build and execute a token minting transaction.
     """
 
+    _proto_body_field = "tokenMint"
+
     def __init__(
         self, token_id: TokenId | None = None, amount: int | None = None, metadata: bytes | list[bytes] | None = None
     ) -> None:
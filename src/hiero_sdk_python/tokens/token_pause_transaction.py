@@ -33,6 +33,8 @@ class TokenPauseTransaction(Transaction):
     to build and execute a token pause transaction.
     """
 
+    _proto_body_field = "token_pause"
+
     def __init__(self, token_id: TokenId | None = None) -> None:
         """
         Initializes a new TokenPauseTransaction instance with optional token_id.
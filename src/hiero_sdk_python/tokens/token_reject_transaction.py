@@ -36,6 +36,8 @@ class TokenRejectTransaction(Transaction):
     to build and execute a token reject transaction.
     """
 
+    _proto_body_field = "tokenReject"
+
     def __init__(
         self,
         owner_id: AccountId | None = None,
@@ -31,6 +31,8 @@ class TokenRevokeKycTransaction(Transaction):
     to build and execute a token revoke KYC transaction.
     """
 
+    _proto_body_field = "tokenRevokeKyc"
+
     def __init__(self, token_id: TokenId | None = None, account_id: AccountId | None = None) -> None:
         """
         Initializes a new TokenRevokeKycTransaction instance with the token ID and account ID.
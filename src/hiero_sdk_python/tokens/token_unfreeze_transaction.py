@@ -29,6 +29,8 @@ class TokenUnfreezeTransaction(Transaction):
     to build and execute a token unfreeze transaction.
     """
 
+    _proto_body_field = "tokenUnfreeze"
+
     def __init__(self, account_id: AccountId | None = None, token_id: TokenId | None = None) -> None:
         """
         Initializes a new TokenUnfreezeTransaction instance with default values.
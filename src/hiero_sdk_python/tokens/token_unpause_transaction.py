@@ -29,6 +29,8 @@ class TokenUnpauseTransaction(Transaction):
     to build and execute a token unpause transaction.
     """
 
+    _proto_body_field = "token_unpause"
+
     def __init__(self, token_id: TokenId | None = None) -> None:
         """
         Initializes a new TokenUnpauseTransaction instance with default values.
@@ -31,6 +31,8 @@ class TokenUpdateNftsTransaction(Transaction):
     to build and execute a token update NFTs transaction.
     """
 
+    _proto_body_field = "token_update_nfts"
+
     def __init__(
         self, token_id: TokenId | None = None, serial_numbers: list[int] | None = None, metadata: bytes | None = None
     ) -> None:
@@ -98,6 +98,8 @@ class TokenUpdateTransaction(Transaction):
             Defaults to FULL_VALIDATION.
     """
 
+    _proto_body_field = "tokenUpdate"
+
     def __init__(
         self,
         token_id: TokenId | None = None,
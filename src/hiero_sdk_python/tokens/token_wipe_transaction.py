@@ -30,6 +30,8 @@ class TokenWipeTransaction(Transaction):
     to build and execute a token wipe transaction.
     """
 
+    _proto_body_field = "tokenWipe"
+
     def __init__(
         self,
         token_id: TokenId | None = None,
@@ -0,0 +1,159 @@
+"""
+Optional OpenTelemetry span hooks for the Hiero SDK.
+
+Spans are emitted around freezing, signing, gRPC submission, retry backoff and
+receipt polling so that the wall time of a single `Transaction.execute` can be
+broken down in a trace viewer.
+
+Tracing is only active when `opentelemetry-api` is installed (the `otel` extra,
+`pip install "hiero-sdk-python[otel]"`) *and* an SDK `TracerProvider` has been
+registered (e.g. `trace.set_tracer_provider(...)`).
+Otherwise every hook is a cheap no-op and the SDK has no runtime dependency
+on OpenTelemetry.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from enum import Enum
+from typing import Any
+
+
+try:
+    from opentelemetry import trace as otel_trace
+except ImportError:
+    otel_trace = None
+
+
+TRACER_NAME = "hiero_sdk_python"
+
+# Span names
+SPAN_EXECUTE = "hiero.transaction.execute"
+SPAN_FREEZE = "hiero.transaction.freeze"
+SPAN_BUILD_BODY = "hiero.transaction.build_body"
+SPAN_SIGN = "hiero.transaction.sign"
+SPAN_GRPC_CALL = "hiero.grpc.call"
+SPAN_BACKOFF = "hiero.backoff"
+SPAN_RECEIPT = "hiero.receipt.query"
+
+# Attribute keys
+ATTR_TRANSACTION_TYPE = "hiero.transaction.type"
+ATTR_TRANSACTION_ID = "hiero.transaction.id"
+ATTR_NODE = "hiero.node.account_id"
+ATTR_NODE_COUNT = "hiero.node.count"
+ATTR_ATTEMPT = "hiero.attempt"
+ATTR_METHOD = "hiero.method"
+ATTR_STATUS = "hiero.status"
+ATTR_EXECUTION_STATE = "hiero.execution_state"
+ATTR_GRPC_STATUS = "rpc.grpc.status_code"
+ATTR_BACKOFF = "hiero.backoff.seconds"
+ATTR_KEY_TYPE = "hiero.key.type"
+
+_cached_provider: Any = None
+_cached_tracer: Any = None
+
+
+def _get_tracer():
+    """
+    Return a tracer from the configured TracerProvider, or None when tracing is inactive.
+
+    The tracer is cached per provider so that registering a provider after the SDK
+    was imported still takes effect.
+    """
+    global _cached_provider, _cached_tracer
+
+    if otel_trace is None:
+        return None
+
+    provider = otel_trace.get_tracer_provider()
+    if isinstance(provider, (otel_trace.ProxyTracerProvider, otel_trace.NoOpTracerProvider)):
+        return None
+
+    if provider is not _cached_provider:
+        _cached_tracer = provider.get_tracer(TRACER_NAME)
+        _cached_provider = provider
+
+    return _cached_tracer
+
+
+def _clean_attribute(value: Any) -> str | bool | int | float:
+    """Convert a value into a type OpenTelemetry can carry as an attribute."""
+    if isinstance(value, Enum):
+        return value.name
+    if isinstance(value, (str, bool, int, float)):
+        return value
+    return str(value)
+
+
+def _clean_attributes(attributes: Mapping[str, Any] | None) -> dict[str, Any]:
+    """Drop unset attributes and convert the rest with `_clean_attribute`."""
+    if not attributes:
+        return {}
+    return {key: _clean_attribute(value) for key, value in attributes.items() if value is not None}
+
+
+@contextmanager
+def _span(name: str, attributes: Mapping[str, Any] | None = None) -> Iterator[Any]:
+    """
+    Run the enclosed block inside a span when tracing is active.
+
+    Exceptions raised inside the block are recorded on the span and re-raised.
+
+    Args:
+        name (str): The span name.
+        attributes (Mapping[str, Any], optional): Initial span attributes; None values are dropped.
+
+    Yields:
+        The active span, or None when tracing is inactive.
+    """
+    tracer = _get_tracer()
+    if tracer is None:
+        yield None
+        return
+
+    with tracer.start_as_current_span(name, attributes=_clean_attributes(attributes)) as span:
+        yield span
+
+
+def _set_attributes(span: Any, attributes: Mapping[str, Any]) -> None:
+    """Set attributes on a span yielded by `_span`, ignoring None spans."""
+    if span is not None:
+        span.set_attributes(_clean_attributes(attributes))
+
+
+def _start_span(name: str, attributes: Mapping[str, Any] | None = None) -> Any:
+    """
+    Start a span without making it current, for work whose outcome is only known later.
+
+    The span must be finished with `_end_span`.
+
+    Returns:
+        The started span, or None when tracing is inactive.
+    """
+    tracer = _get_tracer()
+    if tracer is None:
+        return None
+    return tracer.start_span(name, attributes=_clean_attributes(attributes))
+
+
+def _end_span(span: Any, attributes: Mapping[str, Any] | None = None, error: BaseException | None = None) -> None:
+    """
+    Finish a span created by `_start_span`, optionally recording final attributes and an error.
+
+    Args:
+        span: The span returned by `_start_span` (None is ignored).
+        attributes (Mapping[str, Any], optional): Attributes describing the outcome.
+        error (BaseException, optional): The error that ended the operation.
+    """
+    if span is None:
+        return
+
+    if attributes:
+        span.set_attributes(_clean_attributes(attributes))
+
+    if error is not None:
+        span.record_exception(error)
+        span.set_status(otel_trace.Status(otel_trace.StatusCode.ERROR, str(error)))
+
+    span.end()
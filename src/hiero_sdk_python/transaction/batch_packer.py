@@ -0,0 +1,280 @@
+"""
+hiero_sdk_python.transaction.batch_packer.py.
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Defines BatchPacker, which greedily packs a stream of transactions into
+BatchTransaction envelopes that respect the network's inner-transaction count
+and transaction size limits, and submits them.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from hiero_sdk_python.crypto.private_key import PrivateKey
+from hiero_sdk_python.crypto.public_key import PublicKey
+from hiero_sdk_python.query.transaction_get_receipt_query import TransactionGetReceiptQuery
+from hiero_sdk_python.transaction.batch_transaction import BatchTransaction
+from hiero_sdk_python.transaction.transaction import Transaction
+
+
+if TYPE_CHECKING:
+    from hiero_sdk_python.account.account_id import AccountId
+    from hiero_sdk_python.client.client import Client
+    from hiero_sdk_python.transaction.transaction_id import TransactionId
+    from hiero_sdk_python.transaction.transaction_receipt import TransactionReceipt
+
+
+# Network limit on the number of inner transactions in one atomic batch
+MAX_INNER_TRANSACTIONS = 50
+
+# Network limit on the size of a signed transaction, in bytes
+MAX_TRANSACTION_SIZE = 6144
+
+# Bytes reserved for the envelope's own body fields (transaction ID, node, fee,
+# duration, memo) and for the operator and batch key signatures
+DEFAULT_ENVELOPE_OVERHEAD = 512
+
+# Inner transaction receipts fetched at the same time
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+def _varint_size(value: int) -> int:
+    size = 1
+    while value >= 0x80:
+        value >>= 7
+        size += 1
+    return size
+
+
+def _inner_transaction_cost(transaction: Transaction) -> int:
+    """Bytes an inner transaction adds to the envelope's `transactions` field."""
+    signed_size = len(transaction._make_request().signedTransactionBytes)
+    return 1 + _varint_size(signed_size) + signed_size
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """
+    Outcome of one inner transaction submitted by a `BatchPacker`.
+
+    Attributes:
+        transaction_id (TransactionId): The ID of the inner transaction.
+        batch_transaction_id (TransactionId): The ID of the envelope that carried it.
+        receipt (TransactionReceipt): The receipt of the inner transaction.
+        batch_receipt (TransactionReceipt): The receipt of the envelope.
+    """
+
+    transaction_id: TransactionId
+    batch_transaction_id: TransactionId
+    receipt: TransactionReceipt
+    batch_receipt: TransactionReceipt
+
+
+class BatchPackerError(Exception):
+    """
+    Raised by `BatchPacker.execute` after submitting an envelope or fetching a receipt failed.
+
+    Attributes:
+        results (dict[TransactionId, BatchResult]): The results collected before the
+            failure, including every inner receipt of the failed envelope that was fetched.
+        error (Exception): The error execution failed with, also set as `__cause__`.
+    """
+
+    def __init__(self, results: dict[TransactionId, BatchResult], error: Exception) -> None:
+        self.results = results
+        self.error = error
+        super().__init__(f"Batch execution failed after {len(results)} results: {error}")
+
+
+class BatchPacker:
+    """
+    Packs many small transactions into as few BatchTransactions as the network allows.
+
+    Un-frozen transactions are batchified (batch key set, frozen with the client and
+    signed by the operator). Transactions that were already batchified, e.g. because
+    they need extra signatures, are packed as they are.
+
+    Example:
+        packer = BatchPacker(batch_key)
+        results = packer.execute(client, transfers)
+        status = results[transfers[0].transaction_id].receipt.status
+    """
+
+    def __init__(
+        self,
+        batch_key: PrivateKey | PublicKey,
+        max_inner_transactions: int = MAX_INNER_TRANSACTIONS,
+        max_batch_size: int = MAX_TRANSACTION_SIZE,
+        envelope_overhead: int = DEFAULT_ENVELOPE_OVERHEAD,
+    ) -> None:
+        """
+        Initialize a packer.
+
+        Args:
+            batch_key (PrivateKey | PublicKey): The batch key set on every inner transaction.
+                A PrivateKey also signs each envelope; with a PublicKey the envelope must be
+                signed by the operator or by the caller before submission.
+            max_inner_transactions (int): Maximum inner transactions per envelope.
+            max_batch_size (int): Maximum size in bytes of a signed envelope.
+            envelope_overhead (int): Bytes of `max_batch_size` reserved for the envelope's
+                own fields and signatures.
+
+        Raises:
+            TypeError: If batch_key is not a PrivateKey or PublicKey.
+            ValueError: If a limit is not positive or the overhead leaves no room for payload.
+        """
+        if not isinstance(batch_key, (PrivateKey, PublicKey)):
+            raise TypeError(f"batch_key must be a PrivateKey or PublicKey, got {type(batch_key).__name__}")
+
+        if not 0 < max_inner_transactions <= MAX_INNER_TRANSACTIONS:
+            raise ValueError(f"max_inner_transactions must be between 1 and {MAX_INNER_TRANSACTIONS}")
+
+        if max_batch_size <= 0 or envelope_overhead < 0 or envelope_overhead >= max_batch_size:
+            raise ValueError("max_batch_size must be positive and larger than envelope_overhead")
+
+        self.batch_key = batch_key
+        self.max_inner_transactions = max_inner_transactions
+        self.max_batch_size = max_batch_size
+        self.envelope_overhead = envelope_overhead
+
+    @property
+    def _payload_budget(self) -> int:
+        return self.max_batch_size - self.envelope_overhead
+
+    def _prepare(self, client: Client, transaction: Transaction) -> Transaction:
+        """Batchify an un-frozen transaction, or check that a frozen one was batchified."""
+        if not transaction._transaction_body_bytes:
+            return transaction.batchify(client, self.batch_key)
+
+        if transaction.batch_key is None:
+            raise ValueError(f"Frozen transaction {transaction.transaction_id} has no batch key")
+
+        return transaction
+
+    def _seal(self, client: Client, inner_transactions: list[Transaction]) -> BatchTransaction:
+        """Wrap inner transactions in a frozen (and, with a private batch key, signed) envelope."""
+        batch = BatchTransaction(inner_transactions).freeze_with(client)
+        if isinstance(self.batch_key, PrivateKey):
+            batch.sign(self.batch_key)
+        return batch
+
+    def pack(self, client: Client, transactions: Iterable[Transaction]) -> Iterator[BatchTransaction]:
+        """
+        Greedily pack transactions into frozen BatchTransactions.
+
+        The input is consumed lazily, so arbitrarily long streams can be packed with at
+        most one envelope's worth of transactions in memory. Order is preserved.
+
+        Args:
+            client (Client): The client used to freeze and sign.
+            transactions (Iterable[Transaction]): The transactions to pack.
+
+        Yields:
+            BatchTransaction: Frozen envelopes, each within the count and size limits.
+
+        Raises:
+            ValueError: If a single transaction does not fit in an envelope on its own.
+        """
+        pending: list[Transaction] = []
+        pending_size = 0
+
+        for transaction in transactions:
+            inner = self._prepare(client, transaction)
+            cost = _inner_transaction_cost(inner)
+
+            if cost > self._payload_budget:
+                raise ValueError(
+                    f"Transaction {inner.transaction_id} is {cost} bytes, which exceeds the "
+                    f"{self._payload_budget} bytes available in a batch"
+                )
+
+            if pending and (len(pending) >= self.max_inner_transactions or pending_size + cost > self._payload_budget):
+                yield self._seal(client, pending)
+                pending, pending_size = [], 0
+
+            pending.append(inner)
+            pending_size += cost
+
+        if pending:
+            yield self._seal(client, pending)
+
+    def execute(
+        self,
+        client: Client,
+        transactions: Iterable[Transaction],
+        timeout: int | float | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> dict[TransactionId, BatchResult]:
+        """
+        Pack, submit and collect the receipts of every transaction.
+
+        Envelopes are submitted one after another as they are packed, and the receipts
+        of an envelope's inner transactions are fetched concurrently. Receipts are not
+        validated: a failed envelope is reported through each result's `batch_receipt`
+        and `receipt` status rather than raised.
+
+        Args:
+            client (Client): The client used to freeze, sign and submit.
+            transactions (Iterable[Transaction]): The transactions to submit.
+            timeout (int | float, optional): The execution timeout of each network request.
+            max_concurrency (int): Maximum number of inner receipts fetched at the same time.
+
+        Returns:
+            dict[TransactionId, BatchResult]: The result of every inner transaction, keyed
+                by its transaction ID, in submission order.
+
+        Raises:
+            ValueError: If max_concurrency is not positive.
+            BatchPackerError: If packing, submitting or fetching a receipt failed. It
+                carries the results collected so far.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        results: dict[TransactionId, BatchResult] = {}
+
+        def fetch_receipt(node_id: AccountId, transaction_id: TransactionId) -> TransactionReceipt:
+            return (
+                TransactionGetReceiptQuery()
+                .set_transaction_id(transaction_id)
+                .set_node_account_ids([node_id])
+                .execute(client, timeout)
+            )
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="batch-receipts") as executor:
+                for batch in self.pack(client, transactions):
+                    response = batch.execute(client, timeout, wait_for_receipt=False)
+                    batch_receipt = response.get_receipt(client, timeout=timeout, validate_status=False)
+
+                    transaction_ids = batch.get_inner_transaction_ids()
+                    futures = [
+                        executor.submit(fetch_receipt, response.node_id, transaction_id)
+                        for transaction_id in transaction_ids
+                    ]
+
+                    # Every receipt that was fetched is kept, even when another one failed
+                    error = None
+                    for transaction_id, future in zip(transaction_ids, futures, strict=True):
+                        try:
+                            receipt = future.result()
+                        except Exception as e:  # noqa: BLE001, PERF203
+                            error = error or e
+                            continue
+                        results[transaction_id] = BatchResult(
+                            transaction_id=transaction_id,
+                            batch_transaction_id=batch.transaction_id,
+                            receipt=receipt,
+                            batch_receipt=batch_receipt,
+                        )
+
+                    if error is not None:
+                        raise error
+        except Exception as e:
+            raise BatchPackerError(results, e) from e
+
+        return results
@@ -21,6 +21,8 @@ from hiero_sdk_python.transaction.transaction_id import TransactionId
 class BatchTransaction(Transaction):
     """Represents an atomic batch transaction on the Hedera network."""
 
+    _proto_body_field = "atomic_batch"
+
     def __init__(self, inner_transactions: list[Transaction] | None = None) -> None:
         """
         Initialize a new BatchTransaction.
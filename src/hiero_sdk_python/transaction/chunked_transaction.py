@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import copy
 from abc import ABC, abstractmethod
 from typing import Literal, overload
 
 from hiero_sdk_python.client.client import Client
-from hiero_sdk_python.crypto.private_key import PrivateKey
-from hiero_sdk_python.hapi.services import timestamp_pb2
+from hiero_sdk_python.crypto.signer import SigningKey
+from hiero_sdk_python.hapi.services import timestamp_pb2, transaction_pb2
 from hiero_sdk_python.transaction.transaction import Transaction
 from hiero_sdk_python.transaction.transaction_id import TransactionId
 from hiero_sdk_python.transaction.transaction_receipt import TransactionReceipt
@@ -33,7 +34,7 @@ class ChunkedTransaction(Transaction, ABC):
         self._total_chunks: int = 1
         self._initial_transaction_id: TransactionId | None = None
         self._transaction_ids: list[TransactionId] = []
-        self._signing_keys: list[PrivateKey] = []
+        self._signing_keys: list[SigningKey] = []
 
         # Chunk configuration (set by subclasses)
         self.chunk_size: int = 1024
@@ -133,6 +134,10 @@ class ChunkedTransaction(Transaction, ABC):
             return self
 
         self._validate_chunking()
+
+        if self.transaction_id is None and client is not None and client.operator_account_id is not None:
+            # Reserve a valid start for every chunk so that IDs the client hands out later cannot collide
+            self.transaction_id = client.generate_transaction_ids(self.get_required_chunks())[0]
         self._resolve_transaction_id(client)
 
         if self.transaction_id.valid_start is None:
@@ -293,7 +298,7 @@ class ChunkedTransaction(Transaction, ABC):
 
         return responses
 
-    def sign(self, private_key: PrivateKey) -> ChunkedTransaction:
+    def sign(self, private_key: SigningKey) -> ChunkedTransaction:
         """
         Signs the transaction using the provided private key.
 
@@ -301,7 +306,7 @@ class ChunkedTransaction(Transaction, ABC):
         executing all chunks.
 
         Args:
-            private_key (PrivateKey): The private key to sign with.
+            private_key (SigningKey): The private key or Signer to sign with.
 
         Returns:
             ChunkedTransaction: This transaction instance for chaining.
@@ -312,6 +317,36 @@ class ChunkedTransaction(Transaction, ABC):
             self._signing_keys.append(private_key)
         return self
 
+    def _chunk_to_proto(self, chunk_index: int) -> transaction_pb2.Transaction:
+        """
+        Builds the protobuf Transaction of one chunk for the current node.
+
+        Unlike `execute_all`, this does not re-freeze the transaction: the chunk body is
+        built on a shallow copy, so the frozen bodies, signatures and chunk index of this
+        transaction are left untouched and several chunks can be built independently.
+        Signatures already collected for an identical body are carried over.
+
+        Args:
+            chunk_index (int): The zero-based index of the chunk.
+
+        Returns:
+            Transaction: The protobuf Transaction message for the chunk.
+
+        Raises:
+            Exception: If the transaction is not frozen.
+            IndexError: If chunk_index is out of range.
+        """
+        self._require_frozen()
+
+        chunk = copy.copy(self)
+        chunk._current_chunk_index = chunk_index
+        chunk.transaction_id = self._transaction_ids[chunk_index]
+
+        node_account_id = self._node_account_ids.current
+        chunk._transaction_body_bytes = {node_account_id: chunk.build_transaction_body().SerializeToString()}
+
+        return chunk._to_proto_for_node(node_account_id)
+
     @property
     def body_size_all_chunks(self) -> list[int]:
         """
@@ -0,0 +1,342 @@
+"""
+hiero_sdk_python.transaction.presigned_pool.py.
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Defines PresignedPool, which freezes and signs queued transactions on a background
+thread so that submitting one only costs the network round trip.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from hiero_sdk_python.crypto.private_key import PrivateKey
+from hiero_sdk_python.crypto.signer import AsyncSigner, Signer, SigningKey
+from hiero_sdk_python.transaction.chunked_transaction import ChunkedTransaction
+from hiero_sdk_python.transaction.transaction import Transaction
+
+
+if TYPE_CHECKING:
+    from hiero_sdk_python.account.account_id import AccountId
+    from hiero_sdk_python.client.client import Client
+    from hiero_sdk_python.transaction.transaction_receipt import TransactionReceipt
+    from hiero_sdk_python.transaction.transaction_response import TransactionResponse
+
+
+# Seconds before a transaction's validity window closes at which it is no longer
+# handed out, leaving time for the submission to reach the network
+DEFAULT_REFRESH_MARGIN_SECONDS = 10
+
+# Longest the worker sleeps between expiry checks, in seconds
+_MAX_IDLE_SECONDS = 1.0
+
+
+@dataclass
+class _Entry:
+    transaction: Transaction
+    payer: AccountId
+    signing_keys: tuple[SigningKey, ...]
+    expires_at: float = 0.0
+    error: BaseException | None = None
+    refreshes: int = 0
+
+
+class PresignedPool:
+    """
+    Prepares frozen, signed transactions ahead of time for latency-critical submission.
+
+    Transactions are queued with `put` fully specified but not frozen. A background
+    worker assigns each a transaction ID, freezes it for the client's nodes and signs
+    it with the given keys and the operator key. Transactions queued together are
+    signed together through the client's signing backend, so a Signer receives one
+    request per batch rather than one per transaction. `take` then returns prepared
+    transactions in queue order, and `execute` submits one, which no longer has to
+    freeze or sign anything.
+
+    A prepared transaction is usable until `refresh_margin` seconds before its
+    `transaction_valid_duration` runs out. Stale transactions are re-prepared with a
+    new transaction ID, or discarded when `refresh_expired` is False.
+
+    Example:
+        with PresignedPool(client) as pool:
+            pool.put(TransferTransaction().add_hbar_transfer(...).add_hbar_transfer(...))
+            ...
+            receipt = pool.execute()
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        refresh_margin: float = DEFAULT_REFRESH_MARGIN_SECONDS,
+        refresh_expired: bool = True,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initializes a new PresignedPool. Call `start` (or use it as a context manager)
+        to begin preparing transactions.
+
+        Args:
+            client (Client): The client used to generate IDs, freeze, sign and submit.
+            refresh_margin (float): Seconds before expiry at which a prepared
+                transaction is considered stale.
+            refresh_expired (bool): Whether stale transactions are re-prepared rather
+                than discarded.
+            clock (Callable[[], float]): Returns the current time in seconds since the epoch.
+
+        Raises:
+            ValueError: If refresh_margin is negative.
+        """
+        if refresh_margin < 0:
+            raise ValueError("refresh_margin must be non-negative")
+
+        self._client = client
+        self._refresh_margin = refresh_margin
+        self._refresh_expired = refresh_expired
+        self._clock = clock
+
+        self._condition = threading.Condition()
+        self._pending: deque[_Entry] = deque()
+        self._ready: deque[_Entry] = deque()
+        self._preparing = 0
+        self._discarded = 0
+        self._closed = False
+        self._worker: threading.Thread | None = None
+
+    def __enter__(self) -> PresignedPool:
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        """Return the number of prepared transactions ready to be taken."""
+        with self._condition:
+            return len(self._ready)
+
+    @property
+    def pending(self) -> int:
+        """Return the number of queued transactions not yet prepared."""
+        with self._condition:
+            return len(self._pending) + self._preparing
+
+    @property
+    def discarded(self) -> int:
+        """Return the number of transactions discarded because they went stale."""
+        with self._condition:
+            return self._discarded
+
+    def start(self) -> PresignedPool:
+        """
+        Start the background worker.
+
+        Returns:
+            PresignedPool: This pool, for chaining.
+        """
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("PresignedPool is closed")
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="presigned-pool", daemon=True)
+                self._worker.start()
+        return self
+
+    def close(self) -> None:
+        """Stop the background worker. Transactions still queued are dropped."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            worker = self._worker
+
+        if worker is not None and worker is not threading.current_thread():
+            worker.join()
+
+    def put(self, transaction: Transaction, signing_keys: Iterable[SigningKey] = ()) -> None:
+        """
+        Queue a transaction to be prepared.
+
+        The transaction must not be frozen. If it has a transaction ID, its account
+        pays for this and any refreshed version; otherwise the client's operator pays.
+
+        Args:
+            transaction (Transaction): The fully specified transaction.
+            signing_keys (Iterable[SigningKey]): PrivateKeys, Signers or AsyncSigners that
+                sign in addition to the operator.
+
+        Raises:
+            TypeError: If transaction or a signing key has the wrong type.
+            ValueError: If the transaction is frozen, needs several chunks, or has no payer.
+        """
+        if not isinstance(transaction, Transaction):
+            raise TypeError(f"transaction must be a Transaction, got {type(transaction).__name__}")
+
+        keys = tuple(signing_keys)
+        for key in keys:
+            if not isinstance(key, (PrivateKey, Signer, AsyncSigner)):
+                raise TypeError(f"signing keys must be PrivateKeys, Signers or AsyncSigners, got {type(key).__name__}")
+
+        if transaction._transaction_body_bytes:
+            raise ValueError("transaction must not be frozen; the pool freezes it")
+
+        if isinstance(transaction, ChunkedTransaction) and transaction.get_required_chunks() > 1:
+            raise ValueError("multi-chunk transactions cannot be pre-signed")
+
+        payer = transaction.transaction_id.account_id if transaction.transaction_id else None
+        payer = payer or self._client.operator_account_id
+        if payer is None:
+            raise ValueError("transaction has no payer: set a transaction ID or a client operator")
+
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("PresignedPool is closed")
+            self._pending.append(_Entry(transaction, payer, keys))
+            self._condition.notify_all()
+
+    def take(self, timeout: float | None = None) -> Transaction:
+        """
+        Remove and return the oldest prepared transaction, waiting for one if needed.
+
+        Args:
+            timeout (float, optional): Seconds to wait. Waits indefinitely when None.
+
+        Returns:
+            Transaction: A frozen transaction signed by the operator and its signing keys.
+
+        Raises:
+            TimeoutError: If no transaction became ready in time.
+            Exception: Whatever preparing the transaction raised, e.g. from freezing it.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with self._condition:
+            while True:
+                self._evict_stale()
+
+                if self._ready:
+                    entry = self._ready.popleft()
+                    if entry.error is not None:
+                        raise entry.error
+                    return entry.transaction
+
+                if self._closed:
+                    raise RuntimeError("PresignedPool is closed")
+
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(f"No pre-signed transaction became ready within {timeout}s")
+
+                self._condition.wait(_MAX_IDLE_SECONDS if remaining is None else min(remaining, _MAX_IDLE_SECONDS))
+
+    def execute(
+        self,
+        timeout: float | None = None,
+        wait_for_receipt: bool = True,
+        validate_status: bool = False,
+    ) -> TransactionReceipt | TransactionResponse:
+        """
+        Take the oldest prepared transaction and submit it with the pool's client.
+
+        Args:
+            timeout (float, optional): Seconds to wait for a prepared transaction, and
+                the execution timeout of the submission.
+            wait_for_receipt (bool): Whether to wait for the receipt.
+            validate_status (bool): Whether to raise if the receipt status is not SUCCESS.
+
+        Returns:
+            TransactionReceipt | TransactionResponse: As returned by `Transaction.execute`.
+        """
+        transaction = self.take(timeout)
+        return transaction.execute(
+            self._client, timeout, wait_for_receipt=wait_for_receipt, validate_status=validate_status
+        )
+
+    def _evict_stale(self) -> None:
+        """Move stale entries off the front of the ready queue. Must hold the lock."""
+        now = self._clock()
+        # Entries are prepared in valid start order, so the stalest ones are at the front
+        while self._ready and self._ready[0].error is None and self._ready[0].expires_at <= now:
+            entry = self._ready.popleft()
+            if self._refresh_expired:
+                entry.refreshes += 1
+                self._pending.append(entry)
+                self._condition.notify_all()
+            else:
+                self._discarded += 1
+
+    def _freeze(self, entry: _Entry) -> None:
+        transaction = entry.transaction
+
+        if entry.refreshes:
+            # Unfreeze so that the transaction is rebuilt under a new transaction ID
+            transaction._transaction_body_bytes.clear()
+            transaction._signature_map.clear()
+            if isinstance(transaction, ChunkedTransaction):
+                transaction._transaction_ids.clear()
+                transaction._initial_transaction_id = None
+
+        transaction.transaction_id = self._client.generate_transaction_ids(1, entry.payer)[0]
+        transaction.freeze_with(self._client)
+
+        valid_start = transaction.transaction_id.valid_start
+        entry.expires_at = (
+            valid_start.seconds
+            + valid_start.nanos / 1_000_000_000
+            + transaction.transaction_valid_duration
+            - self._refresh_margin
+        )
+        if entry.expires_at <= self._clock():
+            raise ValueError("transaction_valid_duration is too short for the pool's refresh_margin")
+
+    def _sign(self, entries: list[_Entry]) -> None:
+        """Sign frozen entries with one signing backend call per key, recording failures on the entries."""
+        operator_key = self._client.operator_private_key
+        groups: dict[bytes, tuple[SigningKey, list[_Entry]]] = {}
+        for entry in entries:
+            keys = entry.signing_keys if operator_key is None else (*entry.signing_keys, operator_key)
+            for key in keys:
+                groups.setdefault(key.public_key().to_bytes_raw(), (key, []))[1].append(entry)
+
+        for key, group in groups.values():
+            group = [entry for entry in group if entry.error is None]
+            if not group:
+                continue
+            try:
+                self._client.signing_backend.sign_transactions([entry.transaction for entry in group], [key])
+            except Exception as e:  # noqa: BLE001, PERF203
+                for entry in group:
+                    entry.error = e
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._closed and not self._pending:
+                    self._evict_stale()
+                    if self._pending:
+                        break
+                    wait = _MAX_IDLE_SECONDS
+                    if self._ready and self._ready[0].error is None:
+                        wait = min(self._ready[0].expires_at - self._clock(), _MAX_IDLE_SECONDS)
+                    self._condition.wait(wait)
+
+                if self._closed:
+                    return
+
+                entries = list(self._pending)
+                self._pending.clear()
+                self._preparing += len(entries)
+
+            for entry in entries:
+                try:
+                    self._freeze(entry)
+                except Exception as e:  # noqa: BLE001, PERF203
+                    entry.error = e
+            self._sign(entries)
+
+            with self._condition:
+                self._preparing -= len(entries)
+                self._ready.extend(entries)
+                self._condition.notify_all()
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from hiero_sdk_python.account.account_id import AccountId
-from hiero_sdk_python.crypto.private_key import PrivateKey
+from hiero_sdk_python.crypto.signer import SigningKey
 from hiero_sdk_python.hapi.services import transaction_pb2
 from hiero_sdk_python.hbar import Hbar
 from hiero_sdk_python.transaction.transaction_id import TransactionId
@@ -9,7 +9,7 @@ from hiero_sdk_python.transaction.transfer_transaction import TransferTransactio
 
 
 def build_query_payment_transaction(
-    payer_account_id: AccountId, payer_private_key: PrivateKey, node_account_id: AccountId, amount: Hbar
+    payer_account_id: AccountId, payer_private_key: SigningKey, node_account_id: AccountId, amount: Hbar
 ) -> transaction_pb2.TransactionBody:
     """
     Build and sign a TransferTransaction that sends `amount` of HBAR from
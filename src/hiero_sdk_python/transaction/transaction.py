@@ -1,19 +1,38 @@
 from __future__ import annotations
 
 import hashlib
-from typing import TYPE_CHECKING, Literal, overload
+import importlib
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, ClassVar, Literal, overload
+
+from google.protobuf.message import DecodeError
 
 from hiero_sdk_python.account.account_id import AccountId
 from hiero_sdk_python.client.client import Client
 from hiero_sdk_python.crypto.key import Key
+from hiero_sdk_python.crypto.signing_backend import InProcessSigningBackend, SigningBackend
 from hiero_sdk_python.exceptions import PrecheckError
 from hiero_sdk_python.executable import _Executable, _ExecutionState
+from hiero_sdk_python.hapi.sdk import transaction_list_pb2
 from hiero_sdk_python.hapi.services import basic_types_pb2, transaction_contents_pb2, transaction_pb2
 from hiero_sdk_python.hapi.services.schedulable_transaction_body_pb2 import SchedulableTransactionBody
 from hiero_sdk_python.hapi.services.transaction_response_pb2 import TransactionResponse as TransactionResponseProto
 from hiero_sdk_python.hbar import Hbar
 from hiero_sdk_python.query.fee_estimate_query import FeeEstimateQuery
 from hiero_sdk_python.response_code import ResponseCode
+from hiero_sdk_python.tracing import (
+    ATTR_KEY_TYPE,
+    ATTR_NODE,
+    ATTR_NODE_COUNT,
+    ATTR_TRANSACTION_ID,
+    ATTR_TRANSACTION_TYPE,
+    SPAN_BUILD_BODY,
+    SPAN_EXECUTE,
+    SPAN_FREEZE,
+    SPAN_SIGN,
+    _set_attributes,
+    _span,
+)
 from hiero_sdk_python.transaction.transaction_id import TransactionId
 from hiero_sdk_python.transaction.transaction_receipt import TransactionReceipt
 from hiero_sdk_python.transaction.transaction_response import TransactionResponse
@@ -21,13 +40,78 @@ from hiero_sdk_python.utils.key_utils import key_to_proto
 
 
 if TYPE_CHECKING:
-    from hiero_sdk_python.crypto.private_key import PrivateKey
+    from hiero_sdk_python.crypto.signer import SigningKey
     from hiero_sdk_python.schedule.schedule_create_transaction import (
         ScheduleCreateTransaction,
     )
     from hiero_sdk_python.transaction.custom_fee_limit import CustomFeeLimit
 
 
+# Transaction classes keyed by the TransactionBody `data` oneof field they populate.
+# Filled by Transaction.__init_subclass__ from each subclass's `_proto_body_field`.
+_TRANSACTION_CLASSES: dict[str, type[Transaction]] = {}
+
+# Modules defining the SDK's transaction classes, imported on demand when
+# `from_bytes` meets a type whose class has not been imported (and so not registered) yet.
+_TRANSACTION_MODULES: dict[str, str] = {
+    "cryptoApproveAllowance": "hiero_sdk_python.account.account_allowance_approve_transaction",
+    "cryptoDeleteAllowance": "hiero_sdk_python.account.account_allowance_delete_transaction",
+    "cryptoCreateAccount": "hiero_sdk_python.account.account_create_transaction",
+    "cryptoDelete": "hiero_sdk_python.account.account_delete_transaction",
+    "cryptoUpdateAccount": "hiero_sdk_python.account.account_update_transaction",
+    "consensusCreateTopic": "hiero_sdk_python.consensus.topic_create_transaction",
+    "consensusDeleteTopic": "hiero_sdk_python.consensus.topic_delete_transaction",
+    "consensusSubmitMessage": "hiero_sdk_python.consensus.topic_message_submit_transaction",
+    "consensusUpdateTopic": "hiero_sdk_python.consensus.topic_update_transaction",
+    "contractCreateInstance": "hiero_sdk_python.contract.contract_create_transaction",
+    "contractDeleteInstance": "hiero_sdk_python.contract.contract_delete_transaction",
+    "contractCall": "hiero_sdk_python.contract.contract_execute_transaction",
+    "contractUpdateInstance": "hiero_sdk_python.contract.contract_update_transaction",
+    "ethereumTransaction": "hiero_sdk_python.contract.ethereum_transaction",
+    "fileAppend": "hiero_sdk_python.file.file_append_transaction",
+    "fileCreate": "hiero_sdk_python.file.file_create_transaction",
+    "fileDelete": "hiero_sdk_python.file.file_delete_transaction",
+    "fileUpdate": "hiero_sdk_python.file.file_update_transaction",
+    "nodeCreate": "hiero_sdk_python.nodes.node_create_transaction",
+    "nodeDelete": "hiero_sdk_python.nodes.node_delete_transaction",
+    "nodeUpdate": "hiero_sdk_python.nodes.node_update_transaction",
+    "registeredNodeCreate": "hiero_sdk_python.nodes.registered_node_create_transaction",
+    "registeredNodeDelete": "hiero_sdk_python.nodes.registered_node_delete_transaction",
+    "registeredNodeUpdate": "hiero_sdk_python.nodes.registered_node_update_transaction",
+    "util_prng": "hiero_sdk_python.prng_transaction",
+    "scheduleCreate": "hiero_sdk_python.schedule.schedule_create_transaction",
+    "scheduleDelete": "hiero_sdk_python.schedule.schedule_delete_transaction",
+    "scheduleSign": "hiero_sdk_python.schedule.schedule_sign_transaction",
+    "freeze": "hiero_sdk_python.system.freeze_transaction",
+    "tokenClaimAirdrop": "hiero_sdk_python.tokens.token_airdrop_claim",
+    "tokenAirdrop": "hiero_sdk_python.tokens.token_airdrop_transaction",
+    "tokenCancelAirdrop": "hiero_sdk_python.tokens.token_airdrop_transaction_cancel",
+    "tokenAssociate": "hiero_sdk_python.tokens.token_associate_transaction",
+    "tokenBurn": "hiero_sdk_python.tokens.token_burn_transaction",
+    "tokenCreation": "hiero_sdk_python.tokens.token_create_transaction",
+    "tokenDeletion": "hiero_sdk_python.tokens.token_delete_transaction",
+    "tokenDissociate": "hiero_sdk_python.tokens.token_dissociate_transaction",
+    "token_fee_schedule_update": "hiero_sdk_python.tokens.token_fee_schedule_update_transaction",
+    "tokenFreeze": "hiero_sdk_python.tokens.token_freeze_transaction",
+    "tokenGrantKyc": "hiero_sdk_python.tokens.token_grant_kyc_transaction",
+    "tokenMint": "hiero_sdk_python.tokens.token_mint_transaction",
+    "token_pause": "hiero_sdk_python.tokens.token_pause_transaction",
+    "tokenReject": "hiero_sdk_python.tokens.token_reject_transaction",
+    "tokenRevokeKyc": "hiero_sdk_python.tokens.token_revoke_kyc_transaction",
+    "tokenUnfreeze": "hiero_sdk_python.tokens.token_unfreeze_transaction",
+    "token_unpause": "hiero_sdk_python.tokens.token_unpause_transaction",
+    "token_update_nfts": "hiero_sdk_python.tokens.token_update_nfts_transaction",
+    "tokenUpdate": "hiero_sdk_python.tokens.token_update_transaction",
+    "tokenWipe": "hiero_sdk_python.tokens.token_wipe_transaction",
+    "atomic_batch": "hiero_sdk_python.transaction.batch_transaction",
+    "cryptoTransfer": "hiero_sdk_python.transaction.transfer_transaction",
+}
+
+
+# Used by transactions that were not frozen with a client
+_DEFAULT_SIGNING_BACKEND = InProcessSigningBackend()
+
+
 class Transaction(_Executable):
     """
     Base class for all Hedera transactions.
@@ -40,8 +124,22 @@ class Transaction(_Executable):
     1. build_transaction_body() - Build the transaction-specific protobuf body
     2. build_scheduled_body() - Build the schedulable transaction-specific protobuf body
     3. _get_method(channel) - Return the appropriate gRPC method to call
+
+    Concrete subclasses also set `_proto_body_field` to the TransactionBody field they
+    populate, which registers them for `Transaction.from_bytes`.
     """
 
+    _proto_body_field: ClassVar[str | None] = None
+    _rate_limited: ClassVar[bool] = True
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Register subclasses that declare their own `_proto_body_field`."""
+        super().__init_subclass__(**kwargs)
+
+        body_field = cls.__dict__.get("_proto_body_field")
+        if body_field is not None:
+            _TRANSACTION_CLASSES[body_field] = cls
+
     def __init__(self) -> None:
         """Initializes a new Transaction instance with default values."""
         super().__init__()
@@ -68,6 +166,7 @@ class Transaction(_Executable):
         self._default_transaction_fee = Hbar(2)
         self.operator_account_id = None
         self.batch_key: Key | None = None
+        self._signing_backend: SigningBackend | None = None
 
     def _make_request(self):
         """
@@ -164,12 +263,15 @@ class Transaction(_Executable):
 
         return PrecheckError(error_code, tx_id)
 
-    def sign(self, private_key: PrivateKey) -> Transaction:
+    def sign(self, private_key: SigningKey) -> Transaction:
         """
-        Signs the transaction using the provided private key.
+        Signs the transaction using the provided private key or signer.
+
+        A Signer or AsyncSigner receives all the node bodies it has not signed yet in
+        a single `sign_many` call.
 
         Args:
-            private_key (PrivateKey): The private key to sign the transaction with.
+            private_key (SigningKey): The PrivateKey, Signer or AsyncSigner to sign the transaction with.
 
         Returns:
             Transaction: The current transaction instance for method chaining.
@@ -180,28 +282,36 @@ class Transaction(_Executable):
         # We require the transaction to be frozen before signing
         self._require_frozen()
 
-        # We sign the bodies for each node in case we need to switch nodes during execution.
-        for body_bytes in self._transaction_body_bytes.values():
-            signature = private_key.sign(body_bytes)
+        public_key = private_key.public_key()
+        span_attributes = {
+            ATTR_TRANSACTION_TYPE: self.__class__.__name__,
+            ATTR_KEY_TYPE: "ed25519" if public_key.is_ed25519() else "ecdsa_secp256k1",
+            ATTR_NODE_COUNT: len(self._transaction_body_bytes),
+        }
 
-            public_key_bytes = private_key.public_key().to_bytes_raw()
+        with _span(SPAN_SIGN, span_attributes):
+            # We sign the bodies for each node in case we need to switch nodes during execution.
+            public_key_bytes = public_key.to_bytes_raw()
+            unsigned = [
+                body_bytes
+                for body_bytes in self._transaction_body_bytes.values()
+                if not self._is_body_signed_by(body_bytes, public_key_bytes)
+            ]
 
-            if private_key.is_ed25519():
-                sig_pair = basic_types_pb2.SignaturePair(pubKeyPrefix=public_key_bytes, ed25519=signature)
-            else:
-                sig_pair = basic_types_pb2.SignaturePair(pubKeyPrefix=public_key_bytes, ECDSA_secp256k1=signature)
+            backend = self._signing_backend or _DEFAULT_SIGNING_BACKEND
+            for body_bytes, sig_pair in zip(unsigned, backend.sign_with(private_key, unsigned), strict=True):
+                self._add_signature_pair(body_bytes, sig_pair)
 
-            # We initialize the signature map for this body_bytes if it doesn't exist yet
-            self._signature_map.setdefault(body_bytes, basic_types_pb2.SignatureMap())
+        return self
 
-            # deduplication check
-            already_signed = any(sp.pubKeyPrefix == public_key_bytes for sp in self._signature_map[body_bytes].sigPair)
+    def _is_body_signed_by(self, body_bytes: bytes, public_key_bytes: bytes) -> bool:
+        """Return whether the signature map of `body_bytes` has a signature by the given public key."""
+        signature_map = self._signature_map.get(body_bytes)
+        return signature_map is not None and any(sp.pubKeyPrefix == public_key_bytes for sp in signature_map.sigPair)
 
-            # append only if not already signed
-            if not already_signed:
-                self._signature_map[body_bytes].sigPair.append(sig_pair)
-
-        return self
+    def _add_signature_pair(self, body_bytes: bytes, sig_pair: basic_types_pb2.SignaturePair) -> None:
+        """Attach a signature to the signature map of one node body."""
+        self._signature_map.setdefault(body_bytes, basic_types_pb2.SignatureMap()).sigPair.append(sig_pair)
 
     def _to_proto(self):
         """
@@ -216,9 +326,24 @@ class Transaction(_Executable):
         # We require the transaction to be frozen before converting to protobuf
         self._require_frozen()
 
-        body_bytes = self._transaction_body_bytes.get(self._node_account_ids.current)
+        return self._to_proto_for_node(self._node_account_ids.current)
+
+    def _to_proto_for_node(self, node_account_id: AccountId) -> transaction_pb2.Transaction:
+        """
+        Builds the protobuf Transaction carrying the body and signatures for one node.
+
+        Args:
+            node_account_id (AccountId): The node whose transaction body to use.
+
+        Returns:
+            Transaction: The protobuf Transaction message.
+
+        Raises:
+            ValueError: If no body was built for `node_account_id`.
+        """
+        body_bytes = self._transaction_body_bytes.get(node_account_id)
         if body_bytes is None:
-            raise ValueError(f"No transaction body found for node {self._node_account_ids.current}")
+            raise ValueError(f"No transaction body found for node {node_account_id}")
 
         # Get signature map, or create empty one if transaction is not signed
         sig_map = self._signature_map.get(body_bytes)
@@ -294,22 +419,31 @@ class Transaction(_Executable):
         if self._transaction_body_bytes:
             return self
 
-        # Resolve transaction_id and node_accountids to be set when using freeze()
-        self._resolve_transaction_id(client)
-        self._resolve_node_ids(client)
+        with _span(SPAN_FREEZE, {ATTR_TRANSACTION_TYPE: self.__class__.__name__}) as span:
+            # Resolve transaction_id and node_accountids to be set when using freeze()
+            self._resolve_transaction_id(client)
+            self._resolve_node_ids(client)
+            backend = getattr(client, "signing_backend", None)
+            if isinstance(backend, SigningBackend):
+                self._signing_backend = backend
+
+            _set_attributes(
+                span, {ATTR_TRANSACTION_ID: self.transaction_id, ATTR_NODE_COUNT: len(self._node_account_ids)}
+            )
 
-        # We iterate through every node in the node_account_id list and
-        # For each node_account_id build the transaction body
-        # This allows the transaction to be submitted to the given node in the network
+            # We iterate through every node in the node_account_id list and
+            # For each node_account_id build the transaction body
+            # This allows the transaction to be submitted to the given node in the network
 
-        # TODO: Should lock the node_account_ids once freeze
-        # self._node_account_ids.set_lock(True)
+            # TODO: Should lock the node_account_ids once freeze
+            # self._node_account_ids.set_lock(True)
 
-        for node_account_id in self._node_account_ids.get_list():
-            self._transaction_body_bytes[node_account_id] = self.build_transaction_body().SerializeToString()
-            self._node_account_ids.advance()
+            for node_account_id in self._node_account_ids.get_list():
+                with _span(SPAN_BUILD_BODY, {ATTR_NODE: node_account_id}):
+                    self._transaction_body_bytes[node_account_id] = self.build_transaction_body().SerializeToString()
+                self._node_account_ids.advance()
 
-        self._node_account_ids.set_index(0)
+            self._node_account_ids.set_index(0)
 
         return self
 
@@ -364,26 +498,31 @@ class Transaction(_Executable):
         if self.batch_key and not isinstance(self, (BatchTransaction)):
             raise ValueError("Cannot execute batchified transaction outside of BatchTransaction.")
 
-        if not self._transaction_body_bytes:
-            self.freeze_with(client)
+        with _span(SPAN_EXECUTE, {ATTR_TRANSACTION_TYPE: self.__class__.__name__}) as span:
+            if not self._transaction_body_bytes:
+                self.freeze_with(client)
 
-        if self.operator_account_id is None:
-            self.operator_account_id = client.operator_account_id
+            _set_attributes(span, {ATTR_TRANSACTION_ID: self.transaction_id})
+
+            if self.operator_account_id is None:
+                self.operator_account_id = client.operator_account_id
 
-        if not self.is_signed_by(client.operator_private_key.public_key()):
-            self.sign(client.operator_private_key)
+            if not self.is_signed_by(client.operator_private_key.public_key()):
+                self.sign(client.operator_private_key)
 
-        # Call the _execute function from executable.py to handle the actual execution
-        response = self._execute(client, timeout)
+            # Call the _execute function from executable.py to handle the actual execution
+            response = self._execute(client, timeout)
 
-        response.validate_status = True
-        response.transaction = self
-        response.transaction_id = self.transaction_id
+            response.validate_status = True
+            response.transaction = self
+            response.transaction_id = self.transaction_id
 
-        if wait_for_receipt:
-            return response.get_receipt(client, timeout=timeout, validate_status=validate_status)
+            _set_attributes(span, {ATTR_NODE: response.node_id})
 
-        return response
+            if wait_for_receipt:
+                return response.get_receipt(client, timeout=timeout, validate_status=validate_status)
+
+            return response
 
     def is_signed_by(self, public_key):
         """
@@ -655,19 +794,29 @@ class Transaction(_Executable):
         signed_bytes = tx.to_bytes()  # Ready to submit to network
         ```
 
+        A transaction frozen for a single node serializes to a `Transaction` message.
+        One frozen for several nodes (e.g. with `freeze_with(client)`) serializes to a
+        `TransactionList` holding the body and signatures for every node, so that the
+        restored transaction can still fail over between nodes when executed.
+
         Returns:
             bytes: The serialized transaction as bytes.
 
         Raises:
             Exception: If the transaction has not been frozen yet.
+            ValueError: If a node in the node list has no frozen transaction body.
         """
         self._require_frozen()
 
-        # Get the transaction protobuf
-        transaction_proto = self._to_proto()
+        if len(self._node_account_ids) <= 1:
+            return self._to_proto().SerializeToString()
 
-        # Serialize to bytes
-        return transaction_proto.SerializeToString()
+        transaction_list = transaction_list_pb2.TransactionList(
+            transaction_list=[
+                self._to_proto_for_node(node_account_id) for node_account_id in self._node_account_ids.get_list()
+            ]
+        )
+        return transaction_list.SerializeToString()
 
     @staticmethod
     def from_bytes(transaction_bytes: bytes):
@@ -682,6 +831,7 @@ class Transaction(_Executable):
         - Common fields (transaction ID, node ID, memo, fee, etc.)
         - All signatures (if the transaction was signed)
         - Transaction state (frozen)
+        - Every node body when the bytes hold a `TransactionList`
 
         **Examples:**
 
@@ -730,29 +880,69 @@ class Transaction(_Executable):
         Raises:
             ValueError: If the bytes cannot be parsed or transaction type is unknown.
         """
+        return Transaction._from_bytes(transaction_bytes, transaction_list_pb2.TransactionList())
+
+    @staticmethod
+    def from_bytes_many(transactions_bytes: Iterable[bytes]) -> list[Transaction]:
+        """
+        Deserializes many transactions produced by to_bytes().
+
+        Equivalent to calling from_bytes() on each element, but reuses the outer
+        TransactionList message between items, which adds up when restoring large
+        batches of pre-signed transactions.
+
+        Args:
+            transactions_bytes (Iterable[bytes]): The protobuf-encoded transactions.
+
+        Returns:
+            list[Transaction]: The reconstructed transactions, in input order.
+
+        Raises:
+            ValueError: If any element cannot be parsed; the message includes its index.
+        """
+        transaction_list = transaction_list_pb2.TransactionList()
+        transactions: list[Transaction] = []
+
+        try:
+            transactions.extend(
+                Transaction._from_bytes(transaction_bytes, transaction_list) for transaction_bytes in transactions_bytes
+            )
+        except ValueError as e:
+            raise ValueError(f"Transaction at index {len(transactions)}: {e}") from e
+
+        return transactions
+
+    @staticmethod
+    def _from_bytes(transaction_bytes: bytes, transaction_list: transaction_list_pb2.TransactionList) -> Transaction:
+        """
+        Deserializes one transaction, parsing `TransactionList` bytes into `transaction_list`.
+
+        The list message only carries the per-node Transaction messages, so callers may
+        reuse it between calls. The SignedTransaction and TransactionBody are always
+        fresh because the restored transaction keeps references into them.
+        """
         if not isinstance(transaction_bytes, bytes):
             raise ValueError("transaction_bytes must be bytes")
 
         if len(transaction_bytes) == 0:
             raise ValueError("transaction_bytes cannot be empty")
 
+        # Bytes of a single Transaction parse as a TransactionList with no entries,
+        # since its fields do not overlap with the list's repeated field.
         try:
-            transaction_proto = transaction_pb2.Transaction()
-            transaction_proto.ParseFromString(transaction_bytes)
-        except Exception as e:
-            raise ValueError(f"Failed to parse transaction bytes: {e}") from e
+            transaction_list.ParseFromString(transaction_bytes)
+            transaction_protos = list(transaction_list.transaction_list)
+        except DecodeError:
+            transaction_protos = []
 
-        try:
-            signed_transaction = transaction_contents_pb2.SignedTransaction()
-            signed_transaction.ParseFromString(transaction_proto.signedTransactionBytes)
-        except Exception as e:
-            raise ValueError(f"Failed to parse signed transaction: {e}") from e
+        if not transaction_protos:
+            try:
+                transaction_protos = [transaction_pb2.Transaction.FromString(transaction_bytes)]
+            except DecodeError as e:
+                raise ValueError(f"Failed to parse transaction bytes: {e}") from e
 
-        try:
-            transaction_body = transaction_pb2.TransactionBody()
-            transaction_body.ParseFromString(signed_transaction.bodyBytes)
-        except Exception as e:
-            raise ValueError(f"Failed to parse transaction body: {e}") from e
+        node_bodies = [Transaction._parse_signed_transaction(proto) for proto in transaction_protos]
+        transaction_body, body_bytes, sig_map = node_bodies[0]
 
         transaction_type = transaction_body.WhichOneof("data")
 
@@ -764,90 +954,99 @@ class Transaction(_Executable):
         if transaction_class is None:
             raise ValueError(f"Unknown transaction type: {transaction_type}")
 
-        return transaction_class._from_protobuf(
-            transaction_body, signed_transaction.bodyBytes, signed_transaction.sigMap
-        )
+        transaction = transaction_class._from_protobuf(transaction_body, body_bytes, sig_map)
+
+        for other_body, other_body_bytes, other_sig_map in node_bodies[1:]:
+            if other_body.WhichOneof("data") != transaction_type or other_body.transactionID != (
+                transaction_body.transactionID
+            ):
+                raise ValueError("All transactions in a TransactionList must have the same type and transaction ID")
+
+            transaction._restore_node_body(other_body, other_body_bytes, other_sig_map)
+
+        return transaction
+
+    @staticmethod
+    def _parse_signed_transaction(transaction_proto: transaction_pb2.Transaction):
+        """
+        Parses the SignedTransaction carried by a Transaction message.
+
+        Returns:
+            tuple: The parsed TransactionBody, its raw bytes and the SignatureMap.
+        """
+        try:
+            signed_transaction = transaction_contents_pb2.SignedTransaction.FromString(
+                transaction_proto.signedTransactionBytes
+            )
+        except Exception as e:
+            raise ValueError(f"Failed to parse signed transaction: {e}") from e
+
+        try:
+            transaction_body = transaction_pb2.TransactionBody.FromString(signed_transaction.bodyBytes)
+        except Exception as e:
+            raise ValueError(f"Failed to parse transaction body: {e}") from e
+
+        return transaction_body, signed_transaction.bodyBytes, signed_transaction.sigMap
+
+    def _restore_node_body(self, transaction_body, body_bytes: bytes, sig_map) -> None:
+        """
+        Adds the frozen body and signatures for one more node to a restored transaction.
+
+        Args:
+            transaction_body: The parsed TransactionBody protobuf for the node
+            body_bytes (bytes): The raw bytes of the transaction body
+            sig_map: The SignatureMap protobuf containing signatures
+        """
+        if not transaction_body.HasField("nodeAccountID"):
+            raise ValueError("Transactions in a TransactionList must each set a node account ID")
+
+        node_account_id = AccountId._from_proto(transaction_body.nodeAccountID)
+        if node_account_id in self._transaction_body_bytes:
+            raise ValueError(f"Duplicate transaction body for node {node_account_id} in TransactionList")
+
+        self._node_account_ids.append(node_account_id)
+        self._transaction_body_bytes[node_account_id] = body_bytes
+
+        if sig_map and sig_map.sigPair:
+            self._signature_map[body_bytes] = sig_map
 
     @staticmethod
     def _get_transaction_class(transaction_type: str):
         """
         Maps a protobuf transaction type field name to the corresponding Python class.
 
+        Classes register themselves when their module is imported; if the class for
+        `transaction_type` has not been imported yet, its module is imported once and
+        the registered class is returned from then on.
+
         Args:
             transaction_type (str): The protobuf field name (e.g., "cryptoTransfer")
 
         Returns:
             type: The corresponding transaction class, or None if unknown
-        """
-        transaction_type_map = {
-            "cryptoTransfer": "hiero_sdk_python.transaction.transfer_transaction.TransferTransaction",
-            "contractCall": "hiero_sdk_python.contract.contract_execute_transaction.ContractExecuteTransaction",
-            "contractCreateInstance": "hiero_sdk_python.contract.contract_create_transaction.ContractCreateTransaction",
-            "contractUpdateInstance": "hiero_sdk_python.contract.contract_update_transaction.ContractUpdateTransaction",
-            "contractDeleteInstance": "hiero_sdk_python.contract.contract_delete_transaction.ContractDeleteTransaction",
-            "ethereumTransaction": "hiero_sdk_python.contract.ethereum_transaction.EthereumTransaction",
-            "cryptoAddLiveHash": None,  # Not implemented in SDK
-            "cryptoApproveAllowance": "hiero_sdk_python.account.account_allowance_approve_transaction.AccountAllowanceApproveTransaction",
-            "cryptoDeleteAllowance": "hiero_sdk_python.account.account_allowance_delete_transaction.AccountAllowanceDeleteTransaction",
-            "cryptoCreateAccount": "hiero_sdk_python.account.account_create_transaction.AccountCreateTransaction",
-            "cryptoDelete": "hiero_sdk_python.account.account_delete_transaction.AccountDeleteTransaction",
-            "cryptoDeleteLiveHash": None,  # Not implemented in SDK
-            "cryptoUpdateAccount": "hiero_sdk_python.account.account_update_transaction.AccountUpdateTransaction",
-            "fileAppend": "hiero_sdk_python.file.file_append_transaction.FileAppendTransaction",
-            "fileCreate": "hiero_sdk_python.file.file_create_transaction.FileCreateTransaction",
-            "fileDelete": "hiero_sdk_python.file.file_delete_transaction.FileDeleteTransaction",
-            "fileUpdate": "hiero_sdk_python.file.file_update_transaction.FileUpdateTransaction",
-            "systemDelete": None,  # Admin transaction
-            "systemUndelete": None,  # Admin transaction
-            "freeze": None,  # Admin transaction
-            "consensusCreateTopic": "hiero_sdk_python.consensus.topic_create_transaction.TopicCreateTransaction",
-            "consensusUpdateTopic": "hiero_sdk_python.consensus.topic_update_transaction.TopicUpdateTransaction",
-            "consensusDeleteTopic": "hiero_sdk_python.consensus.topic_delete_transaction.TopicDeleteTransaction",
-            "consensusSubmitMessage": "hiero_sdk_python.consensus.topic_message_submit_transaction.TopicMessageSubmitTransaction",
-            "tokenCreation": "hiero_sdk_python.tokens.token_create_transaction.TokenCreateTransaction",
-            "tokenFreeze": "hiero_sdk_python.tokens.token_freeze_transaction.TokenFreezeTransaction",
-            "tokenUnfreeze": "hiero_sdk_python.tokens.token_unfreeze_transaction.TokenUnfreezeTransaction",
-            "tokenGrantKyc": "hiero_sdk_python.tokens.token_grant_kyc_transaction.TokenGrantKycTransaction",
-            "tokenRevokeKyc": "hiero_sdk_python.tokens.token_revoke_kyc_transaction.TokenRevokeKycTransaction",
-            "tokenDeletion": "hiero_sdk_python.tokens.token_delete_transaction.TokenDeleteTransaction",
-            "tokenUpdate": "hiero_sdk_python.tokens.token_update_transaction.TokenUpdateTransaction",
-            "tokenMint": "hiero_sdk_python.tokens.token_mint_transaction.TokenMintTransaction",
-            "tokenBurn": "hiero_sdk_python.tokens.token_burn_transaction.TokenBurnTransaction",
-            "tokenWipe": "hiero_sdk_python.tokens.token_wipe_transaction.TokenWipeTransaction",
-            "tokenAssociate": "hiero_sdk_python.tokens.token_associate_transaction.TokenAssociateTransaction",
-            "tokenDissociate": "hiero_sdk_python.tokens.token_dissociate_transaction.TokenDissociateTransaction",
-            "tokenPause": "hiero_sdk_python.tokens.token_pause_transaction.TokenPauseTransaction",
-            "tokenUnpause": "hiero_sdk_python.tokens.token_pause_transaction.TokenUnpauseTransaction",
-            "scheduleCreate": "hiero_sdk_python.schedule.schedule_create_transaction.ScheduleCreateTransaction",
-            "scheduleDelete": "hiero_sdk_python.schedule.schedule_delete_transaction.ScheduleDeleteTransaction",
-            "scheduleSign": "hiero_sdk_python.schedule.schedule_sign_transaction.ScheduleSignTransaction",
-            "tokenFeeScheduleUpdate": None,  # Not commonly used
-            "tokenUpdateNfts": "hiero_sdk_python.tokens.token_update_nfts_transaction.TokenUpdateNftsTransaction",
-            "nodeCreate": "hiero_sdk_python.nodes.node_create_transaction.NodeCreateTransaction",
-            "nodeUpdate": "hiero_sdk_python.nodes.node_update_transaction.NodeUpdateTransaction",
-            "nodeDelete": "hiero_sdk_python.nodes.node_delete_transaction.NodeDeleteTransaction",
-            "registeredNodeCreate": "hiero_sdk_python.nodes.registered_node_create_transaction.RegisteredNodeCreateTransaction",
-            "registeredNodeUpdate": "hiero_sdk_python.nodes.registered_node_update_transaction.RegisteredNodeUpdateTransaction",
-            "registeredNodeDelete": "hiero_sdk_python.nodes.registered_node_delete_transaction.RegisteredNodeDeleteTransaction",
-            "utilPrng": "hiero_sdk_python.prng_transaction.PrngTransaction",
-            "tokenReject": "hiero_sdk_python.tokens.token_reject_transaction.TokenRejectTransaction",
-            "tokenAirdrop": "hiero_sdk_python.tokens.token_airdrop_transaction.TokenAirdropTransaction",
-            "tokenCancelAirdrop": "hiero_sdk_python.tokens.token_cancel_airdrop_transaction.TokenCancelAirdropTransaction",
-            "atomic_batch": "hiero_sdk_python.transaction.batch_transaction.BatchTransaction",
-        }
 
-        class_path = transaction_type_map.get(transaction_type)
+        Raises:
+            ValueError: If the module for a known transaction type cannot be imported.
+        """
+        transaction_class = _TRANSACTION_CLASSES.get(transaction_type)
+        if transaction_class is not None:
+            return transaction_class
 
-        if class_path is None:
+        module_path = _TRANSACTION_MODULES.get(transaction_type)
+        if module_path is None:
             return None
 
         try:
-            module_path, class_name = class_path.rsplit(".", 1)
-            module = __import__(module_path, fromlist=[class_name])
-            return getattr(module, class_name)
-        except (ImportError, AttributeError) as e:
+            importlib.import_module(module_path)
+        except ImportError as e:
             raise ValueError(f"Failed to import transaction class for type '{transaction_type}': {e}") from e
 
+        transaction_class = _TRANSACTION_CLASSES.get(transaction_type)
+        if transaction_class is None:
+            raise ValueError(f"Module '{module_path}' did not register a class for type '{transaction_type}'")
+
+        return transaction_class
+
     @classmethod
     def _from_protobuf(cls, transaction_body, body_bytes: bytes, sig_map):
         """
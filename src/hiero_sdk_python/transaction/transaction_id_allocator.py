@@ -0,0 +1,140 @@
+"""
+hiero_sdk_python.transaction.transaction_id_allocator.py.
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Defines TransactionIdAllocator, which hands out transaction IDs that are unique
+per payer even when many threads generate them at the same instant.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+
+from hiero_sdk_python.account.account_id import AccountId
+from hiero_sdk_python.hapi.services import timestamp_pb2
+from hiero_sdk_python.transaction.transaction_id import TransactionId
+
+
+# How far valid starts are set back from the local clock, so that transactions are
+# not rejected as starting in the future when the local clock runs ahead of the network
+DEFAULT_VALID_START_OFFSET_SECONDS = 5
+
+# How far ahead of the (offset) clock issued valid starts may run after the local
+# clock moved backwards before allocation fails; must stay below the offset for the
+# valid starts to remain in the past
+DEFAULT_MAX_CLOCK_SKEW_SECONDS = 4
+
+_NANOS_PER_SECOND = 1_000_000_000
+
+
+class TransactionIdAllocator:
+    """
+    Allocates strictly increasing transaction IDs per payer account.
+
+    Each valid start is the current time minus a fixed offset, or one nanosecond after
+    the payer's previous valid start if that is later. IDs therefore never repeat for
+    a payer, however many are generated within one clock tick, and a block of
+    consecutive IDs can be reserved with a single call.
+
+    If the system clock moves backwards, allocation keeps counting up from the last
+    valid start. Once that runs more than `max_clock_skew` seconds ahead of the clock,
+    new IDs would be rejected by the network as starting in the future, so a
+    ValueError is raised instead.
+
+    Allocators are thread-safe. A `Client` owns one, used by `generate_transaction_id`.
+    """
+
+    def __init__(
+        self,
+        valid_start_offset: float = DEFAULT_VALID_START_OFFSET_SECONDS,
+        max_clock_skew: float = DEFAULT_MAX_CLOCK_SKEW_SECONDS,
+        clock: Callable[[], int] = time.time_ns,
+    ) -> None:
+        """
+        Initializes a new TransactionIdAllocator.
+
+        Args:
+            valid_start_offset (float): Seconds subtracted from the clock for each valid start.
+            max_clock_skew (float): Seconds that valid starts may run ahead of the
+                offset clock. Must be smaller than `valid_start_offset`.
+            clock (Callable[[], int]): Returns the current time in nanoseconds since the epoch.
+
+        Raises:
+            ValueError: If the offsets are negative or max_clock_skew is not below valid_start_offset.
+        """
+        if valid_start_offset < 0 or max_clock_skew < 0:
+            raise ValueError("valid_start_offset and max_clock_skew must be non-negative")
+
+        if max_clock_skew >= valid_start_offset:
+            raise ValueError("max_clock_skew must be smaller than valid_start_offset")
+
+        self._offset_nanos = int(valid_start_offset * _NANOS_PER_SECOND)
+        self._max_skew_nanos = int(max_clock_skew * _NANOS_PER_SECOND)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._last_valid_start: dict[AccountId, int] = {}
+
+    def generate(self, account_id: AccountId) -> TransactionId:
+        """
+        Allocate the next transaction ID for a payer.
+
+        Args:
+            account_id (AccountId): The payer account.
+
+        Returns:
+            TransactionId: A transaction ID not previously issued for this payer.
+
+        Raises:
+            ValueError: If the clock moved backwards by more than `max_clock_skew`.
+        """
+        return self.generate_many(account_id, 1)[0]
+
+    def generate_many(self, account_id: AccountId, count: int) -> list[TransactionId]:
+        """
+        Reserve `count` consecutive transaction IDs for a payer.
+
+        The valid starts are one nanosecond apart, which is the spacing chunked
+        transactions use between their chunks.
+
+        Args:
+            account_id (AccountId): The payer account.
+            count (int): The number of IDs to reserve.
+
+        Returns:
+            list[TransactionId]: The IDs, in increasing valid start order.
+
+        Raises:
+            TypeError: If account_id is not an AccountId.
+            ValueError: If count is below 1, or the clock moved backwards by more
+                than `max_clock_skew`.
+        """
+        if not isinstance(account_id, AccountId):
+            raise TypeError(f"account_id must be an AccountId, got {type(account_id).__name__}")
+
+        if count < 1:
+            raise ValueError("count must be >= 1")
+
+        with self._lock:
+            anchor = self._clock() - self._offset_nanos
+            first = max(anchor, self._last_valid_start.get(account_id, -1) + 1)
+
+            skew = first + count - 1 - anchor
+            if skew > self._max_skew_nanos:
+                raise ValueError(
+                    f"Transaction IDs for {account_id} would run {skew / _NANOS_PER_SECOND:.3f}s ahead of the "
+                    "system clock; the clock moved backwards or too many IDs were reserved at once"
+                )
+
+            self._last_valid_start[account_id] = first + count - 1
+
+        return [
+            TransactionId(
+                account_id,
+                timestamp_pb2.Timestamp(
+                    seconds=valid_start // _NANOS_PER_SECOND, nanos=valid_start % _NANOS_PER_SECOND
+                ),
+            )
+            for valid_start in range(first, first + count)
+        ]
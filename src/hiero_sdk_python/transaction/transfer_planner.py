@@ -0,0 +1,583 @@
+"""
+hiero_sdk_python.transaction.transfer_planner.py.
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Defines TransferPlanner, which shards a stream of recipient payouts into
+network-valid transfer or airdrop transactions and submits them with bounded
+concurrency, checkpointing progress so that an interrupted run can be resumed
+without paying any recipient twice.
+"""
+
+from __future__ import annotations
+
+import base64
+import csv
+import hashlib
+import json
+import os
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import requests
+
+from hiero_sdk_python.account.account_id import AccountId
+from hiero_sdk_python.exceptions import PrecheckError
+from hiero_sdk_python.hapi.services import basic_types_pb2
+from hiero_sdk_python.query.transaction_get_receipt_query import TransactionGetReceiptQuery
+from hiero_sdk_python.response_code import ResponseCode
+from hiero_sdk_python.tokens.token_airdrop_transaction import TokenAirdropTransaction
+from hiero_sdk_python.tokens.token_id import TokenId
+from hiero_sdk_python.transaction.batch_packer import MAX_TRANSACTION_SIZE
+from hiero_sdk_python.transaction.transaction import Transaction
+from hiero_sdk_python.transaction.transaction_id import TransactionId
+from hiero_sdk_python.transaction.transfer_transaction import TransferTransaction
+
+
+if TYPE_CHECKING:
+    from hiero_sdk_python.client.client import Client
+    from hiero_sdk_python.crypto.private_key import PrivateKey
+    from hiero_sdk_python.transaction.transaction_receipt import TransactionReceipt
+
+
+# Network limit on the number of account amounts in one transfer list
+MAX_TRANSFERS_PER_TRANSACTION = 10
+
+# Bytes reserved for the body fields other than the transfer list (transaction ID,
+# node, fee, duration, memo) and for the signatures
+DEFAULT_TRANSACTION_OVERHEAD = 1024
+
+DEFAULT_MAX_CONCURRENCY = 4
+
+# How long after a transaction's validity window the mirror node is trusted to
+# have recorded it, in seconds
+MIRROR_GRACE_SECONDS = 60
+
+_MAX_AMOUNT = 2**63 - 1
+
+# Upper bound on the encoded size of an AccountAmount's amount field
+_MAX_AMOUNT_FIELD_SIZE = 11
+
+StatusLookup = Callable[["Client", TransactionId], "str | None"]
+
+
+def read_transfers_csv(path: str | os.PathLike[str]) -> Iterator[tuple[AccountId, int]]:
+    """
+    Stream payouts from a CSV file with one `account,amount` row per recipient.
+
+    The file is read lazily, so lists larger than memory can be planned. A first row
+    whose amount is not an integer is treated as a header and skipped, as are blank rows.
+
+    Args:
+        path (str | os.PathLike): The file to read.
+
+    Yields:
+        tuple[AccountId, int]: The recipient and the amount, in the smallest unit
+            (tinybars or the token's base unit).
+
+    Raises:
+        ValueError: If a row is malformed.
+    """
+    with open(path, newline="", encoding="utf-8") as file:
+        for line_number, row in enumerate(csv.reader(file), start=1):
+            if not row or not any(field.strip() for field in row):
+                continue
+            if len(row) != 2:
+                raise ValueError(f"Line {line_number}: expected 'account,amount', got {row!r}")
+
+            account, amount = (field.strip() for field in row)
+            try:
+                value = int(amount)
+            except ValueError:
+                if line_number == 1:
+                    continue
+                raise ValueError(f"Line {line_number}: invalid amount {amount!r}") from None
+
+            yield AccountId.from_string(account), value
+
+
+def mirror_transaction_status(client: Client, transaction_id: TransactionId) -> str | None:
+    """
+    Look up the consensus result of a transaction on the client's mirror node.
+
+    Args:
+        client (Client): The client whose network's mirror node is queried.
+        transaction_id (TransactionId): The transaction to look up.
+
+    Returns:
+        str | None: The result name, e.g. `"SUCCESS"`, or None if the mirror node has
+            no record of the transaction.
+    """
+    valid_start = transaction_id.valid_start
+    mirror_id = f"{transaction_id.account_id}-{valid_start.seconds}-{valid_start.nanos:09d}"
+    url = f"{client.network.get_mirror_rest_url()}/transactions/{mirror_id}"
+
+    response = requests.get(url, timeout=10)
+    if response.status_code == 404:
+        return None
+    response.raise_for_status()
+
+    # The parent transaction has nonce 0; a duplicate submission is listed separately
+    results = [
+        entry.get("result")
+        for entry in response.json().get("transactions", [])
+        if entry.get("nonce", 0) == 0 and not entry.get("scheduled", False)
+    ]
+    if ResponseCode.SUCCESS.name in results:
+        return ResponseCode.SUCCESS.name
+    return results[0] if results else None
+
+
+def _entry_size(account_id: AccountId) -> int:
+    """Upper bound on the bytes one recipient adds to a transfer list."""
+    size = basic_types_pb2.AccountAmount(accountID=account_id._to_proto()).ByteSize() + _MAX_AMOUNT_FIELD_SIZE
+    return 1 + (1 if size < 0x80 else 2) + size
+
+
+@dataclass(frozen=True)
+class TransferShard:
+    """
+    One transaction's worth of payouts planned by a `TransferPlanner`.
+
+    Attributes:
+        index (int): Position of the shard in the plan.
+        transfers (tuple[tuple[AccountId, int], ...]): The recipients and their netted
+            amounts, in first-seen order. The sender's debit is not included.
+    """
+
+    index: int
+    transfers: tuple[tuple[AccountId, int], ...]
+
+    @property
+    def total(self) -> int:
+        """Return the amount debited from the sender by this shard."""
+        return sum(amount for _, amount in self.transfers)
+
+    @property
+    def digest(self) -> str:
+        """Return a fingerprint of the shard's transfers, used to validate checkpoints."""
+        content = "".join(f"{account}:{amount}\n" for account, amount in self.transfers)
+        return hashlib.sha256(content.encode()).hexdigest()
+
+
+@dataclass(frozen=True)
+class ShardResult:
+    """
+    Outcome of one shard submitted by `TransferPlanner.execute`.
+
+    Attributes:
+        shard (TransferShard): The shard that was paid.
+        transaction_id (TransactionId): The ID of the transaction that paid it.
+        status (ResponseCode): The consensus status of that transaction.
+        receipt (TransactionReceipt | None): The receipt, or None when the shard was
+            found to be paid while resuming and no receipt was fetched.
+        resumed (bool): Whether the shard was paid by an earlier, interrupted run.
+    """
+
+    shard: TransferShard
+    transaction_id: TransactionId
+    status: ResponseCode
+    receipt: TransactionReceipt | None
+    resumed: bool = False
+
+
+class TransferCheckpoint:
+    """
+    Append-only JSON-lines journal of the shards submitted by a `TransferPlanner`.
+
+    A shard is recorded as `submitted`, together with its signed transaction bytes,
+    before it is sent, and as `done` once its receipt is known. Every record is
+    flushed to disk before the call returns, so after a crash the journal tells which
+    shards may have reached the network.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        """
+        Initializes a checkpoint backed by the given file.
+
+        Args:
+            path (str | os.PathLike): The journal file. It is created on first use.
+        """
+        self.path = os.fspath(path)
+        self._lock = threading.Lock()
+
+    def open(self, fingerprint: str) -> dict[int, dict[str, Any]]:
+        """
+        Load the journal, creating it if it does not exist.
+
+        Args:
+            fingerprint (str): Identifies the plan; an existing journal written for a
+                different plan is rejected.
+
+        Returns:
+            dict[int, dict]: The latest record of each shard, keyed by shard index.
+
+        Raises:
+            ValueError: If the journal belongs to a different plan.
+        """
+        records: dict[int, dict[str, Any]] = {}
+        if not os.path.exists(self.path) or os.path.getsize(self.path) == 0:
+            self._append({"plan": fingerprint})
+            return records
+
+        with open(self.path, encoding="utf-8") as file:
+            lines = file.read().splitlines()
+
+        header = json.loads(lines[0])
+        if header.get("plan") != fingerprint:
+            raise ValueError(f"Checkpoint {self.path} was written for a different transfer plan")
+
+        for line_number, line in enumerate(lines[1:], start=2):
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # A torn final line is what an interrupted write leaves behind
+                if line_number == len(lines):
+                    break
+                raise
+            records[record["shard"]] = record
+
+        return records
+
+    def record(self, **entry: Any) -> None:
+        """Append one record to the journal and flush it to disk."""
+        self._append(entry)
+
+    def _append(self, entry: dict[str, Any]) -> None:
+        line = json.dumps(entry, separators=(",", ":")) + "\n"
+        with self._lock, open(self.path, "a", encoding="utf-8") as file:
+            file.write(line)
+            file.flush()
+            os.fsync(file.fileno())
+
+
+class TransferPlanner:
+    """
+    Pays a large list of recipients from one sender, as few transactions at a time as allowed.
+
+    Payouts are consumed lazily and grouped into shards of at most
+    `max_transfers - 1` recipients, leaving room for the sender's single netted debit.
+    Repeated recipients within a shard are merged. Each shard becomes a
+    TransferTransaction, or a TokenAirdropTransaction when `airdrop=True`.
+
+    Example:
+        planner = TransferPlanner(sender_id, token_id=token_id, airdrop=True)
+        for result in planner.execute(client, read_transfers_csv("payouts.csv"), checkpoint="payouts.ckpt"):
+            print(result.shard.index, result.status)
+    """
+
+    def __init__(
+        self,
+        sender: AccountId,
+        token_id: TokenId | None = None,
+        airdrop: bool = False,
+        max_transfers: int = MAX_TRANSFERS_PER_TRANSACTION,
+        max_transaction_size: int = MAX_TRANSACTION_SIZE,
+        transaction_overhead: int = DEFAULT_TRANSACTION_OVERHEAD,
+        memo: str = "",
+    ) -> None:
+        """
+        Initializes a new TransferPlanner.
+
+        Args:
+            sender (AccountId): The account debited by every shard.
+            token_id (TokenId, optional): The fungible token to pay out. Hbar is paid
+                when omitted.
+            airdrop (bool): Whether to submit TokenAirdropTransactions, which reach
+                recipients that are not associated with the token.
+            max_transfers (int): Account amounts per transaction, sender included.
+            max_transaction_size (int): Size limit of a signed transaction, in bytes.
+            transaction_overhead (int): Bytes of `max_transaction_size` reserved for
+                everything but the transfer list.
+            memo (str): The memo set on every transaction.
+
+        Raises:
+            TypeError: If sender or token_id have the wrong type.
+            ValueError: If airdrop is set without a token, or the limits are out of range.
+        """
+        if not isinstance(sender, AccountId):
+            raise TypeError(f"sender must be an AccountId, got {type(sender).__name__}")
+
+        if token_id is not None and not isinstance(token_id, TokenId):
+            raise TypeError(f"token_id must be a TokenId, got {type(token_id).__name__}")
+
+        if airdrop and token_id is None:
+            raise ValueError("airdrop requires a token_id")
+
+        if not 2 <= max_transfers <= MAX_TRANSFERS_PER_TRANSACTION:
+            raise ValueError(f"max_transfers must be between 2 and {MAX_TRANSFERS_PER_TRANSACTION}")
+
+        if max_transaction_size <= transaction_overhead + 2 * _entry_size(sender):
+            raise ValueError("max_transaction_size must leave room for a transfer after transaction_overhead")
+
+        self.sender = sender
+        self.token_id = token_id
+        self.airdrop = airdrop
+        self.max_transfers = max_transfers
+        self.max_transaction_size = max_transaction_size
+        self.transaction_overhead = transaction_overhead
+        self.memo = memo
+
+    @property
+    def fingerprint(self) -> str:
+        """Return an identifier of the plan's parameters, recorded in checkpoints."""
+        parts = [str(self.sender), str(self.token_id), str(self.airdrop), str(self.max_transfers), self.memo]
+        return hashlib.sha256("|".join(parts).encode()).hexdigest()
+
+    def plan(self, rows: Iterable[tuple[AccountId, int]]) -> Iterator[TransferShard]:
+        """
+        Split payouts into shards that each fit in one transaction.
+
+        The plan is deterministic: the same rows always produce the same shards, which
+        is what allows a checkpointed run to be resumed.
+
+        Args:
+            rows (Iterable[tuple[AccountId, int]]): The recipients and their amounts.
+
+        Yields:
+            TransferShard: The shards, in order.
+
+        Raises:
+            TypeError: If a row holds the wrong types.
+            ValueError: If a row pays the sender or a non-positive amount.
+        """
+        capacity = self.max_transfers - 1
+        budget = self.max_transaction_size - self.transaction_overhead - _entry_size(self.sender)
+        pending: dict[AccountId, int] = {}
+        size = 0
+        total = 0
+        index = 0
+
+        for account_id, amount in rows:
+            if not isinstance(account_id, AccountId):
+                raise TypeError(f"recipient must be an AccountId, got {type(account_id).__name__}")
+            if not isinstance(amount, int) or isinstance(amount, bool):
+                raise TypeError(f"amount must be an int, got {type(amount).__name__}")
+            if not 0 < amount <= _MAX_AMOUNT:
+                raise ValueError(f"amount for {account_id} must be positive and fit in 64 bits, got {amount}")
+            if account_id == self.sender:
+                raise ValueError(f"recipient {account_id} is the sender")
+
+            is_new = account_id not in pending
+            entry_size = _entry_size(account_id) if is_new else 0
+            full = is_new and (len(pending) == capacity or size + entry_size > budget)
+            if pending and (full or total + amount > _MAX_AMOUNT):
+                yield TransferShard(index, tuple(pending.items()))
+                index += 1
+                pending, size, total = {}, 0, 0
+                entry_size = _entry_size(account_id)
+
+            pending[account_id] = pending.get(account_id, 0) + amount
+            size += entry_size
+            total += amount
+
+        if pending:
+            yield TransferShard(index, tuple(pending.items()))
+
+    def build(self, client: Client, shard: TransferShard, signing_keys: Iterable[PrivateKey] = ()) -> Transaction:
+        """
+        Build, freeze and sign the transaction that pays a shard.
+
+        Args:
+            client (Client): The client used to freeze the transaction.
+            shard (TransferShard): The shard to pay.
+            signing_keys (Iterable[PrivateKey]): Keys that sign in addition to the
+                operator, e.g. the sender's key when it is not the operator.
+
+        Returns:
+            Transaction: The frozen, signed transaction.
+
+        Raises:
+            ValueError: If the signed transaction exceeds `max_transaction_size`.
+        """
+        transaction = TokenAirdropTransaction() if self.airdrop else TransferTransaction()
+
+        if self.token_id is None:
+            transaction.add_hbar_transfer(self.sender, -shard.total)
+            for account_id, amount in shard.transfers:
+                transaction.add_hbar_transfer(account_id, amount)
+        else:
+            transaction.add_token_transfer(self.token_id, self.sender, -shard.total)
+            for account_id, amount in shard.transfers:
+                transaction.add_token_transfer(self.token_id, account_id, amount)
+
+        transaction.set_transaction_memo(self.memo).freeze_with(client)
+        for key in signing_keys:
+            transaction.sign(key)
+        if not transaction.is_signed_by(client.operator_private_key.public_key()):
+            transaction.sign(client.operator_private_key)
+
+        size = len(transaction._make_request().SerializeToString())
+        if size > self.max_transaction_size:
+            raise ValueError(
+                f"Shard {shard.index} is {size} bytes, over the {self.max_transaction_size} byte limit; "
+                "increase transaction_overhead"
+            )
+
+        return transaction
+
+    def execute(
+        self,
+        client: Client,
+        rows: Iterable[tuple[AccountId, int]] | str | os.PathLike[str],
+        checkpoint: TransferCheckpoint | str | os.PathLike[str] | None = None,
+        signing_keys: Iterable[PrivateKey] = (),
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        timeout: int | float | None = None,
+        status_lookup: StatusLookup = mirror_transaction_status,
+    ) -> Iterator[ShardResult]:
+        """
+        Pay every shard of the plan, resuming from a checkpoint if one is given.
+
+        Arguments are validated and the checkpoint is loaded immediately; payments start
+        when the returned iterator is first advanced. At most `max_concurrency` shards
+        are in flight, and results are yielded as they complete.
+
+        When resuming, shards recorded as done are yielded with `resumed=True` without
+        being sent. A shard that was submitted but not confirmed is looked up with
+        `status_lookup`: if it succeeded it is marked done; if it is unknown and its
+        transaction may still reach consensus, the same signed bytes are resent, which
+        the network deduplicates; otherwise the shard is paid by a new transaction.
+
+        Args:
+            client (Client): The client used to freeze, sign and submit.
+            rows (Iterable[tuple[AccountId, int]] | str | os.PathLike): The payouts, or
+                the path of a CSV file (see `read_transfers_csv`). A resumed run must be
+                given the same payouts as the interrupted one.
+            checkpoint (TransferCheckpoint | str | os.PathLike, optional): The journal
+                that records progress. Without one the run cannot be resumed.
+            signing_keys (Iterable[PrivateKey]): Extra keys that sign every transaction.
+            max_concurrency (int): Maximum number of shards in flight.
+            timeout (int | float, optional): The execution timeout of each shard.
+            status_lookup (Callable[[Client, TransactionId], str | None]): Returns the
+                consensus result name of a transaction, or None if it is not known.
+
+        Returns:
+            Iterator[ShardResult]: The outcome of each shard. Iterating raises
+                ReceiptStatusError if a shard does not succeed.
+
+        Raises:
+            ValueError: If max_concurrency is out of range or the checkpoint belongs to
+                another plan.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+
+        if isinstance(rows, (str, os.PathLike)):
+            rows = read_transfers_csv(rows)
+
+        if checkpoint is not None and not isinstance(checkpoint, TransferCheckpoint):
+            checkpoint = TransferCheckpoint(checkpoint)
+
+        records = checkpoint.open(self.fingerprint) if checkpoint is not None else {}
+
+        return self._execute_shards(
+            client, rows, checkpoint, records, list(signing_keys), max_concurrency, timeout, status_lookup
+        )
+
+    def _execute_shards(
+        self,
+        client: Client,
+        rows: Iterable[tuple[AccountId, int]],
+        checkpoint: TransferCheckpoint | None,
+        records: dict[int, dict[str, Any]],
+        signing_keys: list[PrivateKey],
+        max_concurrency: int,
+        timeout: int | float | None,
+        status_lookup: StatusLookup,
+    ) -> Iterator[ShardResult]:
+        """Generator behind `execute`, separated so that arguments are validated eagerly."""
+
+        def record(shard: TransferShard, state: str, transaction_id: TransactionId, **fields: Any) -> None:
+            if checkpoint is not None:
+                checkpoint.record(
+                    shard=shard.index, digest=shard.digest, state=state, transaction_id=str(transaction_id), **fields
+                )
+
+        def send(shard: TransferShard, transaction: Transaction, resumed: bool = False) -> ShardResult:
+            transaction_id = transaction.transaction_id
+            try:
+                receipt = transaction.execute(client, timeout, validate_status=True)
+            except PrecheckError as e:
+                if e.status != ResponseCode.DUPLICATE_TRANSACTION:
+                    raise
+                # An earlier submission of these bytes already reached the network
+                receipt = (
+                    TransactionGetReceiptQuery()
+                    .set_transaction_id(transaction_id)
+                    .set_validate_status(True)
+                    .execute(client, timeout)
+                )
+
+            status = ResponseCode(receipt.status)
+            record(shard, "done", transaction_id, status=status.name)
+            return ShardResult(shard, transaction_id, status, receipt, resumed)
+
+        def submit_new(shard: TransferShard) -> Transaction:
+            transaction = self.build(client, shard, signing_keys)
+            expires = transaction.transaction_id.valid_start.seconds + transaction.transaction_valid_duration
+            record(
+                shard,
+                "submitted",
+                transaction.transaction_id,
+                expires=expires,
+                transaction=base64.b64encode(transaction.to_bytes()).decode(),
+            )
+            return transaction
+
+        def resume(shard: TransferShard, entry: dict[str, Any]) -> ShardResult:
+            transaction_id = TransactionId.from_string(entry["transaction_id"])
+            result = status_lookup(client, transaction_id)
+
+            if result == ResponseCode.SUCCESS.name:
+                record(shard, "done", transaction_id, status=result)
+                return ShardResult(shard, transaction_id, ResponseCode.SUCCESS, None, resumed=True)
+
+            if result is None and time.time() < entry["expires"] + MIRROR_GRACE_SECONDS:
+                return send(shard, Transaction.from_bytes(base64.b64decode(entry["transaction"])), resumed=True)
+
+            # The transaction failed, or expired without reaching consensus
+            return send(shard, submit_new(shard))
+
+        with ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="transfer-planner") as executor:
+            in_flight: set[Future[ShardResult]] = set()
+
+            try:
+                for shard in self.plan(rows):
+                    entry = records.get(shard.index)
+                    if entry is not None and entry["digest"] != shard.digest:
+                        raise ValueError(
+                            f"Shard {shard.index} does not match the checkpoint; the payouts changed since it was written"
+                        )
+
+                    if entry is None:
+                        # Freeze and sign on this thread so transaction IDs are generated in order
+                        in_flight.add(executor.submit(send, shard, submit_new(shard)))
+                    elif entry["state"] == "done":
+                        yield ShardResult(
+                            shard,
+                            TransactionId.from_string(entry["transaction_id"]),
+                            ResponseCode[entry["status"]],
+                            None,
+                            resumed=True,
+                        )
+                        continue
+                    else:
+                        in_flight.add(executor.submit(resume, shard, entry))
+
+                    if len(in_flight) >= max_concurrency:
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            yield future.result()
+
+                while in_flight:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+
+            finally:
+                for future in in_flight:
+                    future.cancel()
@@ -5,12 +5,16 @@ from __future__ import annotations
 from hiero_sdk_python.account.account_id import AccountId
 from hiero_sdk_python.channels import _Channel
 from hiero_sdk_python.executable import _Method
-from hiero_sdk_python.hapi.services import basic_types_pb2, crypto_transfer_pb2, transaction_pb2
+from hiero_sdk_python.hapi.services import crypto_transfer_pb2, transaction_pb2
 from hiero_sdk_python.hapi.services.schedulable_transaction_body_pb2 import (
     SchedulableTransactionBody,
 )
 from hiero_sdk_python.hbar import Hbar
-from hiero_sdk_python.tokens.abstract_token_transfer_transaction import AbstractTokenTransferTransaction
+from hiero_sdk_python.tokens.abstract_token_transfer_transaction import (
+    AbstractTokenTransferTransaction,
+    _account_index,
+    _AccountIndex,
+)
 from hiero_sdk_python.tokens.hbar_transfer import HbarTransfer
 from hiero_sdk_python.tokens.token_id import TokenId
 from hiero_sdk_python.tokens.token_nft_transfer import TokenNftTransfer
@@ -20,6 +24,8 @@ from hiero_sdk_python.tokens.token_transfer import TokenTransfer
 class TransferTransaction(AbstractTokenTransferTransaction["TransferTransaction"]):
     """Represents a transaction to transfer HBAR or tokens between accounts."""
 
+    _proto_body_field = "cryptoTransfer"
+
     def __init__(
         self,
         hbar_transfers: dict[AccountId, int] | None = None,
@@ -38,6 +44,7 @@ class TransferTransaction(AbstractTokenTransferTransaction["TransferTransaction"
         """
         super().__init__()
         self.hbar_transfers: list[HbarTransfer] = []
+        self._hbar_transfer_index: _AccountIndex[HbarTransfer] | None = None
 
         if hbar_transfers:
             self._init_hbar_transfers(hbar_transfers)
@@ -75,12 +82,16 @@ class TransferTransaction(AbstractTokenTransferTransaction["TransferTransaction"
         if not isinstance(is_approved, bool):
             raise TypeError("is_approved must be a boolean.")
 
-        for transfer in self.hbar_transfers:
-            if transfer.account_id == account_id:
-                transfer.amount += amount
-                return self
+        transfers, index = self._hbar_transfer_index = _account_index(self.hbar_transfers, self._hbar_transfer_index)
+
+        existing = index.get(account_id)
+        if existing is not None:
+            existing.amount += amount
+            return self
 
-        self.hbar_transfers.append(HbarTransfer(account_id, amount, is_approved))
+        transfer = HbarTransfer(account_id, amount, is_approved)
+        transfers.append(transfer)
+        index[account_id] = transfer
         return self
 
     def add_hbar_transfer(self, account_id: AccountId, amount: int | Hbar) -> TransferTransaction:
@@ -117,17 +128,12 @@ class TransferTransaction(AbstractTokenTransferTransaction["TransferTransaction"
 
         # HBAR
         if self.hbar_transfers:
-            transfer_list = basic_types_pb2.TransferList()
-            for hbar_transfer in self.hbar_transfers:
-                transfer_list.accountAmounts.append(hbar_transfer._to_proto())
-
-            crypto_transfer_tx_body.transfers.CopyFrom(transfer_list)
+            crypto_transfer_tx_body.transfers.accountAmounts.extend(
+                hbar_transfer._to_proto() for hbar_transfer in self.hbar_transfers
+            )
 
         # NFTs/Tokens
-        token_transfers = self.build_token_transfers()
-
-        for transfer in token_transfers:
-            crypto_transfer_tx_body.tokenTransfers.append(transfer)
+        crypto_transfer_tx_body.tokenTransfers.extend(self.build_token_transfers())
 
         return crypto_transfer_tx_body
 
@@ -138,7 +144,7 @@ class TransferTransaction(AbstractTokenTransferTransaction["TransferTransaction"
         Returns:
             TransactionBody: The built transaction body.
         """
-        crypto_transfer_tx_body = self._build_proto_body()
+        crypto_transfer_tx_body = self._get_proto_body()
 
         transaction_body = self.build_base_transaction_body()
         transaction_body.cryptoTransfer.CopyFrom(crypto_transfer_tx_body)
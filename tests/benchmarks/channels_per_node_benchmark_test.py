@@ -0,0 +1,44 @@
+"""Query throughput of many threads sharing one client, with one or several channels per node."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from hiero_sdk_python.account.account_id import AccountId
+from hiero_sdk_python.query.account_balance_query import CryptoGetAccountBalanceQuery
+from tests.benchmarks.conftest import scaled, time_call
+from tests.unit.conftest import balance_response
+from tests.unit.mock_server import mock_hedera_servers
+
+
+pytestmark = pytest.mark.benchmark
+
+QUERY_COUNT = 2000
+
+THREAD_COUNT = 64
+
+ACCOUNT = AccountId(0, 0, 1800)
+
+
+@pytest.mark.parametrize("channels_per_node", [1, 4])
+def test_concurrent_queries(benchmark_report, channels_per_node):
+    """Free queries from 64 threads against the in-process mock node."""
+    queries = scaled(QUERY_COUNT)
+
+    with mock_hedera_servers([[balance_response() for _ in range(queries)]]) as client:
+        client.set_channels_per_node(channels_per_node)
+
+        def query(_):
+            return CryptoGetAccountBalanceQuery(ACCOUNT).execute(client)
+
+        def run():
+            with ThreadPoolExecutor(max_workers=THREAD_COUNT) as executor:
+                list(executor.map(query, range(queries)))
+
+        timings = time_call(run, repeat=1)
+        client.close()
+
+    benchmark_report.add_timings(f"{channels_per_node} channel(s) per node", timings, operations=queries)
+    benchmark_report.add("queries per second", queries / timings[0], "")
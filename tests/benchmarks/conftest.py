@@ -0,0 +1,74 @@
+"""Shared helpers for the performance benchmarks in tests/benchmarks."""
+
+from __future__ import annotations
+
+import os
+import statistics
+import time
+from collections.abc import Callable
+
+import pytest
+
+
+def benchmark_scale() -> float:
+    """
+    Return the multiplier applied to benchmark workload sizes.
+
+    CI runs with the default of 1.0; set ``HIERO_BENCHMARK_SCALE`` to a smaller value
+    for a quick local smoke run or a larger one for more stable numbers.
+    """
+    return float(os.getenv("HIERO_BENCHMARK_SCALE", "1.0"))
+
+
+def scaled(count: int) -> int:
+    """Scale a workload size by `benchmark_scale()`, never going below one."""
+    return max(1, int(count * benchmark_scale()))
+
+
+def time_call(func: Callable[[], object], repeat: int = 5) -> list[float]:
+    """Run `func` `repeat` times and return the wall time of each run in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+class BenchmarkReport:
+    """Collects benchmark results and prints them, and adds them to the GitHub job summary when available."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.rows: list[tuple[str, str]] = []
+
+    def add(self, label: str, value: float, unit: str = "ms") -> None:
+        """Record a single measurement."""
+        self.rows.append((label, f"{value:,.2f} {unit}"))
+
+    def add_timings(self, label: str, timings: list[float], operations: int = 1) -> None:
+        """Record the median of `timings`, and the per-operation time when `operations` > 1."""
+        median = statistics.median(timings)
+        self.add(f"{label} (median)", median * 1000)
+        if operations > 1:
+            self.add(f"{label} per op", median / operations * 1_000_000, "µs")
+
+    def flush(self) -> None:
+        lines = [f"### {self.name}", "", "| Measurement | Value |", "| --- | --- |"]
+        lines += [f"| {label} | {value} |" for label, value in self.rows]
+        text = "\n".join(lines)
+
+        print(f"\n{text}")
+
+        summary_path = os.getenv("GITHUB_STEP_SUMMARY")
+        if summary_path:
+            with open(summary_path, "a", encoding="utf-8") as summary:
+                summary.write(text + "\n\n")
+
+
+@pytest.fixture
+def benchmark_report(request):
+    """Yield a `BenchmarkReport` named after the test and publish it at teardown."""
+    report = BenchmarkReport(request.node.name)
+    yield report
+    report.flush()
@@ -0,0 +1,65 @@
+"""Cold-import cost of the package root, measured with ``python -X importtime``."""
+
+from __future__ import annotations
+
+import os
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+pytestmark = pytest.mark.benchmark
+
+SRC_DIR = Path(__file__).resolve().parents[2] / "src"
+
+# Generous ceiling for a bare ``import hiero_sdk_python`` on a shared CI runner.
+# Before the package root was made lazy this took ~1s.
+IMPORT_BUDGET_MS = float(os.getenv("HIERO_IMPORT_BUDGET_MS", "250"))
+
+RUNS = 5
+
+
+def _cold_import_ms(statement: str) -> float:
+    """
+    Run `statement` in a fresh interpreter and return the time spent importing the SDK, in ms.
+
+    This is the sum of the cumulative times of the top-level ``hiero_sdk_python`` entries
+    reported by ``-X importtime``, so interpreter start-up is excluded.
+    """
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [str(SRC_DIR), os.getenv("PYTHONPATH")]))}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+
+    pattern = re.compile(r"^import time:\s+\d+\s+\|\s+(\d+)\s+\| hiero_sdk_python(\.\S+)?$")
+    total_us = sum(int(match.group(1)) for match in map(pattern.match, result.stderr.splitlines()) if match)
+    if not total_us:
+        raise AssertionError("hiero_sdk_python not found in -X importtime output")
+
+    return total_us / 1000
+
+
+def test_cold_import_package_root(benchmark_report):
+    """A bare ``import hiero_sdk_python`` stays within the import budget."""
+    timings = [_cold_import_ms("import hiero_sdk_python") for _ in range(RUNS)]
+    median = statistics.median(timings)
+
+    benchmark_report.add("import hiero_sdk_python (median)", median)
+    benchmark_report.add("budget", IMPORT_BUDGET_MS)
+
+    assert median < IMPORT_BUDGET_MS
+
+
+def test_cold_import_client(benchmark_report):
+    """Report the cost of the first import that actually needs the Client."""
+    timings = [_cold_import_ms("from hiero_sdk_python import Client") for _ in range(RUNS)]
+
+    benchmark_report.add("from hiero_sdk_python import Client (median)", statistics.median(timings))
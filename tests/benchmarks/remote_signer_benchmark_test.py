@@ -0,0 +1,75 @@
+"""Cost of signing with a remote signer per node body, per transaction and per batch of transactions."""
+
+from __future__ import annotations
+
+import pytest
+
+from hiero_sdk_python.account.account_id import AccountId
+from hiero_sdk_python.crypto.private_key import PrivateKey
+from hiero_sdk_python.crypto.signer import LocalSigner
+from hiero_sdk_python.crypto.signing_backend import InProcessSigningBackend
+from hiero_sdk_python.transaction.transaction_id import TransactionId
+from hiero_sdk_python.transaction.transfer_transaction import TransferTransaction
+from tests.benchmarks.conftest import scaled, time_call
+
+
+pytestmark = pytest.mark.benchmark
+
+TRANSACTION_COUNT = 50
+
+NODE_COUNT = 5
+
+# Simulated round trip to an HSM or KMS, in seconds
+SIGNER_LATENCY = 0.005
+
+PAYER = AccountId.from_string("0.0.1001")
+
+
+def _frozen_transactions() -> list[TransferTransaction]:
+    nodes = [AccountId(0, 0, 3 + index) for index in range(NODE_COUNT)]
+    return [
+        TransferTransaction()
+        .add_hbar_transfer(PAYER, -1 - index)
+        .add_hbar_transfer(AccountId(0, 0, 2000 + index), 1 + index)
+        .set_node_account_ids(nodes)
+        .set_transaction_id(TransactionId.generate(PAYER))
+        .freeze()
+        for index in range(scaled(TRANSACTION_COUNT))
+    ]
+
+
+@pytest.fixture
+def signer() -> LocalSigner:
+    return LocalSigner(PrivateKey.generate(), latency=SIGNER_LATENCY)
+
+
+def test_one_request_per_node_body(benchmark_report, signer):
+    """The request pattern of signing each node body separately."""
+    transactions = _frozen_transactions()
+    bodies = [body for transaction in transactions for body in transaction._transaction_body_bytes.values()]
+
+    timings = time_call(lambda: [signer.sign(body) for body in bodies], repeat=1)
+
+    benchmark_report.add_timings("per node body", timings, operations=len(transactions))
+    benchmark_report.add("signer requests", signer.calls, "")
+
+
+def test_one_request_per_transaction(benchmark_report, signer):
+    """Transaction.sign sends all node bodies of a transaction in one request."""
+
+    def sign_each():
+        for transaction in _frozen_transactions():
+            transaction.sign(signer)
+
+    timings = time_call(sign_each, repeat=1)
+
+    benchmark_report.add_timings("per transaction", timings, operations=scaled(TRANSACTION_COUNT))
+    benchmark_report.add("signer requests", signer.calls, "")
+
+
+def test_one_request_per_batch(benchmark_report, signer):
+    """SigningBackend.sign_transactions sends the bodies of every transaction in one request."""
+    timings = time_call(lambda: InProcessSigningBackend().sign_transactions(_frozen_transactions(), [signer]), repeat=1)
+
+    benchmark_report.add_timings("per batch", timings, operations=scaled(TRANSACTION_COUNT))
+    benchmark_report.add("signer requests", signer.calls, "")
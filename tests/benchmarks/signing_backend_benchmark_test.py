@@ -0,0 +1,88 @@
+"""Throughput of signing many multi-key transactions in-process and in a process pool."""
+
+from __future__ import annotations
+
+import os
+from functools import partial
+
+import pytest
+
+from hiero_sdk_python.account.account_id import AccountId
+from hiero_sdk_python.crypto.private_key import PrivateKey
+from hiero_sdk_python.crypto.signing_backend import InProcessSigningBackend, ProcessPoolSigningBackend
+from hiero_sdk_python.transaction.transaction_id import TransactionId
+from hiero_sdk_python.transaction.transfer_transaction import TransferTransaction
+from tests.benchmarks.conftest import scaled, time_call
+
+
+pytestmark = pytest.mark.benchmark
+
+TRANSACTION_COUNT = 500
+
+NODE_COUNT = 4
+
+WORKER_COUNTS = (1, 2, 4, 8)
+
+PAYER = AccountId.from_string("0.0.1001")
+
+
+@pytest.fixture(scope="module")
+def keys() -> list[PrivateKey]:
+    return [PrivateKey.generate_ed25519(), PrivateKey.generate_ecdsa(), PrivateKey.generate_ecdsa()]
+
+
+def _frozen_transactions() -> list[TransferTransaction]:
+    nodes = [AccountId(0, 0, 3 + index) for index in range(NODE_COUNT)]
+    transactions = []
+    for index in range(scaled(TRANSACTION_COUNT)):
+        transaction = (
+            TransferTransaction()
+            .add_hbar_transfer(PAYER, -1 - index)
+            .add_hbar_transfer(AccountId(0, 0, 2000 + index), 1 + index)
+            .set_node_account_ids(nodes)
+            .set_transaction_id(TransactionId.generate(PAYER))
+        )
+        transactions.append(transaction.freeze())
+    return transactions
+
+
+def _time_signing(backend, keys, repeat: int = 3) -> list[float]:
+    """Time `sign_transactions` alone, on unsigned transactions frozen before each timed run."""
+    timings = []
+    for _ in range(repeat):
+        transactions = _frozen_transactions()
+        timings += time_call(partial(backend.sign_transactions, transactions, keys), repeat=1)
+    return timings
+
+
+def test_in_process_signing(benchmark_report, keys):
+    """Sign every node body of every transaction with three keys on the calling thread."""
+    signatures = scaled(TRANSACTION_COUNT) * NODE_COUNT * len(keys)
+
+    timings = _time_signing(InProcessSigningBackend(), keys)
+
+    benchmark_report.add_timings("in-process", timings, operations=signatures)
+
+
+@pytest.mark.parametrize("workers", WORKER_COUNTS)
+def test_process_pool_signing(benchmark_report, keys, workers):
+    """
+    Sign the same workload in a process pool.
+
+    The speed-up over the in-process backend is reported rather than asserted: it is
+    bounded by the number of cores of the machine running the benchmark.
+    """
+    signatures = scaled(TRANSACTION_COUNT) * NODE_COUNT * len(keys)
+    baseline = _time_signing(InProcessSigningBackend(), keys)
+
+    backend = ProcessPoolSigningBackend(max_workers=workers, keys=keys)
+    try:
+        # Start the workers outside the timed runs
+        backend.sign_transactions(_frozen_transactions(), keys)
+        timings = _time_signing(backend, keys)
+    finally:
+        backend.close()
+
+    benchmark_report.add_timings(f"{workers} worker(s)", timings, operations=signatures)
+    benchmark_report.add("speed-up over in-process", min(baseline) / min(timings), "x")
+    benchmark_report.add("available cores", os.cpu_count() or 1, "")
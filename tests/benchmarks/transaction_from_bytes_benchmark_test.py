@@ -0,0 +1,59 @@
+"""Deserialization throughput of signed transactions via Transaction.from_bytes and from_bytes_many."""
+
+from __future__ import annotations
+
+import pytest
+
+from hiero_sdk_python.account.account_id import AccountId
+from hiero_sdk_python.crypto.private_key import PrivateKey
+from hiero_sdk_python.transaction.transaction import Transaction
+from hiero_sdk_python.transaction.transaction_id import TransactionId
+from hiero_sdk_python.transaction.transfer_transaction import TransferTransaction
+from tests.benchmarks.conftest import scaled, time_call
+
+
+pytestmark = pytest.mark.benchmark
+
+TRANSACTION_COUNT = 100_000
+
+# Number of distinct signed transactions; the workload cycles through them so that
+# building the input does not dominate the benchmark.
+DISTINCT_TRANSACTIONS = 1_000
+
+
+@pytest.fixture(scope="module")
+def signed_transaction_bytes() -> list[bytes]:
+    operator_id = AccountId.from_string("0.0.1234")
+    private_key = PrivateKey.generate_ed25519()
+
+    distinct = []
+    for amount in range(1, min(DISTINCT_TRANSACTIONS, scaled(TRANSACTION_COUNT)) + 1):
+        transaction = (
+            TransferTransaction()
+            .add_hbar_transfer(operator_id, -amount)
+            .add_hbar_transfer(AccountId.from_string("0.0.5678"), amount)
+        )
+        transaction.transaction_id = TransactionId.generate(operator_id)
+        transaction.set_node_account_ids([AccountId.from_string("0.0.3")])
+        distinct.append(transaction.freeze().sign(private_key).to_bytes())
+
+    count = scaled(TRANSACTION_COUNT)
+    return [distinct[index % len(distinct)] for index in range(count)]
+
+
+def test_from_bytes(benchmark_report, signed_transaction_bytes):
+    """Deserialize every transaction with one from_bytes call each."""
+    timings = time_call(lambda: [Transaction.from_bytes(data) for data in signed_transaction_bytes], repeat=3)
+
+    benchmark_report.add_timings("from_bytes", timings, operations=len(signed_transaction_bytes))
+
+
+def test_from_bytes_many(benchmark_report, signed_transaction_bytes):
+    """Deserialize every transaction with a single from_bytes_many call."""
+    restored = Transaction.from_bytes_many(signed_transaction_bytes)
+    assert len(restored) == len(signed_transaction_bytes)
+    assert all(type(transaction) is TransferTransaction for transaction in restored)
+
+    timings = time_call(lambda: Transaction.from_bytes_many(signed_transaction_bytes), repeat=3)
+
+    benchmark_report.add_timings("from_bytes_many", timings, operations=len(signed_transaction_bytes))
@@ -0,0 +1,78 @@
+"""Cost of building and freezing transfer transactions with large transfer lists."""
+
+from __future__ import annotations
+
+import pytest
+
+from hiero_sdk_python.account.account_id import AccountId
+from hiero_sdk_python.tokens.token_id import TokenId
+from hiero_sdk_python.transaction.transaction_id import TransactionId
+from hiero_sdk_python.transaction.transfer_transaction import TransferTransaction
+from tests.benchmarks.conftest import scaled, time_call
+
+
+pytestmark = pytest.mark.benchmark
+
+TRANSFER_COUNT = 10_000
+
+NODE_COUNT = 10
+
+SENDER = AccountId.from_string("0.0.1001")
+TOKEN_ID = TokenId.from_string("0.0.5005")
+
+
+@pytest.fixture(scope="module")
+def recipients() -> list[AccountId]:
+    return [AccountId(0, 0, 10_000 + index) for index in range(scaled(TRANSFER_COUNT))]
+
+
+def _token_transfers(recipients: list[AccountId]) -> TransferTransaction:
+    transaction = TransferTransaction()
+    for recipient in recipients:
+        transaction.add_token_transfer(TOKEN_ID, SENDER, -1)
+        transaction.add_token_transfer(TOKEN_ID, recipient, 1)
+    return transaction
+
+
+def _hbar_transfers(recipients: list[AccountId]) -> TransferTransaction:
+    transaction = TransferTransaction()
+    for recipient in recipients:
+        transaction.add_hbar_transfer(SENDER, -1)
+        transaction.add_hbar_transfer(recipient, 1)
+    return transaction
+
+
+def test_add_token_transfers(benchmark_report, recipients):
+    """Add a debit and a credit per recipient, merging every debit into the sender's single entry."""
+    transaction = _token_transfers(recipients)
+    assert len(transaction.token_transfers[TOKEN_ID]) == len(recipients) + 1
+
+    timings = time_call(lambda: _token_transfers(recipients), repeat=3)
+
+    benchmark_report.add_timings("add_token_transfer", timings, operations=2 * len(recipients))
+
+
+def test_add_hbar_transfers(benchmark_report, recipients):
+    """Add a debit and a credit per recipient, merging every debit into the sender's single entry."""
+    transaction = _hbar_transfers(recipients)
+    assert len(transaction.hbar_transfers) == len(recipients) + 1
+
+    timings = time_call(lambda: _hbar_transfers(recipients), repeat=3)
+
+    benchmark_report.add_timings("add_hbar_transfer", timings, operations=2 * len(recipients))
+
+
+def test_freeze_for_many_nodes(benchmark_report, recipients):
+    """Freeze a large token transfer list for every node of a network."""
+    transaction = _token_transfers(recipients)
+    nodes = [AccountId(0, 0, 3 + index) for index in range(NODE_COUNT)]
+
+    def freeze():
+        transaction._transaction_body_bytes.clear()
+        transaction.set_node_account_ids(nodes)
+        transaction.transaction_id = TransactionId.generate(SENDER)
+        transaction.freeze()
+
+    timings = time_call(freeze, repeat=3)
+
+    benchmark_report.add_timings(f"freeze for {NODE_COUNT} nodes", timings)
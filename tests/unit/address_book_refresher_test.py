@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import binascii
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from hiero_sdk_python.account.account_id import AccountId
+from hiero_sdk_python.client.address_book_refresher import AddressBookRefresher
+from hiero_sdk_python.client.network import Network
+
+
+pytestmark = pytest.mark.unit
+
+
+def _entry(account_num, cert_hash=b"cert-hash"):
+    return {
+        "node_account_id": f"0.0.{account_num}",
+        "node_id": account_num - 3,
+        "node_cert_hash": "0x" + binascii.hexlify(cert_hash).decode("utf-8"),
+        "public_key": "",
+        "description": "",
+        "service_endpoints": [
+            {"ip_address_v4": f"10.0.{account_num // 256}.{account_num % 256}", "port": 50211, "domain_name": ""}
+        ],
+    }
+
+
+def _response(entries, next_link=None):
+    response = MagicMock()
+    response.json.return_value = {"nodes": entries, "links": {"next": next_link}}
+    return response
+
+
+def _mirror(*books):
+    """Patch the mirror node to serve each address book in turn, each given as a list of pages."""
+    served = []
+
+    def get(url, timeout):  # noqa: ARG001
+        if url.endswith("order=desc"):
+            served.append(books[min(len(served), len(books) - 1)])
+            index = 0
+        else:
+            index = int(url.rsplit("page=", 1)[1])
+
+        pages = served[-1]
+        next_link = f"/api/v1/network/nodes?page={index + 1}" if index + 1 < len(pages) else None
+        return _response(pages[index], next_link)
+
+    return patch("hiero_sdk_python.client.network.requests.get", side_effect=get)
+
+
+def test_address_book_pages_are_followed():
+    """Every page of the mirror node address book is fetched."""
+    pages = [[_entry(3 + page * 100 + index) for index in range(100)] for page in range(2)] + [[_entry(203)]]
+
+    with _mirror(pages) as get:
+        network = Network("mainnet")
+
+    assert get.call_count == 3
+    assert len(network.nodes) == 201
+    assert network.nodes[-1]._account_id == AccountId(0, 0, 203)
+
+
+def test_refresh_reuses_unchanged_nodes():
+    """Unchanged nodes keep their _Node, channel and health; changed and removed ones are replaced and closed."""
+    with _mirror([[_entry(3), _entry(4), _entry(5)]], [[_entry(3), _entry(4, b"rotated"), _entry(6)]]):
+        network = Network("mainnet")
+        unchanged, rotated, removed = network.nodes
+        unchanged._channel = MagicMock()
+        channel = unchanged._channel
+        rotated._channel = MagicMock()
+        removed_channel = removed._channel = MagicMock()
+        network._increase_backoff(unchanged)
+
+        assert network._refresh_from_mirror_node()
+
+    assert network.nodes[0] is unchanged
+    assert unchanged._channel is channel
+    assert unchanged not in network._healthy_nodes
+    assert network.nodes[1] is not rotated
+    assert network.nodes[2]._account_id == AccountId(0, 0, 6)
+    assert network.nodes[1] in network._healthy_nodes
+    assert network.nodes[2] in network._healthy_nodes
+    assert removed._channel is None
+    removed_channel.channel.close.assert_called_once()
+    assert network.current_node in network.nodes
+
+
+def test_failed_refresh_keeps_the_current_nodes():
+    """When the mirror node cannot be reached the current address book stays in place."""
+    with _mirror([[_entry(3), _entry(4)]]):
+        network = Network("mainnet")
+    nodes = list(network.nodes)
+
+    with patch.object(Network, "_fetch_node_entries_from_mirror_node", return_value=[]):
+        assert not network._refresh_from_mirror_node()
+
+    assert network.nodes == nodes
+
+
+def test_triggers_do_not_block_and_are_coalesced():
+    """Triggering returns at once; triggers arriving during a refresh result in one more refresh."""
+    started = threading.Event()
+    release = threading.Event()
+    network = MagicMock()
+
+    def refresh():
+        started.set()
+        release.wait(5)
+
+    network._refresh_from_mirror_node.side_effect = refresh
+    refresher = AddressBookRefresher(network)
+
+    start = time.monotonic()
+    refresher.trigger()
+    started.wait(5)
+    for _ in range(5):
+        refresher.trigger()
+    assert time.monotonic() - start < 1
+
+    release.set()
+    deadline = time.monotonic() + 5
+    while refresher.refresh_count < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    refresher.close()
+
+    assert network._refresh_from_mirror_node.call_count == 2
+
+
+def test_periodic_refresh():
+    """With an interval the address book is refreshed repeatedly until the refresher is closed."""
+    network = MagicMock()
+    refresher = AddressBookRefresher(network, interval=0.02)
+
+    deadline = time.monotonic() + 5
+    while refresher.refresh_count < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    refresher.close()
+    count = network._refresh_from_mirror_node.call_count
+    time.sleep(0.05)
+
+    assert count >= 3
+    assert network._refresh_from_mirror_node.call_count == count
+
+    with pytest.raises(ValueError, match="interval must be positive"):
+        refresher.set_interval(0)
+
+
+def test_client_network_update_period(mock_client):
+    """Client.set_network_update_period configures the client's refresher and returns the client."""
+    with patch.object(Network, "_refresh_from_mirror_node") as refresh:
+        assert mock_client.set_network_update_period(0.02) is mock_client
+        deadline = time.monotonic() + 5
+        while refresh.call_count < 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        mock_client.set_network_update_period(None)
+        mock_client.close()
+
+    assert refresh.call_count >= 1
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from hiero_sdk_python.crypto.private_key import PrivateKey
+from hiero_sdk_python.hapi.services import (
+    response_header_pb2,
+    response_pb2,
+    transaction_get_receipt_pb2,
+)
+from hiero_sdk_python.hapi.services.transaction_receipt_pb2 import (
+    TransactionReceipt as TransactionReceiptProto,
+)
+from hiero_sdk_python.hapi.services.transaction_response_pb2 import (
+    TransactionResponse as TransactionResponseProto,
+)
+from hiero_sdk_python.query.transaction_get_receipt_query import TransactionGetReceiptQuery
+from hiero_sdk_python.response_code import ResponseCode
+from hiero_sdk_python.transaction.batch_packer import (
+    MAX_TRANSACTION_SIZE,
+    BatchPacker,
+    BatchPackerError,
+    BatchResult,
+    _inner_transaction_cost,
+)
+from hiero_sdk_python.transaction.transfer_transaction import TransferTransaction
+from tests.unit.mock_server import mock_hedera_servers
+
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def make_transfer(mock_account_ids):
+    """Return a factory for small, un-frozen hbar transfers."""
+    sender, receiver, _, _, _ = mock_account_ids
+
+    def _make(amount=1, memo=""):
+        return (
+            TransferTransaction()
+            .add_hbar_transfer(sender, -amount)
+            .add_hbar_transfer(receiver, amount)
+            .set_transaction_memo(memo)
+        )
+
+    return _make
+
+
+def _receipt_response(status):
+    return response_pb2.Response(
+        transactionGetReceipt=transaction_get_receipt_pb2.TransactionGetReceiptResponse(
+            header=response_header_pb2.ResponseHeader(nodeTransactionPrecheckCode=ResponseCode.OK),
+            receipt=TransactionReceiptProto(status=status),
+        )
+    )
+
+
+def test_constructor_validates_arguments():
+    """The batch key must be a key and the limits must leave room for a payload."""
+    with pytest.raises(TypeError, match="batch_key must be a PrivateKey or PublicKey"):
+        BatchPacker("key")
+
+    with pytest.raises(ValueError, match="max_inner_transactions must be between 1 and 50"):
+        BatchPacker(PrivateKey.generate(), max_inner_transactions=51)
+
+    with pytest.raises(ValueError, match="max_inner_transactions must be between 1 and 50"):
+        BatchPacker(PrivateKey.generate(), max_inner_transactions=0)
+
+    with pytest.raises(ValueError, match="larger than envelope_overhead"):
+        BatchPacker(PrivateKey.generate(), max_batch_size=512, envelope_overhead=512)
+
+
+def test_pack_splits_on_inner_transaction_count(mock_client, make_transfer):
+    """120 small transfers pack into envelopes of 50, 50 and 20, preserving order."""
+    transfers = [make_transfer(amount=i + 1) for i in range(120)]
+    packer = BatchPacker(PrivateKey.generate(), max_batch_size=64 * 1024)
+
+    batches = list(packer.pack(mock_client, transfers))
+
+    assert [len(batch.inner_transactions) for batch in batches] == [50, 50, 20]
+    packed_ids = [tx_id for batch in batches for tx_id in batch.get_inner_transaction_ids()]
+    assert packed_ids == [tx.transaction_id for tx in transfers]
+
+
+def test_pack_splits_on_size(mock_client, make_transfer):
+    """Envelopes are closed before the inner transactions exceed the payload budget."""
+    transfers = [make_transfer(memo="x" * 90) for _ in range(12)]
+    packer = BatchPacker(PrivateKey.generate(), max_batch_size=1600, envelope_overhead=500)
+
+    batches = list(packer.pack(mock_client, transfers))
+
+    assert len(batches) > 1
+    assert sum(len(batch.inner_transactions) for batch in batches) == 12
+    for batch in batches:
+        assert sum(_inner_transaction_cost(tx) for tx in batch.inner_transactions) <= 1100
+
+
+def test_full_envelopes_fit_the_network_size_limit(mock_client, make_transfer):
+    """With default limits, signed envelopes filled to the size budget stay under the network limit."""
+    transfers = [make_transfer(amount=i + 1) for i in range(50)]
+
+    batches = list(BatchPacker(PrivateKey.generate()).pack(mock_client, transfers))
+
+    assert len(batches) == 2
+    for batch in batches:
+        batch.sign(mock_client.operator_private_key)
+        assert len(batch._make_request().SerializeToString()) <= MAX_TRANSACTION_SIZE
+
+
+def test_pack_rejects_transaction_larger_than_an_envelope(mock_client, make_transfer):
+    """A transaction that cannot fit on its own raises instead of producing an oversized envelope."""
+    packer = BatchPacker(PrivateKey.generate(), max_batch_size=600, envelope_overhead=500)
+
+    with pytest.raises(ValueError, match="exceeds the 100 bytes available in a batch"):
+        list(packer.pack(mock_client, [make_transfer()]))
+
+
+def test_pack_keeps_batchified_transactions(mock_client, make_transfer):
+    """Pre-batchified transactions are packed as-is, frozen ones without a batch key are rejected."""
+    batch_key = PrivateKey.generate()
+    batchified = make_transfer().batchify(mock_client, batch_key)
+    body_bytes = dict(batchified._transaction_body_bytes)
+
+    (batch,) = BatchPacker(batch_key).pack(mock_client, [batchified])
+
+    assert batch.inner_transactions[0] is batchified
+    assert batchified._transaction_body_bytes == body_bytes
+
+    with pytest.raises(ValueError, match="has no batch key"):
+        list(BatchPacker(batch_key).pack(mock_client, [make_transfer().freeze_with(mock_client)]))
+
+
+def test_envelope_is_signed_by_private_batch_key(mock_client, make_transfer):
+    """A private batch key is set on inner transactions and signs the envelope."""
+    batch_key = PrivateKey.generate()
+
+    (batch,) = BatchPacker(batch_key).pack(mock_client, [make_transfer()])
+
+    assert batch.inner_transactions[0].batch_key == batch_key
+    assert batch.is_signed_by(batch_key.public_key())
+
+
+def test_public_batch_key_leaves_envelope_unsigned(mock_client, make_transfer):
+    """With a public batch key the envelope is frozen but left for the caller to sign."""
+    batch_key = PrivateKey.generate()
+
+    (batch,) = BatchPacker(batch_key.public_key()).pack(mock_client, [make_transfer()])
+
+    assert batch.inner_transactions[0].batch_key == batch_key.public_key()
+    assert not batch.is_signed_by(batch_key.public_key())
+
+
+def test_execute_returns_results_keyed_by_inner_transaction_id(make_transfer):
+    """Each inner transaction gets its own receipt alongside the envelope's receipt."""
+    ok_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.OK)
+    response_sequences = [
+        [
+            ok_response,
+            _receipt_response(ResponseCode.SUCCESS),
+            _receipt_response(ResponseCode.SUCCESS),
+            _receipt_response(ResponseCode.INSUFFICIENT_ACCOUNT_BALANCE),
+        ],
+    ]
+
+    with mock_hedera_servers(response_sequences) as client:
+        transfers = [make_transfer(), make_transfer(amount=2)]
+        # One receipt at a time, so the mock server answers them in order
+        results = BatchPacker(PrivateKey.generate()).execute(client, transfers, max_concurrency=1)
+
+    assert list(results) == [tx.transaction_id for tx in transfers]
+
+    first, second = results.values()
+    assert isinstance(first, BatchResult)
+    assert first.batch_transaction_id == second.batch_transaction_id
+    assert first.batch_receipt.status == ResponseCode.SUCCESS
+    assert first.receipt.status == ResponseCode.SUCCESS
+    assert second.receipt.status == ResponseCode.INSUFFICIENT_ACCOUNT_BALANCE
+
+
+def test_execute_fetches_inner_receipts_concurrently_and_keeps_them_on_failure(make_transfer):
+    """Inner receipts are fetched at the same time; a failed one raises with every other result attached."""
+    ok_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.OK)
+    fetch_receipt = TransactionGetReceiptQuery.execute
+    barrier = threading.Barrier(3, timeout=5)
+
+    with mock_hedera_servers([[ok_response, _receipt_response(ResponseCode.SUCCESS)]]) as client:
+        transfers = [make_transfer(amount=amount) for amount in (1, 2, 3)]
+
+        def execute(query, client, timeout=None):
+            # Transaction IDs are assigned when the transfers are packed
+            inner_ids = [transfer.transaction_id for transfer in transfers]
+            if query.transaction_id not in inner_ids:
+                return fetch_receipt(query, client, timeout)
+            # Only returns once all three receipts are being fetched
+            barrier.wait()
+            if query.transaction_id == inner_ids[1]:
+                raise RuntimeError("receipt failed")
+            return MagicMock(status=ResponseCode.SUCCESS)
+
+        with (
+            patch.object(TransactionGetReceiptQuery, "execute", autospec=True, side_effect=execute),
+            pytest.raises(BatchPackerError, match="after 2 results: receipt failed") as exc_info,
+        ):
+            BatchPacker(PrivateKey.generate()).execute(client, transfers)
+
+    assert list(exc_info.value.results) == [transfers[0].transaction_id, transfers[2].transaction_id]
+    assert isinstance(exc_info.value.__cause__, RuntimeError)
+
+    with pytest.raises(ValueError, match="max_concurrency must be at least 1"):
+        BatchPacker(PrivateKey.generate()).execute(client, transfers, max_concurrency=0)
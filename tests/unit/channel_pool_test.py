@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from hiero_sdk_python.account.account_id import AccountId
+from hiero_sdk_python.address_book.node_address import NodeAddress
+from hiero_sdk_python.channel_pool import _CHANNEL_POOL, _ChannelPool
+from hiero_sdk_python.channels import _Channel
+from hiero_sdk_python.client.client import Client
+from hiero_sdk_python.client.network import Network
+from hiero_sdk_python.node import _Node
+from tests.unit.conftest import FAKE_CERT_HASH, FAKE_CERT_PEM
+
+
+pytestmark = pytest.mark.unit
+
+
+def _client():
+    client = Client(Network(network="mainnet", nodes=[_Node(AccountId(0, 0, 3), "127.0.0.1:50211", None)]))
+    return client.set_transport_security(False)
+
+
+def test_clients_share_one_channel_per_node():
+    """Clients for the same node share its channel, which is closed when the last client closes."""
+    with patch("hiero_sdk_python.node.grpc.insecure_channel") as insecure_channel:
+        first, second = _client(), _client()
+        channel = first.network.nodes[0]._get_channel()
+
+        assert second.network.nodes[0]._get_channel() is channel
+        assert insecure_channel.call_count == 1
+        key = first.network.nodes[0]._channel_key
+        assert _CHANNEL_POOL.references(key) == 2
+
+        first.close()
+        assert _CHANNEL_POOL.references(key) == 1
+        insecure_channel.return_value.close.assert_not_called()
+
+        second.close()
+        assert _CHANNEL_POOL.references(key) == 0
+        insecure_channel.return_value.close.assert_called_once()
+
+
+def test_connection_settings_are_part_of_the_key():
+    """Nodes with different addresses, transport security or pinned certificates do not share channels."""
+    nodes = [
+        _Node(AccountId(0, 0, 3), "127.0.0.1:50211", None),
+        _Node(AccountId(0, 0, 3), "127.0.0.1:50212", NodeAddress(cert_hash=FAKE_CERT_HASH, addresses=[])),
+        _Node(AccountId(0, 0, 3), "127.0.0.1:50212", NodeAddress(cert_hash=b"other", addresses=[])),
+        _Node(AccountId(0, 0, 4), "127.0.0.1:50212", NodeAddress(cert_hash=FAKE_CERT_HASH, addresses=[])),
+    ]
+    nodes[3]._set_verify_certificates(False)
+
+    assert len({node._pool_key() for node in nodes}) == 4
+
+
+def test_tls_handshake_happens_once_per_shared_channel():
+    """Only the node that opens a shared TLS channel fetches the server certificate."""
+    nodes = [
+        _Node(AccountId(0, 0, 3), "127.0.0.1:50212", NodeAddress(cert_hash=FAKE_CERT_HASH, addresses=[]))
+        for _ in range(3)
+    ]
+
+    with patch.object(_Node, "_fetch_server_certificate_pem", autospec=True, return_value=FAKE_CERT_PEM) as fetch:
+        channels = {id(node._get_channel()) for node in nodes}
+
+    assert fetch.call_count == 1
+    assert len(channels) == 1
+    for node in nodes:
+        node._close()
+    assert len(_CHANNEL_POOL) == 0
+
+
+def test_concurrent_acquisitions_create_one_channel():
+    """Threads acquiring the same key at once wait for a single channel to be created."""
+    pool = _ChannelPool()
+    created = []
+
+    def factory():
+        time.sleep(0.05)
+        channel = _Channel(MagicMock())
+        created.append(channel)
+        return channel
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(pool.acquire("key", factory))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(created) == 1
+    assert all(channel is created[0] for channel in results)
+    assert pool.references("key") == 8
+
+
+def test_failed_creation_is_retried_by_the_next_caller():
+    """A factory error reaches its caller; the next acquisition creates the channel and drops the creation lock."""
+    pool = _ChannelPool()
+
+    def failing_factory():
+        raise OSError("handshake failed")
+
+    with pytest.raises(OSError, match="handshake failed"):
+        pool.acquire("key", failing_factory)
+    assert len(pool) == 0
+
+    channel = pool.acquire("key", lambda: _Channel(MagicMock()))
+
+    assert pool.acquire("key", failing_factory) is channel
+    assert pool.references("key") == 2
+    assert pool._creation_locks == {}
+
+
+def test_channels_outside_the_pool_are_not_released():
+    """Releasing a channel the pool does not hold is refused, and the node closes it itself."""
+    pool = _ChannelPool()
+    pooled = pool.acquire("key", lambda: _Channel(MagicMock()))
+
+    assert not pool.release("key", _Channel(MagicMock()))
+    assert pool.references("key") == 1
+    assert pool.release("key", pooled)
+    pooled.channel.close.assert_called_once()
+
+    node = _Node(AccountId(0, 0, 3), "127.0.0.1:50211", None)
+    node._channel = own = _Channel(MagicMock())
+    node._close()
+    own.channel.close.assert_called_once()
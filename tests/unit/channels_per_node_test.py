@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from hiero_sdk_python.account.account_id import AccountId
+from hiero_sdk_python.address_book.node_address import NodeAddress
+from hiero_sdk_python.channel_pool import _CHANNEL_POOL
+from hiero_sdk_python.node import _Node
+from hiero_sdk_python.query.account_balance_query import CryptoGetAccountBalanceQuery
+from tests.unit.conftest import FAKE_CERT_HASH, balance_response
+from tests.unit.mock_server import mock_hedera_servers
+
+
+pytestmark = pytest.mark.unit
+
+
+def test_requests_rotate_through_the_node_channels(mock_client):
+    """Successive requests use each of the node's channels in turn; closing releases all of them."""
+    mock_client.set_transport_security(False).set_channels_per_node(3)
+    node = mock_client.network.nodes[0]
+
+    with patch("hiero_sdk_python.node.grpc.insecure_channel") as insecure_channel:
+        channels = [node._get_channel() for _ in range(6)]
+
+    assert insecure_channel.call_count == 3
+    assert channels[:3] == channels[3:]
+    assert len({id(channel) for channel in channels}) == 3
+    for call in insecure_channel.call_args_list:
+        assert ("grpc.use_local_subchannel_pool", 1) in call.kwargs["options"]
+
+    mock_client.close()
+    assert len(_CHANNEL_POOL) == 0
+
+
+def test_channel_options_extend_the_defaults():
+    """Configured options replace defaults of the same name and are added otherwise."""
+    node = _Node(AccountId(0, 0, 3), "127.0.0.1:50212", NodeAddress(cert_hash=FAKE_CERT_HASH, addresses=[]))
+    node._set_channel_config(1, {"grpc.keepalive_time_ms": 5000, "grpc.max_receive_message_length": 1 << 24})
+
+    options = node._build_channel_options()
+
+    assert ("grpc.keepalive_time_ms", 5000) in options
+    assert ("grpc.keepalive_time_ms", 100000) not in options
+    assert ("grpc.max_receive_message_length", 1 << 24) in options
+    assert ("grpc.default_authority", "127.0.0.1") in options
+
+
+def test_concurrent_requests_over_several_channels():
+    """Queries from many threads succeed when they are spread over several channels."""
+    with mock_hedera_servers([[balance_response() for _ in range(16)]]) as client:
+        client.set_channels_per_node(4)
+
+        def query(_):
+            return CryptoGetAccountBalanceQuery(AccountId(0, 0, 1800)).execute(client).hbars
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            balances = list(executor.map(query, range(16)))
+
+        assert len(balances) == 16
+        assert len(client.network.nodes[0]._extra_channels) == 3
+        client.close()
+
+
+def test_channel_settings_are_validated(mock_client):
+    """Invalid channel counts and options are rejected."""
+    with pytest.raises(ValueError, match="channels_per_node must be >= 1"):
+        mock_client.set_channels_per_node(0)
+    with pytest.raises(TypeError, match="channels_per_node must be of type int"):
+        mock_client.set_channels_per_node("2")
+    with pytest.raises(TypeError, match="options must be of type dict"):
+        mock_client.set_channel_options([("grpc.keepalive_time_ms", 1)])
+    with pytest.raises(TypeError, match="must be an int or str"):
+        mock_client.set_channel_options({"grpc.keepalive_time_ms": 1.5})
+
+    assert mock_client.set_channel_options({"grpc.max_concurrent_streams": 200}) is mock_client
+    assert mock_client.get_channel_options() == {"grpc.max_concurrent_streams": 200}
+    assert mock_client.set_channel_options(None).get_channel_options() == {}
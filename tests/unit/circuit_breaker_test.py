@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from hiero_sdk_python.account.account_id import AccountId
+from hiero_sdk_python.circuit_breaker import CircuitBreaker, CircuitBreakerConfig, CircuitState
+from hiero_sdk_python.node import _Node
+from hiero_sdk_python.query.account_balance_query import CryptoGetAccountBalanceQuery
+from tests.unit.conftest import balance_response
+from tests.unit.mock_server import mock_hedera_servers
+
+
+pytestmark = pytest.mark.unit
+
+
+def _open_for_probing(node):
+    """Open the node's circuit and let its backoff pass."""
+    node._increase_backoff()
+    node._readmit_time = time.monotonic() - 1
+
+
+def test_failure_rate_opens_the_circuit():
+    """Occasional failures of a healthy node are tolerated; a failure rate at the threshold opens the circuit."""
+    breaker = CircuitBreaker(CircuitBreakerConfig(failure_rate_threshold=0.5, window_size=4))
+    assert breaker.record_failure()
+
+    breaker = CircuitBreaker(CircuitBreakerConfig(failure_rate_threshold=0.5, window_size=4))
+    for _ in range(3):
+        breaker.record_success()
+    assert not breaker.record_failure()
+    assert breaker.state is CircuitState.CLOSED
+    assert breaker.failure_rate() == 0.25
+
+    assert breaker.record_failure()
+    assert breaker.state is CircuitState.OPEN
+
+
+def test_half_open_admits_a_limited_number_of_probes():
+    """Once the backoff has passed, only `half_open_probes` requests are let through until they succeed."""
+    node = _Node(AccountId(0, 0, 3), "127.0.0.1:50211", None)
+    node._set_circuit_breaker_config(CircuitBreakerConfig(half_open_probes=2))
+
+    assert node._increase_backoff()
+    assert not node._allow_request()
+
+    node._readmit_time = time.monotonic() - 1
+    assert node._allow_request()
+    assert node._circuit_breaker.state is CircuitState.HALF_OPEN
+    assert node._allow_request()
+    assert not node._allow_request()
+
+    node._decrease_backoff()
+    assert node._circuit_breaker.state is CircuitState.HALF_OPEN
+    node._decrease_backoff()
+    assert node._circuit_breaker.state is CircuitState.CLOSED
+    assert node._allow_request()
+
+
+def test_failed_probe_reopens_with_a_longer_backoff():
+    """A failed probe opens the circuit again, and the node stays out for twice as long."""
+    node = _Node(AccountId(0, 0, 3), "127.0.0.1:50211", None)
+    _open_for_probing(node)
+    backoff = node._current_backoff
+
+    assert node._allow_request()
+    assert node._increase_backoff()
+
+    assert node._circuit_breaker.state is CircuitState.OPEN
+    assert node._current_backoff == backoff * 2
+    assert not node.is_healthy()
+
+
+def test_backoff_of_a_flapping_node_keeps_growing():
+    """Probe successes do not shrink the backoff; only successes once the circuit is closed do."""
+    node = _Node(AccountId(0, 0, 3), "127.0.0.1:50211", None)
+    backoffs = []
+
+    for _ in range(3):
+        _open_for_probing(node)
+        backoffs.append(node._current_backoff)
+        assert node._allow_request()
+        node._decrease_backoff()
+        assert node._circuit_breaker.state is CircuitState.CLOSED
+
+    assert backoffs == [backoffs[0], backoffs[0] * 2, backoffs[0] * 4]
+
+    node._decrease_backoff()
+    assert node._current_backoff == backoffs[-1] / 2
+
+
+def test_requests_skip_a_node_that_is_being_probed():
+    """While a half-open node's probe permit is taken, requests go to the next node without calling it."""
+    with mock_hedera_servers([[balance_response(3)], [balance_response(4)]]) as client:
+        probing = client.network.nodes[0]
+        _open_for_probing(probing)
+        assert probing._allow_request()
+
+        balance = (
+            CryptoGetAccountBalanceQuery(AccountId(0, 0, 1800))
+            .set_node_account_ids([AccountId(0, 0, 3), AccountId(0, 0, 4)])
+            .execute(client)
+        )
+
+    assert balance.hbars.to_tinybars() == 4
+
+
+def test_requests_wait_for_the_probe_of_the_only_node():
+    """A request to a single half-open node whose probe is taken waits for it instead of failing."""
+    with mock_hedera_servers([[balance_response(5)]]) as client:
+        probing = client.network.nodes[0]
+        _open_for_probing(probing)
+        assert probing._allow_request()
+
+        # The other request's probe finishes while this one backs off
+        with patch("hiero_sdk_python.executable.time.sleep", side_effect=lambda _: probing._release_request()) as sleep:
+            balance = (
+                CryptoGetAccountBalanceQuery(AccountId(0, 0, 1800))
+                .set_node_account_ids([AccountId(0, 0, 3)])
+                .execute(client)
+            )
+
+    assert balance.hbars.to_tinybars() == 5
+    sleep.assert_called_once()
+    assert probing._circuit_breaker.state is CircuitState.CLOSED
+
+
+def test_probe_permit_is_released_when_the_response_cannot_be_handled():
+    """An error raised while handling a probe's response frees its permit without closing the circuit."""
+    with mock_hedera_servers([[balance_response()]]) as client:
+        node = client.network.nodes[0]
+        _open_for_probing(node)
+
+        with (
+            patch.object(CryptoGetAccountBalanceQuery, "_should_retry", side_effect=RuntimeError("bad response")),
+            pytest.raises(RuntimeError, match="bad response"),
+        ):
+            CryptoGetAccountBalanceQuery(AccountId(0, 0, 1800)).set_node_account_ids([AccountId(0, 0, 3)]).execute(
+                client
+            )
+
+        assert node._circuit_breaker.state is CircuitState.HALF_OPEN
+        assert node._allow_request()
+
+
+def test_active_health_checks_close_recovered_circuits():
+    """The health checker probes open nodes with a free query; requests do not probe while it runs."""
+    with mock_hedera_servers([[balance_response()]]) as client:
+        node = client.network.nodes[0]
+        client.set_node_health_check_interval(3600)
+        _open_for_probing(node)
+        client.network._mark_node_unhealthy(node)
+
+        assert not node._allow_request()
+        assert client._node_health_checker.run_once() == 1
+        assert client._node_health_checker.run_once() == 0
+
+        assert node._circuit_breaker.state is CircuitState.CLOSED
+        assert node in client.network._healthy_nodes
+        client.close()
+
+    assert client._node_health_checker is None
+
+
+def test_circuit_breaker_config_is_validated(mock_client):
+    """Out of range settings and other types are rejected; None restores the defaults."""
+    with pytest.raises(ValueError, match="failure_rate_threshold"):
+        CircuitBreakerConfig(failure_rate_threshold=0)
+    with pytest.raises(ValueError, match="minimum_calls"):
+        CircuitBreakerConfig(window_size=5, minimum_calls=6)
+    with pytest.raises(TypeError, match="config must be of type CircuitBreakerConfig"):
+        mock_client.set_circuit_breaker_config({"window_size": 5})
+
+    config = CircuitBreakerConfig(window_size=5)
+    assert mock_client.set_circuit_breaker_config(config) is mock_client
+    assert mock_client.network.nodes[0]._circuit_breaker.config is config
+    assert mock_client.set_circuit_breaker_config(None).get_circuit_breaker_config() == CircuitBreakerConfig()
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import grpc
+import pytest
+
+from hiero_sdk_python.account.account_id import AccountId
+from hiero_sdk_python.channels import _Channel
+from hiero_sdk_python.client.network import Network
+from hiero_sdk_python.node import _Node
+from hiero_sdk_python.query.account_balance_query import CryptoGetAccountBalanceQuery
+from tests.unit.conftest import balance_response
+from tests.unit.mock_server import mock_hedera_servers
+
+
+pytestmark = pytest.mark.unit
+
+THREAD_COUNT = 64
+
+QUERIES_PER_THREAD = 4
+
+NODE_COUNT = 3
+
+
+def test_one_client_shared_by_64_threads():
+    """Queries from 64 threads on one client all succeed, over one channel per node."""
+    total = THREAD_COUNT * QUERIES_PER_THREAD
+    responses = [[balance_response(7) for _ in range(total)] for _ in range(NODE_COUNT)]
+    barrier = threading.Barrier(THREAD_COUNT)
+
+    with (
+        mock_hedera_servers(responses) as client,
+        patch("hiero_sdk_python.node.grpc.insecure_channel", wraps=grpc.insecure_channel) as insecure_channel,
+    ):
+
+        def run(_):
+            barrier.wait()
+            return [
+                CryptoGetAccountBalanceQuery(AccountId(0, 0, 1800)).execute(client).hbars.to_tinybars()
+                for _ in range(QUERIES_PER_THREAD)
+            ]
+
+        with ThreadPoolExecutor(max_workers=THREAD_COUNT) as executor:
+            balances = [balance for result in executor.map(run, range(THREAD_COUNT)) for balance in result]
+
+        channels = [node._channel for node in client.network.nodes]
+        client.close()
+
+    assert balances == [7] * total
+    assert insecure_channel.call_count <= NODE_COUNT
+    assert len({id(channel) for channel in channels if channel is not None}) == insecure_channel.call_count
+
+
+def test_concurrent_first_requests_open_one_channel():
+    """Threads racing to use a fresh node open a single channel."""
+    node = _Node(AccountId(0, 0, 3), "127.0.0.1:50211", None)
+    created = []
+
+    def create_channel(**_):
+        time.sleep(0.05)
+        channel = _Channel(MagicMock())
+        created.append(channel)
+        return channel
+
+    barrier = threading.Barrier(THREAD_COUNT)
+
+    def get_channel(_):
+        barrier.wait()
+        return node._get_channel()
+
+    with (
+        patch.object(node, "_create_channel", side_effect=create_channel),
+        ThreadPoolExecutor(max_workers=THREAD_COUNT) as executor,
+    ):
+        channels = list(executor.map(get_channel, range(THREAD_COUNT)))
+
+    assert len(created) == 1
+    assert all(channel is created[0] for channel in channels)
+    node._close()
+
+
+def test_node_selection_while_health_changes():
+    """Selecting nodes never fails while other threads mark nodes unhealthy and healthy again."""
+    nodes = [_Node(AccountId(0, 0, 3 + index), f"127.0.0.1:{50211 + index}", None) for index in range(8)]
+    network = Network(network="solo", nodes=nodes)
+    barrier = threading.Barrier(THREAD_COUNT)
+
+    def run(index):
+        barrier.wait()
+        node = nodes[index % len(nodes)]
+        for _ in range(200):
+            # The first node always stays healthy, so a node is always available
+            if index % 2 and node is not nodes[0]:
+                network._mark_node_unhealthy(node)
+                network._mark_node_healthy(node)
+            else:
+                assert network._select_node() in nodes
+
+    with ThreadPoolExecutor(max_workers=THREAD_COUNT) as executor:
+        list(executor.map(run, range(THREAD_COUNT)))
+
+    assert sorted(id(node) for node in network._healthy_nodes) == sorted(id(node) for node in nodes)
+
+
+def test_backoff_updates_are_not_lost():
+    """Concurrent failures on one node are all counted."""
+    node = _Node(AccountId(0, 0, 3), "127.0.0.1:50211", None)
+
+    def fail(_):
+        for _ in range(100):
+            node._increase_backoff()
+
+    with ThreadPoolExecutor(max_workers=THREAD_COUNT) as executor:
+        list(executor.map(fail, range(THREAD_COUNT)))
+
+    assert node._bad_grpc_response_count == THREAD_COUNT * 100
+    assert node._current_backoff == node._max_backoff
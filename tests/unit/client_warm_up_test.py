@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from hiero_sdk_python.account.account_id import AccountId
+from hiero_sdk_python.address_book.node_address import NodeAddress
+from hiero_sdk_python.circuit_breaker import CircuitBreakerConfig, CircuitState
+from hiero_sdk_python.client.client import Client
+from hiero_sdk_python.client.network import Network
+from hiero_sdk_python.logger.log_level import LogLevel
+from hiero_sdk_python.node import _Node
+from tests.unit.conftest import FAKE_CERT_HASH, FAKE_CERT_PEM, balance_response
+from tests.unit.mock_server import mock_hedera_servers
+
+
+pytestmark = pytest.mark.unit
+
+HANDSHAKE_SECONDS = 0.2
+
+
+def _tls_client(node_count):
+    nodes = [
+        _Node(
+            AccountId(0, 0, 3 + index),
+            f"node{index}.example.com:50212",
+            NodeAddress(cert_hash=FAKE_CERT_HASH, addresses=[]),
+        )
+        for index in range(node_count)
+    ]
+    client = Client(Network(network="mainnet", nodes=nodes))
+    client.logger.set_level(LogLevel.DISABLED)
+    return client
+
+
+def test_certificates_are_fetched_concurrently():
+    """All nodes handshake at the same time and get a channel."""
+    client = _tls_client(4)
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def fetch(node):  # noqa: ARG001
+        with lock:
+            active.append(1)
+            peak.append(len(active))
+        time.sleep(HANDSHAKE_SECONDS)
+        with lock:
+            active.pop()
+        return FAKE_CERT_PEM
+
+    with patch.object(_Node, "_fetch_server_certificate_pem", autospec=True, side_effect=fetch):
+        start = time.monotonic()
+        readiness = client.warm_up(parallelism=4)
+        elapsed = time.monotonic() - start
+
+    assert max(peak) == 4
+    assert elapsed < 3 * HANDSHAKE_SECONDS
+    assert [result.account_id for result in readiness] == [node._account_id for node in client.network.nodes]
+    assert all(result.ready and result.error is None for result in readiness)
+    assert all(node._channel is not None for node in client.network.nodes)
+    client.close()
+
+
+def test_unreachable_nodes_are_marked_unhealthy():
+    """A node whose certificate cannot be fetched is reported and taken out of rotation."""
+    client = _tls_client(3)
+    unreachable = client.network.nodes[1]
+
+    def fetch(node):
+        if node is unreachable:
+            raise OSError("connection refused")
+        return FAKE_CERT_PEM
+
+    with patch.object(_Node, "_fetch_server_certificate_pem", autospec=True, side_effect=fetch):
+        readiness = client.warm_up(parallelism=2)
+
+    assert [result.ready for result in readiness] == [True, False, True]
+    assert isinstance(readiness[1].error, OSError)
+    assert unreachable not in client.network._healthy_nodes
+    assert not unreachable.is_healthy()
+    assert len(client.network._healthy_nodes) == 2
+    client.close()
+
+
+def test_unreachable_nodes_are_taken_out_of_rotation_under_a_lenient_breaker():
+    """A breaker that tolerates single failures does not keep nodes that failed the warm-up in rotation."""
+    client = _tls_client(3)
+    client.set_circuit_breaker_config(CircuitBreakerConfig(minimum_calls=5))
+    unreachable = client.network.nodes[:2]
+
+    def fetch(node):
+        if node in unreachable:
+            raise OSError("connection refused")
+        return FAKE_CERT_PEM
+
+    with patch.object(_Node, "_fetch_server_certificate_pem", autospec=True, side_effect=fetch):
+        readiness = client.warm_up()
+
+    assert [result.ready for result in readiness] == [False, False, True]
+    assert client.network._healthy_nodes == [client.network.nodes[2]]
+    for node in unreachable:
+        assert node._circuit_breaker.state is CircuitState.OPEN
+        assert not node.is_healthy()
+    client.close()
+
+
+def test_ping_checks_that_nodes_answer():
+    """With ping, each node is sent a query; nodes that do not answer are marked unhealthy."""
+    with mock_hedera_servers([[balance_response(account_num=3)], [balance_response(account_num=3)]]) as client:
+        dead = _Node(AccountId(0, 0, 99), "127.0.0.1:1", None)
+        dead._address._is_transport_security = lambda: False
+        client.network.nodes.append(dead)
+        client.network._healthy_nodes.append(dead)
+
+        readiness = client.warm_up(ping=True, timeout=2)
+
+    assert [result.ready for result in readiness] == [True, True, False]
+    assert readiness[2].account_id == AccountId(0, 0, 99)
+    assert dead not in client.network._healthy_nodes
+
+
+def test_parallelism_is_validated(mock_client):
+    """Parallelism below one is rejected."""
+    with pytest.raises(ValueError, match="parallelism must be >= 1"):
+        mock_client.warm_up(parallelism=0)
@@ -6,14 +6,18 @@ import pytest
 
 from hiero_sdk_python.account.account_id import AccountId
 from hiero_sdk_python.address_book.node_address import NodeAddress
+from hiero_sdk_python.channel_pool import _CHANNEL_POOL
 from hiero_sdk_python.client.client import Client
 from hiero_sdk_python.client.network import Network
 from hiero_sdk_python.consensus.topic_id import TopicId
 from hiero_sdk_python.contract.contract_id import ContractId
 from hiero_sdk_python.crypto.private_key import PrivateKey
 from hiero_sdk_python.file.file_id import FileId
+from hiero_sdk_python.hapi.services import basic_types_pb2, response_header_pb2, response_pb2
+from hiero_sdk_python.hapi.services.crypto_get_account_balance_pb2 import CryptoGetAccountBalanceResponse
 from hiero_sdk_python.logger.log_level import LogLevel
 from hiero_sdk_python.node import _Node
+from hiero_sdk_python.response_code import ResponseCode
 from hiero_sdk_python.tokens.nft_id import NftId
 from hiero_sdk_python.tokens.token_id import TokenId
 from hiero_sdk_python.transaction.transaction_id import TransactionId
@@ -26,6 +30,24 @@ MIIBszCCAVmgAwIBAgIUQFakeFakeFakeFakeFakeFakeFakewCgYIKoZIzj0EAwIw
 FAKE_CERT_HASH = hashlib.sha384(FAKE_CERT_PEM).hexdigest().encode("utf-8")
 
 
+def balance_response(balance=1, account_num=1800):
+    """Build a successful account balance query response for the mock servers."""
+    return response_pb2.Response(
+        cryptogetAccountBalance=CryptoGetAccountBalanceResponse(
+            header=response_header_pb2.ResponseHeader(nodeTransactionPrecheckCode=ResponseCode.OK),
+            accountID=basic_types_pb2.AccountID(accountNum=account_num),
+            balance=balance,
+        )
+    )
+
+
+@pytest.fixture(autouse=True)
+def isolated_channel_pool():
+    """Close channels left in the shared channel pool so that tests do not share connections."""
+    yield
+    _CHANNEL_POOL._close_all()
+
+
 @pytest.fixture
 def mock_account_ids():
     """Fixture to provide mock account IDs and token IDs."""
@@ -905,6 +905,57 @@ def test_request_timeout_exceeded_stops_execution():
             tx.execute(client)
 
 
+def test_attempt_deadline_and_backoff_are_clipped_to_request_timeout():
+    """No gRPC deadline or backoff extends past the remaining request timeout."""
+    busy_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.BUSY)
+
+    with (
+        mock_hedera_servers([[busy_response]]) as client,
+        patch("hiero_sdk_python.executable.time.sleep") as mock_sleep,
+        patch("hiero_sdk_python.executable._execute_method", return_value=busy_response) as mock_execute,
+    ):
+        tx = (
+            AccountCreateTransaction()
+            .set_key_without_alias(PrivateKey.generate().public_key())
+            .set_initial_balance(1)
+            .set_request_timeout(1)
+            .set_min_backoff(4)
+            .set_max_backoff(8)
+        )
+        with pytest.warns(UserWarning, match="grpc_deadline"):
+            tx.set_grpc_deadline(5)
+
+        with pytest.raises(MaxAttemptsError):
+            tx.execute(client, wait_for_receipt=False)
+
+    assert mock_execute.call_count == client.max_attempts
+    assert all(0 < call.args[2] <= 1 for call in mock_execute.call_args_list)
+    assert all(0 <= call.args[0] <= 1 for call in mock_sleep.call_args_list)
+
+
+def test_deadline_exceeded_at_request_timeout_does_not_penalize_node():
+    """A call cut short by the request timeout ends the execution without marking the node unhealthy."""
+    error = RealRpcError(grpc.StatusCode.DEADLINE_EXCEEDED, "timeout")
+
+    with (
+        mock_hedera_servers([[error]]) as client,
+        patch("hiero_sdk_python.executable._execute_method", side_effect=error) as mock_execute,
+    ):
+        tx = (
+            AccountCreateTransaction()
+            .set_key_without_alias(PrivateKey.generate().public_key())
+            .set_initial_balance(1)
+            .set_request_timeout(1)
+        )
+
+        with pytest.raises(MaxAttemptsError) as exc_info:
+            tx.execute(client, wait_for_receipt=False)
+
+        assert mock_execute.call_count == 1
+        assert exc_info.value.last_error is error
+        assert all(node.is_healthy() for node in client.network.nodes)
+
+
 @pytest.mark.parametrize(
     "error",
     [
@@ -1125,7 +1176,7 @@ def test_retry_invalid_node_account_updates_network():
             "hiero_sdk_python.client.network.Network._increase_backoff",
         ) as mock_increase_backoff,
         patch(
-            "hiero_sdk_python.client.client.Client.update_network",
+            "hiero_sdk_python.client.client.Client._request_network_update",
         ) as mock_update_network,
         patch(
             "hiero_sdk_python.executable._delay_for_attempt",
@@ -0,0 +1,412 @@
+"""Tests for the offline FeeCalculator."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from hiero_sdk_python.account.account_create_transaction import AccountCreateTransaction
+from hiero_sdk_python.account.account_id import AccountId
+from hiero_sdk_python.consensus.topic_id import TopicId
+from hiero_sdk_python.consensus.topic_message_submit_transaction import TopicMessageSubmitTransaction
+from hiero_sdk_python.crypto.key_list import KeyList
+from hiero_sdk_python.crypto.private_key import PrivateKey
+from hiero_sdk_python.fees.fee_calculator import (
+    EXCHANGE_RATE_FILE_ID,
+    FEE_SCHEDULE_FILE_ID,
+    ExchangeRate,
+    FeeCalculator,
+    UnsupportedFeeEstimate,
+)
+from hiero_sdk_python.fees.fee_estimate_mode import FeeEstimateMode
+from hiero_sdk_python.fees.fee_estimate_response import FeeEstimateResponse
+from hiero_sdk_python.file.file_contents_query import FileContentsQuery
+from hiero_sdk_python.file.file_create_transaction import FileCreateTransaction
+from hiero_sdk_python.hapi.fees import fee_schedule_pb2
+from hiero_sdk_python.hapi.services import (
+    basic_types_pb2,
+    exchange_rate_pb2,
+    node_stake_update_pb2,
+    timestamp_pb2,
+    transaction_contents_pb2,
+    transaction_pb2,
+)
+from hiero_sdk_python.query.fee_estimate_query import FeeEstimateQuery
+from hiero_sdk_python.tokens.token_id import TokenId
+from hiero_sdk_python.tokens.token_mint_transaction import TokenMintTransaction
+from hiero_sdk_python.transaction.transfer_transaction import TransferTransaction
+
+
+pytestmark = pytest.mark.unit
+
+F = basic_types_pb2.HederaFunctionality
+
+# A synthetic fee schedule with round fees that keep the expected totals easy to check by hand;
+# it does not match the schedule of any network.
+FEE_SCHEDULE = fee_schedule_pb2.FeeSchedule(
+    extras=[
+        {"name": fee_schedule_pb2.SIGNATURES, "fee": 1_000_000},
+        {"name": fee_schedule_pb2.PROCESSING_BYTES, "fee": 10_000},
+        {"name": fee_schedule_pb2.KEYS, "fee": 100_000_000},
+        {"name": fee_schedule_pb2.ACCOUNTS, "fee": 2_000_000},
+        {"name": fee_schedule_pb2.TOKEN_TYPES, "fee": 3_000_000},
+        {"name": fee_schedule_pb2.NFT_SERIALS, "fee": 5_000_000},
+    ],
+    node={
+        "base_fee": 100_000,
+        "extras": [
+            {"name": fee_schedule_pb2.PROCESSING_BYTES, "included_count": 1024},
+            {"name": fee_schedule_pb2.SIGNATURES, "included_count": 1},
+        ],
+    },
+    network={"multiplier": 9},
+    services=[
+        {
+            "name": "Crypto",
+            "schedule": [
+                {
+                    "name": F.Value("CryptoTransfer"),
+                    "base_fee": 1_000_000,
+                    "extras": [
+                        {"name": fee_schedule_pb2.ACCOUNTS, "included_count": 2},
+                        {"name": fee_schedule_pb2.TOKEN_TYPES, "included_count": 1},
+                    ],
+                },
+                {
+                    "name": F.Value("CryptoCreate"),
+                    "base_fee": 5_000_000_000,
+                    "extras": [{"name": fee_schedule_pb2.KEYS, "included_count": 1}],
+                },
+            ],
+        },
+        {
+            "name": "Token",
+            "schedule": [
+                {
+                    "name": F.Value("TokenMint"),
+                    "base_fee": 20_000_000,
+                    "extras": [{"name": fee_schedule_pb2.NFT_SERIALS, "included_count": 1}],
+                },
+            ],
+        },
+        {
+            "name": "Consensus",
+            "schedule": [{"name": F.Value("ConsensusSubmitMessage"), "base_fee": 800_000}],
+        },
+    ],
+)
+
+# Synthetic fixtures in the format of mirror node `/network/fees` responses, computed by hand from
+# FEE_SCHEDULE for the transactions below rather than recorded from a network.
+# PROCESSING_BYTES counts depend on the exact encoding and are checked against `size` instead.
+SYNTHETIC_TRANSFER = {
+    "high_volume_multiplier": 1,
+    "network": {"multiplier": 9, "subtotal": 900_000},
+    "node": {
+        "base": 100_000,
+        "extras": [
+            {"name": "PROCESSING_BYTES", "included": 1024, "charged": 0, "fee_per_unit": 10_000, "subtotal": 0},
+            {"name": "SIGNATURES", "included": 1, "count": 1, "charged": 0, "fee_per_unit": 1_000_000, "subtotal": 0},
+        ],
+    },
+    "service": {
+        "base": 1_000_000,
+        "extras": [
+            {
+                "name": "ACCOUNTS",
+                "included": 2,
+                "count": 3,
+                "charged": 1,
+                "fee_per_unit": 2_000_000,
+                "subtotal": 2_000_000,
+            },
+            {"name": "TOKEN_TYPES", "included": 1, "count": 0, "charged": 0, "fee_per_unit": 3_000_000, "subtotal": 0},
+        ],
+    },
+    "total": 4_000_000,
+}
+
+SYNTHETIC_NFT_MINT = {
+    "high_volume_multiplier": 1,
+    "network": {"multiplier": 9, "subtotal": 900_000},
+    "node": {
+        "base": 100_000,
+        "extras": [
+            {"name": "PROCESSING_BYTES", "included": 1024, "charged": 0, "fee_per_unit": 10_000, "subtotal": 0},
+            {"name": "SIGNATURES", "included": 1, "count": 1, "charged": 0, "fee_per_unit": 1_000_000, "subtotal": 0},
+        ],
+    },
+    "service": {
+        "base": 20_000_000,
+        "extras": [
+            {
+                "name": "NFT_SERIALS",
+                "included": 1,
+                "count": 5,
+                "charged": 4,
+                "fee_per_unit": 5_000_000,
+                "subtotal": 20_000_000,
+            },
+        ],
+    },
+    "total": 41_000_000,
+}
+
+SYNTHETIC_THRESHOLD_ACCOUNT_CREATE = {
+    "high_volume_multiplier": 1,
+    "network": {"multiplier": 9, "subtotal": 9_900_000},
+    "node": {
+        "base": 100_000,
+        "extras": [
+            {"name": "PROCESSING_BYTES", "included": 1024, "charged": 0, "fee_per_unit": 10_000, "subtotal": 0},
+            {
+                "name": "SIGNATURES",
+                "included": 1,
+                "count": 2,
+                "charged": 1,
+                "fee_per_unit": 1_000_000,
+                "subtotal": 1_000_000,
+            },
+        ],
+    },
+    "service": {
+        "base": 5_000_000_000,
+        "extras": [
+            {
+                "name": "KEYS",
+                "included": 1,
+                "count": 3,
+                "charged": 2,
+                "fee_per_unit": 100_000_000,
+                "subtotal": 200_000_000,
+            },
+        ],
+    },
+    "total": 5_211_000_000,
+}
+
+
+def _assert_matches_expected(local: FeeEstimateResponse, response: dict, size: int) -> None:
+    expected = FeeEstimateQuery()._to_response(response, FeeEstimateMode.INTRINSIC)
+
+    assert local.total == expected.total
+    assert local.network_fee == expected.network_fee
+    assert local.high_volume_multiplier == expected.high_volume_multiplier
+
+    for actual_fee, expected_fee in ((local.node_fee, expected.node_fee), (local.service_fee, expected.service_fee)):
+        assert actual_fee.base == expected_fee.base
+        assert len(actual_fee.extras) == len(expected_fee.extras)
+
+        for actual, wanted in zip(actual_fee.extras, expected_fee.extras, strict=True):
+            if actual.name == "PROCESSING_BYTES":
+                assert actual.count == size
+                actual = actual.__class__(**{**actual.__dict__, "count": wanted.count})
+            assert actual == wanted
+
+
+@pytest.fixture
+def calculator():
+    return FeeCalculator().set_fee_schedule(FEE_SCHEDULE, ExchangeRate(hbar_equivalent=30_000, cent_equivalent=150_000))
+
+
+def test_transfer_matches_expected_response(calculator, mock_client):
+    """An hbar transfer between three accounts is charged for one extra account."""
+    tx = (
+        TransferTransaction()
+        .add_hbar_transfer(AccountId(0, 0, 1984), -2)
+        .add_hbar_transfer(AccountId(0, 0, 1001), 1)
+        .add_hbar_transfer(AccountId(0, 0, 1002), 1)
+        .freeze_with(mock_client)
+        .sign(mock_client.operator_private_key)
+    )
+
+    _assert_matches_expected(calculator.estimate(tx), SYNTHETIC_TRANSFER, tx.size)
+
+
+def test_nft_mint_matches_expected_response(calculator, mock_client):
+    """Each NFT serial beyond the included one is charged."""
+    tx = (
+        TokenMintTransaction()
+        .set_token_id(TokenId(0, 0, 5005))
+        .set_metadata([b"a", b"b", b"c", b"d", b"e"])
+        .freeze_with(mock_client)
+        .sign(mock_client.operator_private_key)
+    )
+
+    _assert_matches_expected(calculator.estimate(tx), SYNTHETIC_NFT_MINT, tx.size)
+
+
+def test_threshold_key_account_create_matches_expected_response(calculator, mock_client):
+    """Keys nested in a threshold key are counted individually, and so are extra signatures."""
+    keys = [PrivateKey.generate().public_key() for _ in range(3)]
+    tx = (
+        AccountCreateTransaction()
+        .set_key_without_alias(KeyList(keys, threshold=2))
+        .freeze_with(mock_client)
+        .sign(mock_client.operator_private_key)
+        .sign(PrivateKey.generate())
+    )
+
+    _assert_matches_expected(calculator.estimate(tx), SYNTHETIC_THRESHOLD_ACCOUNT_CREATE, tx.size)
+
+
+def test_processing_bytes_beyond_included_are_charged(mock_client):
+    """Bytes over the node's included count are charged per byte and multiplied into the network fee."""
+    schedule = fee_schedule_pb2.FeeSchedule()
+    schedule.CopyFrom(FEE_SCHEDULE)
+    schedule.node.extras[0].included_count = 10
+
+    tx = (
+        TransferTransaction()
+        .add_hbar_transfer(AccountId(0, 0, 1984), -1)
+        .add_hbar_transfer(AccountId(0, 0, 1001), 1)
+        .freeze_with(mock_client)
+    )
+
+    estimate = FeeCalculator().set_fee_schedule(schedule).estimate(tx)
+    bytes_fee = (tx.size - 10) * 10_000
+
+    assert estimate.node_fee.extras[0].subtotal == bytes_fee
+    assert estimate.network_fee.subtotal == (100_000 + bytes_fee) * 9
+    assert estimate.total == (100_000 + bytes_fee) * 10 + 1_000_000
+
+
+def test_chunked_message_is_estimated_per_chunk(calculator, mock_client):
+    """Multi-chunk transactions are priced chunk by chunk and aggregated."""
+    tx = (
+        TopicMessageSubmitTransaction()
+        .set_topic_id(TopicId(0, 0, 4))
+        .set_chunk_size(100)
+        .set_message("A" * 150)
+        .freeze_with(mock_client)
+    )
+    bodies = dict(tx._transaction_body_bytes)
+
+    estimate = calculator.estimate(tx)
+
+    assert estimate.node_fee.base == 2 * 100_000
+    assert estimate.service_fee.base == 2 * 800_000
+    assert estimate.network_fee.subtotal == 2 * 900_000
+    assert estimate.total == 2 * 1_800_000
+    assert tx._transaction_body_bytes == bodies
+
+
+def test_estimate_freezes_with_client(calculator, mock_client):
+    """An un-frozen transaction is frozen with the given client before pricing."""
+    tx = TransferTransaction().add_hbar_transfer(AccountId(0, 0, 1984), -1).add_hbar_transfer(AccountId(0, 0, 7), 1)
+
+    estimate = calculator.estimate(tx, mock_client)
+
+    assert tx._transaction_body_bytes
+    assert estimate.service_fee.base == 1_000_000
+
+
+def test_unsupported_estimates_raise_without_fallback(calculator, mock_client):
+    """Missing schedule entries, STATE mode and high-volume transactions cannot be priced offline."""
+    file_create = FileCreateTransaction().set_contents(b"x").freeze_with(mock_client)
+    with pytest.raises(UnsupportedFeeEstimate, match="no entry for FileCreate"):
+        calculator.estimate(file_create)
+
+    transfer = (
+        TransferTransaction().add_hbar_transfer(AccountId(0, 0, 1984), -1).add_hbar_transfer(AccountId(0, 0, 7), 1)
+    )
+    with pytest.raises(UnsupportedFeeEstimate, match="require network state"):
+        calculator.estimate(transfer.freeze_with(mock_client), mode=FeeEstimateMode.STATE)
+
+    with pytest.raises(UnsupportedFeeEstimate, match="No fee schedule loaded"):
+        FeeCalculator().estimate(transfer)
+
+    calculator.fallback_to_remote = False
+    with pytest.raises(UnsupportedFeeEstimate, match="no entry for FileCreate"):
+        calculator.estimate(file_create, mock_client)
+
+
+def test_unsupported_estimates_fall_back_to_mirror_node(calculator, mock_client):
+    """With a client, estimates that cannot be computed offline are requested from the mirror node."""
+    remote = FeeEstimateResponse(mode=FeeEstimateMode.INTRINSIC, total=123)
+    file_create = FileCreateTransaction().set_contents(b"x").freeze_with(mock_client)
+
+    with patch.object(FeeEstimateQuery, "execute", return_value=remote) as mock_execute:
+        assert calculator.estimate(file_create, mock_client) is remote
+
+    mock_execute.assert_called_once_with(mock_client)
+
+
+def test_body_without_functionality_is_unsupported(calculator, mock_client):
+    """A body type with no HederaFunctionality is unsupported offline and falls back to the mirror node."""
+    body = transaction_pb2.TransactionBody(node_stake_update=node_stake_update_pb2.NodeStakeUpdateTransactionBody())
+    signed = transaction_contents_pb2.SignedTransaction(bodyBytes=body.SerializeToString())
+    proto = transaction_pb2.Transaction(signedTransactionBytes=signed.SerializeToString())
+    transfer = (
+        TransferTransaction()
+        .add_hbar_transfer(AccountId(0, 0, 1984), -1)
+        .add_hbar_transfer(AccountId(0, 0, 7), 1)
+        .freeze_with(mock_client)
+    )
+    remote = FeeEstimateResponse(mode=FeeEstimateMode.INTRINSIC, total=123)
+
+    with pytest.raises(UnsupportedFeeEstimate, match="node_stake_update"):
+        calculator._estimate_proto(proto)
+
+    with (
+        patch.object(transfer, "_to_proto", return_value=proto),
+        patch.object(FeeEstimateQuery, "execute", return_value=remote),
+    ):
+        assert calculator.estimate(transfer, mock_client) is remote
+
+
+def test_refresh_reads_system_files_and_respects_ttl(mock_client):
+    """The schedule and exchange rate are fetched once per TTL."""
+    rates = exchange_rate_pb2.ExchangeRateSet(
+        currentRate=exchange_rate_pb2.ExchangeRate(
+            hbarEquiv=30_000, centEquiv=150_000, expirationTime=timestamp_pb2.TimestampSeconds(seconds=1_700_000_000)
+        )
+    )
+    contents = {
+        FEE_SCHEDULE_FILE_ID: FEE_SCHEDULE.SerializeToString(),
+        EXCHANGE_RATE_FILE_ID: rates.SerializeToString(),
+    }
+    calculator = FeeCalculator(ttl=60)
+    tx = TransferTransaction().add_hbar_transfer(AccountId(0, 0, 1984), -1).add_hbar_transfer(AccountId(0, 0, 7), 1)
+
+    with (
+        patch.object(
+            FileContentsQuery, "execute", autospec=True, side_effect=lambda query, _client: contents[query.file_id]
+        ) as mock_execute,
+        patch("hiero_sdk_python.fees.fee_calculator.time.monotonic") as mock_monotonic,
+    ):
+        mock_monotonic.return_value = 0.0
+        calculator.estimate(tx, mock_client)
+        assert mock_execute.call_count == 2
+        assert calculator.exchange_rate == ExchangeRate(30_000, 150_000, 1_700_000_000)
+
+        mock_monotonic.return_value = 30.0
+        calculator.estimate(tx, mock_client)
+        assert mock_execute.call_count == 2
+
+        mock_monotonic.return_value = 61.0
+        calculator.estimate(tx, mock_client)
+        assert mock_execute.call_count == 4
+
+
+def test_to_tinybars_uses_cached_exchange_rate(calculator):
+    """Tinycents are converted with the hbar/cent ratio of the cached rate."""
+    assert calculator.to_tinybars(150_000) == 30_000
+    assert calculator.to_tinybars(4_000_000) == 800_000
+
+    with pytest.raises(ValueError, match="No exchange rate loaded"):
+        FeeCalculator().to_tinybars(1)
+
+
+def test_set_fee_schedule_validation():
+    """Schedules can be given as a message or raw file bytes, and the TTL must be positive."""
+    calculator = FeeCalculator().set_fee_schedule(FEE_SCHEDULE.SerializeToString())
+    assert calculator.fee_schedule == FEE_SCHEDULE
+    assert not calculator.is_stale
+
+    with pytest.raises(TypeError, match="fee_schedule must be a FeeSchedule or bytes"):
+        FeeCalculator().set_fee_schedule("schedule")
+
+    with pytest.raises(ValueError, match="ttl must be > 0"):
+        FeeCalculator(ttl=0)
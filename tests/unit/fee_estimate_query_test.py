@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -12,9 +13,11 @@ from hiero_sdk_python.consensus.topic_create_transaction import TopicCreateTrans
 from hiero_sdk_python.consensus.topic_id import TopicId
 from hiero_sdk_python.consensus.topic_message_submit_transaction import TopicMessageSubmitTransaction
 from hiero_sdk_python.contract.contract_create_transaction import ContractCreateTransaction
+from hiero_sdk_python.crypto.private_key import PrivateKey
 from hiero_sdk_python.fees.fee_estimate_mode import FeeEstimateMode
 from hiero_sdk_python.file.file_create_transaction import FileCreateTransaction
 from hiero_sdk_python.file.file_id import FileId
+from hiero_sdk_python.hapi.services import transaction_contents_pb2, transaction_pb2
 from hiero_sdk_python.hbar import Hbar
 from hiero_sdk_python.query.fee_estimate_query import FeeEstimateQuery
 from hiero_sdk_python.tokens.token_create_transaction import TokenCreateTransaction
@@ -237,7 +240,7 @@ def test_topic_message_single_chunk(mock_post):
     assert mock_post.call_count == 1
 
 
-@patch("hiero_sdk_python.query.fee_estimate_query.requests.post")
+@patch("hiero_sdk_python.query.fee_estimate_query.requests.Session.post")
 def test_topic_message_multiple_chunks(mock_post):
     mock_post.side_effect = [
         mock_requests_response(),
@@ -267,6 +270,84 @@ def test_topic_message_multiple_chunks(mock_post):
     assert result.total == 210 * 2
 
 
+def _chunked_message_tx(chunks):
+    return (
+        TopicMessageSubmitTransaction()
+        .set_topic_id(TopicId(0, 0, 4))
+        .set_message("A" * 1024 * chunks)
+        .set_transaction_id(TransactionId.generate(AccountId(0, 0, 3)))
+        .set_node_account_ids([AccountId(0, 0, 4)])
+    )
+
+
+@patch("hiero_sdk_python.query.fee_estimate_query.requests.Session.post")
+def test_multiple_chunks_do_not_mutate_transaction(mock_post):
+    """Estimating a frozen chunked transaction leaves its bodies, signatures and chunk state untouched."""
+    mock_post.return_value = mock_requests_response()
+
+    tx = _chunked_message_tx(3).freeze_with(mock_client())
+    tx.sign(PrivateKey.generate())
+    bodies = dict(tx._transaction_body_bytes)
+    signatures = {body: sig_map.SerializeToString() for body, sig_map in tx._signature_map.items()}
+    transaction_id = tx.transaction_id
+
+    FeeEstimateQuery().set_transaction(tx).execute(mock_client())
+
+    assert tx._transaction_body_bytes == bodies
+    assert {body: sig_map.SerializeToString() for body, sig_map in tx._signature_map.items()} == signatures
+    assert tx.transaction_id == transaction_id
+    assert tx._current_chunk_index == 0
+
+
+@patch("hiero_sdk_python.query.fee_estimate_query.requests.Session.post")
+def test_multiple_chunks_post_one_payload_per_chunk(mock_post):
+    """Each chunk is posted once with its own transaction ID and chunk number."""
+    mock_post.return_value = mock_requests_response()
+
+    tx = _chunked_message_tx(4).freeze_with(mock_client())
+
+    FeeEstimateQuery().set_transaction(tx).execute(mock_client())
+
+    chunks = {}
+    for call in mock_post.call_args_list:
+        proto = transaction_pb2.Transaction.FromString(call.kwargs["data"])
+        signed = transaction_contents_pb2.SignedTransaction.FromString(proto.signedTransactionBytes)
+        body = transaction_pb2.TransactionBody.FromString(signed.bodyBytes)
+        chunks[body.consensusSubmitMessage.chunkInfo.number] = TransactionId._from_proto(body.transactionID)
+
+    assert sorted(chunks) == [1, 2, 3, 4]
+    assert [chunks[number] for number in sorted(chunks)] == tx._transaction_ids
+
+
+@patch("hiero_sdk_python.query.fee_estimate_query.requests.Session.post")
+def test_multiple_chunks_are_posted_concurrently(mock_post):
+    """All chunk requests are in flight at the same time when max_concurrency allows it."""
+    barrier = threading.Barrier(3, timeout=5)
+
+    def post(*args, **kwargs):
+        barrier.wait()
+        return mock_requests_response()
+
+    mock_post.side_effect = post
+
+    result = FeeEstimateQuery().set_max_concurrency(3).set_transaction(_chunked_message_tx(3)).execute(mock_client())
+
+    assert mock_post.call_count == 3
+    assert result.total == 210 * 3
+
+
+@patch("hiero_sdk_python.query.fee_estimate_query.requests.Session.post")
+def test_multiple_chunks_failure_is_raised(mock_post):
+    """A non-retryable failure on any chunk fails the whole estimate."""
+    bad_response = MagicMock(status_code=400, text="bad request")
+    mock_post.side_effect = [mock_requests_response(), bad_response]
+
+    query = FeeEstimateQuery().set_max_concurrency(1).set_transaction(_chunked_message_tx(2))
+
+    with pytest.raises(RuntimeError, match="HTTP status: 400"):
+        query.execute(mock_client())
+
+
 # ---------------------------------------------------------------------
 # Configuration / validation coverage
 # ---------------------------------------------------------------------
@@ -317,6 +398,20 @@ def test_max_backoff_validation():
     assert q._max_backoff == 1.5
 
 
+def test_max_concurrency_validation():
+    q = FeeEstimateQuery()
+
+    with pytest.raises(TypeError):
+        q.set_max_concurrency("4")
+
+    with pytest.raises(ValueError):
+        q.set_max_concurrency(0)
+
+    # valid case
+    q.set_max_concurrency(4)
+    assert q.get_max_concurrency() == 4
+
+
 def test_getters_and_defaults():
     q = FeeEstimateQuery()
 
@@ -380,7 +475,7 @@ def test_port_replacement_for_localhost_execute_multiple():
     with patch.object(query, "_execute_chunked", return_value=MagicMock()) as mock_execute_chunked:
         query.execute(client_1)
 
-        called_url = mock_execute_chunked.call_args[0][1]
+        called_url = mock_execute_chunked.call_args[0][0]
         assert ":8084" in called_url
         assert ":38081" not in called_url
 
@@ -389,6 +484,6 @@ def test_port_replacement_for_localhost_execute_multiple():
 
     with patch.object(query, "_execute_chunked", return_value=MagicMock()) as mock_execute_chunked:
         query.execute(client_2)
-        called_url = mock_execute_chunked.call_args[0][1]
+        called_url = mock_execute_chunked.call_args[0][0]
         assert ":8084" in called_url
         assert ":38081" not in called_url
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import math
+import threading
+from unittest.mock import patch
+
+import grpc
+import pytest
+
+from hiero_sdk_python.account.account_create_transaction import AccountCreateTransaction
+from hiero_sdk_python.crypto.private_key import PrivateKey
+from hiero_sdk_python.hapi.services.transaction_response_pb2 import (
+    TransactionResponse as TransactionResponseProto,
+)
+from hiero_sdk_python.metrics import (
+    BACKOFF_SECONDS,
+    DEFAULT_BUCKETS,
+    EXECUTION_ATTEMPTS,
+    EXECUTION_STATE_TOTAL,
+    GRPC_ERRORS_TOTAL,
+    GRPC_LATENCY_SECONDS,
+    NETWORK_HEALTHY_NODES,
+    NODE_BAD_GRPC_RESPONSES,
+    InMemoryMetricsSink,
+    NoOpMetricsSink,
+)
+from hiero_sdk_python.response_code import ResponseCode
+from tests.unit.mock_server import RealRpcError, mock_hedera_servers
+
+
+pytestmark = pytest.mark.unit
+
+
+def _account_create():
+    return AccountCreateTransaction().set_key_without_alias(PrivateKey.generate().public_key()).set_initial_balance(1)
+
+
+def test_in_memory_sink_counters_and_gauges():
+    """Counters accumulate and gauges keep the last value, keyed by name and labels."""
+    sink = InMemoryMetricsSink()
+
+    sink.increment("requests", labels={"node": "0.0.3"})
+    sink.increment("requests", 2, labels={"node": "0.0.3"})
+    sink.increment("requests", labels={"node": "0.0.4"})
+    sink.set_gauge("healthy", 4)
+    sink.set_gauge("healthy", 3)
+
+    snapshot = sink.snapshot()
+
+    assert snapshot.counter("requests", node="0.0.3") == 3
+    assert snapshot.counter("requests", node="0.0.4") == 1
+    assert snapshot.counter("requests", node="0.0.5") == 0
+    assert snapshot.gauge("healthy") == 3
+    assert snapshot.gauge("missing") is None
+
+
+def test_in_memory_sink_labels_are_order_independent():
+    """The same label set given in a different order maps to the same series."""
+    sink = InMemoryMetricsSink()
+
+    sink.increment("calls", labels={"node": "0.0.3", "method": "A"})
+    sink.increment("calls", labels={"method": "A", "node": "0.0.3"})
+
+    assert sink.snapshot().counter("calls", method="A", node="0.0.3") == 2
+
+
+def test_in_memory_sink_histogram():
+    """Histograms track count, sum, min, max and cumulative buckets."""
+    sink = InMemoryMetricsSink(buckets=(0.1, 1.0))
+
+    for value in (0.05, 0.5, 0.7, 3.0):
+        sink.observe("latency", value)
+
+    histogram = sink.snapshot().histogram("latency")
+
+    assert histogram.count == 4
+    assert histogram.sum == pytest.approx(4.25)
+    assert histogram.min == 0.05
+    assert histogram.max == 3.0
+    assert histogram.mean == pytest.approx(1.0625)
+    assert histogram.buckets == ((0.1, 1), (1.0, 3), (math.inf, 4))
+    assert histogram.quantile(0.5) == 1.0
+    assert histogram.quantile(1.0) == 3.0
+
+    with pytest.raises(ValueError, match="q must be between 0 and 1"):
+        histogram.quantile(1.5)
+
+
+def test_attempt_counts_use_count_buckets():
+    """Attempt counts are bucketed by integer bounds, not by the latency buckets."""
+    sink = InMemoryMetricsSink()
+
+    for attempts in (1, 2, 4):
+        sink.observe(EXECUTION_ATTEMPTS, attempts)
+    sink.observe(GRPC_LATENCY_SECONDS, 0.2)
+
+    snapshot = sink.snapshot()
+    assert snapshot.histogram(EXECUTION_ATTEMPTS).buckets[:4] == ((1, 1), (2, 2), (3, 2), (5, 3))
+    assert snapshot.histogram(GRPC_LATENCY_SECONDS).buckets[0] == (DEFAULT_BUCKETS[0], 0)
+
+
+def test_in_memory_sink_rejects_unsorted_buckets():
+    """Bucket bounds must be ascending."""
+    with pytest.raises(ValueError, match="ascending"):
+        InMemoryMetricsSink(buckets=(1.0, 0.1))
+
+
+def test_in_memory_sink_snapshot_is_a_copy_and_reset_clears():
+    """A snapshot is not affected by later writes, and reset discards all series."""
+    sink = InMemoryMetricsSink()
+    sink.increment("calls")
+
+    snapshot = sink.snapshot()
+    sink.increment("calls")
+    sink.reset()
+
+    assert snapshot.counter("calls") == 1
+    assert sink.snapshot().counters == {}
+
+
+def test_in_memory_sink_is_thread_safe():
+    """Concurrent increments and observations are not lost."""
+    sink = InMemoryMetricsSink()
+
+    def worker():
+        for _ in range(1000):
+            sink.increment("calls")
+            sink.observe("latency", 0.01)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    snapshot = sink.snapshot()
+    assert snapshot.counter("calls") == 8000
+    assert snapshot.histogram("latency").count == 8000
+
+
+def test_client_defaults_to_noop_sink(mock_client):
+    """The client uses a no-op sink unless one is configured."""
+    assert isinstance(mock_client.metrics, NoOpMetricsSink)
+
+
+def test_client_set_metrics_sink(mock_client):
+    """set_metrics_sink validates its argument and None restores the default."""
+    sink = InMemoryMetricsSink()
+
+    assert mock_client.set_metrics_sink(sink) is mock_client
+    assert mock_client.metrics is sink
+
+    mock_client.set_metrics_sink(None)
+    assert isinstance(mock_client.metrics, NoOpMetricsSink)
+
+    with pytest.raises(TypeError, match="metrics must be of type MetricsSink"):
+        mock_client.set_metrics_sink("sink")
+
+
+def test_execute_records_latency_states_attempts_and_backoff():
+    """A BUSY then OK sequence records two latencies, both states, the attempt count and one backoff."""
+    busy_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.BUSY)
+    ok_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.OK)
+
+    with (
+        mock_hedera_servers([[busy_response, ok_response]]) as client,
+        patch("hiero_sdk_python.executable.time.sleep"),
+    ):
+        sink = InMemoryMetricsSink()
+        client.set_metrics_sink(sink)
+
+        _account_create().execute(client, wait_for_receipt=False)
+
+    snapshot = sink.snapshot()
+    labels = {"node": "0.0.3", "method": "AccountCreateTransaction"}
+
+    assert snapshot.histogram(GRPC_LATENCY_SECONDS, **labels).count == 2
+    assert snapshot.counter(EXECUTION_STATE_TOTAL, state="RETRY", **labels) == 1
+    assert snapshot.counter(EXECUTION_STATE_TOTAL, state="FINISHED", **labels) == 1
+    assert snapshot.histogram(EXECUTION_ATTEMPTS, method="AccountCreateTransaction").sum == 2
+    assert snapshot.histogram(BACKOFF_SECONDS, method="AccountCreateTransaction").count == 1
+
+
+def test_execute_records_grpc_errors_and_node_health():
+    """A retryable gRPC error is counted by status code and publishes node health gauges."""
+    error = RealRpcError(grpc.StatusCode.UNAVAILABLE, "unavailable")
+    ok_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.OK)
+
+    with mock_hedera_servers([[error], [ok_response]]) as client:
+        sink = InMemoryMetricsSink()
+        client.set_metrics_sink(sink)
+
+        _account_create().execute(client, wait_for_receipt=False)
+
+    snapshot = sink.snapshot()
+
+    assert snapshot.counter(GRPC_ERRORS_TOTAL, node="0.0.3", method="AccountCreateTransaction", code="UNAVAILABLE") == 1
+    assert snapshot.gauge(NODE_BAD_GRPC_RESPONSES, node="0.0.3") == 1
+    assert snapshot.gauge(NETWORK_HEALTHY_NODES, network="testnet") == 1
+    assert snapshot.counter(EXECUTION_STATE_TOTAL, node="0.0.4", method="AccountCreateTransaction", state="FINISHED")
+
+
+def test_execute_records_attempts_when_request_fails():
+    """The attempt histogram is recorded even when execution raises."""
+    error_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.INVALID_SIGNATURE)
+
+    with mock_hedera_servers([[error_response]]) as client:
+        sink = InMemoryMetricsSink()
+        client.set_metrics_sink(sink)
+
+        with pytest.raises(Exception, match="INVALID_SIGNATURE"):
+            _account_create().execute(client, wait_for_receipt=False)
+
+    snapshot = sink.snapshot()
+    assert snapshot.histogram(EXECUTION_ATTEMPTS, method="AccountCreateTransaction").sum == 1
+    assert snapshot.counter(EXECUTION_STATE_TOTAL, node="0.0.3", method="AccountCreateTransaction", state="ERROR") == 1
+
+
+def test_healthy_node_gauge_follows_recovery(mock_client):
+    """The healthy node count goes back up when a node is readmitted."""
+    sink = InMemoryMetricsSink()
+    mock_client.set_metrics_sink(sink)
+    network = mock_client.network
+    node = network.nodes[0]
+
+    assert sink.snapshot().gauge(NETWORK_HEALTHY_NODES, network=network.network) == 1
+
+    network._increase_backoff(node)
+    assert sink.snapshot().gauge(NETWORK_HEALTHY_NODES, network=network.network) == 0
+
+    node._readmit_time = 0
+    network._earliest_readmit_time = 0
+    network._readmit_nodes()
+    assert sink.snapshot().gauge(NETWORK_HEALTHY_NODES, network=network.network) == 1
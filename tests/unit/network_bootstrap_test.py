@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import binascii
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from hiero_sdk_python.account.account_id import AccountId
+from hiero_sdk_python.client.client import Client
+from hiero_sdk_python.client.network import Network
+from hiero_sdk_python.client.network_cache import NetworkCache
+from hiero_sdk_python.node import _Node
+from hiero_sdk_python.query.account_balance_query import CryptoGetAccountBalanceQuery
+from tests.unit.conftest import FAKE_CERT_HASH, balance_response
+
+
+pytestmark = pytest.mark.unit
+
+
+def _entry(account_num):
+    return {
+        "node_account_id": f"0.0.{account_num}",
+        "node_id": account_num - 3,
+        "node_cert_hash": "0x" + binascii.hexlify(FAKE_CERT_HASH).decode("utf-8"),
+        "public_key": "",
+        "description": "",
+        "service_endpoints": [{"ip_address_v4": f"10.0.0.{account_num}", "port": 50211, "domain_name": ""}],
+    }
+
+
+def _response(entries):
+    response = MagicMock()
+    response.json.return_value = {"nodes": entries, "links": {"next": None}}
+    return response
+
+
+def _blocked_mirror(entries):
+    """Patch the mirror node to answer with `entries` once the returned event is set."""
+    release = threading.Event()
+
+    def get(url, timeout):  # noqa: ARG001
+        assert release.wait(5)
+        return _response(entries)
+
+    return release, patch("hiero_sdk_python.client.network.requests.get", side_effect=get)
+
+
+def _account_ids(network):
+    return [node._account_id for node in network.nodes]
+
+
+def test_client_starts_from_default_nodes_and_switches_to_the_address_book():
+    """Construction does not wait for the mirror node; the fetched address book is swapped in later."""
+    release, mirror = _blocked_mirror([_entry(3), _entry(4)])
+
+    with mirror:
+        client = Client.for_testnet(background_bootstrap=True)
+        network = client.network
+
+        assert _account_ids(network) == [account_id for _, account_id in Network.DEFAULT_NODES["testnet"]]
+        assert not network.wait_for_bootstrap(timeout=0)
+
+        release.set()
+        assert network.wait_for_bootstrap(timeout=5)
+
+    assert _account_ids(network) == [AccountId(0, 0, 3), AccountId(0, 0, 4)]
+    assert all(node._address_book is not None for node in network.nodes)
+    assert network.current_node in network.nodes
+    client.close()
+
+
+def test_requests_sent_during_the_bootstrap_wait_for_the_address_book():
+    """Default nodes have no certificate hashes, so a request waits for the fetched nodes and uses them."""
+    release, mirror = _blocked_mirror([_entry(3), _entry(4)])
+    used_nodes = []
+
+    def get_channel(node):
+        used_nodes.append(node)
+        return MagicMock()
+
+    with (
+        mirror,
+        patch.object(_Node, "_get_channel", autospec=True, side_effect=get_channel),
+        patch("hiero_sdk_python.executable._execute_method", return_value=balance_response(9)),
+    ):
+        client = Client.for_testnet(background_bootstrap=True)
+        threading.Timer(0.1, release.set).start()
+
+        balance = (
+            CryptoGetAccountBalanceQuery(AccountId(0, 0, 1800))
+            .set_node_account_ids([AccountId(0, 0, 3)])
+            .execute(client)
+        )
+
+    assert balance.hbars.to_tinybars() == 9
+    assert [node._account_id for node in used_nodes] == [AccountId(0, 0, 3)]
+    assert used_nodes[0]._address_book is not None
+    client.close()
+
+
+def test_failed_background_fetch_keeps_the_default_nodes():
+    """A mirror node that cannot be reached leaves the network on its default nodes."""
+    with patch("hiero_sdk_python.client.network.requests.get", side_effect=requests.ConnectionError("down")):
+        network = Network("mainnet", background_bootstrap=True)
+        assert network.wait_for_bootstrap(timeout=5)
+
+    assert len(network.nodes) == len(Network.DEFAULT_NODES["mainnet"])
+    assert network._healthy_nodes
+
+
+def test_stale_cached_address_book_is_replaced_in_the_background(tmp_path):
+    """A stale cached address book is used first and replaced by the fetched one, which is cached too."""
+    cache = NetworkCache(tmp_path, ttl=0)
+    cache.store_address_book("mainnet", [_entry(3)])
+    release, mirror = _blocked_mirror([_entry(3), _entry(5)])
+
+    with mirror:
+        network = Network("mainnet", cache=cache, background_bootstrap=True)
+        assert _account_ids(network) == [AccountId(0, 0, 3)]
+        cached_node = network.nodes[0]
+
+        release.set()
+        assert network.wait_for_bootstrap(timeout=5)
+
+    assert _account_ids(network) == [AccountId(0, 0, 3), AccountId(0, 0, 5)]
+    assert network.nodes[0] is cached_node
+    assert len(cache.load_address_book("mainnet").nodes) == 2
+
+
+def test_closed_network_is_not_updated_and_later_updates_fetch_synchronously():
+    """A network closed during the bootstrap keeps its nodes; update_network never returns to the defaults."""
+    release, mirror = _blocked_mirror([_entry(3)])
+
+    with mirror:
+        network = Network("testnet", background_bootstrap=True)
+        network._close()
+        release.set()
+        assert network.wait_for_bootstrap(timeout=5)
+
+    assert len(network.nodes) == len(Network.DEFAULT_NODES["testnet"])
+
+    with patch("hiero_sdk_python.client.network.requests.get", return_value=_response([_entry(4)])):
+        network = Network("testnet", background_bootstrap=True)
+        assert network.wait_for_bootstrap(timeout=5)
+        network._set_network_nodes()
+
+    assert _account_ids(network) == [AccountId(0, 0, 4)]
+    assert network._bootstrap_pending is False
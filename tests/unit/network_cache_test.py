@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import binascii
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from hiero_sdk_python.account.account_id import AccountId
+from hiero_sdk_python.client.network import Network
+from hiero_sdk_python.client.network_cache import CACHE_FORMAT_VERSION, NetworkCache
+from hiero_sdk_python.node import _Node
+from tests.unit.conftest import FAKE_CERT_HASH, FAKE_CERT_PEM
+
+
+pytestmark = pytest.mark.unit
+
+NOW = 1_700_000_000.0
+
+
+def _entry(account_num, cert_hash=FAKE_CERT_HASH):
+    return {
+        "node_account_id": f"0.0.{account_num}",
+        "node_id": account_num - 3,
+        "node_cert_hash": "0x" + binascii.hexlify(cert_hash).decode("utf-8"),
+        "public_key": "",
+        "description": f"node {account_num}",
+        "service_endpoints": [{"ip_address_v4": f"10.0.0.{account_num}", "port": 50211, "domain_name": ""}],
+    }
+
+
+def _mirror_response(entries):
+    response = MagicMock()
+    response.json.return_value = {"nodes": entries, "links": {"next": None}}
+    return response
+
+
+@pytest.fixture
+def clock():
+    now = [NOW]
+
+    def current():
+        return now[0]
+
+    current.now = now
+    return current
+
+
+def test_address_book_round_trip_and_staleness(tmp_path, clock):
+    """A stored address book is read back and becomes stale after the TTL."""
+    cache = NetworkCache(tmp_path, ttl=60, clock=clock)
+    assert cache.load_address_book("mainnet") is None
+
+    cache.store_address_book("mainnet", [_entry(3), _entry(4)])
+    cached = cache.load_address_book("mainnet")
+    assert [node["node_account_id"] for node in cached.nodes] == ["0.0.3", "0.0.4"]
+    assert cached.fetched_at == NOW
+    assert not cached.stale
+
+    clock.now[0] += 60
+    assert cache.load_address_book("mainnet").stale
+    assert cache.load_address_book("testnet") is None
+    assert not list(tmp_path.rglob("*.tmp"))
+
+
+def test_unusable_address_book_files_are_ignored(tmp_path):
+    """Corrupt files and files from another format version are treated as missing."""
+    cache = NetworkCache(tmp_path)
+    path = tmp_path / "address_books" / "mainnet.json"
+    path.parent.mkdir(parents=True)
+
+    path.write_text("{not json")
+    assert cache.load_address_book("mainnet") is None
+
+    path.write_text(json.dumps({"version": CACHE_FORMAT_VERSION + 1, "fetched_at": NOW, "nodes": [_entry(3)]}))
+    assert cache.load_address_book("mainnet") is None
+
+
+def test_certificates_must_match_their_hash(tmp_path):
+    """Certificates are only stored and returned when they match the pinned hash."""
+    cache = NetworkCache(tmp_path)
+    assert cache.load_certificate(FAKE_CERT_HASH) is None
+
+    with pytest.raises(ValueError, match="does not match"):
+        cache.store_certificate(FAKE_CERT_HASH, b"another certificate")
+
+    cache.store_certificate(FAKE_CERT_HASH, FAKE_CERT_PEM)
+    assert cache.load_certificate(FAKE_CERT_HASH) == FAKE_CERT_PEM
+    assert cache.load_certificate("0x" + FAKE_CERT_HASH.decode().upper()) == FAKE_CERT_PEM
+
+    (tmp_path / "certificates" / f"{FAKE_CERT_HASH.decode()}.pem").write_bytes(b"tampered")
+    assert cache.load_certificate(FAKE_CERT_HASH) is None
+
+
+def test_network_populates_and_then_uses_the_cache(tmp_path, clock):
+    """The first network fetches from the mirror node; later ones start from the cache."""
+    cache = NetworkCache(tmp_path, clock=clock)
+
+    with patch("hiero_sdk_python.client.network.requests.get", return_value=_mirror_response([_entry(3)])) as get:
+        Network("mainnet", cache=cache)
+        network = Network("mainnet", cache=cache)
+
+    assert get.call_count == 1
+    assert [node._account_id for node in network.nodes] == [AccountId(0, 0, 3)]
+    assert network._cache_refresh is None
+
+
+def test_stale_address_book_is_used_and_revalidated(tmp_path, clock):
+    """A stale address book is used immediately while the cache is refreshed in the background."""
+    cache = NetworkCache(tmp_path, ttl=60, clock=clock)
+    cache.store_address_book("mainnet", [_entry(3)])
+    clock.now[0] += 120
+
+    with patch("hiero_sdk_python.client.network.requests.get", return_value=_mirror_response([_entry(3), _entry(4)])):
+        network = Network("mainnet", cache=cache)
+        network._cache_refresh.join(timeout=5)
+
+    assert [node._account_id for node in network.nodes] == [AccountId(0, 0, 3)]
+    refreshed = cache.load_address_book("mainnet")
+    assert len(refreshed.nodes) == 2
+    assert not refreshed.stale
+
+
+def test_update_network_fetches_from_the_mirror_node_despite_the_cache(tmp_path, clock):
+    """An explicit update ignores a fresh cached address book and replaces it with the fetched one."""
+    cache = NetworkCache(tmp_path, clock=clock)
+    cache.store_address_book("mainnet", [_entry(3)])
+
+    with patch(
+        "hiero_sdk_python.client.network.requests.get", return_value=_mirror_response([_entry(3), _entry(4)])
+    ) as get:
+        network = Network("mainnet", cache=cache)
+        assert get.call_count == 0
+
+        network._set_network_nodes()
+
+    assert get.call_count == 1
+    assert [node._account_id for node in network.nodes] == [AccountId(0, 0, 3), AccountId(0, 0, 4)]
+    assert len(cache.load_address_book("mainnet").nodes) == 2
+
+
+def test_node_certificates_are_cached(tmp_path):
+    """A validated certificate is cached, and nodes with the same pinned hash skip the handshake."""
+    cache = NetworkCache(tmp_path)
+    cache.store_address_book("mainnet", [_entry(3)])
+
+    with patch.object(_Node, "_fetch_server_certificate_pem", autospec=True, return_value=FAKE_CERT_PEM) as fetch:
+        first = Network("mainnet", cache=cache)
+        first.nodes[0]._get_channel()
+        # Close the shared channel so that the second network has to open its own
+        first._close()
+        second = Network("mainnet", cache=cache)
+        second.nodes[0]._get_channel()
+
+    assert fetch.call_count == 1
+    assert second.nodes[0]._node_pem_cert == FAKE_CERT_PEM
+    second._close()
+
+
+def test_negative_ttl_is_rejected(tmp_path):
+    """The TTL must be non-negative."""
+    with pytest.raises(ValueError, match="ttl must be non-negative"):
+        NetworkCache(tmp_path, ttl=-1)
@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from hiero_sdk_python.crypto.private_key import PrivateKey
+from hiero_sdk_python.crypto.signer import Signer
+from hiero_sdk_python.hapi.services import (
+    response_header_pb2,
+    response_pb2,
+    transaction_get_receipt_pb2,
+)
+from hiero_sdk_python.hapi.services.transaction_receipt_pb2 import (
+    TransactionReceipt as TransactionReceiptProto,
+)
+from hiero_sdk_python.hapi.services.transaction_response_pb2 import (
+    TransactionResponse as TransactionResponseProto,
+)
+from hiero_sdk_python.response_code import ResponseCode
+from hiero_sdk_python.tokens.nft_mint_pipeline import MintedNfts, NftMintError, mint_nfts, read_metadata_file
+from hiero_sdk_python.tokens.token_id import TokenId
+from hiero_sdk_python.tokens.token_mint_transaction import TokenMintTransaction
+from tests.unit.mock_server import mock_hedera_servers
+
+
+pytestmark = pytest.mark.unit
+
+TOKEN_ID = TokenId(0, 0, 5005)
+
+
+def _receipt_response(serials):
+    return response_pb2.Response(
+        transactionGetReceipt=transaction_get_receipt_pb2.TransactionGetReceiptResponse(
+            header=response_header_pb2.ResponseHeader(nodeTransactionPrecheckCode=ResponseCode.OK),
+            receipt=TransactionReceiptProto(status=ResponseCode.SUCCESS, serialNumbers=serials),
+        )
+    )
+
+
+class _FakeMints:
+    """Stands in for TokenMintTransaction.execute, assigning serials and tracking concurrency."""
+
+    def __init__(self, barrier=None, fail_on=None):
+        self.barrier = barrier
+        self.fail_on = fail_on
+        self.lock = threading.Lock()
+        self.next_serial = 1
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = []
+
+    def __call__(self, transaction, client, timeout=None, validate_status=False):  # noqa: ARG002
+        with self.lock:
+            self.calls.append(list(transaction.metadata))
+            call_number = len(self.calls)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        try:
+            if self.barrier is not None:
+                self.barrier.wait()
+            if call_number == self.fail_on:
+                raise RuntimeError("mint failed")
+
+            with self.lock:
+                serials = list(range(self.next_serial, self.next_serial + len(transaction.metadata)))
+                self.next_serial += len(transaction.metadata)
+            return MagicMock(serial_numbers=serials)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+def test_client_mint_nfts_splits_metadata_and_returns_serials():
+    """25 entries are minted as 10 + 10 + 5, and each result reports its offset and serial range."""
+    ok_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.OK)
+    response_sequences = [
+        [
+            ok_response,
+            _receipt_response(range(1, 11)),
+            ok_response,
+            _receipt_response(range(11, 21)),
+            ok_response,
+            _receipt_response(range(21, 26)),
+        ]
+    ]
+    supply_key = PrivateKey.generate()
+    metadata = (f"nft-{i}".encode() for i in range(25))
+
+    with mock_hedera_servers(response_sequences) as client:
+        results = list(client.mint_nfts(TOKEN_ID, metadata, supply_key, max_concurrency=1))
+
+    assert [result.offset for result in results] == [0, 10, 20]
+    assert [(result.first_serial, result.last_serial) for result in results] == [(1, 10), (11, 20), (21, 25)]
+    assert all(isinstance(result, MintedNfts) for result in results)
+    assert all(result.receipt.status == ResponseCode.SUCCESS for result in results)
+    assert len({result.transaction_id for result in results}) == 3
+
+
+def test_mints_are_signed_by_supply_key(mock_client):
+    """Every mint is frozen with the client and signed by the supply key before submission."""
+    supply_key = PrivateKey.generate()
+    signed = []
+
+    def execute(transaction, client, timeout=None, validate_status=False):  # noqa: ARG001
+        signed.append(transaction.is_signed_by(supply_key.public_key()))
+        return MagicMock(serial_numbers=[1])
+
+    with patch.object(TokenMintTransaction, "execute", autospec=True, side_effect=execute):
+        list(mint_nfts(mock_client, TOKEN_ID, [b"a", b"b", b"c"], supply_key, batch_size=1))
+
+    assert signed == [True, True, True]
+
+
+def test_mints_run_concurrently(mock_client):
+    """With max_concurrency=3, three mints are in flight at the same time."""
+    fake = _FakeMints(barrier=threading.Barrier(3, timeout=5))
+
+    with patch.object(TokenMintTransaction, "execute", autospec=True, side_effect=fake):
+        results = list(mint_nfts(mock_client, TOKEN_ID, [b"x"] * 30, PrivateKey.generate(), max_concurrency=3))
+
+    assert fake.max_in_flight == 3
+    assert sorted(result.offset for result in results) == [0, 10, 20]
+    assert sorted(serial for result in results for serial in result.serial_numbers) == list(range(1, 31))
+
+
+def test_concurrency_is_bounded(mock_client):
+    """No more than max_concurrency mints are ever in flight."""
+    fake = _FakeMints()
+
+    with patch.object(TokenMintTransaction, "execute", autospec=True, side_effect=fake):
+        results = list(mint_nfts(mock_client, TOKEN_ID, [b"x"] * 95, PrivateKey.generate(), max_concurrency=2))
+
+    assert fake.max_in_flight <= 2
+    assert len(results) == 10
+    assert sorted(len(metadata) for metadata in fake.calls) == [5] + [10] * 9
+
+
+def test_metadata_is_streamed_lazily(mock_client):
+    """Metadata is pulled from the iterator only as mints are submitted."""
+    consumed = []
+
+    def metadata():
+        for i in range(1000):
+            consumed.append(i)
+            yield b"x"
+
+    with patch.object(TokenMintTransaction, "execute", autospec=True, side_effect=_FakeMints()):
+        iterator = mint_nfts(mock_client, TOKEN_ID, metadata(), PrivateKey.generate(), max_concurrency=1)
+        next(iterator)
+        iterator.close()
+
+    assert len(consumed) <= 11
+
+
+def test_metadata_can_be_read_from_file(mock_client, tmp_path):
+    """A file path is read one entry per line, skipping blank lines and stripping line endings."""
+    path = tmp_path / "metadata.txt"
+    path.write_bytes(b"ipfs://a\r\nipfs://b\n\nipfs://c\n")
+
+    assert list(read_metadata_file(path)) == [b"ipfs://a", b"ipfs://b", b"ipfs://c"]
+
+    fake = _FakeMints()
+    with patch.object(TokenMintTransaction, "execute", autospec=True, side_effect=fake):
+        list(mint_nfts(mock_client, TOKEN_ID, str(path), PrivateKey.generate()))
+
+    assert fake.calls == [[b"ipfs://a", b"ipfs://b", b"ipfs://c"]]
+
+
+def test_failed_mint_stops_the_pipeline(mock_client):
+    """A failing mint is raised from the iterator with its offset, and no further mints are submitted."""
+    fake = _FakeMints(fail_on=2)
+
+    with (
+        patch.object(TokenMintTransaction, "execute", autospec=True, side_effect=fake),
+        pytest.raises(NftMintError, match="offset 10") as exc_info,
+    ):
+        list(mint_nfts(mock_client, TOKEN_ID, [b"x"] * 100, PrivateKey.generate(), max_concurrency=1))
+
+    assert len(fake.calls) == 2
+    assert exc_info.value.offset == 10
+    assert isinstance(exc_info.value.__cause__, RuntimeError)
+
+
+def test_mints_in_flight_with_a_failure_are_reported(mock_client):
+    """Mints that complete alongside a failed one are yielded before the error is raised."""
+    fake = _FakeMints(barrier=threading.Barrier(3, timeout=5), fail_on=2)
+    results = []
+
+    with (
+        patch.object(TokenMintTransaction, "execute", autospec=True, side_effect=fake),
+        pytest.raises(NftMintError),
+    ):
+        for result in mint_nfts(mock_client, TOKEN_ID, [b"x"] * 30, PrivateKey.generate(), max_concurrency=3):
+            results.append(result)
+
+    assert len(fake.calls) == 3
+    assert sorted(result.offset for result in results) == [0, 20]
+    assert sorted(serial for result in results for serial in result.serial_numbers) == list(range(1, 21))
+
+
+def test_mints_can_be_signed_by_a_signer(mock_client):
+    """An external Signer holding the supply key signs every mint."""
+    supply_key = PrivateKey.generate()
+
+    class _Signer(Signer):
+        def public_key(self):
+            return supply_key.public_key()
+
+        def sign_many(self, messages):
+            return [supply_key.sign(message) for message in messages]
+
+    signed = []
+
+    def execute(transaction, client, timeout=None, validate_status=False):  # noqa: ARG001
+        signed.append(transaction.is_signed_by(supply_key.public_key()))
+        return MagicMock(serial_numbers=[1])
+
+    with patch.object(TokenMintTransaction, "execute", autospec=True, side_effect=execute):
+        list(mint_nfts(mock_client, TOKEN_ID, [b"a", b"b"], _Signer(), batch_size=1))
+
+    assert signed == [True, True]
+
+
+def test_arguments_are_validated_eagerly(mock_client):
+    """Invalid arguments raise when mint_nfts is called, before iteration."""
+    supply_key = PrivateKey.generate()
+
+    with pytest.raises(TypeError, match="token_id must be a TokenId"):
+        mint_nfts(mock_client, "0.0.5005", [b"x"], supply_key)
+
+    with pytest.raises(TypeError, match="supply_key must be a PrivateKey, Signer or AsyncSigner"):
+        mint_nfts(mock_client, TOKEN_ID, [b"x"], supply_key.public_key())
+
+    with pytest.raises(ValueError, match="max_concurrency must be >= 1"):
+        mint_nfts(mock_client, TOKEN_ID, [b"x"], supply_key, max_concurrency=0)
+
+    with pytest.raises(ValueError, match="batch_size must be between 1 and 10"):
+        mint_nfts(mock_client, TOKEN_ID, [b"x"], supply_key, batch_size=11)
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import importlib
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import hiero_sdk_python
+
+
+pytestmark = pytest.mark.unit
+
+SRC_DIR = Path(hiero_sdk_python.__file__).resolve().parents[1]
+
+
+def _run_isolated(code: str) -> subprocess.CompletedProcess:
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [str(SRC_DIR), os.getenv("PYTHONPATH")]))}
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, check=False)
+
+
+def test_lazy_imports_cover_public_names():
+    """Every name in __all__ is either lazily importable or already bound."""
+    lazy_names = set(hiero_sdk_python._LAZY_IMPORTS)
+    eager_names = {name for name in hiero_sdk_python.__all__ if name not in lazy_names}
+
+    assert lazy_names <= set(hiero_sdk_python.__all__)
+    assert eager_names == {"Duration"}
+
+
+@pytest.mark.parametrize("name", sorted(hiero_sdk_python._LAZY_IMPORTS))
+def test_lazy_name_resolves_to_defining_module_object(name):
+    """Each public name resolves to the same object as importing it from its module."""
+    module = importlib.import_module(hiero_sdk_python._LAZY_IMPORTS[name], "hiero_sdk_python")
+
+    assert getattr(hiero_sdk_python, name) is getattr(module, name)
+
+
+def test_unknown_attribute_raises_attribute_error():
+    """Unknown names raise AttributeError so hasattr() keeps working."""
+    with pytest.raises(AttributeError, match="has no attribute 'NotAThing'"):
+        _ = hiero_sdk_python.NotAThing
+
+    assert not hasattr(hiero_sdk_python, "not_a_submodule")
+
+
+def test_submodules_remain_reachable_as_attributes():
+    """Submodules can still be reached as attributes of the package."""
+    assert hiero_sdk_python.timestamp is importlib.import_module("hiero_sdk_python.timestamp")
+
+
+def test_dir_lists_public_names():
+    """dir() includes names that have not been imported yet."""
+    assert set(hiero_sdk_python.__all__) <= set(dir(hiero_sdk_python))
+
+
+def test_import_root_does_not_load_transactions():
+    """Importing the package root does not load the client or any transaction module."""
+    result = _run_isolated(
+        "import sys, hiero_sdk_python\n"
+        "loaded = [m for m in sys.modules if m.startswith(('hiero_sdk_python.client', 'hiero_sdk_python.transaction'))]\n"
+        "assert not loaded, loaded\n"
+        "assert 'eth_abi' not in sys.modules\n"
+    )
+
+    assert result.returncode == 0, result.stderr
+
+
+def test_duration_stays_a_class_after_submodule_import():
+    """Importing the Duration submodule does not rebind the package's Duration attribute."""
+    result = _run_isolated(
+        "import hiero_sdk_python\n"
+        "import hiero_sdk_python.Duration\n"
+        "from hiero_sdk_python import Duration\n"
+        "assert isinstance(Duration, type), Duration\n"
+    )
+
+    assert result.returncode == 0, result.stderr
+
+
+def test_star_import_exports_all_names():
+    """`from hiero_sdk_python import *` still binds every public name."""
+    namespace: dict[str, object] = {}
+    exec("from hiero_sdk_python import *", namespace)
+
+    assert set(hiero_sdk_python.__all__) <= set(namespace)
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from hiero_sdk_python.account.account_id import AccountId
+from hiero_sdk_python.consensus.topic_id import TopicId
+from hiero_sdk_python.consensus.topic_message_submit_transaction import TopicMessageSubmitTransaction
+from hiero_sdk_python.crypto.private_key import PrivateKey
+from hiero_sdk_python.crypto.signer import LocalSigner
+from hiero_sdk_python.hapi.services import (
+    response_header_pb2,
+    response_pb2,
+    transaction_get_receipt_pb2,
+)
+from hiero_sdk_python.hapi.services.transaction_receipt_pb2 import (
+    TransactionReceipt as TransactionReceiptProto,
+)
+from hiero_sdk_python.hapi.services.transaction_response_pb2 import (
+    TransactionResponse as TransactionResponseProto,
+)
+from hiero_sdk_python.response_code import ResponseCode
+from hiero_sdk_python.transaction.presigned_pool import PresignedPool
+from hiero_sdk_python.transaction.transaction_id import TransactionId
+from hiero_sdk_python.transaction.transaction_id_allocator import TransactionIdAllocator
+from hiero_sdk_python.transaction.transfer_transaction import TransferTransaction
+from tests.unit.mock_server import mock_hedera_servers
+
+
+pytestmark = pytest.mark.unit
+
+
+def _transfer(amount=1):
+    return (
+        TransferTransaction()
+        .add_hbar_transfer(AccountId(0, 0, 1001), -amount)
+        .add_hbar_transfer(AccountId(0, 0, 1002), amount)
+    )
+
+
+class _Clock:
+    """A wall clock that tests can move forward, shared by the pool and the client's ID allocator."""
+
+    def __init__(self, client):
+        self.offset = 0.0
+        client.transaction_id_allocator = TransactionIdAllocator(clock=lambda: int(self() * 1_000_000_000))
+
+    def __call__(self):
+        return time.time() + self.offset
+
+
+def test_transactions_are_prepared_in_the_background(mock_client):
+    """Taken transactions are frozen, have an ID and carry the operator and extra signatures."""
+    extra_key = PrivateKey.generate()
+
+    with PresignedPool(mock_client) as pool:
+        pool.put(_transfer(1), signing_keys=[extra_key])
+        pool.put(_transfer(2))
+        first = pool.take(timeout=5)
+        second = pool.take(timeout=5)
+
+    assert [t.hbar_transfers[1].amount for t in (first, second)] == [1, 2]
+    for transaction in (first, second):
+        assert transaction._transaction_body_bytes
+        assert transaction.transaction_id.account_id == mock_client.operator_account_id
+        assert transaction.is_signed_by(mock_client.operator_private_key.public_key())
+    assert first.is_signed_by(extra_key.public_key())
+    assert not second.is_signed_by(extra_key.public_key())
+
+
+def test_queued_transactions_are_signed_in_one_batch_per_key(mock_client):
+    """A Signer signs every transaction queued before the worker starts in a single request."""
+    signer = LocalSigner(PrivateKey.generate())
+    pool = PresignedPool(mock_client)
+    for amount in range(1, 4):
+        pool.put(_transfer(amount), signing_keys=[signer])
+
+    with patch.object(signer, "sign_many", wraps=signer.sign_many) as sign_many, pool:
+        prepared = [pool.take(timeout=5) for _ in range(3)]
+
+    sign_many.assert_called_once()
+    assert len(sign_many.call_args[0][0]) == sum(len(t._transaction_body_bytes) for t in prepared)
+    for transaction in prepared:
+        assert transaction.is_signed_by(signer.public_key())
+        assert transaction.is_signed_by(mock_client.operator_private_key.public_key())
+
+
+def test_payer_of_a_preset_transaction_id_is_kept(mock_client):
+    """A transaction ID set by the caller determines the payer of the prepared transaction."""
+    payer = AccountId(0, 0, 4242)
+    transaction = _transfer().set_transaction_id(TransactionId.generate(payer))
+
+    with PresignedPool(mock_client) as pool:
+        pool.put(transaction)
+        prepared = pool.take(timeout=5)
+
+    assert prepared.transaction_id.account_id == payer
+
+
+def test_execute_only_submits():
+    """execute submits a prepared transaction without freezing or signing it again."""
+    ok_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.OK)
+    receipt_response = response_pb2.Response(
+        transactionGetReceipt=transaction_get_receipt_pb2.TransactionGetReceiptResponse(
+            header=response_header_pb2.ResponseHeader(nodeTransactionPrecheckCode=ResponseCode.OK),
+            receipt=TransactionReceiptProto(status=ResponseCode.SUCCESS),
+        )
+    )
+
+    with mock_hedera_servers([[ok_response, receipt_response]]) as client, PresignedPool(client) as pool:
+        pool.put(_transfer())
+        while len(pool) == 0:
+            time.sleep(0.01)
+
+        with (
+            patch.object(TransferTransaction, "freeze_with", autospec=True) as freeze_with,
+            patch.object(TransferTransaction, "sign", autospec=True) as sign,
+        ):
+            receipt = pool.execute(timeout=5)
+
+    assert receipt.status == ResponseCode.SUCCESS
+    freeze_with.assert_not_called()
+    sign.assert_not_called()
+
+
+def test_stale_transactions_are_refreshed(mock_client):
+    """A transaction close to expiry is re-prepared under a new transaction ID."""
+    clock = _Clock(mock_client)
+
+    with PresignedPool(mock_client, refresh_margin=10, clock=clock) as pool:
+        pool.put(_transfer())
+        while len(pool) == 0:
+            time.sleep(0.01)
+        original_id = pool._ready[0].transaction.transaction_id
+
+        clock.offset = 120
+        refreshed = pool.take(timeout=5)
+
+    assert refreshed.transaction_id != original_id
+    assert refreshed.is_signed_by(mock_client.operator_private_key.public_key())
+    assert len(refreshed._signature_map) == len(refreshed._transaction_body_bytes)
+
+
+def test_stale_transactions_can_be_discarded(mock_client):
+    """With refresh_expired=False a stale transaction is dropped instead of handed out."""
+    clock = _Clock(mock_client)
+
+    with PresignedPool(mock_client, refresh_expired=False, clock=clock) as pool:
+        pool.put(_transfer())
+        while len(pool) == 0:
+            time.sleep(0.01)
+
+        clock.offset = 120
+        with pytest.raises(TimeoutError):
+            pool.take(timeout=0.1)
+
+    assert pool.discarded == 1
+
+
+def test_preparation_errors_are_raised_from_take(mock_client):
+    """An error raised while preparing a transaction surfaces when it is taken."""
+    with PresignedPool(mock_client) as pool:
+        pool.put(_transfer().set_transaction_valid_duration(10))
+
+        with pytest.raises(ValueError, match="too short for the pool's refresh_margin"):
+            pool.take(timeout=5)
+
+
+def test_put_validates_transactions(mock_client):
+    """Frozen, multi-chunk and non-transaction inputs are rejected."""
+    pool = PresignedPool(mock_client)
+
+    with pytest.raises(TypeError, match="transaction must be a Transaction"):
+        pool.put("transfer")
+
+    with pytest.raises(TypeError, match="signing keys must be PrivateKeys, Signers or AsyncSigners, got str"):
+        pool.put(_transfer(), signing_keys=["key"])
+
+    with pytest.raises(ValueError, match="must not be frozen"):
+        pool.put(_transfer().freeze_with(mock_client))
+
+    chunked = TopicMessageSubmitTransaction().set_topic_id(TopicId(0, 0, 1)).set_message("x" * 3000)
+    with pytest.raises(ValueError, match="multi-chunk transactions cannot be pre-signed"):
+        pool.put(chunked)
+
+    pool.close()
+    with pytest.raises(RuntimeError, match="closed"):
+        pool.put(_transfer())
+
+
+def test_take_times_out_when_nothing_is_queued(mock_client):
+    """take raises TimeoutError when no transaction becomes ready in time."""
+    with PresignedPool(mock_client) as pool, pytest.raises(TimeoutError):
+        pool.take(timeout=0.05)
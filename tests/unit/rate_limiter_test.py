@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from hiero_sdk_python.account.account_create_transaction import AccountCreateTransaction
+from hiero_sdk_python.crypto.private_key import PrivateKey
+from hiero_sdk_python.executable import _acquire_rate_limits
+from hiero_sdk_python.hapi.services.transaction_response_pb2 import (
+    TransactionResponse as TransactionResponseProto,
+)
+from hiero_sdk_python.metrics import RATE_LIMIT_TPS, InMemoryMetricsSink
+from hiero_sdk_python.rate_limiter import AdaptiveRateLimiter
+from hiero_sdk_python.response_code import ResponseCode
+from tests.unit.mock_server import mock_hedera_servers
+
+
+pytestmark = pytest.mark.unit
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket_holds_one_second_of_tokens():
+    """A full bucket allows max_tps requests at once, then refills at the current rate."""
+    clock = _FakeClock()
+    limiter = AdaptiveRateLimiter(10, clock=clock)
+
+    assert all(limiter.try_acquire() for _ in range(10))
+    assert not limiter.try_acquire()
+
+    clock.now += 0.25
+    assert limiter.try_acquire()
+    assert limiter.try_acquire()
+    assert not limiter.try_acquire()
+
+
+def test_throttles_decrease_multiplicatively_and_successes_increase_additively():
+    """Throttles halve the rate once per cooldown down to min_tps; successes grow it back up to max_tps."""
+    clock = _FakeClock()
+    limiter = AdaptiveRateLimiter(8, min_tps=2, decrease_cooldown=1, clock=clock)
+
+    assert limiter.on_throttle()
+    assert not limiter.on_throttle()
+    assert limiter.rate == 4
+
+    clock.now += 1
+    assert limiter.on_throttle()
+    clock.now += 1
+    assert limiter.on_throttle()
+    assert limiter.rate == 2
+
+    limiter.on_success()
+    assert limiter.rate == 2.5
+    for _ in range(100):
+        limiter.on_success()
+    assert limiter.rate == 8
+
+
+def test_acquire_gives_up_at_the_timeout():
+    """acquire waits for a token and returns False when none arrives in time."""
+    limiter = AdaptiveRateLimiter(1)
+    assert limiter.acquire(timeout=0)
+    assert not limiter.acquire(timeout=0.01)
+
+    with pytest.raises(ValueError, match="min_tps cannot exceed max_tps"):
+        AdaptiveRateLimiter(1, min_tps=2)
+
+
+def test_failed_acquisition_gives_back_the_tokens_it_took():
+    """When one limiter times out, the tokens already taken from the others are returned."""
+    clock = _FakeClock()
+    client_limiter = AdaptiveRateLimiter(2, clock=clock)
+    node_limiter = AdaptiveRateLimiter(1, clock=clock)
+    assert node_limiter.try_acquire()
+
+    assert not _acquire_rate_limits([client_limiter, node_limiter], timeout=0)
+    assert client_limiter.try_acquire()
+    assert client_limiter.try_acquire()
+    assert not client_limiter.try_acquire()
+
+    client_limiter.release()
+    client_limiter.release()
+    client_limiter.release()
+    assert client_limiter.try_acquire()
+    assert client_limiter.try_acquire()
+    assert not client_limiter.try_acquire()
+
+
+def test_node_limiter_is_waited_for_before_the_client_limiter(mock_client):
+    """Attempts take the node's token first, so a throttled node holds no client-wide token while waiting."""
+    mock_client.set_max_tps(10, node_max_tps=4)
+    node = mock_client.network.nodes[0]
+
+    limiters = AccountCreateTransaction()._rate_limiters(mock_client, node)
+
+    assert limiters == [node._rate_limiter, mock_client.rate_limiter]
+
+
+def test_set_max_tps_is_validated(mock_client):
+    """Limits must be positive numbers; None removes the client and node limiters."""
+    with pytest.raises(TypeError, match="max_tps must be of type Union\\[int, float\\], got str"):
+        mock_client.set_max_tps("10")
+    with pytest.raises(ValueError, match="node_max_tps must be a finite value greater than 0"):
+        mock_client.set_max_tps(10, node_max_tps=0)
+
+    assert mock_client.set_max_tps(10, node_max_tps=4) is mock_client
+    assert mock_client.rate_limiter.max_tps == 10
+    assert mock_client.network.nodes[0]._rate_limiter.max_tps == 4
+
+    mock_client.set_max_tps(None)
+    assert mock_client.rate_limiter is None
+    assert mock_client.network.nodes[0]._rate_limiter is None
+
+
+def test_busy_response_slows_down_the_client_and_node():
+    """A BUSY precheck shrinks both limiters, and their rates are published as gauges."""
+    busy_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.BUSY)
+    ok_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.OK)
+
+    with (
+        mock_hedera_servers([[busy_response, ok_response]]) as client,
+        patch("hiero_sdk_python.executable.time.sleep"),
+    ):
+        sink = InMemoryMetricsSink()
+        client.set_metrics_sink(sink).set_max_tps(100, node_max_tps=50)
+
+        (
+            AccountCreateTransaction()
+            .set_key_without_alias(PrivateKey.generate().public_key())
+            .set_initial_balance(1)
+            .execute(client, wait_for_receipt=False)
+        )
+        node_limiter = client.network.nodes[0]._rate_limiter
+
+    assert 50 < client.rate_limiter.rate < 100
+    assert 25 < node_limiter.rate < 50
+
+    snapshot = sink.snapshot()
+    assert snapshot.gauge(RATE_LIMIT_TPS, scope="client") == client.rate_limiter.rate
+    assert snapshot.gauge(RATE_LIMIT_TPS, scope="node", node="0.0.3") == node_limiter.rate
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from hiero_sdk_python.account.account_id import AccountId
+from hiero_sdk_python.crypto.private_key import PrivateKey
+from hiero_sdk_python.crypto.signer import AsyncLocalSigner, LocalSigner, Signer, sign_many
+from hiero_sdk_python.crypto.signing_backend import InProcessSigningBackend
+from hiero_sdk_python.hapi.services import (
+    response_header_pb2,
+    response_pb2,
+    transaction_contents_pb2,
+    transaction_get_receipt_pb2,
+)
+from hiero_sdk_python.hapi.services.transaction_receipt_pb2 import (
+    TransactionReceipt as TransactionReceiptProto,
+)
+from hiero_sdk_python.hapi.services.transaction_response_pb2 import (
+    TransactionResponse as TransactionResponseProto,
+)
+from hiero_sdk_python.hbar import Hbar
+from hiero_sdk_python.query.account_info_query import AccountInfoQuery
+from hiero_sdk_python.response_code import ResponseCode
+from hiero_sdk_python.transaction.transfer_transaction import TransferTransaction
+from tests.unit.mock_server import mock_hedera_servers
+
+
+pytestmark = pytest.mark.unit
+
+NODES = [AccountId(0, 0, 3), AccountId(0, 0, 4), AccountId(0, 0, 5)]
+
+
+def _transfer(client, amount=1):
+    return (
+        TransferTransaction()
+        .add_hbar_transfer(AccountId(0, 0, 1001), -amount)
+        .add_hbar_transfer(AccountId(0, 0, 1002), amount)
+        .set_node_account_ids(NODES)
+        .freeze_with(client)
+    )
+
+
+def _assert_signed(transaction, public_key):
+    for body_bytes, signature_map in transaction._signature_map.items():
+        (pair,) = [pair for pair in signature_map.sigPair if pair.pubKeyPrefix == public_key.to_bytes_raw()]
+        signature = pair.ed25519 if public_key.is_ed25519() else pair.ECDSA_secp256k1
+        public_key.verify(signature, body_bytes)
+
+
+class _ShortSigner(Signer):
+    def public_key(self):
+        return PrivateKey.generate().public_key()
+
+    def sign_many(self, messages):  # noqa: ARG002
+        return [b"signature"]
+
+
+@pytest.mark.parametrize("key_type", ["ed25519", "ecdsa"])
+def test_signer_signs_all_node_bodies_in_one_call(mock_client, key_type):
+    """A Signer receives every node body of a transaction in a single request."""
+    signer = LocalSigner(PrivateKey.generate(key_type))
+    transaction = _transfer(mock_client)
+
+    transaction.sign(signer)
+    transaction.sign(signer)
+
+    assert signer.calls == 1
+    assert len(transaction._signature_map) == len(NODES)
+    assert transaction.is_signed_by(signer.public_key())
+    _assert_signed(transaction, signer.public_key())
+
+
+def test_async_signer_from_sync_code_and_inside_an_event_loop(mock_client):
+    """An AsyncSigner can sign from plain code and from code already running in an event loop."""
+    signer = AsyncLocalSigner(PrivateKey.generate(), latency=0.01)
+    first = _transfer(mock_client, 1)
+    second = _transfer(mock_client, 2)
+
+    first.sign(signer)
+
+    async def sign_in_loop():
+        second.sign(signer)
+
+    asyncio.run(sign_in_loop())
+
+    assert signer.calls == 2
+    _assert_signed(first, signer.public_key())
+    _assert_signed(second, signer.public_key())
+
+
+def test_sign_transactions_makes_one_request_per_signer(mock_client):
+    """Batch signing sends the bodies of all transactions to a signer at once."""
+    signer = LocalSigner(PrivateKey.generate())
+    transactions = [_transfer(mock_client, amount) for amount in range(1, 11)]
+
+    InProcessSigningBackend().sign_transactions(transactions, [signer])
+
+    assert signer.calls == 1
+    for transaction in transactions:
+        _assert_signed(transaction, signer.public_key())
+
+
+def test_signer_returning_the_wrong_number_of_signatures():
+    """A signer that does not return one signature per message is rejected."""
+    with pytest.raises(ValueError, match="returned 1 signatures for 2 messages"):
+        sign_many(_ShortSigner(), [b"first", b"second"])
+
+
+def test_no_request_without_messages():
+    """Nothing is sent to a signer when there is nothing to sign."""
+    signer = LocalSigner(PrivateKey.generate())
+
+    assert sign_many(signer, []) == []
+    assert signer.calls == 0
+
+
+def test_latency_validation():
+    """Fake signers reject negative latencies."""
+    with pytest.raises(ValueError, match="latency must be non-negative"):
+        LocalSigner(PrivateKey.generate(), latency=-1)
+
+    with pytest.raises(ValueError, match="latency must be non-negative"):
+        AsyncLocalSigner(PrivateKey.generate(), latency=-1)
+
+
+def test_operator_signer_signs_executed_transactions():
+    """A Signer set as the operator key signs transactions on execute."""
+    ok_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.OK)
+    receipt_response = response_pb2.Response(
+        transactionGetReceipt=transaction_get_receipt_pb2.TransactionGetReceiptResponse(
+            header=response_header_pb2.ResponseHeader(nodeTransactionPrecheckCode=ResponseCode.OK),
+            receipt=TransactionReceiptProto(status=ResponseCode.SUCCESS),
+        )
+    )
+
+    with mock_hedera_servers([[ok_response, receipt_response]]) as client:
+        signer = LocalSigner(PrivateKey.generate())
+        client.set_operator(client.operator_account_id, signer)
+
+        transaction = (
+            TransferTransaction()
+            .add_hbar_transfer(AccountId(0, 0, 1001), -1)
+            .add_hbar_transfer(AccountId(0, 0, 1002), 1)
+        )
+        receipt = transaction.execute(client)
+
+    assert receipt.status == ResponseCode.SUCCESS
+    assert signer.calls == 1
+    _assert_signed(transaction, signer.public_key())
+
+
+@pytest.mark.parametrize("key_type", ["ed25519", "ecdsa"])
+def test_query_payment_signed_by_signer(key_type):
+    """Query payments are signed through the payer's Signer."""
+    signer = LocalSigner(PrivateKey.generate(key_type))
+
+    payment = AccountInfoQuery()._build_query_payment_transaction(
+        AccountId(0, 0, 1984), signer, AccountId(0, 0, 3), Hbar(1)
+    )
+
+    signed = transaction_contents_pb2.SignedTransaction.FromString(payment.signedTransactionBytes)
+    (pair,) = signed.sigMap.sigPair
+    assert signer.calls == 1
+    assert pair.pubKeyPrefix == signer.public_key().to_bytes_raw()
+    signature = pair.ed25519 if key_type == "ed25519" else pair.ECDSA_secp256k1
+    signer.public_key().verify(signature, signed.bodyBytes)
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import pytest
+
+from hiero_sdk_python.account.account_id import AccountId
+from hiero_sdk_python.crypto.private_key import PrivateKey
+from hiero_sdk_python.crypto.signing_backend import (
+    InProcessSigningBackend,
+    ProcessPoolSigningBackend,
+    SigningBackend,
+)
+from hiero_sdk_python.transaction.transfer_transaction import TransferTransaction
+
+
+pytestmark = pytest.mark.unit
+
+BODIES = [f"body-{index}".encode() for index in range(10)]
+
+
+class _CountingBackend(InProcessSigningBackend):
+    def __init__(self):
+        self.batches = []
+
+    def sign_bodies(self, private_key, bodies):
+        self.batches.append(len(bodies))
+        return super().sign_bodies(private_key, bodies)
+
+
+def _transfer(client, amount=1):
+    return (
+        TransferTransaction()
+        .add_hbar_transfer(AccountId(0, 0, 1001), -amount)
+        .add_hbar_transfer(AccountId(0, 0, 1002), amount)
+        .freeze_with(client)
+    )
+
+
+def _assert_valid(private_key, bodies, pairs):
+    public_key = private_key.public_key()
+    assert len(pairs) == len(bodies)
+    for body, pair in zip(bodies, pairs, strict=True):
+        assert pair.pubKeyPrefix == public_key.to_bytes_raw()
+        signature = pair.ed25519 if private_key.is_ed25519() else pair.ECDSA_secp256k1
+        public_key.verify(signature, body)
+
+
+@pytest.mark.parametrize("key_type", ["ed25519", "ecdsa"])
+def test_in_process_backend_signs_each_body(key_type):
+    """The in-process backend returns one valid signature pair per body, in order."""
+    private_key = PrivateKey.generate(key_type)
+
+    pairs = InProcessSigningBackend().sign_bodies(private_key, BODIES)
+
+    _assert_valid(private_key, BODIES, pairs)
+
+
+@pytest.mark.parametrize("key_type", ["ed25519", "ecdsa"])
+def test_process_pool_backend_signs_with_registered_and_other_keys(key_type):
+    """Worker processes sign with keys loaded at start-up and with keys sent along with a batch."""
+    registered = PrivateKey.generate(key_type)
+    other = PrivateKey.generate(key_type)
+
+    backend = ProcessPoolSigningBackend(max_workers=2, keys=[registered], min_parallel_batch=1)
+    try:
+        _assert_valid(registered, BODIES, backend.sign_bodies(registered, BODIES))
+        _assert_valid(other, BODIES, backend.sign_bodies(other, BODIES))
+    finally:
+        backend.close()
+
+
+def test_process_pool_backend_signs_small_batches_in_process():
+    """Batches below min_parallel_batch never reach the worker processes."""
+    private_key = PrivateKey.generate()
+    backend = ProcessPoolSigningBackend(max_workers=2, min_parallel_batch=100)
+    try:
+        pairs = backend.sign_bodies(private_key, BODIES)
+        assert not backend._executor._processes
+    finally:
+        backend.close()
+
+    _assert_valid(private_key, BODIES, pairs)
+
+
+def test_process_pool_backend_validation():
+    """Worker counts and batch thresholds below one are rejected."""
+    with pytest.raises(ValueError, match="max_workers must be >= 1"):
+        ProcessPoolSigningBackend(max_workers=0)
+
+    with pytest.raises(ValueError, match="min_parallel_batch must be >= 1"):
+        ProcessPoolSigningBackend(min_parallel_batch=0)
+
+
+def test_sign_transactions_batches_per_key_and_skips_signed_bodies(mock_client):
+    """Every node body of every transaction is signed in one batch per key, without duplicates."""
+    first_key = PrivateKey.generate()
+    second_key = PrivateKey.generate_ecdsa()
+    transactions = [_transfer(mock_client, amount) for amount in range(1, 6)]
+    transactions[0].sign(first_key)
+    body_count = sum(len(transaction._transaction_body_bytes) for transaction in transactions)
+
+    backend = _CountingBackend()
+    backend.sign_transactions(transactions, [first_key, second_key])
+
+    first_body_count = len(transactions[0]._transaction_body_bytes)
+    assert backend.batches == [body_count - first_body_count, body_count]
+    for transaction in transactions:
+        assert transaction.is_signed_by(first_key.public_key())
+        assert transaction.is_signed_by(second_key.public_key())
+        for signature_map in transaction._signature_map.values():
+            assert len(signature_map.sigPair) == 2
+
+
+def test_sign_transactions_requires_frozen_transactions():
+    """Unfrozen transactions are rejected before anything is signed."""
+    transaction = TransferTransaction().add_hbar_transfer(AccountId(0, 0, 1001), -1)
+
+    with pytest.raises(Exception, match="not frozen"):
+        InProcessSigningBackend().sign_transactions([transaction], [PrivateKey.generate()])
+
+
+def test_transactions_sign_with_the_client_backend(mock_client):
+    """A transaction frozen with a client signs through that client's backend, once per key."""
+    backend = _CountingBackend()
+    mock_client.set_signing_backend(backend)
+    private_key = PrivateKey.generate()
+
+    transaction = _transfer(mock_client)
+    transaction.sign(private_key)
+    transaction.sign(private_key)
+
+    assert backend.batches == [len(transaction._transaction_body_bytes), 0]
+    assert transaction.is_signed_by(private_key.public_key())
+
+
+def test_set_signing_backend(mock_client):
+    """set_signing_backend validates its argument and None restores the in-process default."""
+    backend = _CountingBackend()
+    assert mock_client.set_signing_backend(backend) is mock_client
+    assert mock_client.signing_backend is backend
+
+    mock_client.set_signing_backend(None)
+    assert isinstance(mock_client.signing_backend, InProcessSigningBackend)
+
+    with pytest.raises(TypeError, match="backend must be of type SigningBackend"):
+        mock_client.set_signing_backend(object())
+
+    assert issubclass(ProcessPoolSigningBackend, SigningBackend)
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+from opentelemetry.sdk import trace as otel_sdk_trace
+from opentelemetry.sdk.trace import export as otel_export
+from opentelemetry.sdk.trace.export import in_memory_span_exporter as otel_in_memory
+
+from hiero_sdk_python import tracing
+from hiero_sdk_python.account.account_create_transaction import AccountCreateTransaction
+from hiero_sdk_python.crypto.private_key import PrivateKey
+from hiero_sdk_python.hapi.services import (
+    response_header_pb2,
+    response_pb2,
+    transaction_get_receipt_pb2,
+    transaction_receipt_pb2,
+)
+from hiero_sdk_python.hapi.services.transaction_response_pb2 import (
+    TransactionResponse as TransactionResponseProto,
+)
+from hiero_sdk_python.response_code import ResponseCode
+from tests.unit.mock_server import mock_hedera_servers
+
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def exporter(monkeypatch):
+    """Route the SDK's spans to an in-memory exporter for the duration of a test."""
+    span_exporter = otel_in_memory.InMemorySpanExporter()
+    provider = otel_sdk_trace.TracerProvider()
+    provider.add_span_processor(otel_export.SimpleSpanProcessor(span_exporter))
+
+    monkeypatch.setattr(tracing.otel_trace, "get_tracer_provider", lambda: provider)
+    yield span_exporter
+    provider.shutdown()
+
+
+def _spans_by_name(exporter, name):
+    return [span for span in exporter.get_finished_spans() if span.name == name]
+
+
+def _account_create():
+    return AccountCreateTransaction().set_key_without_alias(PrivateKey.generate().public_key()).set_initial_balance(1)
+
+
+def test_hooks_are_noop_without_provider():
+    """Without a registered SDK provider the hooks yield no span."""
+    assert tracing._get_tracer() is None
+
+    with tracing._span(tracing.SPAN_FREEZE, {tracing.ATTR_NODE: "0.0.3"}) as span:
+        assert span is None
+
+    assert tracing._start_span(tracing.SPAN_GRPC_CALL) is None
+    tracing._end_span(None, {tracing.ATTR_STATUS: "OK"})
+
+
+def test_hooks_are_noop_without_opentelemetry(monkeypatch):
+    """The hooks degrade to no-ops when opentelemetry is not installed."""
+    monkeypatch.setattr(tracing, "otel_trace", None)
+
+    with tracing._span(tracing.SPAN_SIGN) as span:
+        assert span is None
+
+
+def test_span_attributes_are_cleaned(exporter):
+    """Enums are exported by name, arbitrary objects as strings and None values are dropped."""
+    with tracing._span(tracing.SPAN_SIGN, {tracing.ATTR_STATUS: ResponseCode.BUSY, tracing.ATTR_NODE: None}) as span:
+        tracing._set_attributes(span, {tracing.ATTR_TRANSACTION_ID: object.__new__(object)})
+
+    (span,) = _spans_by_name(exporter, tracing.SPAN_SIGN)
+    assert span.attributes[tracing.ATTR_STATUS] == "BUSY"
+    assert tracing.ATTR_NODE not in span.attributes
+    assert isinstance(span.attributes[tracing.ATTR_TRANSACTION_ID], str)
+
+
+def test_execute_emits_nested_spans(exporter):
+    """Freeze, sign, gRPC attempts, backoff and receipt spans nest under the execute span."""
+    busy_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.BUSY)
+    ok_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.OK)
+    receipt_response = response_pb2.Response(
+        transactionGetReceipt=transaction_get_receipt_pb2.TransactionGetReceiptResponse(
+            header=response_header_pb2.ResponseHeader(nodeTransactionPrecheckCode=ResponseCode.OK),
+            receipt=transaction_receipt_pb2.TransactionReceipt(status=ResponseCode.SUCCESS),
+        )
+    )
+
+    with (
+        mock_hedera_servers([[busy_response, ok_response, receipt_response]]) as client,
+        patch("hiero_sdk_python.executable.time.sleep"),
+    ):
+        transaction = _account_create().freeze_with(client)
+        receipt = transaction.execute(client)
+
+    assert receipt.status == ResponseCode.SUCCESS
+
+    (execute_span,) = _spans_by_name(exporter, tracing.SPAN_EXECUTE)
+    (freeze_span,) = _spans_by_name(exporter, tracing.SPAN_FREEZE)
+    (sign_span,) = _spans_by_name(exporter, tracing.SPAN_SIGN)
+    (backoff_span,) = _spans_by_name(exporter, tracing.SPAN_BACKOFF)
+    (receipt_span,) = _spans_by_name(exporter, tracing.SPAN_RECEIPT)
+    grpc_spans = _spans_by_name(exporter, tracing.SPAN_GRPC_CALL)
+
+    assert freeze_span.attributes[tracing.ATTR_TRANSACTION_TYPE] == "AccountCreateTransaction"
+    assert len(_spans_by_name(exporter, tracing.SPAN_BUILD_BODY)) == freeze_span.attributes[tracing.ATTR_NODE_COUNT]
+
+    assert execute_span.attributes[tracing.ATTR_TRANSACTION_ID] == str(transaction.transaction_id)
+    assert sign_span.parent.span_id == execute_span.context.span_id
+    assert receipt_span.parent.span_id == execute_span.context.span_id
+    assert receipt_span.attributes[tracing.ATTR_STATUS] == "SUCCESS"
+
+    # Two transaction attempts plus the receipt query attempt
+    assert len(grpc_spans) == 3
+    first, second = (span for span in grpc_spans if span.parent.span_id == execute_span.context.span_id)
+    assert first.attributes[tracing.ATTR_ATTEMPT] == 1
+    assert first.attributes[tracing.ATTR_STATUS] == "BUSY"
+    assert first.attributes[tracing.ATTR_EXECUTION_STATE] == "RETRY"
+    assert first.attributes[tracing.ATTR_NODE] == "0.0.3"
+    assert second.attributes[tracing.ATTR_ATTEMPT] == 2
+    assert second.attributes[tracing.ATTR_EXECUTION_STATE] == "FINISHED"
+    assert backoff_span.attributes[tracing.ATTR_ATTEMPT] == 1
+
+
+def test_grpc_span_records_error(exporter):
+    """A failing attempt marks its gRPC span as an error."""
+    error_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.INVALID_SIGNATURE)
+
+    with mock_hedera_servers([[error_response]]) as client, pytest.raises(Exception, match="INVALID_SIGNATURE"):
+        _account_create().execute(client, wait_for_receipt=False)
+
+    (grpc_span,) = _spans_by_name(exporter, tracing.SPAN_GRPC_CALL)
+    (execute_span,) = _spans_by_name(exporter, tracing.SPAN_EXECUTE)
+
+    assert grpc_span.attributes[tracing.ATTR_EXECUTION_STATE] == "ERROR"
+    assert not execute_span.status.is_ok
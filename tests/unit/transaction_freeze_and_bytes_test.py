@@ -8,15 +8,25 @@ and expected behavior.
 
 from __future__ import annotations
 
+import grpc
 import pytest
 
 from hiero_sdk_python.account.account_id import AccountId
 from hiero_sdk_python.crypto.private_key import PrivateKey
+from hiero_sdk_python.hapi.sdk import transaction_list_pb2
+from hiero_sdk_python.hapi.services import transaction_contents_pb2, transaction_pb2
 from hiero_sdk_python.hapi.services.transaction_response_pb2 import (
     TransactionResponse as TransactionResponseProto,
 )
+from hiero_sdk_python.prng_transaction import PrngTransaction
+from hiero_sdk_python.response_code import ResponseCode
+from hiero_sdk_python.tokens.token_id import TokenId
+from hiero_sdk_python.tokens.token_pause_transaction import TokenPauseTransaction
+from hiero_sdk_python.transaction import transaction as transaction_module
+from hiero_sdk_python.transaction.transaction import Transaction
 from hiero_sdk_python.transaction.transaction_id import TransactionId
 from hiero_sdk_python.transaction.transfer_transaction import TransferTransaction
+from tests.unit.mock_server import RealRpcError, mock_hedera_servers
 
 
 pytestmark = pytest.mark.unit
@@ -687,3 +697,213 @@ def test_map_response_raises_if_proto_request_is_not_transaction():
             node_id=mock_node_id,
             proto_request=invalid_proto_request,
         )
+
+
+def _frozen_transfer(amount: int = 100_000_000) -> TransferTransaction:
+    operator_id = AccountId.from_string("0.0.1234")
+    transaction = (
+        TransferTransaction()
+        .add_hbar_transfer(operator_id, -amount)
+        .add_hbar_transfer(AccountId.from_string("0.0.5678"), amount)
+    )
+    transaction.transaction_id = TransactionId.generate(operator_id)
+    transaction.set_node_account_ids([AccountId.from_string("0.0.3")])
+    return transaction.freeze()
+
+
+def test_transaction_registry_covers_known_body_fields():
+    """Every known TransactionBody field resolves to a class registered under that field."""
+    body_fields = {field.name for field in transaction_pb2.TransactionBody.DESCRIPTOR.oneofs_by_name["data"].fields}
+
+    for body_field in transaction_module._TRANSACTION_MODULES:
+        assert body_field in body_fields
+
+        transaction_class = Transaction._get_transaction_class(body_field)
+
+        assert issubclass(transaction_class, Transaction)
+        assert transaction_class._proto_body_field == body_field
+        assert transaction_module._TRANSACTION_CLASSES[body_field] is transaction_class
+
+
+def test_transaction_registry_unknown_type_returns_none():
+    """Body fields without an SDK class are reported as unknown."""
+    assert Transaction._get_transaction_class("cryptoAddLiveHash") is None
+
+    body = transaction_pb2.TransactionBody()
+    body.cryptoAddLiveHash.SetInParent()
+    signed_transaction = transaction_contents_pb2.SignedTransaction(bodyBytes=body.SerializeToString())
+    transaction_bytes = transaction_pb2.Transaction(
+        signedTransactionBytes=signed_transaction.SerializeToString()
+    ).SerializeToString()
+
+    with pytest.raises(ValueError, match="Unknown transaction type: cryptoAddLiveHash"):
+        Transaction.from_bytes(transaction_bytes)
+
+
+def test_subclass_registration_overrides_body_field(monkeypatch):
+    """A subclass declaring `_proto_body_field` is returned by from_bytes for that field."""
+    monkeypatch.setattr(transaction_module, "_TRANSACTION_CLASSES", dict(transaction_module._TRANSACTION_CLASSES))
+
+    class AuditedTransferTransaction(TransferTransaction):
+        _proto_body_field = "cryptoTransfer"
+
+    class PlainSubclass(TransferTransaction):
+        pass
+
+    restored = Transaction.from_bytes(_frozen_transfer().to_bytes())
+
+    assert type(restored) is AuditedTransferTransaction
+    assert PlainSubclass not in transaction_module._TRANSACTION_CLASSES.values()
+
+
+@pytest.mark.parametrize(
+    "transaction",
+    [
+        TokenPauseTransaction().set_token_id(TokenId(0, 0, 42)),
+        PrngTransaction().set_range(10),
+    ],
+)
+def test_from_bytes_restores_snake_case_body_fields(transaction):
+    """Types whose TransactionBody field is snake_case round-trip through from_bytes."""
+    transaction.transaction_id = TransactionId.generate(AccountId.from_string("0.0.1234"))
+    transaction.set_node_account_ids([AccountId.from_string("0.0.3")])
+    transaction.freeze()
+
+    restored = Transaction.from_bytes(transaction.to_bytes())
+
+    assert type(restored) is type(transaction)
+    assert restored.transaction_id == transaction.transaction_id
+
+
+def test_from_bytes_many_round_trip():
+    """from_bytes_many restores every transaction in order."""
+    private_key = PrivateKey.generate()
+    transactions = [_frozen_transfer(amount).sign(private_key) for amount in (1, 2, 3)]
+
+    restored = Transaction.from_bytes_many(transaction.to_bytes() for transaction in transactions)
+
+    assert [type(transaction) for transaction in restored] == [TransferTransaction] * 3
+    assert [transaction.hbar_transfers[1].amount for transaction in restored] == [1, 2, 3]
+    assert [transaction.to_bytes() for transaction in restored] == [
+        transaction.to_bytes() for transaction in transactions
+    ]
+
+
+def test_from_bytes_many_reports_failing_index():
+    """from_bytes_many names the index of the element that failed to parse."""
+    valid_bytes = _frozen_transfer().to_bytes()
+
+    with pytest.raises(ValueError, match="Transaction at index 2: transaction_bytes cannot be empty"):
+        Transaction.from_bytes_many([valid_bytes, valid_bytes, b""])
+
+    assert Transaction.from_bytes_many([]) == []
+
+
+def _frozen_multi_node_transfer(node_ids: list[AccountId]) -> TransferTransaction:
+    operator_id = AccountId.from_string("0.0.1234")
+    transaction = (
+        TransferTransaction()
+        .add_hbar_transfer(operator_id, -100_000_000)
+        .add_hbar_transfer(AccountId.from_string("0.0.5678"), 100_000_000)
+    )
+    transaction.transaction_id = TransactionId.generate(operator_id)
+    transaction.set_node_account_ids(node_ids)
+    return transaction.freeze()
+
+
+def test_from_bytes_many_restores_multi_node_transactions():
+    """from_bytes_many restores TransactionList bytes with the body of every node."""
+    node_ids = [AccountId(0, 0, 3), AccountId(0, 0, 4), AccountId(0, 0, 5)]
+    private_key = PrivateKey.generate()
+    transactions = [_frozen_multi_node_transfer(node_ids).sign(private_key) for _ in range(2)]
+
+    restored = Transaction.from_bytes_many([transaction.to_bytes() for transaction in transactions])
+
+    assert [transaction.to_bytes() for transaction in restored] == [
+        transaction.to_bytes() for transaction in transactions
+    ]
+    for transaction in restored:
+        assert len(transaction._transaction_body_bytes) == len(node_ids)
+        assert transaction.is_signed_by(private_key.public_key())
+
+
+def test_single_node_to_bytes_is_a_transaction():
+    """A transaction frozen for one node keeps serializing to a plain Transaction message."""
+    transaction_bytes = _frozen_transfer().to_bytes()
+
+    assert not transaction_list_pb2.TransactionList.FromString(transaction_bytes).transaction_list
+    assert transaction_pb2.Transaction.FromString(transaction_bytes).signedTransactionBytes
+
+
+def test_multi_node_to_bytes_emits_transaction_list():
+    """A transaction frozen for several nodes serializes every node body with its signatures."""
+    node_ids = [AccountId(0, 0, 3), AccountId(0, 0, 4), AccountId(0, 0, 5)]
+    private_key = PrivateKey.generate()
+    transaction = _frozen_multi_node_transfer(node_ids).sign(private_key)
+
+    transaction_list = transaction_list_pb2.TransactionList.FromString(transaction.to_bytes())
+
+    assert len(transaction_list.transaction_list) == 3
+    for node_id, transaction_proto in zip(node_ids, transaction_list.transaction_list, strict=True):
+        signed_transaction = transaction_contents_pb2.SignedTransaction.FromString(
+            transaction_proto.signedTransactionBytes
+        )
+        body = transaction_pb2.TransactionBody.FromString(signed_transaction.bodyBytes)
+
+        assert AccountId._from_proto(body.nodeAccountID) == node_id
+        assert signed_transaction.bodyBytes == transaction._transaction_body_bytes[node_id]
+        assert len(signed_transaction.sigMap.sigPair) == 1
+
+
+def test_multi_node_from_bytes_restores_every_node():
+    """from_bytes restores every node body and signature, and re-serializes identically."""
+    node_ids = [AccountId(0, 0, 3), AccountId(0, 0, 4), AccountId(0, 0, 5)]
+    first_key, second_key = PrivateKey.generate(), PrivateKey.generate()
+    transaction = _frozen_multi_node_transfer(node_ids).sign(first_key)
+
+    restored = Transaction.from_bytes(transaction.to_bytes())
+    restored.sign(second_key)
+
+    assert type(restored) is TransferTransaction
+    assert restored._node_account_ids.get_list() == node_ids
+    assert restored._transaction_body_bytes == transaction._transaction_body_bytes
+    assert restored.is_signed_by(first_key.public_key())
+    for body_bytes in restored._transaction_body_bytes.values():
+        assert len(restored._signature_map[body_bytes].sigPair) == 2
+
+    transaction.sign(second_key)
+    assert restored.to_bytes() == transaction.to_bytes()
+
+
+def test_multi_node_from_bytes_rejects_mismatched_transactions():
+    """All entries of a TransactionList must belong to the same transaction."""
+    first = _frozen_transfer()
+
+    transaction_list = transaction_list_pb2.TransactionList(transaction_list=[first._to_proto(), first._to_proto()])
+    with pytest.raises(ValueError, match="Duplicate transaction body for node 0.0.3"):
+        Transaction.from_bytes(transaction_list.SerializeToString())
+
+    other = _frozen_multi_node_transfer([AccountId(0, 0, 4)])
+    transaction_list = transaction_list_pb2.TransactionList(transaction_list=[first._to_proto(), other._to_proto()])
+    with pytest.raises(ValueError, match="same type and transaction ID"):
+        Transaction.from_bytes(transaction_list.SerializeToString())
+
+
+def test_restored_multi_node_transaction_fails_over():
+    """A transaction restored from a TransactionList can still move to another node on failure."""
+    error = RealRpcError(grpc.StatusCode.UNAVAILABLE, "unavailable")
+    ok_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.OK)
+
+    with mock_hedera_servers([[error], [ok_response]]) as client:
+        transaction = (
+            TransferTransaction()
+            .add_hbar_transfer(client.operator_account_id, -1)
+            .add_hbar_transfer(AccountId.from_string("0.0.5678"), 1)
+            .freeze_with(client)
+            .sign(client.operator_private_key)
+        )
+
+        restored = Transaction.from_bytes(transaction.to_bytes())
+        response = restored.execute(client, wait_for_receipt=False)
+
+    assert response.node_id == AccountId(0, 0, 4)
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from hiero_sdk_python.account.account_id import AccountId
+from hiero_sdk_python.consensus.topic_id import TopicId
+from hiero_sdk_python.consensus.topic_message_submit_transaction import TopicMessageSubmitTransaction
+from hiero_sdk_python.transaction.transaction_id_allocator import TransactionIdAllocator
+
+
+pytestmark = pytest.mark.unit
+
+PAYER = AccountId(0, 0, 1984)
+NOW = 1_700_000_000_000_000_000
+
+
+def _nanos(transaction_id):
+    return transaction_id.valid_start.seconds * 1_000_000_000 + transaction_id.valid_start.nanos
+
+
+def test_ids_are_offset_from_the_clock():
+    """The first ID starts valid_start_offset seconds before the clock."""
+    allocator = TransactionIdAllocator(valid_start_offset=5, clock=lambda: NOW)
+
+    transaction_id = allocator.generate(PAYER)
+
+    assert transaction_id.account_id == PAYER
+    assert _nanos(transaction_id) == NOW - 5_000_000_000
+
+
+def test_ids_increase_when_the_clock_does_not():
+    """With a frozen clock, successive IDs are one nanosecond apart."""
+    allocator = TransactionIdAllocator(clock=lambda: NOW)
+
+    starts = [_nanos(allocator.generate(PAYER)) for _ in range(1000)]
+
+    assert starts == list(range(starts[0], starts[0] + 1000))
+
+
+def test_payers_are_allocated_independently():
+    """Each payer has its own sequence."""
+    allocator = TransactionIdAllocator(clock=lambda: NOW)
+
+    first = allocator.generate(PAYER)
+    other = allocator.generate(AccountId(0, 0, 1985))
+
+    assert first.valid_start == other.valid_start
+    assert first != other
+
+
+def test_generate_many_reserves_a_contiguous_block():
+    """A reserved block is contiguous and later IDs start after it."""
+    allocator = TransactionIdAllocator(clock=lambda: NOW)
+
+    block = allocator.generate_many(PAYER, 100_000)
+    following = allocator.generate(PAYER)
+
+    starts = [_nanos(transaction_id) for transaction_id in block]
+    assert starts == list(range(starts[0], starts[0] + 100_000))
+    assert _nanos(following) == starts[-1] + 1
+
+
+def test_ids_are_unique_across_threads():
+    """IDs generated concurrently from many threads never collide."""
+    allocator = TransactionIdAllocator()
+    barrier = threading.Barrier(16)
+    results = [[] for _ in range(16)]
+
+    def worker(index):
+        barrier.wait()
+        results[index].extend(allocator.generate(PAYER) for _ in range(2000))
+
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    all_ids = [transaction_id for result in results for transaction_id in result]
+    assert len(set(all_ids)) == len(all_ids) == 32_000
+    for result in results:
+        assert [_nanos(transaction_id) for transaction_id in result] == sorted(
+            _nanos(transaction_id) for transaction_id in result
+        )
+
+
+def test_clock_moving_backwards():
+    """Small backward steps keep counting up; steps beyond max_clock_skew raise."""
+    now = [NOW]
+    allocator = TransactionIdAllocator(valid_start_offset=5, max_clock_skew=2, clock=lambda: now[0])
+
+    before = allocator.generate(PAYER)
+    now[0] -= 1_000_000_000
+    after = allocator.generate(PAYER)
+    assert _nanos(after) == _nanos(before) + 1
+
+    now[0] -= 2_000_000_000
+    with pytest.raises(ValueError, match="ahead of the system clock"):
+        allocator.generate(PAYER)
+
+
+def test_constructor_and_argument_validation():
+    """The skew must be below the offset, and payers and counts are validated."""
+    with pytest.raises(ValueError, match="max_clock_skew must be smaller than valid_start_offset"):
+        TransactionIdAllocator(valid_start_offset=2, max_clock_skew=2)
+
+    allocator = TransactionIdAllocator()
+    with pytest.raises(TypeError, match="account_id must be an AccountId"):
+        allocator.generate("0.0.1984")
+    with pytest.raises(ValueError, match="count must be >= 1"):
+        allocator.generate_many(PAYER, 0)
+
+
+def test_client_ids_do_not_collide_with_chunk_ids(mock_client):
+    """Freezing a chunked transaction reserves an ID per chunk from the client's allocator."""
+    transaction = (
+        TopicMessageSubmitTransaction()
+        .set_topic_id(TopicId(0, 0, 1234))
+        .set_message("x" * 3000)
+        .set_chunk_size(1024)
+        .freeze_with(mock_client)
+    )
+    later = [mock_client.generate_transaction_id() for _ in range(10)]
+
+    chunk_ids = transaction._transaction_ids
+    assert len(chunk_ids) == 3
+    assert not set(chunk_ids) & set(later)
+    assert _nanos(later[0]) > _nanos(chunk_ids[-1])
+
+
+def test_client_generate_transaction_ids(mock_client):
+    """Client.generate_transaction_ids defaults to the operator and accepts another payer."""
+    operator_ids = mock_client.generate_transaction_ids(3)
+    payer_ids = mock_client.generate_transaction_ids(2, AccountId(0, 0, 42))
+
+    assert {transaction_id.account_id for transaction_id in operator_ids} == {mock_client.operator_account_id}
+    assert {transaction_id.account_id for transaction_id in payer_ids} == {AccountId(0, 0, 42)}
+    assert len(set(operator_ids)) == 3
@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import json
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from hiero_sdk_python.account.account_id import AccountId
+from hiero_sdk_python.hapi.services import (
+    response_header_pb2,
+    response_pb2,
+    transaction_get_receipt_pb2,
+)
+from hiero_sdk_python.hapi.services.transaction_receipt_pb2 import (
+    TransactionReceipt as TransactionReceiptProto,
+)
+from hiero_sdk_python.hapi.services.transaction_response_pb2 import (
+    TransactionResponse as TransactionResponseProto,
+)
+from hiero_sdk_python.response_code import ResponseCode
+from hiero_sdk_python.tokens.token_airdrop_transaction import TokenAirdropTransaction
+from hiero_sdk_python.tokens.token_id import TokenId
+from hiero_sdk_python.transaction.batch_packer import MAX_TRANSACTION_SIZE
+from hiero_sdk_python.transaction.transfer_planner import (
+    TransferCheckpoint,
+    TransferPlanner,
+    TransferShard,
+    read_transfers_csv,
+)
+from hiero_sdk_python.transaction.transfer_transaction import TransferTransaction
+from tests.unit.mock_server import mock_hedera_servers
+
+
+pytestmark = pytest.mark.unit
+
+SENDER = AccountId(0, 0, 1001)
+TOKEN_ID = TokenId(0, 0, 5005)
+
+
+def _recipients(count, amount=1):
+    return [(AccountId(0, 0, 2000 + i), amount) for i in range(count)]
+
+
+class _FakeTransfers:
+    """Stands in for Transaction.execute, recording submitted transaction IDs."""
+
+    def __init__(self, fail_on=None):
+        self.fail_on = fail_on
+        self.lock = threading.Lock()
+        self.calls = []
+
+    def __call__(self, transaction, client, timeout=None, validate_status=False):  # noqa: ARG002
+        with self.lock:
+            self.calls.append(transaction.transaction_id)
+            call_number = len(self.calls)
+        if call_number == self.fail_on:
+            raise RuntimeError("connection lost")
+        return MagicMock(status=ResponseCode.SUCCESS)
+
+
+def _not_found(client, transaction_id):  # noqa: ARG001
+    return None
+
+
+def test_plan_shards_recipients_and_nets_duplicates():
+    """Each shard holds at most 9 recipients, and repeated recipients within a shard are merged."""
+    rows = _recipients(20) + [(AccountId(0, 0, 2019), 5)]
+
+    shards = list(TransferPlanner(SENDER).plan(rows))
+
+    assert [len(shard.transfers) for shard in shards] == [9, 9, 2]
+    assert [shard.index for shard in shards] == [0, 1, 2]
+    assert shards[2].transfers == ((AccountId(0, 0, 2018), 1), (AccountId(0, 0, 2019), 6))
+    assert sum(shard.total for shard in shards) == 25
+
+
+def test_plan_is_deterministic():
+    """The same payouts always produce the same shards and digests."""
+    planner = TransferPlanner(SENDER)
+
+    first = [shard.digest for shard in planner.plan(_recipients(30))]
+    second = [shard.digest for shard in planner.plan(_recipients(30))]
+
+    assert first == second
+    assert len(set(first)) == len(first)
+
+
+def test_plan_respects_transaction_size_budget():
+    """A tight size limit closes shards before the transfer count limit is reached."""
+    planner = TransferPlanner(SENDER, max_transaction_size=1100, transaction_overhead=1000)
+
+    shards = list(planner.plan(_recipients(20)))
+
+    assert len(shards) > 3
+    assert all(len(shard.transfers) < 9 for shard in shards)
+
+
+def test_plan_rejects_invalid_rows():
+    """Payouts must be positive, must not pay the sender and must use AccountIds."""
+    planner = TransferPlanner(SENDER)
+
+    with pytest.raises(ValueError, match="must be positive"):
+        list(planner.plan([(AccountId(0, 0, 2000), 0)]))
+
+    with pytest.raises(ValueError, match="is the sender"):
+        list(planner.plan([(SENDER, 10)]))
+
+    with pytest.raises(TypeError, match="recipient must be an AccountId"):
+        list(planner.plan([("0.0.2000", 10)]))
+
+
+def test_constructor_validates_arguments():
+    """Airdrops need a token and the limits must leave room for a transfer."""
+    with pytest.raises(TypeError, match="sender must be an AccountId"):
+        TransferPlanner("0.0.1001")
+
+    with pytest.raises(ValueError, match="airdrop requires a token_id"):
+        TransferPlanner(SENDER, airdrop=True)
+
+    with pytest.raises(ValueError, match="max_transfers must be between 2 and 10"):
+        TransferPlanner(SENDER, max_transfers=11)
+
+
+def test_read_transfers_csv(tmp_path):
+    """A header row and blank rows are skipped; malformed rows raise."""
+    path = tmp_path / "payouts.csv"
+    path.write_text("account,amount\n0.0.2000,5\n\n0.0.2001, 7\n")
+
+    assert list(read_transfers_csv(path)) == [(AccountId(0, 0, 2000), 5), (AccountId(0, 0, 2001), 7)]
+
+    path.write_text("0.0.2000,5\n0.0.2001,many\n")
+    with pytest.raises(ValueError, match="Line 2: invalid amount"):
+        list(read_transfers_csv(path))
+
+
+def test_build_debits_the_sender_once(mock_client):
+    """The sender's debit is the netted total of the shard, and the signed transaction fits the limit."""
+    shard = TransferShard(0, tuple(_recipients(9, amount=3)))
+
+    transaction = TransferPlanner(SENDER).build(mock_client, shard)
+
+    amounts = {transfer.account_id: transfer.amount for transfer in transaction.hbar_transfers}
+    assert amounts[SENDER] == -27
+    assert len(amounts) == 10
+    assert len(transaction._make_request().SerializeToString()) <= MAX_TRANSACTION_SIZE
+
+
+def test_build_airdrop(mock_client):
+    """In airdrop mode the shard becomes a TokenAirdropTransaction of the planner's token."""
+    shard = TransferShard(0, tuple(_recipients(2, amount=4)))
+
+    transaction = TransferPlanner(SENDER, token_id=TOKEN_ID, airdrop=True).build(mock_client, shard)
+
+    assert isinstance(transaction, TokenAirdropTransaction)
+    amounts = {transfer.account_id: transfer.amount for transfer in transaction.token_transfers[TOKEN_ID]}
+    assert amounts == {SENDER: -8, AccountId(0, 0, 2000): 4, AccountId(0, 0, 2001): 4}
+
+
+def test_execute_pays_every_shard_and_checkpoints(mock_client, tmp_path):
+    """Every shard is submitted once and recorded as submitted, then done."""
+    fake = _FakeTransfers()
+    checkpoint = tmp_path / "payouts.ckpt"
+
+    with patch.object(TransferTransaction, "execute", autospec=True, side_effect=fake):
+        results = list(TransferPlanner(SENDER).execute(mock_client, _recipients(25), checkpoint=checkpoint))
+
+    assert sorted(result.shard.index for result in results) == [0, 1, 2]
+    assert not any(result.resumed for result in results)
+    assert len(set(fake.calls)) == 3
+
+    records = TransferCheckpoint(checkpoint).open(TransferPlanner(SENDER).fingerprint)
+    assert {index: record["state"] for index, record in records.items()} == {0: "done", 1: "done", 2: "done"}
+
+
+def test_interrupted_run_resumes_without_double_paying(mock_client, tmp_path):
+    """After a crash, done shards are skipped and the in-doubt shard is resent with the same transaction ID."""
+    checkpoint = tmp_path / "payouts.ckpt"
+    planner = TransferPlanner(SENDER)
+    first_run = _FakeTransfers(fail_on=2)
+
+    with (
+        patch.object(TransferTransaction, "execute", autospec=True, side_effect=first_run),
+        pytest.raises(RuntimeError, match="connection lost"),
+    ):
+        list(planner.execute(mock_client, _recipients(25), checkpoint=checkpoint, max_concurrency=1))
+
+    second_run = _FakeTransfers()
+    with patch.object(TransferTransaction, "execute", autospec=True, side_effect=second_run):
+        results = list(
+            planner.execute(
+                mock_client, _recipients(25), checkpoint=checkpoint, max_concurrency=1, status_lookup=_not_found
+            )
+        )
+
+    assert [result.shard.index for result in results] == [0, 1, 2]
+    assert [result.resumed for result in results] == [True, True, False]
+    assert second_run.calls[0] == first_run.calls[1]
+    assert len(second_run.calls) == 2
+
+
+def test_resume_skips_shards_confirmed_by_lookup(mock_client, tmp_path):
+    """An in-doubt shard that the lookup reports as successful is marked done without resending."""
+    checkpoint = tmp_path / "payouts.ckpt"
+    planner = TransferPlanner(SENDER)
+
+    with (
+        patch.object(TransferTransaction, "execute", autospec=True, side_effect=_FakeTransfers(fail_on=1)),
+        pytest.raises(RuntimeError),
+    ):
+        list(planner.execute(mock_client, _recipients(5), checkpoint=checkpoint))
+
+    fake = _FakeTransfers()
+    with patch.object(TransferTransaction, "execute", autospec=True, side_effect=fake):
+        (result,) = planner.execute(
+            mock_client, _recipients(5), checkpoint=checkpoint, status_lookup=lambda *_: "SUCCESS"
+        )
+
+    assert result.resumed
+    assert result.status == ResponseCode.SUCCESS
+    assert fake.calls == []
+
+
+def test_resume_rebuilds_expired_shards(mock_client, tmp_path):
+    """An in-doubt shard whose transaction expired unseen is paid by a new transaction."""
+    checkpoint = tmp_path / "payouts.ckpt"
+    planner = TransferPlanner(SENDER)
+    first_run = _FakeTransfers(fail_on=1)
+
+    with (
+        patch.object(TransferTransaction, "execute", autospec=True, side_effect=first_run),
+        pytest.raises(RuntimeError),
+    ):
+        list(planner.execute(mock_client, _recipients(5), checkpoint=checkpoint))
+
+    second_run = _FakeTransfers()
+    with (
+        patch.object(TransferTransaction, "execute", autospec=True, side_effect=second_run),
+        patch("hiero_sdk_python.transaction.transfer_planner.time.time", return_value=4_000_000_000),
+    ):
+        (result,) = planner.execute(mock_client, _recipients(5), checkpoint=checkpoint, status_lookup=_not_found)
+
+    assert not result.resumed
+    assert second_run.calls[0] != first_run.calls[0]
+
+    records = [json.loads(line) for line in checkpoint.read_text().splitlines()[1:]]
+    assert [record["state"] for record in records] == ["submitted", "submitted", "done"]
+
+
+def test_resume_rejects_changed_payouts(mock_client, tmp_path):
+    """A checkpoint cannot be resumed with different payouts or a different plan."""
+    checkpoint = tmp_path / "payouts.ckpt"
+
+    with patch.object(TransferTransaction, "execute", autospec=True, side_effect=_FakeTransfers()):
+        list(TransferPlanner(SENDER).execute(mock_client, _recipients(5), checkpoint=checkpoint))
+
+        with pytest.raises(ValueError, match="does not match the checkpoint"):
+            list(TransferPlanner(SENDER).execute(mock_client, _recipients(5, amount=2), checkpoint=checkpoint))
+
+    with pytest.raises(ValueError, match="different transfer plan"):
+        TransferPlanner(SENDER, memo="other").execute(mock_client, _recipients(5), checkpoint=checkpoint)
+
+
+def test_execute_against_mock_network():
+    """Shards are submitted to the network and their receipts returned."""
+    ok_response = TransactionResponseProto(nodeTransactionPrecheckCode=ResponseCode.OK)
+    receipt_response = response_pb2.Response(
+        transactionGetReceipt=transaction_get_receipt_pb2.TransactionGetReceiptResponse(
+            header=response_header_pb2.ResponseHeader(nodeTransactionPrecheckCode=ResponseCode.OK),
+            receipt=TransactionReceiptProto(status=ResponseCode.SUCCESS),
+        )
+    )
+    response_sequences = [[ok_response, receipt_response, ok_response, receipt_response]]
+
+    with mock_hedera_servers(response_sequences) as client:
+        results = list(TransferPlanner(SENDER).execute(client, _recipients(12), max_concurrency=1))
+
+    assert [len(result.shard.transfers) for result in results] == [9, 3]
+    assert all(result.receipt.status == ResponseCode.SUCCESS for result in results)
@@ -4,14 +4,21 @@ Unit tests for the TransferTransaction class
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
 import pytest
 
+from hiero_sdk_python.account.account_id import AccountId
+from hiero_sdk_python.hapi.services import transaction_pb2
 from hiero_sdk_python.hapi.services.schedulable_transaction_body_pb2 import (
     SchedulableTransactionBody,
 )
 from hiero_sdk_python.hbar import Hbar
 from hiero_sdk_python.hbar_unit import HbarUnit
+from hiero_sdk_python.tokens.hbar_transfer import HbarTransfer
 from hiero_sdk_python.tokens.nft_id import NftId
+from hiero_sdk_python.tokens.token_transfer import TokenTransfer
+from hiero_sdk_python.transaction.transaction_id import TransactionId
 from hiero_sdk_python.transaction.transfer_transaction import TransferTransaction
 
 
@@ -855,3 +862,43 @@ def test_token_transfer_without_expected_decimals(mock_account_ids):
             assert token_transfer.amount == -300
         elif token_transfer.account_id == account_id_recipient:
             assert token_transfer.amount == 300
+
+
+def test_transfers_are_merged_after_direct_list_changes(mock_account_ids):
+    """Transfers appended to the public lists directly are still merged with later additions."""
+    account_id_sender, account_id_recipient, _, token_id_1, _ = mock_account_ids
+    transfer_tx = TransferTransaction()
+
+    transfer_tx.hbar_transfers.append(HbarTransfer(account_id_sender, -10))
+    transfer_tx.token_transfers[token_id_1].append(TokenTransfer(token_id_1, account_id_sender, -5))
+    transfer_tx.add_hbar_transfer(account_id_sender, -15)
+    transfer_tx.add_token_transfer(token_id_1, account_id_sender, -20)
+    transfer_tx.add_token_transfer(token_id_1, account_id_recipient, 25)
+
+    assert [(t.account_id, t.amount) for t in transfer_tx.hbar_transfers] == [(account_id_sender, -25)]
+    assert [(t.account_id, t.amount) for t in transfer_tx.token_transfers[token_id_1]] == [
+        (account_id_sender, -25),
+        (account_id_recipient, 25),
+    ]
+
+
+def test_freeze_builds_transfer_lists_once(mock_account_ids):
+    """Freezing for several nodes builds the transfer body once and reuses it for every node."""
+    account_id_sender, account_id_recipient, _, _, _ = mock_account_ids
+    transfer_tx = (
+        TransferTransaction()
+        .add_hbar_transfer(account_id_sender, -100)
+        .add_hbar_transfer(account_id_recipient, 100)
+        .set_node_account_ids([AccountId(0, 0, 3), AccountId(0, 0, 4), AccountId(0, 0, 5)])
+        .set_transaction_id(TransactionId.generate(account_id_sender))
+    )
+
+    build_proto_body = TransferTransaction._build_proto_body
+    with patch.object(TransferTransaction, "_build_proto_body", autospec=True, side_effect=build_proto_body) as build:
+        transfer_tx.freeze()
+
+    assert build.call_count == 1
+    assert len(transfer_tx._transaction_body_bytes) == 3
+    for body_bytes in transfer_tx._transaction_body_bytes.values():
+        body = transaction_pb2.TransactionBody.FromString(body_bytes)
+        assert [amount.amount for amount in body.cryptoTransfer.transfers.accountAmounts] == [-100, 100]